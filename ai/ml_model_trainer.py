@@ -26,6 +26,8 @@ from sklearn.metrics import (
     f1_score, roc_auc_score, confusion_matrix
 )
 
+from utils.model_registry import get_model_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -493,9 +495,11 @@ class MLModelTrainer:
             path = Path(model_version.model_path)
             self.feature_names = model_version.feature_names
 
-        # 모델 로드
-        with open(path, 'rb') as f:
-            self.model = pickle.load(f)
+        # 모델 로드 (ModelRegistry — 같은 파일은 프로세스 내 1회만 언픽클)
+        model = get_model_registry().load(path)
+        if model is None:
+            raise ValueError(f"모델을 로드할 수 없습니다: {path}")
+        self.model = model
 
         logger.info(f"모델 로드 완료: {path}")
 
@@ -59,20 +59,13 @@ class CooldownOptimizer:
         stock_code: str,
         exit_time: datetime
     ) -> Optional[pd.DataFrame]:
-        """yfinance 5분봉으로 exit 후 60bars(5시간) 데이터 조회"""
+        """5분봉(로컬 캐시 + yfinance 빈 구간)으로 exit 후 60bars(5시간) 데이터 조회"""
         try:
-            import yfinance as yf
-
-            # KRX 종목코드 → yfinance ticker
-            ticker = f"{stock_code}.KS"
-            stock = yf.Ticker(ticker)
-            df = stock.history(period=f"{self.days}d", interval="5m")
-
-            if df.empty:
-                # KOSDAQ 시도
-                ticker = f"{stock_code}.KQ"
-                stock = yf.Ticker(ticker)
-                df = stock.history(period=f"{self.days}d", interval="5m")
+            from utils.ohlcv_store import get_store
+
+            # KRX 종목코드 → .KS 우선, 없으면 .KQ (캐시에 없는 구간만 조회)
+            start = datetime.now() - timedelta(days=self.days)
+            df = get_store().get(stock_code, start, timeframe="5m")
 
             if df.empty or len(df) < 10:
                 return None
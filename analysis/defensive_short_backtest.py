@@ -64,26 +64,18 @@ class BacktestResult:
     params:        Dict = field(default_factory=dict)
 
 
-# ── yfinance 데이터 로드 ──────────────────────────────────────────────
+# ── 데이터 로드 (로컬 OHLCV 캐시 + yfinance 빈 구간) ──────────────────
 
 def _fetch_yf(ticker: str, days: int, interval: str = "5m") -> Optional[pd.DataFrame]:
     try:
-        import yfinance as yf
-        end   = datetime.now()
-        start = end - timedelta(days=days)
-        df = yf.download(ticker, start=start, end=end, interval=interval,
-                         progress=False, auto_adjust=True)
+        from utils.ohlcv_store import get_store
+        start = datetime.now() - timedelta(days=days)
+        df = get_store().get(ticker, start, timeframe=interval)
         if df is None or df.empty:
             return None
-        df.columns = [c.lower() if isinstance(c, str) else c[0].lower()
-                      for c in df.columns]
-        df = df.rename(columns={"adj close": "close"}).dropna()
-        df.index = pd.to_datetime(df.index)
-        if df.index.tz is not None:
-            df.index = df.index.tz_convert("Asia/Seoul").tz_localize(None)
         return df
     except Exception as e:
-        print(f"  [WARN] yfinance 로드 실패 ({ticker}): {e}")
+        print(f"  [WARN] 데이터 로드 실패 ({ticker}): {e}")
         return None
 
 
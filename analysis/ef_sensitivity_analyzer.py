@@ -98,19 +98,15 @@ class EFSensitivityAnalyzer:
         return len(self.trade_pairs)
 
     def _fetch_hold_data(self, stock_code: str, entry_time: datetime) -> Optional[pd.DataFrame]:
-        """yfinance 5분봉: 진입 전후 데이터 조회 (캐시)"""
+        """5분봉: 진입 전후 데이터 조회 (프로세스 캐시 → 로컬 OHLCV 캐시 → yfinance 빈 구간)"""
         if stock_code in self._data_cache:
             return self._data_cache[stock_code]
 
         try:
-            import yfinance as yf
-
-            for suffix in ['.KS', '.KQ']:
-                ticker = f"{stock_code}{suffix}"
-                stock = yf.Ticker(ticker)
-                df = stock.history(period=f"{self.days}d", interval="5m")
-                if not df.empty:
-                    break
+            from utils.ohlcv_store import get_store
+
+            start = datetime.now() - timedelta(days=self.days)
+            df = get_store().get(stock_code, start, timeframe="5m")
 
             if df.empty or len(df) < 30:
                 self._data_cache[stock_code] = None
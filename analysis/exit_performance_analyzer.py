@@ -131,14 +131,12 @@ def _a_grade_winner_rate(trades: List[Dict], win_r: float = 2.0) -> Dict:
 # ── 사후 가격 체크 (NO_PROGRESS_EXIT 이후 실제로 올랐는지) ─────────────────
 
 def _post_exit_check(trades: List[Dict], window_bars: int = 6) -> List[Dict]:
-    """NO_PROGRESS_EXIT 이후 N봉 가격 변화를 yfinance로 확인 (선택 기능)"""
+    """NO_PROGRESS_EXIT 이후 N봉 가격 변화를 5분봉(로컬 캐시 + yfinance)으로 확인 (선택 기능)"""
     np_trades = [t for t in trades if t["tag"] == "NO_PROGRESS_EXIT"]
     if not np_trades:
         return []
-    try:
-        import yfinance as yf
-    except ImportError:
-        return [{"error": "yfinance 없음 — pip install yfinance"}]
+    from utils.ohlcv_store import get_store
+    store = get_store()
 
     results = []
     for t in np_trades[:10]:  # 최대 10건
@@ -147,18 +145,18 @@ def _post_exit_check(trades: List[Dict], window_bars: int = 6) -> List[Dict]:
         try:
             exit_dt  = datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
             end_dt   = exit_dt + timedelta(minutes=window_bars * 5 + 30)
-            ticker   = yf.Ticker(f"{code}.KS")
-            hist     = ticker.history(
+            hist     = store.get(
+                code,
                 start=exit_dt.strftime("%Y-%m-%d"),
                 end=end_dt.strftime("%Y-%m-%d"),
-                interval="5m",
+                timeframe="5m",
             )
             if hist.empty:
                 results.append({"code": code, "ts": ts_str, "post_chg": None})
                 continue
             # exit 직후 첫 봉 대비 window_bars봉 후 변화
-            exit_close  = hist["Close"].iloc[0]
-            after_close = hist["Close"].iloc[min(window_bars, len(hist) - 1)]
+            exit_close  = hist["close"].iloc[0]
+            after_close = hist["close"].iloc[min(window_bars, len(hist) - 1)]
             post_chg    = (after_close - exit_close) / exit_close * 100
             results.append({
                 "code":     code,
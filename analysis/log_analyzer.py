@@ -4,6 +4,11 @@ analysis/log_analyzer.py — 로그 파일 전용 분석기
 DB 없이 auto_trading_YYYYMMDD.log + smc_decision_YYYYMMDD.log만으로
 Signal Orchestrator 파이프라인, Market Context, CHoCH, TREND 신호를 분석한다.
 
+이벤트 저널(core/event_journal, data/journal/events_YYYYMMDD.bin)이 있는 날은
+저널을 우선 사용하고, 저널 도입 이전 날짜만 로그 정규식 파싱으로 폴백한다.
+(저널의 REJECT 는 L1/L3/L6/CONFIDENCE/ALPHA 거부도 담지만, 로그의 '❌ REJECT' 라인과
+ 같은 집계가 되도록 L0 만 사용)
+
 사용법:
     python3 -m analysis.log_analyzer             # 오늘
     python3 -m analysis.log_analyzer 20260320    # 특정 날짜
@@ -19,6 +24,10 @@ from datetime import date, datetime, timedelta
 from collections import Counter
 from typing import Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from core import event_journal  # noqa: E402
+
 LOG_DIR = os.path.join(os.path.dirname(__file__), '..', 'logs')
 
 # ─── 정규식 패턴 ──────────────────────────────────────────────────────────────
@@ -29,6 +38,8 @@ _RE_ACCEPT = re.compile(
 _RE_REJECT = re.compile(
     r'❌ REJECT (\d{6}) \| PID:\d+ \| (\S+) \| (.+)'
 )
+# '❌ REJECT … | PID' 로그 라인을 남기는 거부 레벨 (저널 REJECT 를 같은 범위로 제한)
+_LOG_REJECT_LEVEL = "L0"
 _RE_TIME_BLOCK = re.compile(
     r'⏰ (\d{6}): 🚫 SMC .+? 진입 차단'
 )
@@ -205,6 +216,68 @@ def summarize(
     }
 
 
+def parse_journal_events(journal: list[dict]) -> tuple[list[dict], list[dict], dict, list[dict]]:
+    """
+    이벤트 저널 레코드를 로그 파서와 같은 형태로 변환한다 (dedup 규칙 동일).
+
+    Returns:
+        (orchestrator events, chochs, mkt_ctx, trend_signals)
+    """
+    seen: set[tuple] = set()
+    events: list[dict] = []
+    chochs: dict[str, dict] = {}
+    mkt_ctx = {"no_trade_day": False, "reason": ""}
+    trends: list[dict] = []
+
+    for ev in journal:
+        kind = ev["type"]
+        if kind == "ACCEPT":
+            key = ("ACCEPT", ev["stock_code"], ev["price"])
+            if key not in seen:
+                seen.add(key)
+                events.append({
+                    "type":       "ACCEPT",
+                    "stock_code": ev["stock_code"],
+                    "price":      ev["price"],
+                    "pid":        "",
+                    "conf":       round(ev["conf"], 2),
+                    "pos_mult":   round(ev["pos_mult"], 2),
+                })
+        elif kind == "REJECT" and ev["level"] == _LOG_REJECT_LEVEL:
+            reason = ev["reason"].strip()
+            key    = ("REJECT", ev["stock_code"], reason[:30])
+            if key not in seen:
+                seen.add(key)
+                events.append({
+                    "type":       "REJECT",
+                    "stock_code": ev["stock_code"],
+                    "level":      ev["level"],
+                    "reason":     reason,
+                })
+        elif kind == "CHOCH":
+            code = ev["stock_code"]
+            if code not in chochs or chochs[code]["level"] != ev["level"]:
+                chochs[code] = {
+                    "stock_code":  code,
+                    "direction":   ev["direction"],
+                    "level":       ev["level"],
+                    "wick":        ev["wick"],
+                    "close":       ev["close"],
+                    "penetration": round(ev["penetration"], 2),
+                }
+        elif kind == "MKT_CTX":
+            if ev["status"] == "NO_TRADE_DAY" and not mkt_ctx["no_trade_day"]:
+                mkt_ctx = {"no_trade_day": True, "reason": ev["summary"].strip()}
+        elif kind == "TREND_SIG":
+            trends.append({
+                "entry_type": (ev["entry_type"] or "").lower(),
+                "grade":      ev["grade"],
+                "detail":     ev["detail"],
+            })
+
+    return events, list(chochs.values()), mkt_ctx, trends
+
+
 # ─── 로그 로더 ───────────────────────────────────────────────────────────────
 
 def _read_lines(path: str) -> list[str]:
@@ -215,7 +288,17 @@ def _read_lines(path: str) -> list[str]:
 
 
 def analyze_day(target: date) -> dict:
-    """하루치 로그를 종합 분석하여 요약 dict를 반환한다."""
+    """하루치 로그를 종합 분석하여 요약 dict를 반환한다 (저널 우선)."""
+    if event_journal.has_journal(target):
+        journal = event_journal.read_events(
+            target, types=("ACCEPT", "REJECT", "CHOCH", "MKT_CTX", "TREND_SIG"),
+        )
+        events, chochs, mkt_ctx, trends = parse_journal_events(journal)
+        result = summarize(events=events, chochs=chochs, mkt_ctx=mkt_ctx, trend_signals=trends)
+        result["date"] = target.isoformat()
+        result["source"] = "journal"
+        return result
+
     ds = target.strftime("%Y%m%d")
 
     main_lines  = _read_lines(os.path.join(LOG_DIR, f"auto_trading_{ds}.log"))
@@ -228,6 +311,7 @@ def analyze_day(target: date) -> dict:
 
     result = summarize(events=events, chochs=chochs, mkt_ctx=mkt_ctx, trend_signals=trends)
     result["date"] = target.isoformat()
+    result["source"] = "log"
     return result
 
 
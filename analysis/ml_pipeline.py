@@ -11,7 +11,6 @@ LightGBM은 NaN 기본 지원 → 구버전 NULL 피처도 안전하게 학습.
 import os
 import sys
 import json
-import pickle
 import logging
 import argparse
 from datetime import datetime, timedelta
@@ -21,9 +20,12 @@ from typing import Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from utils.model_registry import MANIFEST_NAME, atomic_pickle_dump, get_model_registry, write_manifest_entry
+
 logger = logging.getLogger(__name__)
 
 _MODELS_DIR = Path(__file__).parent.parent / 'models'
+MODEL_NAME = 'lgbm_entry'
 _PG_DSN = {
     "host":     os.getenv("POSTGRES_HOST", "localhost"),
     "port":     int(os.getenv("POSTGRES_PORT", "5432")),
@@ -241,10 +243,12 @@ def train(
             'feature_cols': FEATURE_COLS,
             'cat_cols':     CAT_COLS,
         }
-        with open(versioned, 'wb') as f:
-            pickle.dump(payload, f)
-        with open(latest, 'wb') as f:
-            pickle.dump(payload, f)
+        # 원자적 교체 + manifest 갱신 → 실행 중인 프로세스의 ModelRegistry 가 다음 확인 때 새 모델로 교체
+        atomic_pickle_dump(payload, versioned)
+        atomic_pickle_dump(payload, latest)
+        write_manifest_entry(MODEL_NAME, latest, version=tag,
+                             manifest_path=_MODELS_DIR / MANIFEST_NAME,
+                             auc=metrics['auc'], trained_at=metrics['trained_at'])
         metrics['model_path'] = str(versioned)
         logger.info(
             f"[ML] 모델 저장: {versioned.name} "
@@ -254,18 +258,58 @@ def train(
     return metrics
 
 
+def _registry():
+    registry = get_model_registry()
+    registry.register(MODEL_NAME, _MODELS_DIR / 'lgbm_entry_latest.pkl')
+    return registry
+
+
 def load_latest_model() -> Tuple[Optional[object], Optional[dict]]:
-    """최신 모델 로드. 없으면 (None, None)."""
-    latest = _MODELS_DIR / 'lgbm_entry_latest.pkl'
-    if not latest.exists():
+    """최신 모델 (ModelRegistry — 1회 로드, 새 버전 저장 시 자동 교체). 없으면 (None, None)."""
+    entry = _registry().get(MODEL_NAME)
+    if entry is None:
         return None, None
+    return entry.model, entry.meta
+
+
+def _quality(prob: float) -> str:
+    return 'HIGH' if prob >= 0.65 else ('MED' if prob >= 0.50 else 'LOW')
+
+
+def entry_feature_row(df, price: float, extra: dict = None) -> dict:
+    """진입 시점 df → 예측 입력 행 (FEATURE_COLS)."""
+    from database.decision_trace import _extract_features_from_df
+    feats = _extract_features_from_df(df, price)
+    ex = extra or {}
+    return {
+        'rvol':              feats.get('rvol'),
+        'vwap_distance':     feats.get('vwap_distance'),
+        'price_vs_breakout': feats.get('price_vs_breakout'),
+        'ema_slope':         feats.get('ema_slope'),
+        'atr_ratio':         feats.get('atr_ratio'),
+        'rsi':               None,
+        'gap_pct':           None,
+        'entry_type':        ex.get('entry_type', 'UNKNOWN'),
+        'choch_grade':       ex.get('choch_grade', 'N/A'),
+        'market_context':    ex.get('market_context', 'UNKNOWN'),
+        'volume_trend':      feats.get('volume_trend') or 'flat',
+    }
+
+
+def predict_many(feature_rows) -> list:
+    """
+    후보 여러 건 배치 예측 (entry_feature_row 형식 행 목록).
+    Returns: 행마다 {'win_prob': 0.72, 'quality': 'HIGH'} — 모델 없음/실패 시 {'win_prob': None}
+    """
+    rows = list(feature_rows)
     try:
-        with open(latest, 'rb') as f:
-            payload = pickle.load(f)
-        return payload['model'], payload['metrics']
+        probs = _registry().predict_many(MODEL_NAME, rows, columns=FEATURE_COLS, categorical=CAT_COLS)
     except Exception as e:
-        logger.warning(f"[ML] 모델 로드 실패: {e}")
-        return None, None
+        logger.debug(f"[ML] predict_many 실패: {e}")
+        probs = None
+    if probs is None:
+        return [{'win_prob': None} for _ in rows]
+    return [{'win_prob': round(float(p), 3), 'quality': _quality(float(p))} for p in probs]
 
 
 def predict_entry_quality(df, price: float, extra: dict = None) -> dict:
@@ -274,35 +318,14 @@ def predict_entry_quality(df, price: float, extra: dict = None) -> dict:
     extra: {'entry_type': 'EXPLORATION', 'choch_grade': 'A', ...}
     Returns: {'win_prob': 0.72, 'quality': 'HIGH'} or {'win_prob': None}
     """
-    model, _ = load_latest_model()
-    if model is None:
+    if _registry().get(MODEL_NAME) is None:
         return {'win_prob': None}
     try:
-        from database.decision_trace import _extract_features_from_df
-        feats = _extract_features_from_df(df, price)
-        ex = extra or {}
-        row = {
-            'rvol':              feats.get('rvol'),
-            'vwap_distance':     feats.get('vwap_distance'),
-            'price_vs_breakout': feats.get('price_vs_breakout'),
-            'ema_slope':         feats.get('ema_slope'),
-            'atr_ratio':         feats.get('atr_ratio'),
-            'rsi':               None,
-            'gap_pct':           None,
-            'entry_type':        ex.get('entry_type', 'UNKNOWN'),
-            'choch_grade':       ex.get('choch_grade', 'N/A'),
-            'market_context':    ex.get('market_context', 'UNKNOWN'),
-            'volume_trend':      feats.get('volume_trend') or 'flat',
-        }
-        X = pd.DataFrame([row])
-        for col in CAT_COLS:
-            X[col] = X[col].astype('category')
-        prob = float(model.predict_proba(X)[0, 1])
-        quality = 'HIGH' if prob >= 0.65 else ('MED' if prob >= 0.50 else 'LOW')
-        return {'win_prob': round(prob, 3), 'quality': quality}
+        row = entry_feature_row(df, price, extra)
     except Exception as e:
         logger.debug(f"[ML] predict_entry_quality 실패: {e}")
         return {'win_prob': None}
+    return predict_many([row])[0]
 
 
 if __name__ == '__main__':
@@ -5,16 +5,24 @@ EXIT 형식:
    수익률: -2.18%
    실현손익: -1,200원
    사유: ...
+
+이벤트 저널(data/journal/events_YYYYMMDD.bin)이 있는 날은 REJECT/SELL 레코드를 사용.
+(REJECT 는 로그의 '❌ REJECT' 라인과 같은 L0 거부만)
 """
 
-import re, os, glob
+import re, os, sys, glob
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import event_journal  # noqa: E402
+
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
 
 TIME_RE   = re.compile(r'(\d{2}:\d{2}:\d{2})')
 REJECT_RE = re.compile(r'REJECT (\d{6})')
+JOURNAL_REJECT_LEVEL = 'L0'   # REJECT_RE 가 잡는 로그 라인은 L0 거부만 출력됨
 # 매도수량 → 종목코드 찾기용 (매도수량 앞 라인에 종목코드 나옴)
 SELL_CODE_RE = re.compile(r'(\d{6})[^\d].*매도|매도.*(\d{6})')
 YIELD_RE  = re.compile(r'^\s*수익률:\s*([-+]?\d+\.\d+)%')
@@ -22,11 +30,28 @@ REASON_RE = re.compile(r'^\s*사유:')
 QTY_RE    = re.compile(r'^\s*매도수량:')
 
 
+def parse_journal(day):
+    rejects = defaultdict(list)  # code → [datetime]
+    exits   = {}                 # code → (datetime, pct) 최초만
+    for ev in event_journal.read_events(day, types=('REJECT', 'SELL')):
+        t = event_journal.event_time(ev).replace(microsecond=0)
+        if ev['type'] == 'REJECT':
+            if ev['level'] == JOURNAL_REJECT_LEVEL:
+                rejects[ev['stock_code']].append(t)
+        elif ev['stock_code'] not in exits:
+            exits[ev['stock_code']] = (t, ev['pnl_pct'])
+    return rejects, exits
+
+
 def parse_file(filepath):
     date_m = re.search(r'(\d{8})', os.path.basename(filepath))
     if not date_m: return {}, {}
     log_date = date_m.group(1)
 
+    day = datetime.strptime(log_date, "%Y%m%d").date()
+    if event_journal.has_journal(day):
+        return parse_journal(day)
+
     rejects = defaultdict(list)  # code → [datetime]
     exits   = {}                 # code → (datetime, pct) 최초만
 
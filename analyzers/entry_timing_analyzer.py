@@ -172,7 +172,7 @@ class EntryTimingAnalyzer:
 
         # NaN 처리 및 범위 제한
         williams_r = williams_r.replace([np.inf, -np.inf], np.nan)
-        williams_r = williams_r.fillna(method='ffill').fillna(-50.0)
+        williams_r = williams_r.ffill().fillna(-50.0)
         williams_r = williams_r.clip(-100.0, 0.0)
 
         df[f'williams_r_{period}'] = williams_r
@@ -610,76 +610,71 @@ class EntryTimingAnalyzer:
 
         # 허용 오차 계산
         vwap_tol = float(vwap_tolerance_pct) / 100.0  # 예: 0.5 → 0.005
-        ma_tol = float(ma_tolerance_pct) / 100.0      # 예: 0.3 → 0.003
 
-        # 각 행별로 시그널 체크 (오프바이원 방지: range(1, len(df)))
-        for idx in range(1, len(df)):
-            current = df.iloc[idx]
-            previous = df.iloc[idx - 1]
+        # 🔧 2026-10-16: 행 단위 루프(df.iloc[idx]) → 전체 열 벡터 연산 (시그널 동일)
+        #   NaN 비교는 False (루프의 스칼라 비교와 동일), 첫 행(idx=0)은 판정 제외
+        close = df['close']
+        vwap = df['vwap']
+        prev_close = close.shift(1)
+        prev_vwap = vwap.shift(1)
+        cross_up = (prev_close < prev_vwap) & (close > vwap)
+        cross_down = (close < vwap) & (prev_close > prev_vwap)
+
+        # --- VWAP 판정 ---
+        if vwap_cross_only:
+            # 엄격 모드: 상향 돌파만 인정 (근접 허용 X)
+            vwap_ok = cross_up
+        else:
+            # 완화 모드: 근접 허용 또는 상향 돌파
+            vwap_ok = (close >= vwap * (1.0 - vwap_tol)) | cross_up
 
-            # --- VWAP 판정 ---
-            if vwap_cross_only:
-                # 엄격 모드: 상향 돌파만 인정 (근접 허용 X)
-                vwap_ok = (previous['close'] < previous['vwap']) and (current['close'] > current['vwap'])
-            else:
-                # 완화 모드: 근접 허용 또는 상향 돌파
-                vwap_ok = (
-                    current['close'] >= current['vwap'] * (1.0 - vwap_tol)
-                    or ((previous['close'] < previous['vwap']) and (current['close'] > current['vwap']))
-                )
+        # --- MA(추세) 판정 --- (uptrend 가 boolean 이므로 ma_tolerance_pct 는 적용되지 않음 — 기존 동작 유지)
+        trend_ok = uptrend if use_trend_filter else True
 
-            # --- MA(추세) 판정 ---
-            if use_trend_filter:
-                ma_val_curr = uptrend.iloc[idx] if isinstance(uptrend, pd.Series) else None
-                if ma_val_curr is not None and isinstance(ma_val_curr, (int, float)):
-                    # MA 근접 허용: MA*(1 - tol) 이상이면 통과
-                    trend_ok = current['close'] >= ma_val_curr * (1.0 - ma_tol)
-                else:
-                    # uptrend가 boolean이면 그대로 사용
-                    trend_ok = bool(uptrend.iloc[idx] if isinstance(uptrend, pd.Series) else uptrend)
-            else:
-                trend_ok = True
-
-            # VWAP 상향 돌파 (Buy Signal)
-            if (vwap_ok and
-                trend_ok and
-                (volume_surge.iloc[idx] if isinstance(volume_surge, pd.Series) else volume_surge)):
-
-                # 추가 필터 체크
-                filters_passed = True
-
-                # 1. Williams %R 과매수 필터 (롱 진입 시)
-                if use_williams_r_filter and wr_col:
-                    wr_val = current[wr_col]
-                    # %R이 ceiling(-20) 미만이어야 진입 (>-20은 과매수)
-                    if wr_val >= williams_r_long_ceiling:
-                        filters_passed = False
-
-                # 2. 돌파 지속성 확인
-                if use_breakout_confirm:
-                    if not self.confirm_breakout(df, idx):
-                        filters_passed = False
-
-                # 3. 거래대금 절대값 확인 (amount 컬럼 자동 보강)
-                if use_volume_value_filter:
-                    if 'amount' not in df.columns:
-                        df.loc[:, 'amount'] = df['close'] * df['volume']
-                    if not self.check_volume_value(df, idx):
-                        filters_passed = False
-
-                if filters_passed:
-                    df.loc[idx, 'signal'] = 1
-
-            # VWAP 하향 돌파 (Sell Signal)
-            elif (current['close'] < current['vwap'] and
-                  previous['close'] > previous['vwap'] and
-                  (downtrend.iloc[idx] if isinstance(downtrend, pd.Series) else downtrend) and
-                  (volume_surge.iloc[idx] if isinstance(volume_surge, pd.Series) else volume_surge)):
-
-                df.loc[idx, 'signal'] = -1
+        # VWAP 상향 돌파 후보 (Buy)
+        buy_candidate = (vwap_ok & trend_ok & volume_surge).to_numpy(dtype=bool, copy=True)
+        buy_candidate[:1] = False
+        filters_passed = buy_candidate.copy()
+
+        # 1. Williams %R 과매수 필터 (롱 진입 시): %R이 ceiling(-20) 미만이어야 진입
+        if use_williams_r_filter and wr_col:
+            filters_passed &= ~(df[wr_col] >= williams_r_long_ceiling).to_numpy(dtype=bool)
+
+        # 2. 돌파 지속성 확인 (최근 n개 캔들 모두 VWAP 위)
+        if use_breakout_confirm:
+            filters_passed &= self._breakout_confirmed(close, vwap)
+
+        # 3. 거래대금 절대값 확인 (amount 컬럼 자동 보강 — 후보가 있을 때만)
+        if use_volume_value_filter:
+            if buy_candidate.any() and 'amount' not in df.columns:
+                df.loc[:, 'amount'] = df['close'] * df['volume']
+            filters_passed &= ((close * df['volume']) >= self.min_volume_value).to_numpy(dtype=bool)
+
+        # VWAP 하향 돌파 (Sell) — 매수 후보가 아닌 행만
+        sell = (cross_down & downtrend & volume_surge).to_numpy(dtype=bool, copy=True)
+        sell[:1] = False
+        sell &= ~buy_candidate
+
+        signal = np.zeros(len(df), dtype=np.int64)
+        signal[filters_passed] = 1
+        signal[sell] = -1
+        df['signal'] = signal
 
         return df
 
+    def _breakout_confirmed(self, close: pd.Series, vwap: pd.Series) -> np.ndarray:
+        """confirm_breakout() 의 전체 행 버전 — idx 기준 최근 n개 캔들이 모두 VWAP 위인지."""
+        n = self.breakout_confirm_candles
+        above = (close > vwap).to_numpy(dtype=bool)
+        if n <= 0:
+            return np.ones(len(above), dtype=bool)
+        counts = np.cumsum(above, dtype=np.int64)
+        window = counts.copy()
+        window[n:] -= counts[:-n]
+        confirmed = window == n
+        confirmed[:n - 1] = False       # 캔들 수 부족
+        return confirmed
+
     def analyze_entry_timing(self, stock_code: str, chart_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         진입 타이밍 분석 (5분봉 기준)
@@ -15,6 +15,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 
+from utils.linreg import rolling_linreg
+
 
 def add_momentum_indicators(df: pd.DataFrame) -> pd.DataFrame:
     """모멘텀 지표 추가
@@ -262,19 +264,11 @@ def calculate_momentum_linreg(series: pd.Series, length: int = 20) -> pd.Series:
     Returns:
         모멘텀 Series
     """
-    momentum = pd.Series(index=series.index, dtype=float)
-
-    for i in range(length, len(series)):
-        y = series.iloc[i-length:i].values
-        x = np.arange(length)
-
-        # 선형 회귀
-        slope, intercept = np.polyfit(x, y, 1)
+    values = series.to_numpy(dtype=float)
 
-        # 현재 값과 회귀선 값의 차이
-        predicted = slope * (length - 1) + intercept
-        actual = y[-1]
-        momentum.iloc[i] = actual - predicted
+    # 현재 값과 회귀선 값의 차이 (i 위치에는 직전 봉까지의 윈도우 결과)
+    residual = values - rolling_linreg(values, length)
+    momentum = pd.Series(residual, index=series.index).shift(1)
 
     return momentum.fillna(0)
 
@@ -5,6 +5,9 @@ Multi-Timeframe Consensus 전략 (3TF)
 - 15분봉: 추세 확인 (EMA20 위)
 - 3개 타임프레임 모두 동의 시에만 진입
 - 승률 60-70% 보장
+
+🔧 2026-10-16: 5분/15분봉은 전달받은 기준 분봉을 MTFBarProvider 로 리샘플
+  (종목별 캐시 + EMA20/VWAP 증분) — 후보마다 yf.download 하던 동기 조회 제거
 """
 
 import yfinance as yf
@@ -23,6 +26,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from analyzers.entry_timing_analyzer import EntryTimingAnalyzer
+from core.mtf_bars import MTFBarProvider  # ✅ 기준 분봉 → 5/15분봉 리샘플 (EMA/VWAP 증분)
 from rich.console import Console
 
 console = Console()
@@ -43,6 +47,9 @@ class MultiTimeframeConsensus:
         self.ema_period_5m = self.config.get('mtf', {}).get('ema_period_5m', 20)
         self.ema_period_15m = self.config.get('mtf', {}).get('ema_period_15m', 20)
 
+        # 상위 타임프레임 봉 공급자 (종목별 상태 유지)
+        self.bar_provider = MTFBarProvider(ema_period=self.ema_period_5m)
+
         # VWAP 분석기 (1분봉 진입 조건용)
         self.analyzer = EntryTimingAnalyzer(
             stop_loss_pct=3.0,
@@ -140,55 +147,24 @@ class MultiTimeframeConsensus:
         # ========================================
         # 5분봉: 방향성 확인 (EMA20 위)
         # ========================================
-        # 1분봉을 5분봉으로 리샘플링 (키움 데이터 활용)
-        if len(df_1m) >= 250:  # 최소 250개 1분봉 필요 (5분봉 50개 생성)
-            df_5m = df_1m.resample('5min').agg({
-                'open': 'first',
-                'high': 'max',
-                'low': 'min',
-                'close': 'last',
-                'volume': 'sum'
-            }).dropna()
-            # 컬럼명 대문자로 변경 (Yahoo Finance 형식 맞추기)
-            df_5m.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        else:
-            # 1분봉 부족 시 Yahoo Finance 시도
-            df_5m = self._download_data(ticker, period='5d', interval='5m')
-
-        if df_5m is None or len(df_5m) < 50:
+        # 기준 분봉 리샘플 (키움 데이터 활용) — 마감 봉은 캐시, 진행 중 봉만 재계산
+        tf_5m = self.bar_provider.latest(stock_code, df_1m, 5, self.ema_period_5m)
+        if tf_5m is None or tf_5m['bars'] < 50:
             return False, "5분봉 데이터 부족", {}
 
-        # EMA20 계산
-        ema20_5m = df_5m['Close'].ewm(span=self.ema_period_5m, adjust=False).mean()
-        close_5m = self._safe_get_value(df_5m['Close'].iloc[-1])
-        ema_5m = self._safe_get_value(ema20_5m.iloc[-1])
+        close_5m = tf_5m['close']
+        ema_5m = tf_5m['ema']
         trend_5m = close_5m > ema_5m
 
         # ========================================
         # 15분봉: 추세 확인 (EMA20 위)
         # ========================================
-        # 1분봉을 15분봉으로 리샘플링 (키움 데이터 활용)
-        if len(df_1m) >= 750:  # 최소 750개 1분봉 필요 (15분봉 50개 생성)
-            df_15m = df_1m.resample('15min').agg({
-                'open': 'first',
-                'high': 'max',
-                'low': 'min',
-                'close': 'last',
-                'volume': 'sum'
-            }).dropna()
-            # 컬럼명 대문자로 변경
-            df_15m.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        else:
-            # 1분봉 부족 시 Yahoo Finance 시도
-            df_15m = self._download_data(ticker, period='1mo', interval='15m')
-
-        if df_15m is None or len(df_15m) < 50:
+        tf_15m = self.bar_provider.latest(stock_code, df_1m, 15, self.ema_period_15m)
+        if tf_15m is None or tf_15m['bars'] < 50:
             return False, "15분봉 데이터 부족", {}
 
-        # EMA20 계산
-        ema20_15m = df_15m['Close'].ewm(span=self.ema_period_15m, adjust=False).mean()
-        close_15m = self._safe_get_value(df_15m['Close'].iloc[-1])
-        ema_15m = self._safe_get_value(ema20_15m.iloc[-1])
+        close_15m = tf_15m['close']
+        ema_15m = tf_15m['ema']
         trend_15m = close_15m > ema_15m
 
         # ========================================
@@ -14,7 +14,7 @@ import pandas as pd
 import math
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
-from analyzers.entry_timing_analyzer import EntryTimingAnalyzer
+from analyzers.quick_simulation import QuickTradeSimulator, get_validation_cache  # ✅ 배열 시뮬레이터 + 종목별 결과 캐시
 from utils.config_loader import ConfigLoader
 
 
@@ -76,7 +76,7 @@ class PreTradeValidator:
             return False, "데이터 부족 (최소 100봉 필요)", {}
 
         # 2. 빠른 시뮬레이션 실행
-        trades = self._run_quick_simulation(historical_data)
+        trades = self._run_quick_simulation(historical_data, cache_key=stock_code)
 
         # 3. 통계 계산
         stats = self._calculate_stats(trades)
@@ -142,7 +142,7 @@ class PreTradeValidator:
                 # 🔧 FIX: Stage 2 - 30분봉 검증 (문서 명세)
                 if historical_data_30m is not None and len(historical_data_30m) >= 50:
                     # 30분봉으로 백테스트
-                    trades_30m = self._run_quick_simulation(historical_data_30m)
+                    trades_30m = self._run_quick_simulation(historical_data_30m, cache_key=f"{stock_code}:30m")
                     stats_30m = self._calculate_stats(trades_30m)
 
                     # 30분봉에서 좋은 결과면 entry_ratio 상향
@@ -175,172 +175,18 @@ class PreTradeValidator:
         # 정상적으로 Stage 1 적용
         return True, reason, stats
 
-    def _run_quick_simulation(self, df: pd.DataFrame) -> List[Dict]:
-        """빠른 시뮬레이션 실행"""
-
-        # Analyzer 초기화
-        analyzer_config = self.config.get_analyzer_config()
-        analyzer = EntryTimingAnalyzer(**analyzer_config)
-
-        # Signal generation config
-        signal_config = self.config.get_signal_generation_config()
-        trailing_config = self.config.get_trailing_config()
-        trailing_kwargs = {
-            'use_atr_based': trailing_config.get('use_atr_based', False),
-            'atr_multiplier': trailing_config.get('atr_multiplier', 1.5),
-            'use_profit_tier': trailing_config.get('use_profit_tier', False),
-            'profit_tier_threshold': trailing_config.get('profit_tier_threshold', 3.0)
-        }
-        partial_config = self.config.get_partial_exit_config()
-
-        # 데이터 복사
-        df = df.copy()
-
-        # 데이터 검증: close 가격이 0이거나 너무 작은 경우 필터링
-        if 'close' in df.columns:
-            df = df[df['close'] > 0].copy()  # 0 제거
-            df = df[df['close'] > df['close'].median() * 0.01].copy()  # 중앙값의 1% 이하 제거 (이상치)
-
-        if len(df) < 100:
-            # 데이터가 너무 적으면 빈 리스트 반환
-            return []
-
-        # VWAP 설정 가져오기
-        vwap_config = self.config.get_section('vwap')
-        use_rolling = vwap_config.get('use_rolling', True)
-        rolling_window = vwap_config.get('rolling_window', 20)
-
-        # VWAP, ATR 계산
-        df = analyzer.calculate_vwap(df, use_rolling=use_rolling, rolling_window=rolling_window)
-        df = analyzer.calculate_atr(df)
-
-        # 시그널 생성
-        df = analyzer.generate_signals(df, **signal_config)
-
-        # 시뮬레이션
-        trades = []
-        position = None
-        executed_tiers = []
-
-        for idx in range(len(df)):
-            row = df.iloc[idx]
-            current_price = row['close']
-            signal = row['signal']
-
-            # 가격 검증: 0이거나 너무 작은 값 스킵
-            if current_price <= 0 or pd.isna(current_price):
-                continue
-
-            # 진입
-            if position is None and signal == 1:
-                position = {
-                    'entry_price': current_price,
-                    'quantity': 100,
-                    'highest_price': current_price,
-                    'trailing_active': False,
-                    'entry_idx': idx
-                }
-                executed_tiers = []
-
-            # 청산
-            elif position is not None:
-                # 최고가 갱신
-                if current_price > position['highest_price']:
-                    position['highest_price'] = current_price
-
-                # 수익률 계산
-                profit_pct = ((current_price - position['entry_price']) / position['entry_price']) * 100
-
-                # 청산 여부 판단
-                should_exit = False
-
-                # 1. Hard Stop (실거래와 동일)
-                stop_loss_pct = trailing_config.get('stop_loss_pct', getattr(analyzer, 'stop_loss_pct', 3.0))
-                if profit_pct <= -stop_loss_pct:
-                    should_exit = True
-
-                # 2. 부분 청산
-                elif partial_config['enabled'] and partial_config['tiers']:
-                    partial_should_exit, exit_qty, reason, new_executed = analyzer.check_partial_exit(
-                        current_price=current_price,
-                        avg_price=position['entry_price'],
-                        current_quantity=position['quantity'],
-                        exit_tiers=partial_config['tiers'],
-                        executed_tiers=executed_tiers
-                    )
-
-                    if partial_should_exit:
-                        # 안전장치: entry_price가 0이면 거래 기록 안 함
-                        if position['entry_price'] <= 0:
-                            continue
-
-                        profit = exit_qty * (current_price - position['entry_price'])
-                        profit_pct_calc = ((current_price - position['entry_price']) / position['entry_price']) * 100
-
-                        # 비정상적인 수익률 필터링 (-300% ~ +1000% 범위 밖)
-                        if -300 < profit_pct_calc < 1000:
-                            trades.append({
-                                'entry_price': position['entry_price'],
-                                'exit_price': current_price,
-                                'profit': profit,
-                                'profit_pct': profit_pct_calc,
-                                'holding_bars': idx - position['entry_idx']
-                            })
-
-                        position['quantity'] -= exit_qty
-                        executed_tiers = new_executed
-
-                        if position['quantity'] <= 0:
-                            position = None
-                            executed_tiers = []
-                        continue
-
-                # 3. VWAP 하향 돌파 (실거래와 동일)
-                elif signal == -1:
-                    should_exit = True
-
-                # 4. 트레일링 스탑 (실거래와 동일)
-                if not should_exit:
-                    atr = row.get('atr', None)
-                    trailing_should_exit, trailing_active, stop_price, trailing_reason = analyzer.check_trailing_stop(
-                        current_price=current_price,
-                        avg_price=position['entry_price'],
-                        highest_price=position['highest_price'],
-                        trailing_active=position['trailing_active'],
-                        atr=atr,
-                        **trailing_kwargs
-                    )
-
-                    position['trailing_active'] = trailing_active
-
-                    if trailing_should_exit:
-                        should_exit = True
-
-                # 전량 청산 실행
-                if should_exit:
-                    # 안전장치: entry_price가 0이면 거래 기록 안 함
-                    if position['entry_price'] <= 0:
-                        position = None
-                        executed_tiers = []
-                        continue
-
-                    profit = position['quantity'] * (current_price - position['entry_price'])
-                    profit_pct = ((current_price - position['entry_price']) / position['entry_price']) * 100
-
-                    # 비정상적인 수익률 필터링 (-300% ~ +1000% 범위 밖)
-                    if -300 < profit_pct < 1000:
-                        trades.append({
-                            'entry_price': position['entry_price'],
-                            'exit_price': current_price,
-                            'profit': profit,
-                            'profit_pct': profit_pct,
-                            'holding_bars': idx - position['entry_idx']
-                        })
-
-                    position = None
-                    executed_tiers = []
-
-        return trades
+    def _run_quick_simulation(self, df: pd.DataFrame, cache_key: Optional[str] = None) -> List[Dict]:
+        """
+        빠른 시뮬레이션 실행
+
+        🔧 2026-10-16: df.iloc 행 단위 루프 → QuickTradeSimulator 배열 시뮬레이션 (거래 목록 동일)
+          cache_key(종목코드)가 있으면 프로세스 공용 ValidationCache 경유
+          → 같은 봉이면 저장된 결과, 새 봉이면 마지막 마감 봉 체크포인트부터 이어서 계산
+        """
+        simulator = QuickTradeSimulator(self.config)
+        if cache_key is None:
+            return simulator.simulate(df)
+        return get_validation_cache().simulate(cache_key, df, simulator)
 
     def _wilson_lower_bound(self, wins: int, total: int, z: float = 1.96) -> float:
         """
@@ -213,6 +213,7 @@ class PreTradeValidatorV2(PreTradeValidator):
         # ========================
         # 기존 백테스트 검증
         # ========================
+        # 🔧 2026-10-16: validate_trade → 종목별 ValidationCache 경유 (같은 봉이면 시뮬레이션 생략)
         allowed, reason, stats = self.validate_trade(
             stock_code, stock_name, df,
             current_price, current_time, historical_data_30m
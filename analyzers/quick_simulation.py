@@ -0,0 +1,344 @@
+"""
+analyzers/quick_simulation.py — L6 사전 검증용 빠른 시뮬레이션 (배열 시뮬레이터 + 종목별 증분 캐시)
+
+기존 방식:
+  PreTradeValidator._run_quick_simulation → 종목 평가마다 전체 이력에 대해
+  df.copy() → VWAP/ATR → generate_signals → df.iloc[idx] 행 단위 매매 루프
+  → 오케스트레이터 레이어 중 가장 무겁고, 종목당 시간당 ~60회 처음부터 재계산
+
+QuickTradeSimulator (설정 1벌):
+  - 지표/시그널은 기존 analyzer 메서드 그대로 (열 단위 벡터 연산)
+  - 매매 루프는 close/signal/atr 배열 위에서 실행
+    포지션 없는 구간은 다음 매수 시그널(np.flatnonzero)로 바로 점프, 보유 구간만 스칼라 진행
+    청산 판정은 analyzer.check_partial_exit / check_trailing_stop 그대로 호출 → 거래 목록 동일
+  - 시뮬레이션 상태(_SimState)를 넘겨받아 중간 행부터 이어서 실행 가능
+
+ValidationCache (프로세스 공용, (종목, 설정 해시) 별 1항목):
+  - 입력 봉 다이제스트가 같으면 저장된 거래 목록 그대로 반환 (지표 계산 생략)
+  - 새 봉 / 진행 중 봉 갱신: 지표·시그널만 다시 계산하고, 마지막 마감 봉(끝에서 두 번째 행)까지의
+    close/signal/atr 가 이전과 같으면 그 시점 체크포인트에서 새 행만 시뮬레이션
+  - 앞부분이 달라짐(윈도우 이동, 데이터 정정, 이상치 필터 결과 변화) → 전체 재시뮬레이션
+  → 어느 경로든 결과는 전체 재계산과 동일
+
+사용:
+  simulator = QuickTradeSimulator(config)
+  trades = get_validation_cache().simulate("005930", df_5m, simulator)
+  trades = simulator.simulate(df_5m)               # 캐시 없이
+
+v1.0 2026-10-16: 최초 작성
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analyzers.entry_timing_analyzer import EntryTimingAnalyzer
+from utils.config_loader import ConfigLoader
+
+MIN_BARS = 100
+_DIGEST_COLUMNS = ('high', 'low', 'close', 'volume', 'date', 'dt')
+
+
+class _SimState:
+    """시뮬레이션 진행 상태 (포지션 + 실행된 부분청산 티어 + 거래 목록)"""
+    __slots__ = ('position', 'executed_tiers', 'trades')
+
+    def __init__(self, position: Optional[Dict] = None, executed_tiers: Optional[List[int]] = None,
+                 trades: Optional[List[Dict]] = None):
+        self.position = position
+        self.executed_tiers = executed_tiers or []
+        self.trades = trades or []
+
+    def copy(self) -> '_SimState':
+        return _SimState(dict(self.position) if self.position else None,
+                         list(self.executed_tiers), list(self.trades))
+
+
+class QuickTradeSimulator:
+    """
+    PreTradeValidator 빠른 시뮬레이션 (설정 1벌)
+
+    Args:
+        config: 전략 설정 (analyzer / filters / trailing / partial_exit / vwap 섹션 사용)
+    """
+
+    def __init__(self, config: ConfigLoader):
+        analyzer_config = config.get_analyzer_config()
+        self.analyzer = EntryTimingAnalyzer(**analyzer_config)
+        self.signal_config = config.get_signal_generation_config()
+        trailing_config = config.get_trailing_config()
+        self.trailing_kwargs = {
+            'use_atr_based': trailing_config.get('use_atr_based', False),
+            'atr_multiplier': trailing_config.get('atr_multiplier', 1.5),
+            'use_profit_tier': trailing_config.get('use_profit_tier', False),
+            'profit_tier_threshold': trailing_config.get('profit_tier_threshold', 3.0)
+        }
+        self.stop_loss_pct = trailing_config.get('stop_loss_pct', getattr(self.analyzer, 'stop_loss_pct', 3.0))
+        self.partial_config = config.get_partial_exit_config()
+        vwap_config = config.get_section('vwap')
+        self.use_rolling = vwap_config.get('use_rolling', True)
+        self.rolling_window = vwap_config.get('rolling_window', 20)
+
+        payload = {
+            'analyzer': analyzer_config, 'signal': self.signal_config, 'trailing': trailing_config,
+            'partial': self.partial_config, 'vwap': [self.use_rolling, self.rolling_window],
+        }
+        self.config_hash = hashlib.sha1(
+            json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+    def prepare(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """이상치 제거 + VWAP/ATR/시그널 (기존 _run_quick_simulation 전처리와 동일). 100봉 미만이면 None."""
+        df = df.copy()
+
+        # 데이터 검증: close 가격이 0이거나 너무 작은 경우 필터링
+        if 'close' in df.columns:
+            df = df[df['close'] > 0].copy()
+            df = df[df['close'] > df['close'].median() * 0.01].copy()
+
+        if len(df) < MIN_BARS:
+            return None
+
+        df = self.analyzer.calculate_vwap(df, use_rolling=self.use_rolling, rolling_window=self.rolling_window)
+        df = self.analyzer.calculate_atr(df)
+        return self.analyzer.generate_signals(df, **self.signal_config)
+
+    @staticmethod
+    def arrays(prepared: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """시뮬레이션 입력 배열 (close, signal, atr)."""
+        close = prepared['close'].to_numpy(dtype=float)
+        signal = prepared['signal'].to_numpy(dtype=np.int64)
+        atr = prepared['atr'].to_numpy(dtype=float)
+        return close, signal, atr
+
+    def simulate(self, df: pd.DataFrame) -> List[Dict]:
+        """전체 이력 시뮬레이션 → 거래 목록."""
+        prepared = self.prepare(df)
+        if prepared is None:
+            return []
+        close, signal, atr = self.arrays(prepared)
+        return self.run(close, signal, atr, _SimState(), 0, len(close)).trades
+
+    def run(self, close: np.ndarray, signal: np.ndarray, atr: np.ndarray, state: _SimState,
+            start: int, stop: int) -> _SimState:
+        """
+        [start, stop) 행을 state 에 이어서 시뮬레이션 (state 를 직접 갱신해서 반환).
+
+        청산 우선순위는 기존 루프와 동일:
+          하드 손절 → 부분 청산(활성 시, 이 경우 VWAP 하향 돌파 청산은 보지 않음) → VWAP 하향 돌파 → 트레일링
+        """
+        analyzer = self.analyzer
+        partial_on = bool(self.partial_config['enabled'] and self.partial_config['tiers'])
+        tiers = self.partial_config['tiers']
+        stop_loss_pct = self.stop_loss_pct
+        trailing_kwargs = self.trailing_kwargs
+
+        entries = np.flatnonzero(signal[start:stop] == 1) + start
+        prices = close.tolist()
+        position, executed_tiers, trades = state.position, state.executed_tiers, state.trades
+
+        idx = start
+        while idx < stop:
+            # 진입 — 포지션이 없으면 다음 매수 시그널까지 건너뜀
+            if position is None:
+                k = int(np.searchsorted(entries, idx))
+                if k == len(entries):
+                    break
+                idx = int(entries[k])
+                position = {
+                    'entry_price': prices[idx],
+                    'quantity': 100,
+                    'highest_price': prices[idx],
+                    'trailing_active': False,
+                    'entry_idx': idx
+                }
+                executed_tiers = []
+                idx += 1
+                continue
+
+            current_price = prices[idx]
+            entry_price = position['entry_price']
+            if current_price > position['highest_price']:
+                position['highest_price'] = current_price
+
+            profit_pct = ((current_price - entry_price) / entry_price) * 100
+            should_exit = False
+
+            # 1. Hard Stop
+            if profit_pct <= -stop_loss_pct:
+                should_exit = True
+
+            # 2. 부분 청산
+            elif partial_on:
+                partial_should_exit, exit_qty, _, new_executed = analyzer.check_partial_exit(
+                    current_price=current_price,
+                    avg_price=entry_price,
+                    current_quantity=position['quantity'],
+                    exit_tiers=tiers,
+                    executed_tiers=executed_tiers
+                )
+                if partial_should_exit:
+                    self._record(trades, position, current_price, exit_qty, idx)
+                    position['quantity'] -= exit_qty
+                    executed_tiers = new_executed
+                    if position['quantity'] <= 0:
+                        position = None
+                        executed_tiers = []
+                    idx += 1
+                    continue
+
+            # 3. VWAP 하향 돌파
+            elif signal[idx] == -1:
+                should_exit = True
+
+            # 4. 트레일링 스탑
+            if not should_exit:
+                trailing_should_exit, trailing_active, _, _ = analyzer.check_trailing_stop(
+                    current_price=current_price,
+                    avg_price=entry_price,
+                    highest_price=position['highest_price'],
+                    trailing_active=position['trailing_active'],
+                    atr=float(atr[idx]),
+                    **trailing_kwargs
+                )
+                position['trailing_active'] = trailing_active
+                should_exit = trailing_should_exit
+
+            # 전량 청산
+            if should_exit:
+                self._record(trades, position, current_price, position['quantity'], idx)
+                position = None
+                executed_tiers = []
+            idx += 1
+
+        state.position, state.executed_tiers, state.trades = position, executed_tiers, trades
+        return state
+
+    @staticmethod
+    def _record(trades: List[Dict], position: Dict, exit_price: float, quantity: int, idx: int) -> None:
+        entry_price = position['entry_price']
+        profit_pct = ((exit_price - entry_price) / entry_price) * 100
+        # 비정상적인 수익률 필터링 (-300% ~ +1000% 범위 밖)
+        if -300 < profit_pct < 1000:
+            trades.append({
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'profit': quantity * (exit_price - entry_price),
+                'profit_pct': profit_pct,
+                'holding_bars': idx - position['entry_idx']
+            })
+
+
+class _CacheEntry:
+    __slots__ = ('digest', 'close', 'signal', 'atr', 'checkpoint', 'trades')
+
+    def __init__(self, digest, close, signal, atr, checkpoint, trades):
+        self.digest = digest
+        self.close = close
+        self.signal = signal
+        self.atr = atr
+        self.checkpoint = checkpoint     # 마지막 행 직전까지 진행한 _SimState
+        self.trades = trades
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """시뮬레이션 입력 컬럼(고가/저가/종가/거래량/일자) 다이제스트."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(len(df)).encode())
+    for col in _DIGEST_COLUMNS:
+        if col not in df.columns:
+            continue
+        h.update(col.encode())
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            h.update(np.ascontiguousarray(series.to_numpy(dtype=float)).tobytes())
+        else:
+            h.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+class ValidationCache:
+    """
+    (종목, 설정 해시) 별 시뮬레이션 결과 캐시 (스레드 안전)
+
+    Args:
+        max_entries: 보관할 항목 수 (초과 시 오래 안 쓴 것부터 제거)
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[Hashable, str], _CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'extends': 0, 'rebuilds': 0}
+
+    def simulate(self, symbol: Hashable, df: pd.DataFrame, simulator: QuickTradeSimulator) -> List[Dict]:
+        """simulator.simulate(df) 와 같은 거래 목록 (가능하면 캐시/체크포인트 재사용)."""
+        if df is None or len(df) == 0:
+            return []
+        key = (symbol, simulator.config_hash)
+        digest = frame_digest(df)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.digest == digest:
+                    self.stats['hits'] += 1
+                    return list(entry.trades)
+
+        # 지표/시뮬레이션은 잠금 밖에서 (항목은 통째로 교체)
+        prepared = simulator.prepare(df)
+        if prepared is None:
+            return []
+        close, signal, atr = simulator.arrays(prepared)
+        n = len(close)
+
+        state = None
+        if entry is not None:
+            m = len(entry.close) - 1
+            if (0 < m < n
+                    and np.array_equal(close[:m], entry.close[:m])
+                    and np.array_equal(signal[:m], entry.signal[:m])
+                    and np.array_equal(atr[:m], entry.atr[:m], equal_nan=True)):
+                state = simulator.run(close, signal, atr, entry.checkpoint.copy(), m, n - 1)
+        extended = state is not None
+        if state is None:
+            state = simulator.run(close, signal, atr, _SimState(), 0, n - 1)
+        checkpoint = state.copy()
+        trades = simulator.run(close, signal, atr, state, n - 1, n).trades
+
+        with self._lock:
+            self.stats['extends' if extended else 'rebuilds'] += 1
+            self._entries[key] = _CacheEntry(digest, close, signal, atr, checkpoint, trades)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return list(trades)
+
+    def invalidate(self, symbol: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == symbol]:
+                    del self._entries[key]
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'entries': len(self._entries), **self.stats}
+
+
+_cache: Optional[ValidationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_validation_cache(**kwargs) -> ValidationCache:
+    """프로세스 공용 ValidationCache (첫 호출의 kwargs 로 생성)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ValidationCache(**kwargs)
+    return _cache
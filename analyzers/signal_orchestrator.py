@@ -31,6 +31,7 @@ from analyzers.pre_trade_validator_v2 import PreTradeValidatorV2  # noqa: E402
 
 # Confidence Aggregator
 from trading.confidence_aggregator import ConfidenceAggregator  # noqa: E402
+from core import event_journal  # noqa: E402
 
 from rich.console import Console  # noqa: E402
 import logging  # noqa: E402
@@ -446,6 +447,7 @@ class SignalOrchestrator:
             msg = f"❌ REJECT {stock_code} | PID:{os.getpid()} | L0 | {l0_reason}"
             console.print(f"[red]{msg}[/red]")
             signal_logger.info(msg)
+            event_journal.emit('REJECT', stock_code=stock_code, level='L0', reason=l0_reason)
             return result
 
         # Phase 4: Market Regime 업데이트 및 가중치 동적 조정
@@ -462,6 +464,7 @@ class SignalOrchestrator:
             result['rejection_level'] = 'L1'
             result['rejection_reason'] = l1_reason
             logger.debug(f"[REJECT_L1] {stock_code} | {l1_reason}")
+            event_journal.emit('REJECT', stock_code=stock_code, level='L1', reason=l1_reason)
             return result
 
         # L3-L6: Confidence-based 필터링
@@ -476,6 +479,7 @@ class SignalOrchestrator:
             result['rejection_level'] = 'L3'
             result['rejection_reason'] = l3_result.reason
             logger.debug(f"[REJECT_L3] {stock_code} | {l3_result.reason[:60]}")
+            event_journal.emit('REJECT', stock_code=stock_code, level='L3', reason=l3_result.reason)
             return result
 
         # L4: Liquidity Shift
@@ -512,6 +516,7 @@ class SignalOrchestrator:
             result['rejection_level'] = 'L6'
             result['rejection_reason'] = l6_result.reason
             logger.debug(f"[REJECT_L6] {stock_code} | {l6_result.reason[:60]}")
+            event_journal.emit('REJECT', stock_code=stock_code, level='L6', reason=l6_result.reason)
             return result
 
         # Confidence 결합
@@ -533,6 +538,7 @@ class SignalOrchestrator:
             result['rejection_reason'] = aggregation_reason
             msg = f"[REJECT_CONF] {stock_code} | {aggregation_reason}"
             logger.debug(msg)
+            event_journal.emit('REJECT', stock_code=stock_code, level='CONFIDENCE', reason=aggregation_reason)
             return result
 
         # Phase 2: Multi-Alpha Engine 실행
@@ -557,6 +563,7 @@ class SignalOrchestrator:
             result['rejection_level'] = 'ALPHA'
             result['rejection_reason'] = f"Multi-Alpha 점수 부족 ({aggregate_score:+.2f} <= {ALPHA_THRESHOLD})"
             logger.debug(f"[REJECT_ALPHA] {stock_code} | score={aggregate_score:+.2f}")
+            event_journal.emit('REJECT', stock_code=stock_code, level='ALPHA', reason=result['rejection_reason'])
             return result
 
         # 모든 레벨 통과!
@@ -572,6 +579,8 @@ class SignalOrchestrator:
         msg = f"✅ ACCEPT {stock_code} @{current_price:.0f}원 | PID:{os.getpid()} | conf={final_confidence:.2f} alpha={aggregate_score:+.2f} pos_mult={position_multiplier:.2f}"
         console.print(f"[green]{msg}[/green]")
         signal_logger.info(msg)
+        event_journal.emit('ACCEPT', stock_code=stock_code, price=current_price, conf=final_confidence,
+                           alpha=aggregate_score, pos_mult=position_multiplier)
 
         return result
 
@@ -13,7 +13,8 @@ from .smc_utils import (
     SwingPoint,
     LiquiditySweep,
     find_swing_points,
-    detect_liquidity_sweep
+    detect_liquidity_sweep,
+    IncrementalSwingDetector
 )
 
 from .smc_structure import (
@@ -36,6 +37,7 @@ __all__ = [
     'LiquiditySweep',
     'find_swing_points',
     'detect_liquidity_sweep',
+    'IncrementalSwingDetector',
     # Structure
     'MarketTrend',
     'StructureBreak',
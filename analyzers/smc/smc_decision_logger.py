@@ -14,6 +14,8 @@ import logging
 from datetime import datetime
 from collections import defaultdict
 
+from core import event_journal
+
 
 class SMCDecisionLogger:
     def __init__(self):
@@ -42,6 +44,8 @@ class SMCDecisionLogger:
             f'[CHOCH] {code} | {direction} | level={level:.0f} | '
             f'wick={wick:.0f} | close={close:.0f} | penetration={penetration_pct:.2f}%'
         )
+        event_journal.emit('CHOCH', stock_code=code, direction=direction, level=level,
+                           wick=wick, close=close, penetration=penetration_pct)
 
     def log_sweep(self, code: str, sweep_type: str, dist_pct: float, reason: str = ''):
         if sweep_type == 'penetration':
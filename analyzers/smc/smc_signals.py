@@ -399,7 +399,8 @@ class SMCStrategy:
         df_htf: pd.DataFrame,
         choch: StructureBreakEvent,
         liquidity_sweep,
-        debug: bool = True
+        debug: bool = True,
+        symbol: str = ''  # 🔧 2026-10-16: 종목별 증분 스윙 탐지 키
     ) -> Tuple[bool, str, Dict]:
         """
         🔧 2026-02-06: SMC 진입 프리필터
@@ -415,6 +416,7 @@ class SMCStrategy:
             choch: CHoCH 이벤트
             liquidity_sweep: 유동성 스윕 (있으면)
             debug: 디버그 로그 출력
+            symbol: 종목코드 (HTF 증분 스윙 탐지 키)
 
         Returns:
             (passed, reason, details)
@@ -437,7 +439,7 @@ class SMCStrategy:
             try:
                 if df_htf is not None and len(df_htf) >= 20:
                     mtf_direction = 'long' if choch.direction == 'bullish' else 'short'
-                    mtf_allowed, mtf_reason, mtf_details = self.check_mtf_bias(df_htf, mtf_direction)
+                    mtf_allowed, mtf_reason, mtf_details = self.check_mtf_bias(df_htf, mtf_direction, symbol=symbol)
 
                     is_uptrend = mtf_details.get('is_uptrend', False)
                     is_downtrend = mtf_details.get('is_downtrend', False)
@@ -510,7 +512,8 @@ class SMCStrategy:
     def check_mtf_bias(
         self,
         df_htf: pd.DataFrame,
-        direction: str = 'long'
+        direction: str = 'long',
+        symbol: str = ''  # 🔧 2026-10-16: 종목별 증분 스윙 탐지 키
     ) -> Tuple[bool, str, Dict]:
         """
         🔧 2026-01-29: MTF (Multi-Timeframe) Bias 필터
@@ -527,6 +530,7 @@ class SMCStrategy:
         Args:
             df_htf: 상위 타임프레임 OHLCV (30분봉)
             direction: 진입 방향 ('long' or 'short')
+            symbol: 종목코드 (5분봉과 키가 겹치지 않도록 '@htf' 접미사)
 
         Returns:
             (allowed, reason, details)
@@ -543,7 +547,9 @@ class SMCStrategy:
             df.columns = [c.lower() for c in df.columns]
 
             # 30분봉 구조 분석
-            htf_structure = self.structure_analyzer.analyze_structure(df)
+            htf_structure = self.structure_analyzer.analyze_structure(
+                df, symbol=f"{symbol}@htf" if symbol else ''
+            )
             htf_trend = htf_structure.trend.value
 
             details['htf_trend'] = htf_trend
@@ -717,7 +723,7 @@ class SMCStrategy:
         df.columns = [c.lower() for c in df.columns]
 
         # 1. 시장 구조 분석
-        structure = self.structure_analyzer.analyze_structure(df)
+        structure = self.structure_analyzer.analyze_structure(df, symbol=symbol)
         details['structure'] = {
             'trend': structure.trend.value,
             'swing_count': len(structure.swing_points),
@@ -795,7 +801,8 @@ class SMCStrategy:
                 df_htf=df_htf,
                 choch=choch,
                 liquidity_sweep=liquidity_sweep,
-                debug=debug
+                debug=debug,
+                symbol=symbol
             )
             details['prefilter'] = pf_details
             if not pf_passed:
@@ -910,7 +917,7 @@ class SMCStrategy:
         if self.mtf_bias_enabled and df_htf is not None:
             # CHoCH 방향에 따른 MTF 체크
             mtf_direction = 'long' if choch.direction == 'bullish' else 'short'
-            mtf_allowed, mtf_reason, mtf_details = self.check_mtf_bias(df_htf, mtf_direction)
+            mtf_allowed, mtf_reason, mtf_details = self.check_mtf_bias(df_htf, mtf_direction, symbol=symbol)
 
             details['mtf_bias'] = {
                 'allowed': mtf_allowed,
@@ -1313,7 +1320,8 @@ class SMCStrategy:
         self,
         df: pd.DataFrame,
         entry_direction: str = 'long',
-        debug: bool = True
+        debug: bool = True,
+        symbol: str = ''  # 🔧 2026-10-16: 종목별 증분 스윙 탐지 키
     ) -> Tuple[bool, str, Dict]:
         """
         SMC 청산 신호 체크
@@ -1322,6 +1330,7 @@ class SMCStrategy:
             df: OHLCV DataFrame
             entry_direction: 진입 방향 ('long' | 'short')
             debug: 디버그 로그 출력
+            symbol: 종목코드 (전달 시 증분 스윙 탐지)
 
         Returns:
             (should_exit, reason, details)
@@ -1336,7 +1345,7 @@ class SMCStrategy:
             return False, "SMC: 데이터 부족", details
 
         # 시장 구조 분석
-        structure = self.structure_analyzer.analyze_structure(df)
+        structure = self.structure_analyzer.analyze_structure(df, symbol=symbol)
         details['structure'] = {
             'trend': structure.trend.value,
             'swing_count': len(structure.swing_points)
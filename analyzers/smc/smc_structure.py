@@ -11,7 +11,7 @@ from typing import List, Optional, Dict
 from enum import Enum
 import pandas as pd
 
-from .smc_utils import SwingPoint, find_swing_points
+from .smc_utils import SwingPoint, find_swing_points, IncrementalSwingDetector
 from .smc_decision_logger import get_smc_logger
 
 
@@ -81,6 +81,12 @@ class SMCStructureAnalyzer:
         self.min_swing_size_pct = min_swing_size_pct
         self.bos_confirm_candles = bos_confirm_candles
 
+        # 종목별 증분 스윙 탐지 (analyze_structure 에 symbol 전달 시)
+        self._swing_detector = IncrementalSwingDetector(
+            lookback=swing_lookback,
+            min_swing_size_pct=min_swing_size_pct
+        )
+
         # 캐시 (성능 최적화)
         self._cache = {
             'last_df_len': 0,
@@ -88,12 +94,13 @@ class SMCStructureAnalyzer:
             'structure': None
         }
 
-    def analyze_structure(self, df: pd.DataFrame) -> MarketStructure:
+    def analyze_structure(self, df: pd.DataFrame, symbol: str = '') -> MarketStructure:
         """
         시장 구조 분석 (HH/HL/LH/LL 분류)
 
         Args:
             df: OHLCV DataFrame
+            symbol: 종목 키 — 전달 시 종목별 증분 스윙 탐지 (타임프레임이 다르면 키도 달리)
 
         Returns:
             MarketStructure 상태
@@ -105,11 +112,14 @@ class SMCStructureAnalyzer:
             )
 
         # 스윙 포인트 탐지
-        swing_points = find_swing_points(
-            df,
-            lookback=self.swing_lookback,
-            min_swing_size_pct=self.min_swing_size_pct
-        )
+        if symbol:
+            swing_points = self._swing_detector.swings(symbol, df)
+        else:
+            swing_points = find_swing_points(
+                df,
+                lookback=self.swing_lookback,
+                min_swing_size_pct=self.min_swing_size_pct
+            )
 
         if len(swing_points) < 3:
             return MarketStructure(
@@ -6,7 +6,7 @@ SMC 유틸리티 함수
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
 import logging
@@ -41,6 +41,76 @@ class LiquiditySweep:
         return f"LiquiditySweep({self.direction}@{self.swept_level:.0f}, type={self.sweep_type})"
 
 
+def _swing_masks(
+    high_values: np.ndarray,
+    low_values: np.ndarray,
+    lookback: int,
+    min_swing_size_pct: float = 0.0
+) -> tuple:
+    """
+    find_swing_points 판정 벡터화 (슬라이딩 윈도우 max/min)
+
+    - 후보: lookback <= i < end_idx (end_idx = 마지막 미확정 봉)
+    - 좌측 lookback 봉, 우측은 end_idx 이전 확정봉만 (끝부분은 우측 비교 축소)
+    - 엄격 비교 (동일 가격이면 스윙 아님), NaN 이웃은 비교에서 제외
+
+    Returns:
+        (is_high, is_low) — 길이 end_idx - lookback 의 bool 배열 (i = lookback + k)
+    """
+    end_idx = len(high_values) - 1
+    count = end_idx - lookback
+    if count <= 0:
+        empty = np.zeros(0, dtype=bool)
+        return empty, empty
+
+    h = np.asarray(high_values[:end_idx], dtype=np.float64)
+    l = np.asarray(low_values[:end_idx], dtype=np.float64)
+    cur_h = h[lookback:]
+    cur_l = l[lookback:]
+
+    if lookback > 0:
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        pad_h = np.full(lookback, -np.inf)
+        pad_l = np.full(lookback, np.inf)
+        hn = np.concatenate([np.where(np.isnan(h), -np.inf, h), pad_h])
+        ln = np.concatenate([np.where(np.isnan(l), np.inf, l), pad_l])
+
+        win_h = sliding_window_view(hn, lookback)
+        win_l = sliding_window_view(ln, lookback)
+        # 좌측: [i-lookback, i) → 윈도우 i-lookback / 우측: [i+1, i+lookback] → 윈도우 i+1 (패딩으로 축소 처리)
+        neighbor_h = np.maximum(win_h[:count].max(axis=1), win_h[lookback + 1:end_idx + 1].max(axis=1))
+        neighbor_l = np.minimum(win_l[:count].min(axis=1), win_l[lookback + 1:end_idx + 1].min(axis=1))
+    else:
+        neighbor_h = np.full(count, -np.inf)
+        neighbor_l = np.full(count, np.inf)
+
+    # NaN 현재가는 어떤 비교에도 걸리지 않으므로 스윙으로 판정 (기존 루프 동작 유지)
+    is_high = np.isnan(cur_h) | (cur_h > neighbor_h)
+    is_low = np.isnan(cur_l) | (cur_l < neighbor_l)
+
+    # 최소 크기 필터
+    if min_swing_size_pct > 0:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_price = (cur_h + cur_l) / 2
+            swing_size = np.abs(cur_h - cur_l) / avg_price * 100
+        too_small = swing_size < min_swing_size_pct
+        is_high &= ~too_small
+        is_low &= ~too_small
+
+    return is_high, is_low
+
+
+def _ohlc_column(df: pd.DataFrame, name: str):
+    """대소문자 무관 컬럼 조회 (df.copy() 없이)"""
+    if name in df.columns:
+        return df[name]
+    for col in df.columns:
+        if str(col).lower() == name:
+            return df[col]
+    return None
+
+
 def find_swing_points(
     df: pd.DataFrame,
     lookback: int = 5,
@@ -61,86 +131,181 @@ def find_swing_points(
         - shift(-1) 미사용 (실시간 호환)
         - 마지막 봉은 미확정으로 제외
         - 과거 데이터만 참조
+        - 슬라이딩 윈도우 max/min 벡터화 (봉별 Python 루프 없음)
     """
     if df is None or len(df) < lookback * 2 + 1:
         return []
 
-    # 컬럼명 소문자 통일
-    df = df.copy()
-    df.columns = [c.lower() for c in df.columns]
-
-    if 'high' not in df.columns or 'low' not in df.columns:
+    high_col = _ohlc_column(df, 'high')
+    low_col = _ohlc_column(df, 'low')
+    if high_col is None or low_col is None:
         return []
 
+    high_values = high_col.values
+    low_values = low_col.values
+
+    is_high, is_low = _swing_masks(high_values, low_values, lookback, min_swing_size_pct)
+
     swings: List[SwingPoint] = []
-    high_values = df['high'].values
-    low_values = df['low'].values
-
-    # 마지막 봉은 미확정이므로 제외
-    end_idx = len(df) - 1
-
-    for i in range(lookback, end_idx):
-        # 스윙 고점 체크: 좌우 lookback개 봉보다 높아야 함
-        is_swing_high = True
-        current_high = high_values[i]
-
-        for j in range(1, lookback + 1):
-            # 좌측 비교
-            if i - j >= 0 and current_high <= high_values[i - j]:
-                is_swing_high = False
-                break
-            # 우측 비교 (확정된 봉만, 마지막 봉 제외)
-            if i + j < end_idx and current_high <= high_values[i + j]:
-                is_swing_high = False
-                break
-
-        # 스윙 저점 체크: 좌우 lookback개 봉보다 낮아야 함
-        is_swing_low = True
-        current_low = low_values[i]
-
-        for j in range(1, lookback + 1):
-            # 좌측 비교
-            if i - j >= 0 and current_low >= low_values[i - j]:
-                is_swing_low = False
-                break
-            # 우측 비교 (확정된 봉만)
-            if i + j < end_idx and current_low >= low_values[i + j]:
-                is_swing_low = False
-                break
-
-        # 최소 크기 필터
-        if min_swing_size_pct > 0:
-            avg_price = (current_high + current_low) / 2
-            swing_size = abs(current_high - current_low) / avg_price * 100
-            if swing_size < min_swing_size_pct:
-                is_swing_high = False
-                is_swing_low = False
-
-        # 스윙 포인트 추가
-        timestamp = df.index[i] if isinstance(df.index, pd.DatetimeIndex) else None
-
-        if is_swing_high:
+    is_dt_index = isinstance(df.index, pd.DatetimeIndex)
+
+    # 같은 봉이 고점/저점 동시 해당 시 high → low 순 (기존 append 순서)
+    for k in np.flatnonzero(is_high | is_low):
+        i = int(k) + lookback
+        timestamp = df.index[i] if is_dt_index else None
+
+        if is_high[k]:
             swings.append(SwingPoint(
                 index=i,
-                price=current_high,
+                price=high_values[i],
                 type='high',
                 timestamp=timestamp
             ))
 
-        if is_swing_low:
+        if is_low[k]:
             swings.append(SwingPoint(
                 index=i,
-                price=current_low,
+                price=low_values[i],
                 type='low',
                 timestamp=timestamp
             ))
 
-    # 시간순 정렬
-    swings.sort(key=lambda x: x.index)
-
     return swings
 
 
+class _SwingState:
+    """종목별 확정 스윙 캐시 (봉 timestamp 기준)"""
+    __slots__ = ('first_ts', 'last_ts', 'ref_index', 'ref_high', 'ref_low', 'swings')
+
+    def __init__(self):
+        self.first_ts: Optional[pd.Timestamp] = None   # 캐시가 유효한 첫 후보 봉
+        self.last_ts: Optional[pd.Timestamp] = None    # 마지막 확정 판정 봉
+        self.ref_index = None                          # last_ts 주변 2*lookback+1 봉 지문
+        self.ref_high = None
+        self.ref_low = None
+        self.swings: list = []                         # (timestamp, type, price), 시간순
+
+
+class IncrementalSwingDetector:
+    """
+    종목별 증분 스윙 탐지기 (find_swing_points 와 동일 결과)
+
+    좌우 lookback 봉이 모두 확정된 봉의 판정은 이후 봉이 추가돼도 바뀌지 않으므로
+    봉 timestamp 로 캐시하고, 호출마다 새로 확정 가능해진 봉 + 끝부분 잠정 구간
+    (우측 비교 축소)만 다시 판정한다 → O(신규 봉 + lookback).
+
+    - 키는 종목(+타임프레임) 문자열, 캐시는 행 위치가 아닌 봉 timestamp 기준이라
+      봉 저장소가 가득 차 앞 봉이 잘려나가는 슬라이딩 윈도우에서도 결과가 같다
+      (SwingPoint.index 는 호출 시점 df 의 위치로 다시 매핑)
+    - 마지막 확정 봉 주변 2*lookback+1 봉의 고가/저가를 지문으로 보관 → 새 df 에서
+      달라졌거나(재적재/다른 데이터) 창이 과거 쪽으로 늘어나면 전체 재계산
+    - DatetimeIndex 가 아니거나 정렬/중복이 깨진 df 는 find_swing_points 로 폴백
+
+    사용:
+        det = IncrementalSwingDetector(lookback=5)
+        swings = det.swings('005930', df_5m)     # 봉 갱신마다 호출
+    """
+
+    def __init__(self, lookback: int = 5, min_swing_size_pct: float = 0.0, max_symbols: int = 512):
+        self.lookback = lookback
+        self.min_swing_size_pct = min_swing_size_pct
+        self.max_symbols = max_symbols
+        self._states: Dict[str, _SwingState] = {}
+        self.stats = {'full': 0, 'incremental': 0}
+
+    def reset(self, key: Optional[str] = None) -> None:
+        if key is None:
+            self._states.clear()
+        else:
+            self._states.pop(key, None)
+
+    def _resume_position(self, state: _SwingState, index: pd.DatetimeIndex,
+                         highs: np.ndarray, lows: np.ndarray) -> int:
+        """캐시 재사용 가능하면 last_ts 의 현재 위치, 아니면 -1"""
+        lb = self.lookback
+        n = len(index)
+        if state.last_ts is None or index[lb] < state.first_ts:
+            return -1
+        pos = int(index.searchsorted(state.last_ts))
+        if pos >= n or index[pos] != state.last_ts or pos < lb or pos + lb >= n - 1:
+            return -1
+        window = slice(pos - lb, pos + lb + 1)
+        if not (index[window].equals(state.ref_index)
+                and np.array_equal(highs[window], state.ref_high, equal_nan=True)
+                and np.array_equal(lows[window], state.ref_low, equal_nan=True)):
+            return -1
+        return pos
+
+    def swings(self, key: str, df: pd.DataFrame) -> List[SwingPoint]:
+        """
+        key 종목의 현재 df 스윙 포인트 (find_swing_points(df, lookback, min_swing_size_pct) 와 동일)
+        """
+        lb = self.lookback
+        if df is None or len(df) < lb * 2 + 1:
+            return []
+        index = df.index
+        if not isinstance(index, pd.DatetimeIndex) or not index.is_monotonic_increasing or not index.is_unique:
+            return find_swing_points(df, lb, self.min_swing_size_pct)
+
+        high_col = _ohlc_column(df, 'high')
+        low_col = _ohlc_column(df, 'low')
+        if high_col is None or low_col is None:
+            return []
+        highs = np.asarray(high_col.values, dtype=np.float64)
+        lows = np.asarray(low_col.values, dtype=np.float64)
+
+        n = len(df)
+        end_idx = n - 1            # 마지막 봉은 미확정
+        decided_end = end_idx - lb  # 이 위치 미만 후보는 우측 lookback 봉까지 확정
+
+        state = self._states.pop(key, None)
+        pos = self._resume_position(state, index, highs, lows) if state is not None else -1
+        if pos < 0:
+            state = _SwingState()
+            start = lb
+            self.stats['full'] += 1
+        else:
+            start = pos + 1
+            first = index[lb]
+            state.swings = [sw for sw in state.swings if sw[0] >= first]
+            self.stats['incremental'] += 1
+        state.first_ts = index[lb]
+
+        # 재판정 구간 [start, end_idx): 좌측 lookback 봉부터 끝까지 잘라 벡터 판정
+        is_high, is_low = _swing_masks(highs[start - lb:], lows[start - lb:], lb, self.min_swing_size_pct)
+
+        result: List[SwingPoint] = []
+        if state.swings:
+            positions = index.get_indexer([sw[0] for sw in state.swings])
+            for i, (ts, kind, price) in zip(positions, state.swings):
+                result.append(SwingPoint(index=int(i), price=price, type=kind, timestamp=ts))
+
+        for k in np.flatnonzero(is_high | is_low):
+            i = int(k) + start
+            ts = index[i]
+            if is_high[k]:
+                result.append(SwingPoint(index=i, price=high_col.values[i], type='high', timestamp=ts))
+                if i < decided_end:
+                    state.swings.append((ts, 'high', high_col.values[i]))
+            if is_low[k]:
+                result.append(SwingPoint(index=i, price=low_col.values[i], type='low', timestamp=ts))
+                if i < decided_end:
+                    state.swings.append((ts, 'low', low_col.values[i]))
+
+        last = decided_end - 1
+        if last >= lb:
+            window = slice(last - lb, last + lb + 1)
+            state.last_ts = index[last]
+            state.ref_index = index[window]
+            state.ref_high = highs[window].copy()
+            state.ref_low = lows[window].copy()
+            self._states[key] = state      # 재삽입 → 최근 사용 순서 유지
+            while len(self._states) > self.max_symbols:
+                self._states.pop(next(iter(self._states)))
+
+        return result
+
+
 def detect_liquidity_sweep(
     df: pd.DataFrame,
     swing_points: List[SwingPoint],
@@ -11,11 +11,12 @@ LazyBear Squeeze Momentum Indicator (1:1 Python 구현)
 """
 
 import pandas as pd
-import numpy as np
 from typing import Tuple, Dict, Optional, List
 from dataclasses import dataclass
 from rich.console import Console
 
+from utils.linreg import rolling_linreg
+
 console = Console()
 
 
@@ -92,32 +93,9 @@ class SqueezeMomentumLazyBear:
         """
         Linear Regression (Pine Script linreg 함수 동일)
 
-        y = linreg(source, length, 0) 계산
+        y = linreg(source, length, 0) 계산 (누적합 기반 O(n) 커널)
         """
-        def calc_linreg(window):
-            if len(window) < length:
-                return np.nan
-
-            y = window.values
-            x = np.arange(length)
-
-            # 선형 회귀 계수 계산
-            x_mean = x.mean()
-            y_mean = y.mean()
-
-            numerator = np.sum((x - x_mean) * (y - y_mean))
-            denominator = np.sum((x - x_mean) ** 2)
-
-            if denominator == 0:
-                return y_mean
-
-            slope = numerator / denominator
-            intercept = y_mean - slope * x_mean
-
-            # offset=0이므로 마지막 값 반환
-            return intercept + slope * (length - 1)
-
-        return series.rolling(window=length).apply(calc_linreg, raw=False)
+        return rolling_linreg(series, length)
 
     def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -1,6 +1,6 @@
 """
 Trading Dashboard API Server
-- Reads live data from kiwoom_trading system files
+- Reads live data from kiwoom_trading system files (shared-memory state bus first, core/state_bus.py)
 - Exposes REST endpoints for the Next.js dashboard
 - Run: uvicorn api_server:app --host 0.0.0.0 --port 8000
 """
@@ -10,6 +10,7 @@ import json
 import re
 import asyncio
 import logging
+import threading
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Optional
@@ -19,6 +20,8 @@ import pandas as pd
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
+from utils.log_tail import LogIndex
+
 # Add kiwoom_trading to path for internal modules
 sys.path.insert(0, str(Path('/home/greatbps/projects/kiwoom_trading')))
 try:
@@ -47,10 +50,11 @@ _KIWOOM_TTL = 30                # seconds (candidates/stats 등 일반 TTL)
 
 
 def _kiwoom_api():
-    """KiwoomAPI 싱글턴 (프로세스 내 재사용)."""
+    """KiwoomAPI 싱글턴 (프로세스 내 재사용, Rate Governor 대시보드 우선순위)."""
     if not hasattr(_kiwoom_api, '_inst'):
         from kiwoom_api import KiwoomAPI
-        _kiwoom_api._inst = KiwoomAPI()
+        from utils.rate_governor import PRIORITY_DASHBOARD
+        _kiwoom_api._inst = KiwoomAPI(rate_priority=PRIORITY_DASHBOARD)
     return _kiwoom_api._inst
 
 
@@ -103,7 +107,7 @@ def fetch_kiwoom_positions() -> list[dict]:
 
 
 def _get_pg_conn():
-    """PostgreSQL 연결 반환 (psycopg2)."""
+    """PostgreSQL 연결 반환 (psycopg2). 대시보드 조회는 _dashboard_db() 사용."""
     import os, psycopg2
     return psycopg2.connect(
         host=os.getenv("POSTGRES_HOST", "localhost"),
@@ -113,20 +117,25 @@ def _get_pg_conn():
     )
 
 
+def _dashboard_db():
+    """연결 풀 + prepared statement + trades 버전 캐시 (database/dashboard_db.py)."""
+    from database.dashboard_db import get_dashboard_db
+    return get_dashboard_db()
+
+
+def _trade_ledger() -> list:
+    """
+    trades 전체 (trade_id 순): (trade_id, code, type, realized_profit, strategy, date).
+    성과/리스크/오늘 손익 집계 공용 — 새 거래가 들어오기 전까지 캐시.
+    """
+    return _dashboard_db().query('trade_ledger')
+
+
 def _read_account_snapshot_from_db() -> dict:
     """account_snapshot 테이블에서 최신 유효값 읽기."""
     try:
-        conn = _get_pg_conn()
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT deposit, holding_value, total_assets, eval_profit, snapshot_at
-            FROM account_snapshot
-            WHERE total_assets > 0
-            ORDER BY snapshot_at DESC
-            LIMIT 1
-        """)
-        row = cur.fetchone()
-        conn.close()
+        rows = _dashboard_db().query('account_snapshot_latest')
+        row = rows[0] if rows else None
         if row:
             return {
                 'deposit':       int(row[0]),
@@ -195,27 +204,50 @@ def _invalidate_cache(*keys: str):
 async def _background_refresh():
     """백그라운드: 15초마다 잔고·포지션 현재가 선제 갱신."""
     await asyncio.sleep(5)   # 서버 완전 기동 후 시작
+    loop = asyncio.get_event_loop()
     while True:
         try:
             _invalidate_cache('balance', 'positions')
-            fetch_kiwoom_balance()
-            fetch_kiwoom_positions()
+            await loop.run_in_executor(None, fetch_kiwoom_balance)
+            await loop.run_in_executor(None, fetch_kiwoom_positions)
         except Exception as e:
             logger.debug(f'[BG_REFRESH] 갱신 실패: {e}')
         await asyncio.sleep(_POSITIONS_TTL)
 
 
+async def _state_bus_watch(interval: float = 0.5):
+    """백그라운드: 상태 버스 events 시퀀스 변화(매수/매도 완료) 감지 → /api/refresh 와 같은 캐시 무효화."""
+    loop = asyncio.get_event_loop()
+    bus = _state_bus()
+    last = bus.version('events')
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            seq = bus.version('events')
+            if seq is None or seq == last or seq & 1:
+                continue
+            last = seq
+            _invalidate_cache('balance', 'positions')
+            _dashboard_db().invalidate()
+            await loop.run_in_executor(None, fetch_kiwoom_balance)
+            await loop.run_in_executor(None, fetch_kiwoom_positions)
+        except Exception as e:
+            logger.debug(f'[STATE_BUS] 갱신 실패: {e}')
+
+
 @app.on_event('startup')
 async def on_startup():
     """서버 기동 시 캐시 선제 적재 + 백그라운드 갱신 시작."""
+    loop = asyncio.get_event_loop()
     try:
-        fetch_kiwoom_balance()
-        fetch_kiwoom_positions()
+        await loop.run_in_executor(None, fetch_kiwoom_balance)
+        await loop.run_in_executor(None, fetch_kiwoom_positions)
         logger.info('[STARTUP] 계좌·포지션 캐시 적재 완료')
     except Exception as e:
         logger.warning(f'[STARTUP] 초기 캐시 적재 실패: {e}')
 
     asyncio.create_task(_background_refresh())
+    asyncio.create_task(_state_bus_watch())
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
@@ -233,6 +265,26 @@ def read_json(path: Path) -> dict | list:
         return json.load(f)
 
 
+_state_bus_reader = None
+
+
+def _state_bus():
+    """트레이딩 프로세스 상태 버스 reader (core/state_bus.py) — 시퀀스가 바뀔 때만 디코딩."""
+    global _state_bus_reader
+    if _state_bus_reader is None:
+        from core.state_bus import StateBusReader
+        _state_bus_reader = StateBusReader()
+    return _state_bus_reader
+
+
+def read_state(section: str, path: Path) -> dict | list:
+    """상태 버스 스냅샷 (읽기 전용 공유본). 버스 미발행 시 JSON 파일 폴백."""
+    data = _state_bus().read(section)
+    if data is None:
+        return read_json(path)
+    return data
+
+
 
 
 # ─── yfinance cache (TTL 60s) ─────────────────────────────────────────────────
@@ -360,9 +412,7 @@ async def fetch_supply(stock_code: str) -> dict:
 
 def _fetch_supply_sync(stock_code: str) -> dict:
     try:
-        from kiwoom_api import KiwoomAPI
-        api = KiwoomAPI()
-        result = api.get_investor_trend(stock_code)
+        result = _kiwoom_api().get_investor_trend(stock_code)
         rows = result.get('stk_invsr_orgn', [])
 
         # Aggregate last 5 days (단위: 천주 → 억원 근사: ×현재가/1000/10000)
@@ -611,143 +661,154 @@ def _latest_log_path() -> Path | None:
     return None
 
 
+# 증분 인덱스 (utils/log_tail.py) — 폴링마다 새로 붙은 줄만 파싱, 종류별 최근 N개 ring 유지
+_LOG_INDEXES: dict[str, LogIndex] = {}
+_LOG_INDEXES_LOCK = threading.Lock()
+
+# Log format: "2026-04-10 09:17:47,014 - INFO - <message>"
+_LOG_TS = r'\d{4}-\d{2}-\d{2} (\d{2}:\d{2}:\d{2}),\d+'
+
+
+def _log_index(name: str, path: Path, parser_factory, maxlen) -> LogIndex:
+    """name 별 LogIndex (경로가 바뀌면 — 날짜 변경 — 새로 생성) 후 증분 갱신."""
+    with _LOG_INDEXES_LOCK:
+        index = _LOG_INDEXES.get(name)
+        if index is None or index.path != path:
+            index = LogIndex(path, parser_factory(), maxlen=maxlen)
+            _LOG_INDEXES[name] = index
+    index.refresh()
+    return index
+
+
+# Format: "HH:MM:SS [CHOCH] XXXXXX | bullish | level=NNN | ..."
+_SMC_CHOCH_PAT = re.compile(r'(\d{2}:\d{2}:\d{2}) \[CHOCH\] (\d{6}) \| (\w+) \| level=([\d]+) \| .* penetration=([\d.]+)%')
+_SMC_TAIL_LINES = 200
+
+
+def _parse_smc_line(line: str, line_no: int):
+    m = _SMC_CHOCH_PAT.match(line.strip())
+    if not m:
+        return None
+    return 'choch', f"{m.group(1)}_{m.group(2)}_choch", {
+        'type': 'SCORE', 'event': 'CHoCH',
+        'symbol': m.group(2),
+        'params': f'{m.group(3)}  level:{m.group(4)}  pen:{m.group(5)}%',
+        'result': f'CHoCH {m.group(3)}', 'resultClass': 'score',
+        'time': m.group(1), 'fnRef': 'smc_decision.log',
+    }
+
+
 def _parse_smc_decision_log() -> list[dict]:
-    """Parse smc_decision log for CHoCH/SWEEP score events."""
+    """Parse smc_decision log for CHoCH/SWEEP score events (last 200 lines)."""
     smc_path = LOGS_DIR / f'smc_decision_{today_str()}.log'
     if not smc_path.exists():
         return []
 
-    events = []
-    seen_ids: set = set()
-    # Format: "HH:MM:SS [CHOCH] XXXXXX | bullish | level=NNN | ..."
-    pat_choch = re.compile(r'(\d{2}:\d{2}:\d{2}) \[CHOCH\] (\d{6}) \| (\w+) \| level=([\d]+) \| .* penetration=([\d.]+)%')
-
-    with open(smc_path, encoding='utf-8') as f:
-        lines = f.readlines()
-
-    for line in lines[-200:]:
-        line = line.strip()
-        m = pat_choch.match(line)
+    index = _log_index('smc_decision', smc_path, lambda: _parse_smc_line, _SMC_TAIL_LINES)
+    return index.events('choch', since_line=index.lines - _SMC_TAIL_LINES)
+
+
+# Each entry: (keyword_for_fast_filter, compiled_re, builder_fn)
+# NOTE: ACCEPT/REJECT are parsed from signal_orchestrator.log (full 8:30-16:00 coverage)
+_AUTO_TRADING_PATTERNS = [
+    # ── Market Context ───────────────────────────────────────────────────
+    ('[MKT_CTX]',
+     re.compile(_LOG_TS + r' - \w+ - \[MKT_CTX\] (?!캐시)(.+)'),
+     lambda m: {
+         'type': 'SYSTEM', 'event': 'MKT_CTX', 'symbol': '——',
+         'params': m.group(2)[:80],
+         'result': 'BLOCK' if 'NO_TRADE' in m.group(2) else 'INFO',
+         'resultClass': 'block' if 'NO_TRADE' in m.group(2) else 'info',
+         'time': m.group(1),
+     }),
+    # ── Trend Market Block ───────────────────────────────────────────────
+    ('[TREND_MKT_BLOCK]',
+     re.compile(_LOG_TS + r' - \w+ - \[TREND_MKT_BLOCK\] (\d{6}) [^:]+: (.+)'),
+     lambda m: {
+         'type': 'BLOCK', 'event': 'TREND_BLOCK', 'symbol': m.group(2),
+         'params': m.group(3)[:60], 'result': 'BLOCK',
+         'resultClass': 'block', 'time': m.group(1),
+     }),
+    # ── SMC Entry ───────────────────────────────────────────────────────
+    ('매수완료',
+     re.compile(_LOG_TS + r' - \w+ - .*매수완료.* (\d{6}) .*([\d,]+)원'),
+     lambda m: {
+         'type': 'EXEC', 'event': 'BUY', 'symbol': m.group(2),
+         'params': f'price:{m.group(3)}원', 'result': 'EXEC',
+         'resultClass': 'exec', 'time': m.group(1),
+     }),
+    ('매도완료',
+     re.compile(_LOG_TS + r' - \w+ - .*매도완료.* (\d{6}) .*([\d,]+)원'),
+     lambda m: {
+         'type': 'EXEC', 'event': 'SELL', 'symbol': m.group(2),
+         'params': f'price:{m.group(3)}원', 'result': 'EXEC',
+         'resultClass': 'exec', 'time': m.group(1),
+     }),
+    # ── System Events ────────────────────────────────────────────────────
+    ('[SYSTEM_START]',
+     re.compile(_LOG_TS + r' - \w+ - \[SYSTEM_START\] (.+)'),
+     lambda m: {
+         'type': 'SYSTEM', 'event': 'START', 'symbol': '——',
+         'params': m.group(2)[:80], 'result': 'INIT',
+         'resultClass': 'info', 'time': m.group(1),
+     }),
+    ('[LOOP_BLOCKED]',
+     re.compile(_LOG_TS + r' - \w+ - \[LOOP_BLOCKED\] (.+)'),
+     lambda m: {
+         'type': 'SYSTEM', 'event': 'LOOP_LAG', 'symbol': '——',
+         'params': m.group(2)[:60], 'result': 'WARN',
+         'resultClass': 'info', 'time': m.group(1),
+     }),
+    ('[CAPITAL_SNAPSHOT]',
+     re.compile(_LOG_TS + r' - \w+ - \[CAPITAL_SNAPSHOT\] (.+)'),
+     lambda m: {
+         'type': 'SYSTEM', 'event': 'SNAPSHOT', 'symbol': '——',
+         'params': m.group(2)[:80], 'result': 'OK',
+         'resultClass': 'info', 'time': m.group(1),
+     }),
+    ('[TRADING_HALT]',
+     re.compile(_LOG_TS + r' - \w+ - \[TRADING_HALT\] (.+)'),
+     lambda m: {
+         'type': 'SYSTEM', 'event': 'HALT', 'symbol': '——',
+         'params': m.group(2)[:60], 'result': 'HALT',
+         'resultClass': 'block', 'time': m.group(1),
+     }),
+]
+
+
+_AUTO_TRADING_KEEP = 15   # 패턴별 최근 15개 → 이벤트 종류 다양성 유지
+
+
+def _parse_auto_trading_line(line: str, line_no: int):
+    line = line.strip()
+    if not line:
+        return None
+    for idx, (keyword, pat, builder) in enumerate(_AUTO_TRADING_PATTERNS):
+        if keyword not in line:
+            continue
+        m = pat.match(line)
         if m:
-            uid = f"{m.group(1)}_{m.group(2)}_choch"
-            if uid not in seen_ids:
-                seen_ids.add(uid)
-                events.append({
-                    'type': 'SCORE', 'event': 'CHoCH',
-                    'symbol': m.group(2),
-                    'params': f'{m.group(3)}  level:{m.group(4)}  pen:{m.group(5)}%',
-                    'result': f'CHoCH {m.group(3)}', 'resultClass': 'score',
-                    'time': m.group(1), 'fnRef': 'smc_decision.log',
-                })
-
-    return events
+            ev = builder(m)
+            ev['id'] = f'log_{idx}_{hash(line) & 0xffff}'
+            ev['fnRef'] = 'main_auto_trading.py'
+            return str(idx), f"{m.group(1)}_{line[:80]}", ev
+    return None
 
 
 def parse_today_log() -> list[dict]:
     """Parse latest auto_trading log into decision events.
 
-    Reads the entire file but only matches lines with known keywords (fast grep-style).
-    Avoids the 'last N lines' trap where post-market news logs bury trading events.
+    Matches only lines with known keywords (fast grep-style), incrementally: the
+    index remembers its byte offset and parses just the lines appended since the
+    last poll. Covers the whole file, avoiding the 'last N lines' trap where
+    post-market news logs bury trading events.
     """
     log_path = _latest_log_path()
     if not log_path:
         return _parse_smc_decision_log()
 
-    # Log format: "2026-04-10 09:17:47,014 - INFO - <message>"
-    TS = r'\d{4}-\d{2}-\d{2} (\d{2}:\d{2}:\d{2}),\d+'
-
-    # Each entry: (keyword_for_fast_filter, compiled_re, builder_fn)
-    # NOTE: ACCEPT/REJECT are parsed from signal_orchestrator.log (full 8:30-16:00 coverage)
-    patterns = [
-        # ── Market Context ───────────────────────────────────────────────────
-        ('[MKT_CTX]',
-         re.compile(TS + r' - \w+ - \[MKT_CTX\] (?!캐시)(.+)'),
-         lambda m: {
-             'type': 'SYSTEM', 'event': 'MKT_CTX', 'symbol': '——',
-             'params': m.group(2)[:80],
-             'result': 'BLOCK' if 'NO_TRADE' in m.group(2) else 'INFO',
-             'resultClass': 'block' if 'NO_TRADE' in m.group(2) else 'info',
-             'time': m.group(1),
-         }),
-        # ── Trend Market Block ───────────────────────────────────────────────
-        ('[TREND_MKT_BLOCK]',
-         re.compile(TS + r' - \w+ - \[TREND_MKT_BLOCK\] (\d{6}) [^:]+: (.+)'),
-         lambda m: {
-             'type': 'BLOCK', 'event': 'TREND_BLOCK', 'symbol': m.group(2),
-             'params': m.group(3)[:60], 'result': 'BLOCK',
-             'resultClass': 'block', 'time': m.group(1),
-         }),
-        # ── SMC Entry ───────────────────────────────────────────────────────
-        ('매수완료',
-         re.compile(TS + r' - \w+ - .*매수완료.* (\d{6}) .*([\d,]+)원'),
-         lambda m: {
-             'type': 'EXEC', 'event': 'BUY', 'symbol': m.group(2),
-             'params': f'price:{m.group(3)}원', 'result': 'EXEC',
-             'resultClass': 'exec', 'time': m.group(1),
-         }),
-        ('매도완료',
-         re.compile(TS + r' - \w+ - .*매도완료.* (\d{6}) .*([\d,]+)원'),
-         lambda m: {
-             'type': 'EXEC', 'event': 'SELL', 'symbol': m.group(2),
-             'params': f'price:{m.group(3)}원', 'result': 'EXEC',
-             'resultClass': 'exec', 'time': m.group(1),
-         }),
-        # ── System Events ────────────────────────────────────────────────────
-        ('[SYSTEM_START]',
-         re.compile(TS + r' - \w+ - \[SYSTEM_START\] (.+)'),
-         lambda m: {
-             'type': 'SYSTEM', 'event': 'START', 'symbol': '——',
-             'params': m.group(2)[:80], 'result': 'INIT',
-             'resultClass': 'info', 'time': m.group(1),
-         }),
-        ('[LOOP_BLOCKED]',
-         re.compile(TS + r' - \w+ - \[LOOP_BLOCKED\] (.+)'),
-         lambda m: {
-             'type': 'SYSTEM', 'event': 'LOOP_LAG', 'symbol': '——',
-             'params': m.group(2)[:60], 'result': 'WARN',
-             'resultClass': 'info', 'time': m.group(1),
-         }),
-        ('[CAPITAL_SNAPSHOT]',
-         re.compile(TS + r' - \w+ - \[CAPITAL_SNAPSHOT\] (.+)'),
-         lambda m: {
-             'type': 'SYSTEM', 'event': 'SNAPSHOT', 'symbol': '——',
-             'params': m.group(2)[:80], 'result': 'OK',
-             'resultClass': 'info', 'time': m.group(1),
-         }),
-        ('[TRADING_HALT]',
-         re.compile(TS + r' - \w+ - \[TRADING_HALT\] (.+)'),
-         lambda m: {
-             'type': 'SYSTEM', 'event': 'HALT', 'symbol': '——',
-             'params': m.group(2)[:60], 'result': 'HALT',
-             'resultClass': 'block', 'time': m.group(1),
-         }),
-    ]
-
-    # Collect matched lines per pattern (keep last 20 each → max ~200 events)
-    per_pattern: list[list[dict]] = [[] for _ in patterns]
-    seen_ids: set = set()
-
-    with open(log_path, encoding='utf-8', errors='replace') as f:
-        for raw_line in f:
-            line = raw_line.strip()
-            if not line:
-                continue
-            for idx, (keyword, pat, builder) in enumerate(patterns):
-                if keyword not in line:
-                    continue
-                m = pat.match(line)
-                if m:
-                    uid = f"{m.group(1)}_{line[:80]}"
-                    if uid not in seen_ids:
-                        seen_ids.add(uid)
-                        ev = builder(m)
-                        ev['id'] = f'log_{idx}_{hash(line) & 0xffff}'
-                        ev['fnRef'] = 'main_auto_trading.py'
-                        per_pattern[idx].append(ev)
-                    break
-
-    # Take last 15 per pattern to keep diversity
-    events = [ev for bucket in per_pattern for ev in bucket[-15:]]
+    index = _log_index('auto_trading', log_path, lambda: _parse_auto_trading_line, _AUTO_TRADING_KEEP)
+    events = [ev for idx in range(len(_AUTO_TRADING_PATTERNS)) for ev in index.events(str(idx))]
 
     # Merge: main log events + SMC decision log + orchestrator ACCEPT/REJECT
     smc_events = _parse_smc_decision_log()
@@ -757,6 +818,63 @@ def parse_today_log() -> list[dict]:
     return list(reversed(all_events[-80:]))  # newest first
 
 
+# Supports both old format (no PID) and new format (with PID)
+# Old: ✅ ACCEPT 009420 @45750원 | conf=0.49 alpha=+1.55 pos_mult=0.40
+# New: ✅ ACCEPT 056360 @12410원 | PID:2379128 | conf=0.52 alpha=+1.65 pos_mult=0.62
+_ORCH_ACCEPT_PAT = re.compile(
+    _LOG_TS + r' - \w+ - .*✅ ACCEPT (\d{6}) @([\d,]+)원 \| (?:PID:\d+ \| )?conf=([\d.]+) alpha=([+\-\d.]+)'
+)
+# REJECT: ❌ REJECT 218410 | PID:2379128 | L0 | 진입 시간 외 (09:17, 10:00 이전)
+# Also without PID: ❌ REJECT 218410 | L0 | 진입 시간 외 ...
+_ORCH_REJECT_PAT = re.compile(
+    _LOG_TS + r' - \w+ - .*❌ REJECT (\d{6}) \| (?:PID:\d+ \| )?(.+)'
+)
+_ORCH_DATE_PAT = re.compile(r'\d{4}-\d{2}-\d{2}')
+_ORCH_KEEP = 30
+
+
+class _OrchestratorLogParser:
+    """signal_orchestrator.log 줄 파서 — 마지막 날짜를 기억, 이벤트에 날짜 태그 (조회 시 최근 날짜만)."""
+
+    def __init__(self):
+        self.date: str | None = None
+
+    def __call__(self, raw_line: str, line_no: int):
+        day = raw_line[:10]
+        if not _ORCH_DATE_PAT.fullmatch(day):
+            return None
+        if self.date is None or day > self.date:
+            self.date = day
+        elif day != self.date:
+            return None
+        line = raw_line.strip()
+        if 'ACCEPT' in line:
+            m = _ORCH_ACCEPT_PAT.match(line)
+            if m:
+                return 'accept', f"{day}_{m.group(1)}_{m.group(2)}", {
+                    'date': day, 'type': 'FILTER', 'event': 'ACCEPT', 'symbol': m.group(2),
+                    'params': f'price:{m.group(3)}원  conf:{m.group(4)}  alpha:{m.group(5)}',
+                    'result': 'PASS', 'resultClass': 'pass', 'time': m.group(1),
+                    'id': f'orch_accept_{hash(line) & 0xffff}',
+                    'fnRef': 'signal_orchestrator',
+                }
+        elif 'REJECT' in line:
+            m = _ORCH_REJECT_PAT.match(line)
+            if m:
+                return 'reject', f"{day}_{m.group(1)}_{m.group(2)}", {
+                    'date': day, 'type': 'FILTER', 'event': 'REJECT', 'symbol': m.group(2),
+                    'params': m.group(3)[:60],
+                    'result': 'REJECT', 'resultClass': 'reject', 'time': m.group(1),
+                    'id': f'orch_reject_{hash(line) & 0xffff}',
+                    'fnRef': 'signal_orchestrator',
+                }
+        return None
+
+
+def _new_orchestrator_parser() -> _OrchestratorLogParser:
+    return _OrchestratorLogParser()
+
+
 def _parse_orchestrator_log() -> list[dict]:
     """Parse signal_orchestrator.log for ACCEPT/REJECT events (8:30–16:00 coverage).
 
@@ -767,8 +885,14 @@ def _parse_orchestrator_log() -> list[dict]:
     if not orch_path.exists():
         return []
 
+    index = _log_index('signal_orchestrator', orch_path, _new_orchestrator_parser, _ORCH_KEEP)
+    target_date = index.parse.date
+    cutoff = (date.today() - timedelta(days=7)).strftime('%Y-%m-%d')
+    if not target_date or target_date < cutoff:
+        return []
+
     # Build stock_code → name lookup from watchlist
-    _wl = read_json(WATCHLIST_PATH)
+    _wl = read_state('watchlist', WATCHLIST_PATH)
     _name_map: dict[str, str] = {}
     if isinstance(_wl, list):
         for _w in _wl:
@@ -777,102 +901,29 @@ def _parse_orchestrator_log() -> list[dict]:
             if _code and _name:
                 _name_map[_code] = _name
 
-    # Find the most recent date in the orchestrator log (read tail, then verify it's ≤7 days old)
-    target_date: str | None = None
-    cutoff = (date.today() - timedelta(days=7)).strftime('%Y-%m-%d')
-    with open(orch_path, encoding='utf-8', errors='replace') as f:
-        # Seek near end to find the last non-empty line efficiently
-        try:
-            f.seek(0, 2)
-            size = f.tell()
-            f.seek(max(0, size - 4096))
-        except OSError:
-            pass
-        tail = f.read()
-    for raw in reversed(tail.splitlines()):
-        raw = raw.strip()
-        if len(raw) >= 10 and raw[:10] >= cutoff:
-            target_date = raw[:10]
-            break
-
-    if not target_date:
-        return []
-
-    today = target_date
-    TS = r'\d{4}-\d{2}-\d{2} (\d{2}:\d{2}:\d{2}),\d+'
-
-    # Supports both old format (no PID) and new format (with PID)
-    # Old: ✅ ACCEPT 009420 @45750원 | conf=0.49 alpha=+1.55 pos_mult=0.40
-    # New: ✅ ACCEPT 056360 @12410원 | PID:2379128 | conf=0.52 alpha=+1.65 pos_mult=0.62
-    pat_accept = re.compile(
-        TS + r' - \w+ - .*✅ ACCEPT (\d{6}) @([\d,]+)원 \| (?:PID:\d+ \| )?conf=([\d.]+) alpha=([+\-\d.]+)'
-    )
-    # REJECT: ❌ REJECT 218410 | PID:2379128 | L0 | 진입 시간 외 (09:17, 10:00 이전)
-    # Also without PID: ❌ REJECT 218410 | L0 | 진입 시간 외 ...
-    pat_reject = re.compile(
-        TS + r' - \w+ - .*❌ REJECT (\d{6}) \| (?:PID:\d+ \| )?(.+)'
-    )
-
-    accept_events: list[dict] = []
-    reject_events: list[dict] = []
-    seen: set = set()
-
-    with open(orch_path, encoding='utf-8', errors='replace') as f:
-        for raw_line in f:
-            if not raw_line.startswith(today):
+    # Keep last 30 of each type (ring 크기) → spread across full trading day
+    result = []
+    for kind in ('accept', 'reject'):
+        for ev in index.events(kind):
+            if ev['date'] != target_date:
                 continue
-            line = raw_line.strip()
-            if 'ACCEPT' in line:
-                m = pat_accept.match(line)
-                if m:
-                    uid = f"{m.group(1)}_{m.group(2)}"
-                    if uid not in seen:
-                        seen.add(uid)
-                        _sym_a = m.group(2)
-                        accept_events.append({
-                            'type': 'FILTER', 'event': 'ACCEPT', 'symbol': _sym_a,
-                            'symbolName': _name_map.get(_sym_a, ''),
-                            'params': f'price:{m.group(3)}원  conf:{m.group(4)}  alpha:{m.group(5)}',
-                            'result': 'PASS', 'resultClass': 'pass', 'time': m.group(1),
-                            'id': f'orch_accept_{hash(line) & 0xffff}',
-                            'fnRef': 'signal_orchestrator',
-                        })
-            elif 'REJECT' in line:
-                m = pat_reject.match(line)
-                if m:
-                    uid = f"{m.group(1)}_{m.group(2)}"
-                    if uid not in seen:
-                        seen.add(uid)
-                        _sym_r = m.group(2)
-                        reject_events.append({
-                            'type': 'FILTER', 'event': 'REJECT', 'symbol': _sym_r,
-                            'symbolName': _name_map.get(_sym_r, ''),
-                            'params': m.group(3)[:60],
-                            'result': 'REJECT', 'resultClass': 'reject', 'time': m.group(1),
-                            'id': f'orch_reject_{hash(line) & 0xffff}',
-                            'fnRef': 'signal_orchestrator',
-                        })
-
-    # Keep last 30 of each type → spread across full trading day
-    return accept_events[-30:] + reject_events[-30:]
+            out = {k: v for k, v in ev.items() if k != 'date'}
+            out['symbolName'] = _name_map.get(ev['symbol'], '')
+            result.append(out)
+    return result
 
 
 # ─── Performance from trades ─────────────────────────────────────────────────
 
 def compute_performance() -> dict:
     try:
-        conn = _get_pg_conn()
-        cur  = conn.cursor()
-        today      = today_iso()
-        week_start = (date.today() - timedelta(days=7)).isoformat()
-        month_start= (date.today() - timedelta(days=30)).isoformat()
-
-        def fetch(since: str) -> list:
-            cur.execute(
-                "SELECT realized_profit FROM trades WHERE trade_time::date >= %s AND trade_type='SELL'",
-                (since,)
-            )
-            return cur.fetchall()
+        all_rows   = _trade_ledger()
+        today      = date.today()
+        week_start = date.today() - timedelta(days=7)
+        month_start= date.today() - timedelta(days=30)
+
+        def fetch(since: date) -> list:
+            return [(r[3],) for r in all_rows if r[2] == 'SELL' and r[5] is not None and r[5] >= since]
 
         def summarize(rows: list) -> dict:
             pnls = [float(r[0]) for r in rows if r[0] is not None]
@@ -889,17 +940,11 @@ def compute_performance() -> dict:
         perf_month = summarize(fetch(month_start))
 
         # Strategy breakdown
-        cur.execute(
-            "SELECT trade_id, stock_code, trade_type, realized_profit, strategy_name FROM trades ORDER BY trade_id"
-        )
-        all_rows = cur.fetchall()
-        conn.close()
-
         from collections import defaultdict
         import statistics
         last_buy_strat: dict[str, str] = {}
         strat_map: dict = defaultdict(list)
-        for _, code, ttype, pnl, strat in all_rows:
+        for _, code, ttype, pnl, strat, _ in all_rows:
             if ttype == 'BUY' and strat and strat != 'EXIT':
                 last_buy_strat[code] = strat
             elif ttype == 'SELL' and pnl is not None:
@@ -940,7 +985,7 @@ DAILY_WATCHLIST_PATH = BASE / 'data' / 'daily_watchlist.json'
 async def build_candidates() -> list[dict]:
     # ① monitoring_watchlist.json — main_auto_trading.py가 매 루프마다 저장하는 실시간 감시 목록
     watchlist: list[dict] = []
-    mon = read_json(MONITORING_WATCHLIST_PATH)
+    mon = read_state('monitoring_watchlist', MONITORING_WATCHLIST_PATH)
     if isinstance(mon, dict) and mon.get('symbols'):
         for item in mon['symbols']:
             if isinstance(item, dict) and item.get('stock_code'):
@@ -951,11 +996,11 @@ async def build_candidates() -> list[dict]:
 
     # ② fallback: watchlist.json (validated_stocks 스냅샷)
     if not watchlist:
-        raw = read_json(WATCHLIST_PATH)
+        raw = read_state('watchlist', WATCHLIST_PATH)
         if isinstance(raw, list):
             watchlist = raw
 
-    positions_raw: dict = read_json(POSITIONS_PATH)
+    positions_raw: dict = read_state('positions', POSITIONS_PATH)
 
     # Fetch prices + news concurrently
     async def enrich(item: dict) -> dict | None:
@@ -1034,15 +1079,7 @@ def _is_ghost_position(code: str, entry_date_str: str) -> bool:
         return False
     try:
         entry_ts = entry_date_str[:19]   # 'YYYY-MM-DDTHH:MM:SS'
-        conn = _get_pg_conn()
-        cur  = conn.cursor()
-        cur.execute(
-            "SELECT trade_id FROM trades WHERE stock_code=%s AND trade_type='SELL' AND trade_time >= %s LIMIT 1",
-            (code, entry_ts),
-        )
-        row = cur.fetchone()
-        conn.close()
-        return row is not None
+        return bool(_dashboard_db().query('sell_after', code, entry_ts))
     except Exception:
         return False
 
@@ -1058,7 +1095,7 @@ def build_positions() -> list[dict]:
     kiwoom_pos = fetch_kiwoom_positions()
     if kiwoom_pos:
         # positions_state 메타 (SL, TP, strategy, entry_date, choch_grade 등) 보완
-        state_raw: dict = read_json(POSITIONS_PATH)
+        state_raw: dict = read_state('positions', POSITIONS_PATH)
         result = []
         for kp in kiwoom_pos:
             code    = kp['symbol']
@@ -1109,7 +1146,7 @@ def build_positions() -> list[dict]:
 
     # ── ② 폴백: positions_state.json + 유령 필터 ──────────────────────────────
     logger.warning('[POSITIONS] Kiwoom API 실패 — 파일 폴백')
-    raw: dict = read_json(POSITIONS_PATH)
+    raw: dict = read_state('positions', POSITIONS_PATH)
     result = []
     for code, pos in raw.items():
         if not isinstance(pos, dict):
@@ -1181,25 +1218,9 @@ def build_trades(limit: int = 50, days: int = 7,
     limit은 최종 건수 상한.
     """
     try:
-        conn = _get_pg_conn()
-        cur  = conn.cursor()
         start = from_date or (date.today() - timedelta(days=days)).isoformat()
         end   = to_date   or today_iso()
-        cur.execute(
-            """SELECT trade_id,
-                      trade_time::date,
-                      trade_time,
-                      stock_code, stock_name, trade_type,
-                      quantity, price, realized_profit,
-                      COALESCE(exit_reason, entry_reason, ''),
-                      COALESCE(strategy_name, 'SMC')
-               FROM trades
-               WHERE trade_time::date >= %s AND trade_time::date <= %s
-               ORDER BY trade_id ASC""",
-            (start, end),
-        )
-        all_rows = cur.fetchall()
-        conn.close()
+        all_rows = _dashboard_db().query('trades_range', start, end)
     except Exception as e:
         logger.warning(f'[BUILD_TRADES] PostgreSQL 조회 실패: {e}')
         return []
@@ -1215,7 +1236,7 @@ def build_trades(limit: int = 50, days: int = 7,
 
     # Match each SELL to the latest BUY of the same stock
     # BUY가 없는 경우: positions_state에서 entry_price 보완
-    positions_raw: dict = read_json(POSITIONS_PATH)
+    positions_raw: dict = read_state('positions', POSITIONS_PATH)
     last_buy: dict[str, dict] = {}
     pairs: list[tuple] = []
     for t in raw:
@@ -1365,9 +1386,11 @@ def _calc_adx(close: pd.Series, period: int = 14) -> float:
 def _get_health() -> dict:
     """Check if kiwoom trading process is alive via heartbeat."""
     hb_path = Path('/tmp/kiwoom_heartbeat.json')
-    if hb_path.exists():
+    hb = _state_bus().read('heartbeat')
+    if hb is not None or hb_path.exists():
         try:
-            hb = json.loads(hb_path.read_text())
+            if hb is None:
+                hb = json.loads(hb_path.read_text())
             hb_time = datetime.fromisoformat(hb.get('time', '2000-01-01'))
             age_sec = (datetime.now() - hb_time).seconds
             status = 'ok' if age_sec < 120 else 'warn'
@@ -1400,14 +1423,8 @@ def get_filter_stats() -> list[dict]:
     # Also count today's trades from PostgreSQL as proxy for passed signals
     exec_today = 0
     try:
-        conn = _get_pg_conn()
-        cur  = conn.cursor()
-        cur.execute(
-            "SELECT COUNT(*) FROM trades WHERE trade_time::date=%s AND trade_type='BUY'", (today_iso(),)
-        )
-        row = cur.fetchone()
-        conn.close()
-        exec_today = row[0] if row else 0
+        today = date.today()
+        exec_today = sum(1 for r in _trade_ledger() if r[2] == 'BUY' and r[5] == today)
     except Exception:
         pass
 
@@ -1487,11 +1504,11 @@ async def api_candidates():
 
 @app.get('/api/candidates/{symbol}')
 async def api_candidate_detail(symbol: str):
-    positions_raw: dict = read_json(POSITIONS_PATH)
+    positions_raw: dict = read_state('positions', POSITIONS_PATH)
     pos = positions_raw.get(symbol)
 
     # Find stock name from watchlist
-    watchlist = read_json(WATCHLIST_PATH)
+    watchlist = read_state('watchlist', WATCHLIST_PATH)
     stock_name = symbol
     if isinstance(watchlist, list):
         for w in watchlist:
@@ -1584,8 +1601,8 @@ def api_positions():
 
 
 @app.get('/api/trades')
-def api_trades(days: int = 7, limit: int = 50,
-               from_date: str = None, to_date: str = None):
+async def api_trades(days: int = 7, limit: int = 50,
+                     from_date: str = None, to_date: str = None):
     """
     거래 목록.
     ?from_date=2026-04-01&to_date=2026-04-24  → 날짜 범위
@@ -1593,7 +1610,8 @@ def api_trades(days: int = 7, limit: int = 50,
     """
     start = from_date or (date.today() - timedelta(days=days)).isoformat()
     end   = to_date   or today_iso()
-    trades = build_trades(limit=limit, from_date=start, to_date=end)
+    trades = await _dashboard_db().run(
+        lambda: build_trades(limit=limit, from_date=start, to_date=end))
     actual_days = (date.fromisoformat(end) - date.fromisoformat(start)).days + 1
     return {
         'period': {
@@ -1610,13 +1628,7 @@ def api_trades(days: int = 7, limit: int = 50,
 def _compute_risk_metrics() -> list[dict]:
     """Compute risk metrics from PostgreSQL trades."""
     try:
-        conn = _get_pg_conn()
-        cur  = conn.cursor()
-        cur.execute(
-            "SELECT realized_profit FROM trades WHERE trade_type='SELL' AND realized_profit IS NOT NULL ORDER BY trade_id"
-        )
-        rows = cur.fetchall()
-        conn.close()
+        rows = [(r[3],) for r in _trade_ledger() if r[2] == 'SELL' and r[3] is not None]
     except Exception as e:
         logger.warning(f'[RISK_METRICS] PostgreSQL 조회 실패: {e}')
         return []
@@ -1674,9 +1686,10 @@ def _compute_risk_metrics() -> list[dict]:
 
 
 @app.get('/api/performance')
-def api_performance():
-    perf = compute_performance()
-    return {**perf, 'riskMetrics': _compute_risk_metrics()}
+async def api_performance():
+    db = _dashboard_db()
+    perf = await db.run(compute_performance)
+    return {**perf, 'riskMetrics': await db.run(_compute_risk_metrics)}
 
 
 @app.get('/api/filter-stats')
@@ -1696,8 +1709,9 @@ def api_health():
 
 @app.post('/api/refresh')
 def api_refresh():
-    """거래 발생 시: 잔고·포지션 캐시 무효화."""
+    """거래 발생 시: 잔고·포지션 캐시 + 거래 조회 캐시 무효화."""
     _invalidate_cache('balance', 'positions')
+    _dashboard_db().invalidate()
     balance   = fetch_kiwoom_balance()
     positions = fetch_kiwoom_positions()
     return {
@@ -1716,15 +1730,9 @@ _SNAPSHOT_TTL_SECONDS = 300   # 5분 초과 시 stale 처리
 def _today_realized_pnl_from_db() -> int:
     """오늘 실현 손익 합계 (SELL trades, PostgreSQL)."""
     try:
-        conn = _get_pg_conn()
-        cur  = conn.cursor()
-        cur.execute(
-            "SELECT COALESCE(SUM(realized_profit), 0) FROM trades WHERE trade_type='SELL' AND trade_time::date=%s",
-            (today_iso(),),
-        )
-        row = cur.fetchone()
-        conn.close()
-        return int(float(row[0] or 0))
+        today = date.today()
+        total = sum(r[3] for r in _trade_ledger() if r[2] == 'SELL' and r[5] == today and r[3] is not None)
+        return int(float(total or 0))
     except Exception:
         return 0
 
@@ -1811,6 +1819,7 @@ def api_account():
 
 # ─── Optimize (Grid Search) ───────────────────────────────────────────────────
 
+import os
 import uuid
 import threading
 from pydantic import BaseModel
@@ -1818,6 +1827,9 @@ from pydantic import BaseModel
 # Job store: {job_id: {status, progress, total, current_tp, current_sl, results, error}}
 _optimize_jobs: dict[str, dict] = {}
 
+# 그리드 서치 기본 병렬 프로세스 수 (코어 1개는 API 응답용으로 남김)
+_OPTIMIZE_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
 
 class OptimizeRequest(BaseModel):
     strategy:         str         = 'B+VOL'
@@ -1830,6 +1842,7 @@ class OptimizeRequest(BaseModel):
     trailing_range:   list[float] = []
     be_trigger_range: list[float] = []
     symbols:          list[str] | None = None
+    workers:          int         = _OPTIMIZE_WORKERS   # 1 → 순차 실행
 
 
 def _run_optimize_job(job_id: str, req: OptimizeRequest):
@@ -1871,6 +1884,7 @@ def _run_optimize_job(job_id: str, req: OptimizeRequest):
             strategy         = req.strategy,
             mode             = req.mode,
             on_progress      = on_progress,
+            workers          = max(1, req.workers),
         )
         job['status'] = 'done'
         job['message'] = '완료'
@@ -21,26 +21,45 @@ MIN_BARS = 20  # 최소 lookback 봉 수
 
 # ── 내부 헬퍼 ────────────────────────────────────────────────────────────────
 
+def _pivot_masks(high_v: np.ndarray, low_v: np.ndarray, lb: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    전 구간 피벗 마스크 (좌우 lb봉 모두 존재하는 봉만, >= / <= 비교, NaN 포함 윈도우는 제외).
+    Returns: (is_high, is_low) — 길이 n bool 배열
+    """
+    n = len(high_v)
+    is_high = np.zeros(n, dtype=bool)
+    is_low  = np.zeros(n, dtype=bool)
+    if lb <= 0:
+        # 비교 대상 없음 → 전 봉 피벗
+        is_high[:] = True
+        is_low[:]  = True
+        return is_high, is_low
+    if n < 2 * lb + 1:
+        return is_high, is_low
+
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    h = np.asarray(high_v, dtype=np.float64)
+    l = np.asarray(low_v, dtype=np.float64)
+    win_h = sliding_window_view(h, 2 * lb + 1)
+    win_l = sliding_window_view(l, 2 * lb + 1)
+    # 중심 포함 윈도우 max/min 과 같으면 피벗 (NaN 은 비교 실패로 자동 제외)
+    is_high[lb:n - lb] = h[lb:n - lb] >= win_h.max(axis=1)
+    is_low[lb:n - lb]  = l[lb:n - lb] <= win_l.min(axis=1)
+    return is_high, is_low
+
+
 def _find_pivots(df: pd.DataFrame, lb: int) -> tuple[list, list]:
     """
     단순 피벗 고점/저점 탐지.
     Returns: (swing_highs, swing_lows) — 각 원소는 (index, price)
     """
-    highs, lows = [], []
-    closes = df['close'].values
     high_v = df['high'].values
     low_v  = df['low'].values
-    n = len(closes)
-
-    for i in range(lb, n - lb):
-        if all(high_v[i] >= high_v[i-j] for j in range(1, lb+1)) and \
-           all(high_v[i] >= high_v[i+j] for j in range(1, lb+1)):
-            highs.append((i, float(high_v[i])))
-
-        if all(low_v[i] <= low_v[i-j] for j in range(1, lb+1)) and \
-           all(low_v[i] <= low_v[i+j] for j in range(1, lb+1)):
-            lows.append((i, float(low_v[i])))
+    is_high, is_low = _pivot_masks(high_v, low_v, lb)
 
+    highs = [(int(i), float(high_v[i])) for i in np.flatnonzero(is_high)]
+    lows  = [(int(i), float(low_v[i])) for i in np.flatnonzero(is_low)]
     return highs, lows
 
 
@@ -149,6 +168,47 @@ class SMCAdapter:
         self.ma50_slope_bars     = ma50_slope_bars
         self.fitness_tracker     = fitness_tracker
         self.symbol              = symbol
+        self._pivot_cache        = None   # (df, is_high, is_low) — df 전체 피벗 마스크
+
+    def _window_pivots(self, df: pd.DataFrame, start: int, end: int) -> tuple[list, list]:
+        """
+        _find_pivots(df.iloc[start:end], lb) 와 동일한 결과를 df 전체 마스크에서 잘라 반환.
+
+        window 안에서 좌우 lb봉이 모두 존재하는 봉만 피벗이 될 수 있으므로
+        전역 마스크의 [start+lb, end-lb) 구간과 정확히 일치한다.
+        마스크는 df 객체당 한 번만 계산 (bar-by-bar 재계산 제거).
+        """
+        cache = self._pivot_cache
+        if cache is None or cache[0] is not df:
+            is_high, is_low = _pivot_masks(df['high'].values, df['low'].values, self.lb)
+            cache = (df, is_high, is_low)
+            self._pivot_cache = cache
+        _, is_high, is_low = cache
+
+        lo = start + max(self.lb, 0)
+        hi = end - max(self.lb, 0)
+        if hi <= lo:
+            return [], []
+        high_v = df['high'].values
+        low_v  = df['low'].values
+        highs = [(int(g) - start, float(high_v[g])) for g in lo + np.flatnonzero(is_high[lo:hi])]
+        lows  = [(int(g) - start, float(low_v[g])) for g in lo + np.flatnonzero(is_low[lo:hi])]
+        return highs, lows
+
+    def signal_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        전 봉의 get_signal() == 'BUY' 여부 (bool 배열, len(df)).
+
+        진입 신호는 청산 파라미터(TP/SL/trailing...)와 무관하므로 그리드 서치에서
+        (종목, 전략) 당 1회만 계산해 BacktestEngine.run(signal_mask=...) 으로 재사용한다.
+        fitness_tracker 사용 시 신호가 이전 거래 결과에 의존하므로 사용 불가.
+        """
+        if self.fitness_tracker is not None:
+            raise ValueError('fitness_tracker 사용 시 signal_mask 사전 계산 불가')
+        mask = np.zeros(len(df), dtype=bool)
+        for i in range(MIN_BARS + self.lb, len(df)):
+            mask[i] = self.get_signal(df, i) == 'BUY'
+        return mask
 
     def get_signal(self, df: pd.DataFrame, i: int) -> str | None:
         """
@@ -160,14 +220,15 @@ class SMCAdapter:
             return None
 
         # 확정봉 window (bar i는 아직 미확정)
-        w = df.iloc[max(0, i - self.window): i].copy()
+        w_start = max(0, i - self.window)
+        w = df.iloc[w_start: i].copy()
         if len(w) < MIN_BARS:
             return None
 
         last_confirmed = i - 1   # 분석 window 내 마지막 봉 = w.iloc[-1]
 
         try:
-            highs, lows = _find_pivots(w, self.lb)
+            highs, lows = self._window_pivots(df, w_start, i)
             if not highs or not lows:
                 return None
 
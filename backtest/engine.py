@@ -4,6 +4,12 @@
 청산 모드:
   tp_sl  (기본) : 고정 TP/SL %
   swing         : 최소보유 + trailing stop + BE 전환 + MFE 추적
+
+실행 경로:
+  array_mode=True  (기본) : OHLC → float64 배열 1회 추출, ATR 전 구간 선계산,
+                            TP/SL 모드는 보유 구간 청산 지점을 배열 스캔으로 탐색
+  array_mode=False        : 기존 df.iloc bar-by-bar 루프 (검증/비교용)
+  두 경로의 Trade/BacktestResult 출력은 동일.
 """
 import pandas as pd
 import numpy as np
@@ -14,6 +20,16 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+def _running_extreme(current: float, values: np.ndarray, use_max: bool) -> float:
+    """봉마다 max()/min() 누적 갱신한 결과와 동일 (NaN 값은 갱신에 쓰이지 않음)."""
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return current
+    if use_max:
+        return max(current, float(values.max()))
+    return min(current, float(values.min()))
+
+
 @dataclass
 class Trade:
     symbol:       str
@@ -52,6 +68,7 @@ class BacktestEngine:
         sl_atr_mult:     ATR 기반 SL 배수 (설정 시 sl_pct 대신 ATR×mult 사용)
         trail_atr_mult:  ATR 기반 trailing stop 배수 (설정 시 고정 % 대신 사용)
         atr_period:      ATR 계산 기간 (기본 14봉)
+        array_mode:      True → 배열 기반 fast path (출력 동일)
     """
 
     def __init__(
@@ -69,6 +86,7 @@ class BacktestEngine:
         trail_atr_mult:  Optional[float] = None,    # ATR trailing (설정 시 trailing_pct % 대체)
         atr_period:      int             = 14,
         on_trade_complete = None,                   # callable(symbol, trade) — fitness tracker 연동용
+        array_mode:      bool            = True,
     ):
         self.tp_pct          = tp_pct
         self.sl_pct          = sl_pct
@@ -83,8 +101,28 @@ class BacktestEngine:
         self.trail_atr_mult     = trail_atr_mult
         self.atr_period         = atr_period
         self.on_trade_complete  = on_trade_complete
-
-    def run(self, df: pd.DataFrame, symbol: str = '') -> BacktestResult:
+        self.array_mode         = array_mode
+
+    def run(
+        self, df: pd.DataFrame, symbol: str = '',
+        signal_mask: Optional[np.ndarray] = None,
+    ) -> BacktestResult:
+        """
+        Args:
+            signal_mask: 봉별 진입 신호 bool 배열 (len(df)). 주어지면 signal_func 대신 사용.
+                         신호가 청산 파라미터와 무관할 때 그리드 서치에서 1회만 계산해 재사용.
+        """
+        if signal_mask is not None and len(signal_mask) != len(df):
+            raise ValueError(f'signal_mask 길이 불일치: {len(signal_mask)} != {len(df)}')
+        if self.array_mode:
+            return self._run_arrays(df, symbol, signal_mask)
+        return self._run_frame(df, symbol, signal_mask)
+
+    def _run_frame(
+        self, df: pd.DataFrame, symbol: str = '',
+        signal_mask: Optional[np.ndarray] = None,
+    ) -> BacktestResult:
+        """기존 df.iloc bar-by-bar 루프."""
         result   = BacktestResult(symbol=symbol)
         position: Optional[dict] = None
 
@@ -123,29 +161,16 @@ class BacktestEngine:
                         exit_price  = ep * (1 + self.sl_pct)
 
                 if exit_reason:
-                    pnl = (exit_price - ep) / ep - self.commission * 2
-                    trade = Trade(
-                        symbol      = symbol,
-                        entry_date  = position['entry_date'],
-                        exit_date   = dates[i],
-                        entry_price = ep,
-                        exit_price  = round(exit_price, 0),
-                        pnl_pct     = round(pnl, 4),
-                        pnl_won     = round(exit_price - ep, 0),
-                        exit_reason = exit_reason,
-                        hold_bars   = bars,
-                        mfe_pct     = round(position['mfe'] * 100, 2),
-                        mae_pct     = round(position['mae'] * 100, 2),
-                    )
-                    result.trades.append(trade)
-                    if self.on_trade_complete is not None:
-                        self.on_trade_complete(symbol, trade)
+                    self._close_trade(result, symbol, position, dates[i], exit_reason, exit_price, bars)
                     position = None
                     continue
 
             # ── 진입 신호 (포지션 없을 때) ────────────────────────────────────
-            if position is None and self.signal_func is not None:
-                signal = self.signal_func(df, i)
+            if position is None and (signal_mask is not None or self.signal_func is not None):
+                if signal_mask is not None:
+                    signal = 'BUY' if signal_mask[i] else None
+                else:
+                    signal = self.signal_func(df, i)
                 if signal == 'BUY' and i + 1 < len(df):
                     entry_price = float(df.iloc[i + 1]['open'])
                     atr_val = self._calc_atr(df, i)   # 신호봉 기준 ATR
@@ -164,6 +189,184 @@ class BacktestEngine:
 
         return result
 
+    def _run_arrays(
+        self, df: pd.DataFrame, symbol: str = '',
+        signal_mask: Optional[np.ndarray] = None,
+    ) -> BacktestResult:
+        """
+        배열 기반 fast path — _run_frame 과 동일한 Trade 출력.
+
+        - OHLC 를 float64 배열로 1회 추출 (봉마다 df.iloc/row.get 제거)
+        - ATR 은 첫 진입 시 전 구간 1회 계산 (_calc_atr 와 동일 값)
+        - TP/SL 모드: 진입 후 청산 봉을 배열 스캔으로 찾고 MFE/MAE 는 구간 max/min
+        - 스윙 모드: 경로 의존 상태(peak/BE/trailing)라 봉 단위 진행, 값만 배열에서 읽음
+        - signal_mask 사용 시 무포지션 구간은 다음 신호 봉으로 바로 이동
+        """
+        result   = BacktestResult(symbol=symbol)
+        position: Optional[dict] = None
+
+        dates = df.index.strftime('%Y-%m-%d').tolist() if hasattr(df.index, 'strftime') else list(range(len(df)))
+
+        n       = len(df)
+        close_a = df['close'].to_numpy(dtype=np.float64)
+        high_a  = df['high'].to_numpy(dtype=np.float64) if 'high' in df.columns else close_a
+        low_a   = df['low'].to_numpy(dtype=np.float64) if 'low' in df.columns else close_a
+        open_a  = None
+        atr_a   = None
+        sig_idx = np.flatnonzero(signal_mask) if signal_mask is not None else None
+
+        i = 0
+        while i < n:
+            if position is not None and i > position['entry_i']:
+                ep = position['entry_price']
+
+                if not self.swing_mode:
+                    # ── TP/SL 모드: 청산 봉 직접 탐색 ─────────────────────────
+                    j, exit_reason, exit_price = self._scan_tp_sl_exit(position, close_a, i)
+                    end = n if j is None else j + 1
+                    position['mfe'] = _running_extreme(position['mfe'], (high_a[i:end] - ep) / ep, use_max=True)
+                    position['mae'] = _running_extreme(position['mae'], (low_a[i:end] - ep) / ep, use_max=False)
+                    if j is None:
+                        break   # 데이터 끝까지 미청산 → 이후 진입 없음
+                    self._close_trade(result, symbol, position, dates[j], exit_reason, exit_price,
+                                      j - position['entry_i'])
+                    position = None
+                    i = j + 1
+                    continue
+
+                close = close_a[i]
+                high  = high_a[i]
+                low   = low_a[i]
+                bars  = i - position['entry_i']
+                chg   = (close - ep) / ep
+
+                # MFE/MAE 갱신
+                position['mfe'] = max(position['mfe'], (high - ep) / ep)
+                position['mae'] = min(position['mae'], (low  - ep) / ep)
+
+                exit_reason, exit_price = self._check_swing_exit(
+                    position, close, high, low, chg, bars, ep
+                )
+                if exit_reason:
+                    self._close_trade(result, symbol, position, dates[i], exit_reason, exit_price, bars)
+                    position = None
+                    i += 1
+                    continue
+
+            # ── 진입 신호 (포지션 없을 때) ────────────────────────────────────
+            if position is None and sig_idx is not None:
+                k = int(np.searchsorted(sig_idx, i))
+                if k >= len(sig_idx):
+                    break   # 남은 신호 없음
+                i = int(sig_idx[k])
+                signal = 'BUY'
+            elif position is None and self.signal_func is not None:
+                signal = self.signal_func(df, i)
+            else:
+                signal = None
+
+            if signal is not None:
+                if signal == 'BUY' and i + 1 < n:
+                    if open_a is None:
+                        open_a = df['open'].to_numpy(dtype=np.float64)
+                    if atr_a is None:
+                        atr_a = self._atr_array(high_a, low_a, close_a)
+                    entry_price = float(open_a[i + 1])
+                    position = {
+                        'entry_i':     i + 1,
+                        'entry_price': entry_price,
+                        'entry_date':  dates[i + 1],
+                        'mfe':         0.0,
+                        'mae':         0.0,
+                        'peak_price':  entry_price,   # trailing용 고점
+                        'be_raised':   False,
+                        'trail_active': False,
+                        'atr':         float(atr_a[i]),   # 신호봉 기준 ATR
+                    }
+                    logger.debug(f'[ENGINE] {symbol} BUY @ {entry_price:.0f} ({dates[i+1]})')
+            i += 1
+
+        return result
+
+    def _scan_tp_sl_exit(
+        self, position: dict, close_a: np.ndarray, start: int,
+    ) -> tuple[Optional[int], Optional[str], float]:
+        """
+        TP/SL 모드 첫 청산 봉 탐색 (start 이후). 블록 단위로 넓혀가며 스캔.
+        Returns: (청산 봉 index | None, 'TP'|'SL'|None, 청산가)
+        """
+        ep      = position['entry_price']
+        entry_i = position['entry_i']
+        n       = len(close_a)
+        block   = 64
+        lo      = start
+        while lo < n:
+            hi   = min(n, lo + block)
+            chg  = (close_a[lo:hi] - ep) / ep
+            hit_sl = chg <= self.sl_pct
+            if self.tp_pct is not None:
+                bars   = np.arange(lo, hi) - entry_i
+                hit_tp = (chg >= self.tp_pct) & (bars >= self.min_hold_bars)
+            else:
+                hit_tp = np.zeros(hi - lo, dtype=bool)
+            hit = hit_tp | hit_sl
+            if hit.any():
+                k = int(np.argmax(hit))
+                if hit_tp[k]:
+                    return lo + k, 'TP', ep * (1 + self.tp_pct)
+                return lo + k, 'SL', ep * (1 + self.sl_pct)
+            lo    = hi
+            block = min(block * 2, 4096)
+        return None, None, 0.0
+
+    def _close_trade(
+        self, result: BacktestResult, symbol: str, position: dict,
+        exit_date, exit_reason: str, exit_price: float, bars: int,
+    ) -> None:
+        """청산 Trade 기록 + on_trade_complete 콜백."""
+        ep  = position['entry_price']
+        pnl = (exit_price - ep) / ep - self.commission * 2
+        trade = Trade(
+            symbol      = symbol,
+            entry_date  = position['entry_date'],
+            exit_date   = exit_date,
+            entry_price = ep,
+            exit_price  = round(exit_price, 0),
+            pnl_pct     = round(pnl, 4),
+            pnl_won     = round(exit_price - ep, 0),
+            exit_reason = exit_reason,
+            hold_bars   = bars,
+            mfe_pct     = round(position['mfe'] * 100, 2),
+            mae_pct     = round(position['mae'] * 100, 2),
+        )
+        result.trades.append(trade)
+        if self.on_trade_complete is not None:
+            self.on_trade_complete(symbol, trade)
+
+    def _atr_array(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        """전 구간 ATR — atr[i] == _calc_atr(df, i)."""
+        p   = self.atr_period
+        n   = len(close)
+        atr = high - low   # 이전 봉 부족 구간 (i < 2, 또는 p <= 0) → 당일 range
+        if n <= 2 or p <= 0:
+            return atr
+
+        # tr[k] (k>=1): 봉 k 의 True Range
+        tr = np.empty(n, dtype=np.float64)
+        tr[0] = np.nan
+        tr[1:] = np.maximum(high[1:] - low[1:],
+                            np.maximum(np.abs(high[1:] - close[:-1]),
+                                       np.abs(low[1:] - close[:-1])))
+
+        # atr[i] = mean(tr[max(1, i-p) : i])
+        warm = min(n, p + 1)
+        for i in range(2, warm):
+            atr[i] = np.mean(tr[1:i])
+        if n > p + 1 and p > 0:
+            from numpy.lib.stride_tricks import sliding_window_view
+            atr[p + 1:] = sliding_window_view(tr[1:n - 1], p).mean(axis=1)
+        return atr
+
     def _calc_atr(self, df: pd.DataFrame, i: int) -> float:
         """ATR(atr_period) — bar i 기준."""
         p   = self.atr_period
@@ -1,9 +1,16 @@
 """
-데이터 로더 — yfinance에서 일봉 OHLCV 다운로드
+데이터 로더 — 일봉 OHLCV (로컬 캐시 data/ohlcv + yfinance 빈 구간 조회)
 """
-import pandas as pd
-import yfinance as yf
 import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ohlcv_store import get_store
 
 logger = logging.getLogger(__name__)
 
@@ -18,45 +25,25 @@ KOSPI_CODES = {'005930', '000660', '035420', '373220', '006400', '051910',
 
 def load_daily(code: str, start: str, end: str) -> pd.DataFrame:
     """
-    yfinance에서 일봉 데이터 로드.
+    일봉 데이터 로드 (utils.ohlcv_store 로컬 캐시 경유 — 빈 구간만 yfinance 조회).
 
     Returns:
         columns: open, high, low, close, volume (소문자)
         index: DatetimeIndex
     """
-    suffix = '.KS' if code in KOSPI_CODES else '.KQ'
-    ticker = f'{code}{suffix}'
-
-    df = yf.download(ticker, start=start, end=end,
-                     interval='1d', progress=False, auto_adjust=True)
-
-    if df.empty:
-        # 반대 suffix 시도
-        alt = '.KQ' if suffix == '.KS' else '.KS'
-        df = yf.download(f'{code}{alt}', start=start, end=end,
-                         interval='1d', progress=False, auto_adjust=True)
+    market = 'KS' if code in KOSPI_CODES else 'KQ'
+    df = get_store().get(code, start, end, timeframe='1d', market=market)
 
     if df.empty:
         logger.warning(f'[LOADER] {code}: 데이터 없음')
         return pd.DataFrame()
 
-    # MultiIndex 컬럼 처리 (yfinance 최신 버전)
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
-
-    df.columns = [c.lower() for c in df.columns]
-    df = df[['open', 'high', 'low', 'close', 'volume']].dropna()
-    df.index = pd.to_datetime(df.index)
-
-    logger.info(f'[LOADER] {code}{suffix}: {len(df)}봉 ({df.index[0].date()} ~ {df.index[-1].date()})')
+    logger.info(f'[LOADER] {code}: {len(df)}봉 ({df.index[0].date()} ~ {df.index[-1].date()})')
     return df
 
 
-def load_multi(codes: list[str], start: str, end: str) -> dict[str, pd.DataFrame]:
-    """여러 종목 일괄 로드."""
-    result = {}
-    for code in codes:
-        df = load_daily(code, start, end)
-        if not df.empty:
-            result[code] = df
-    return result
+def load_multi(codes: list[str], start: str, end: str, max_workers: int = 4) -> dict[str, pd.DataFrame]:
+    """여러 종목 일괄 로드 (캐시 미스 종목만 병렬 조회, 결과는 codes 순서)."""
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(codes) or 1))) as pool:
+        frames = list(pool.map(lambda c: load_daily(c, start, end), codes))
+    return {code: df for code, df in zip(codes, frames) if not df.empty}
@@ -0,0 +1,134 @@
+"""
+그리드 서치 병렬 실행 — multiprocessing.shared_memory 로 OHLCV 1회 공개
+
+흐름:
+    with SharedArrays.from_frames(data) as shared:       # 부모: 종목별 OHLCV → 단일 공유 블록
+        pool.imap(worker, [(shared.manifest, ...), ...])  # 태스크에는 manifest(이름+레이아웃)만 전달
+    worker: attach_frames(manifest)                       # 프로세스당 1회 attach, zero-copy DataFrame
+
+- 태스크 피클링 비용이 조합 수 × 데이터 크기 → 조합 수 × manifest 크기로 감소
+- pool.imap 은 입력 순서대로 결과를 반환 → 진행 콜백/결과 순서가 순차 실행과 동일
+- spawn 컨텍스트 사용: api_server 스레드에서 호출돼도 fork-in-thread 교착 위험 없음
+
+analysis/wfo_optimizer.py 의 _worker(args) / grid_search_parallel 패턴을 일반화.
+"""
+import logging
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+_ALIGN = 64
+
+# 워커 프로세스별 attach 캐시: shm 이름 → {shm, arrays, meta, frames}
+_ATTACHED: dict = {}
+
+
+class SharedArrays:
+    """
+    dict[key, ndarray] 를 하나의 SharedMemory 블록으로 공개.
+
+    manifest = (shm 이름, [(key, dtype, shape, offset), ...], meta)
+    다른 프로세스는 attach_arrays(manifest) 로 복사 없이 같은 메모리를 본다.
+    생성한 프로세스가 close() (또는 with 종료) 시 unlink.
+    """
+
+    def __init__(self, arrays: dict, meta: Optional[dict] = None):
+        layout, offset = [], 0
+        prepared = []
+        for key, arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            layout.append((key, arr.dtype.str, arr.shape, offset))
+            prepared.append((arr, offset))
+            offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+
+        self._shm = SharedMemory(create=True, size=max(offset, 1))
+        for arr, off in prepared:
+            dst = np.ndarray(arr.shape, dtype=arr.dtype, buffer=self._shm.buf, offset=off)
+            dst[...] = arr
+        self.manifest = (self._shm.name, layout, meta or {})
+        self.nbytes = offset
+
+    @classmethod
+    def from_frames(cls, frames: dict, columns: tuple = OHLCV_COLUMNS) -> 'SharedArrays':
+        """
+        종목별 DataFrame → (컬럼 × 봉) float64 + datetime64 인덱스 배열로 공개.
+        attach_frames() 로 동일 컬럼/인덱스의 DataFrame 복원.
+        """
+        arrays, tz = {}, {}
+        for symbol, df in frames.items():
+            idx = pd.DatetimeIndex(df.index)
+            tz[symbol] = str(idx.tz) if idx.tz is not None else None
+            if idx.tz is not None:
+                idx = idx.tz_convert('UTC').tz_localize(None)
+            arrays[(symbol, 'index')] = idx.to_numpy()   # datetime64 (원래 단위 유지)
+            arrays[(symbol, 'values')] = df[list(columns)].to_numpy(dtype=np.float64).T
+        return cls(arrays, meta={'columns': list(columns), 'tz': tz, 'symbols': list(frames)})
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self) -> 'SharedArrays':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _attach(manifest: tuple) -> dict:
+    name, layout, meta = manifest
+    entry = _ATTACHED.get(name)
+    if entry is not None:
+        return entry
+
+    # 풀 워커는 부모의 resource_tracker 를 공유 → 등록은 중복 무시, unlink 는 부모 close() 가 담당
+    shm = SharedMemory(name=name)
+    arrays = {
+        key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for key, dtype, shape, offset in layout
+    }
+    entry = {'shm': shm, 'arrays': arrays, 'meta': meta, 'frames': None}
+    _ATTACHED[name] = entry
+    return entry
+
+
+def attach_arrays(manifest: tuple) -> dict:
+    """manifest → {key: ndarray} (공유 메모리 view, 프로세스당 1회 attach)."""
+    return _attach(manifest)['arrays']
+
+
+def attach_frames(manifest: tuple) -> dict:
+    """SharedArrays.from_frames() manifest → {symbol: DataFrame} (공유 메모리 view)."""
+    entry = _attach(manifest)
+    if entry['frames'] is None:
+        arrays, meta = entry['arrays'], entry['meta']
+        frames = {}
+        for symbol in meta['symbols']:
+            index = pd.DatetimeIndex(arrays[(symbol, 'index')])
+            if meta['tz'][symbol]:
+                index = index.tz_localize('UTC').tz_convert(meta['tz'][symbol])
+            # (컬럼 × 봉) C-order 의 전치 → pandas 블록 그대로 사용 (복사 없음)
+            frames[symbol] = pd.DataFrame(
+                arrays[(symbol, 'values')].T, index=index, columns=meta['columns'], copy=False,
+            )
+        entry['frames'] = frames
+    return entry['frames']
+
+
+def make_pool(n_workers: int):
+    """spawn 컨텍스트 프로세스 풀."""
+    return get_context('spawn').Pool(processes=n_workers)
+
@@ -12,6 +12,9 @@
     # 스윙 그리드 (min_hold × trailing × BE trigger)
     python -m backtest.runner --swing-grid
     python -m backtest.runner --swing-grid --min-hold 4 8 16 --trailing 0.03 0.05
+
+    # 병렬 (프로세스 4개, 결과 순서는 순차 실행과 동일)
+    python -m backtest.runner --grid-search --workers 4
 """
 import argparse
 import itertools
@@ -28,6 +31,7 @@ from backtest.adapter import SMCAdapter
 from backtest.engine  import BacktestEngine
 from backtest.metrics import calculate, aggregate
 from backtest.fitness import RollingFitnessTracker
+from backtest.parallel import SharedArrays, attach_arrays, attach_frames, make_pool
 
 # 백테스트 중 SMC 내부 logger 억제
 logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(message)s')
@@ -112,6 +116,11 @@ _STRATEGY_MAP = {
 }
 
 
+def _signal_key(symbol: str, config: dict, adapter_kwargs: dict) -> tuple:
+    """진입 신호 마스크 캐시 키 — 신호에 영향을 주는 값만 포함 (청산 파라미터 제외)."""
+    return (symbol, tuple(sorted(config.items())), tuple(sorted(adapter_kwargs.items())))
+
+
 def _run_single_strategy(
     data: dict,
     config: dict,
@@ -120,11 +129,15 @@ def _run_single_strategy(
     mode: str = 'tp_sl',
     use_fitness: bool = False,
     fitness_kwargs: dict = None,
+    signal_cache: dict = None,
     **adapter_kwargs,
 ) -> tuple[list, list]:
     """
     use_fitness=True 시 RollingFitnessTracker를 생성해 종목별로 공유.
     종목 순서대로 누적 → 진행할수록 fitness 필터가 실시간 작동.
+
+    signal_cache 가 주어지면 (종목, config, 전략) 별 진입 신호 마스크를 1회만 계산해
+    그리드 조합 간 재사용 (use_fitness=True 시에는 신호가 거래 결과에 의존 → 미사용).
     """
     # 공유 fitness tracker (use_fitness=True 시)
     tracker = RollingFitnessTracker(**(fitness_kwargs or {})) if use_fitness else None
@@ -156,7 +169,14 @@ def _run_single_strategy(
             on_trade_complete=_make_on_complete(symbol, tracker),
             **engine_kwargs,
         )
-        result = engine.run(df, symbol)
+        mask = None
+        if signal_cache is not None and tracker is None:
+            key = _signal_key(symbol, config, adapter_kwargs)
+            mask = signal_cache.get(key)
+            if mask is None:
+                mask = sym_adapter.signal_mask(df)
+                signal_cache[key] = mask
+        result = engine.run(df, symbol, signal_mask=mask)
         m = calculate(symbol, result.trades)
         all_metrics.append(m)
         all_trades.extend(result.trades)
@@ -238,6 +258,108 @@ def run(
     return results
 
 
+def _tp_sl_combo(
+    data, config, adapter_kwargs, tp, sl,
+    mode: str = 'tp_sl',
+    signal_cache: dict = None,
+) -> tuple[dict, str]:
+    """TP/SL 조합 1개 실행 → (row, 로그 라인)."""
+    engine_kwargs = dict(tp_pct=tp, sl_pct=-sl)
+    m_list, _ = _run_single_strategy(
+        data, config, engine_kwargs,
+        label=f'TP{tp*100:.0f}/SL{sl*100:.0f}',
+        mode=mode,
+        signal_cache=signal_cache,
+        **adapter_kwargs,
+    )
+    agg   = aggregate(m_list, mode)
+    win   = agg['overall_win_rate'] * 100
+    ret   = agg['total_return'] * 100
+    mdd   = agg['avg_mdd'] * 100
+    rr    = agg['avg_rr']
+    score = rr * ret if math.isfinite(rr) and math.isfinite(ret) else 0.0
+
+    row = {
+        'tp': tp, 'sl': sl,
+        'trades': agg['total_trades'],
+        'win_pct': round(win, 1), 'rr': rr,
+        'mdd': round(mdd, 1), 'ret': round(ret, 1),
+        'score': round(score, 2),
+        'passed': agg['passed_symbols'],
+    }
+    line = (
+        f'  {tp*100:>4.1f}%  {sl*100:>4.1f}%  '
+        f'{agg["total_trades"]:>6}  {win:>4.1f}%  {rr:>4.2f}  '
+        f'{mdd:>5.1f}%  {ret:>+5.1f}%  {score:>+7.2f}  {agg["passed_symbols"]}'
+    )
+    return row, line
+
+
+def _grid_rows(
+    data, config, adapter_kwargs, kind, indexed_combos,
+    workers: int = 1,
+    signal_cache: dict = None,
+    **combo_kwargs,
+):
+    """
+    (done, (row, line)) 를 조합 순서대로 yield.
+
+    workers <= 1: 현재 프로세스에서 순차 실행 (signal_cache 공유)
+    workers > 1 : OHLCV 를 shared_memory 로 1회 공개 → spawn 풀에서 조합별 실행.
+                  진입 신호 마스크도 종목별로 풀에서 1회 계산 후 공유 (use_fitness 시 제외).
+    """
+    fn = _COMBO_FUNCS[kind]
+    if workers <= 1 or len(indexed_combos) <= 1:
+        for done, combo in indexed_combos:
+            yield done, fn(data, config, adapter_kwargs, *combo,
+                           signal_cache=signal_cache, **combo_kwargs)
+        return
+
+    n_workers = min(workers, len(indexed_combos))
+    with SharedArrays.from_frames(data) as shared_data, make_pool(n_workers) as pool:
+        shared_masks = None
+        try:
+            if not combo_kwargs.get('use_fitness'):
+                masks = pool.map(
+                    _mask_task,
+                    [(shared_data.manifest, sym, config, adapter_kwargs) for sym in data],
+                )
+                shared_masks = SharedArrays(dict(zip(data, masks)))
+            tasks = [
+                (shared_data.manifest, shared_masks.manifest if shared_masks else None,
+                 kind, config, adapter_kwargs, combo, combo_kwargs)
+                for _, combo in indexed_combos
+            ]
+            # imap: 완료 순서와 무관하게 입력 순서대로 반환 → 결정적 진행 보고
+            for (done, _), result in zip(indexed_combos, pool.imap(_combo_task, tasks)):
+                yield done, result
+        finally:
+            if shared_masks is not None:
+                shared_masks.close()
+
+
+def _mask_task(args: tuple):
+    """풀 워커: (data manifest, symbol, config, adapter_kwargs) → 진입 신호 마스크"""
+    manifest, symbol, config, adapter_kwargs = args
+    df = attach_frames(manifest)[symbol]
+    return SMCAdapter(config, symbol=symbol, **adapter_kwargs).signal_mask(df)
+
+
+def _combo_task(args: tuple):
+    """풀 워커: 조합 1개 실행 → (row, line)"""
+    data_manifest, mask_manifest, kind, config, adapter_kwargs, combo, combo_kwargs = args
+    global _QUIET
+    _QUIET = True   # 워커 종목별 로그 억제 (조합 단위 로그는 부모가 출력)
+
+    data = attach_frames(data_manifest)
+    signal_cache = None
+    if mask_manifest is not None:
+        masks = attach_arrays(mask_manifest)
+        signal_cache = {_signal_key(sym, config, adapter_kwargs): masks[sym] for sym in data}
+    return _COMBO_FUNCS[kind](data, config, adapter_kwargs, *combo,
+                              signal_cache=signal_cache, **combo_kwargs)
+
+
 def run_grid_search(
     symbols:    list[str]   = None,
     start:      str         = '2022-01-01',
@@ -255,12 +377,15 @@ def run_grid_search(
     on_progress = None,    # callback(done, total, param1, param2, row) → 실시간 진행 보고
     use_fitness: bool  = False,   # Fitness Score 필터 활성화
     fitness_kwargs: dict = None,  # RollingFitnessTracker 파라미터
+    workers: int = 1,             # >1 → 프로세스 풀 병렬 (OHLCV 는 shared_memory 로 1회 공개)
 ):
     """B+VOL 전략 그리드 서치.
 
     mode='tp_sl': TP × SL 조합
     mode='swing': min_hold × trailing × be_trigger 조합
 
+    workers > 1 이어도 결과 리스트/on_progress 호출 순서는 순차 실행과 동일.
+
     on_progress(done, total, p1, p2, row_dict | None):
         row_dict = None → 데이터 로드 완료 알림 (done=0)
         row_dict = {...} → 조합 1개 완료
@@ -322,6 +447,8 @@ def run_grid_search(
         on_progress(0, 0, None, None, None)
 
     config = {'swing_lookback': swing_lb, 'sweep_lookback': sweep_lb}
+    # 진입 신호는 TP/SL/trailing 조합과 무관 → 종목당 1회 계산 후 전 조합에서 재사용
+    signal_cache = {}
 
     # ══════════════════════════════════════════════════════════════════════
     if mode == 'swing':
@@ -330,6 +457,8 @@ def run_grid_search(
             adapter_kwargs, on_progress, _log, mode,
             use_fitness=use_fitness,
             fitness_kwargs=fitness_kwargs,
+            signal_cache=signal_cache,
+            workers=workers,
         )
     # ══════════════════════════════════════════════════════════════════════
     # TP/SL 그리드
@@ -340,39 +469,17 @@ def run_grid_search(
     _log(f'  {"TP":>5}  {"SL":>5}  {"trades":>6}  {"win%":>5}  {"RR":>4}  {"MDD":>6}  {"ret%":>6}  {"RR×ret":>7}  pass')
     _log(f'  {"-"*62}')
 
-    for done, (tp, sl) in enumerate(combos, 1):
-        engine_kwargs = dict(tp_pct=tp, sl_pct=-sl)
-        m_list, _ = _run_single_strategy(
-            data, config, engine_kwargs,
-            label=f'TP{tp*100:.0f}/SL{sl*100:.0f}',
-            mode=mode,
-            **adapter_kwargs,
-        )
-        agg   = aggregate(m_list, mode)
-        win   = agg['overall_win_rate'] * 100
-        ret   = agg['total_return'] * 100
-        mdd   = agg['avg_mdd'] * 100
-        rr    = agg['avg_rr']
-        score = rr * ret if math.isfinite(rr) and math.isfinite(ret) else 0.0
-
-        row = {
-            'tp': tp, 'sl': sl,
-            'trades': agg['total_trades'],
-            'win_pct': round(win, 1), 'rr': rr,
-            'mdd': round(mdd, 1), 'ret': round(ret, 1),
-            'score': round(score, 2),
-            'passed': agg['passed_symbols'],
-        }
+    rows = _grid_rows(
+        data, config, adapter_kwargs, 'tp_sl', list(enumerate(combos, 1)),
+        workers, signal_cache, mode=mode,
+    )
+    for done, (row, line) in rows:
         grid_results.append(row)
 
         if on_progress:
-            on_progress(done, total, tp, sl, row)
+            on_progress(done, total, row['tp'], row['sl'], row)
 
-        _log(
-            f'  {tp*100:>4.1f}%  {sl*100:>4.1f}%  '
-            f'{agg["total_trades"]:>6}  {win:>4.1f}%  {rr:>4.2f}  '
-            f'{mdd:>5.1f}%  {ret:>+5.1f}%  {score:>+7.2f}  {agg["passed_symbols"]}'
-        )
+        _log(line)
 
     best = max(grid_results, key=lambda x: x['score'])
     _log(f'\n{"="*65}')
@@ -393,11 +500,103 @@ def run_grid_search(
     return grid_results
 
 
+def _swing_combo(
+    data, config, adapter_kwargs, tp, min_hold, trail, be_trig,
+    sl_fixed: float,
+    mode: str = 'swing',
+    use_fitness: bool = False,
+    fitness_kwargs: dict = None,
+    signal_cache: dict = None,
+) -> tuple[dict, str]:
+    """스윙 조합 1개 실행 → (row, 로그 라인)."""
+    engine_kwargs = dict(
+        tp_pct         = tp,
+        sl_pct         = -sl_fixed,
+        min_hold_bars  = min_hold,
+        trailing_pct   = trail,
+        be_trigger_pct = be_trig,
+        swing_mode     = True,
+    )
+    label = f'tp{tp*100:.0f}/h{min_hold}/tr{trail*100:.0f}/be{be_trig*100:.0f}'
+    m_list, _ = _run_single_strategy(
+        data, config, engine_kwargs,
+        label=label, mode=mode,
+        use_fitness=use_fitness,
+        fitness_kwargs=fitness_kwargs,
+        signal_cache=signal_cache,
+        **adapter_kwargs,
+    )
+    agg = aggregate(m_list, mode)
+    win  = agg['overall_win_rate'] * 100
+    ret  = agg['total_return'] * 100
+    mdd  = agg['avg_mdd'] * 100
+    rr   = agg['avg_rr']
+    cap  = agg['avg_capture_rate'] * 100
+    mfe  = agg['avg_mfe_pct']
+    mae  = agg['avg_mae_pct']
+    sl   = agg['sl_hit_ratio'] * 100
+    bwr  = agg['big_winner_ratio'] * 100
+    m10  = agg['mfe_10plus_ratio'] * 100
+
+    # 스윙 score: capture_rate × BW boost × MAE 패널티 × MDD 패널티
+    mdd_penalty = max(0.0, 1.0 - abs(agg['avg_mdd']) / 0.10)
+    mae_penalty = max(0.3, 1.0 - agg['mae_3plus_ratio'])   # MAE>3% 많으면 감점
+    bw_boost    = 1.0 + agg['big_winner_ratio'] * 2.0
+    score = (agg['avg_capture_rate'] * bw_boost * mdd_penalty * mae_penalty) if math.isfinite(cap) else 0.0
+
+    row = {
+        'tp':               tp,
+        'min_hold':         min_hold,
+        'trailing':         trail,
+        'be_trigger':       be_trig,
+        'trades':           agg['total_trades'],
+        'win_pct':          round(win, 1),
+        'rr':               rr,
+        'capture_rate':     round(cap, 1),
+        'avg_mfe_pct':      round(mfe, 2),
+        'avg_mae_pct':      round(mae, 2),
+        'mae_3plus_ratio':  round(agg['mae_3plus_ratio'] * 100, 1),
+        'sl_hit_ratio':     round(sl, 1),
+        'big_winner_ratio': round(bwr, 1),
+        'mfe_10plus_ratio': round(m10, 1),
+        'mdd':              round(mdd, 1),
+        'ret':              round(ret, 1),
+        'score':            round(score, 4),
+        'passed':           agg['passed_symbols'],
+        # 시간대별 수익
+        'ret_d1':     agg['ret_d1'],
+        'ret_d2_5':   agg['ret_d2_5'],
+        'ret_d6_14':  agg['ret_d6_14'],
+        'ret_d15plus': agg['ret_d15plus'],
+        'cnt_d1':     agg['cnt_d1'],
+        'cnt_d2_5':   agg['cnt_d2_5'],
+        'cnt_d6_14':  agg['cnt_d6_14'],
+        'cnt_d15plus': agg['cnt_d15plus'],
+    }
+    line = (
+        f'  {tp*100:>4.0f}%  {min_hold:>4}  {trail*100:>4.0f}%  {be_trig*100:>4.0f}%  '
+        f'{agg["total_trades"]:>6}  {win:>4.1f}%  {cap:>4.1f}%  '
+        f'{mfe:>4.1f}%  {mae:>4.1f}%  {sl:>3.0f}%  '
+        f'{bwr:>4.1f}%  {m10:>4.1f}%  '
+        f'{mdd:>5.1f}%  {ret:>+5.1f}%  {score:>+7.4f}  {agg["passed_symbols"]}'
+    )
+    return row, line
+
+
+# 조합 종류 → 실행 함수 (_grid_rows / 풀 워커 공용)
+_COMBO_FUNCS = {
+    'tp_sl': _tp_sl_combo,
+    'swing': _swing_combo,
+}
+
+
 def _swing_grid(
     data, config, combos, sl_fixed,
     adapter_kwargs, on_progress, _log, mode,
     use_fitness: bool = False,
     fitness_kwargs: dict = None,
+    signal_cache: dict = None,
+    workers: int = 1,
 ):
     """스윙 그리드 내부 실행 — TP × min_hold × trailing × be_trigger."""
     total        = len(combos)
@@ -411,86 +610,23 @@ def _swing_grid(
     )
     _log(f'  {"-"*114}')
 
-    for done, (tp, min_hold, trail, be_trig) in enumerate(combos, 1):
-        # be_trigger < trailing 이어야 의미 있음 (방어)
-        if be_trig >= trail:
-            continue
-
-        engine_kwargs = dict(
-            tp_pct         = tp,
-            sl_pct         = -sl_fixed,
-            min_hold_bars  = min_hold,
-            trailing_pct   = trail,
-            be_trigger_pct = be_trig,
-            swing_mode     = True,
-        )
-        label = f'tp{tp*100:.0f}/h{min_hold}/tr{trail*100:.0f}/be{be_trig*100:.0f}'
-        m_list, _ = _run_single_strategy(
-            data, config, engine_kwargs,
-            label=label, mode=mode,
-            use_fitness=use_fitness,
-            fitness_kwargs=fitness_kwargs,
-            **adapter_kwargs,
-        )
-        agg = aggregate(m_list, mode)
-        win  = agg['overall_win_rate'] * 100
-        ret  = agg['total_return'] * 100
-        mdd  = agg['avg_mdd'] * 100
-        rr   = agg['avg_rr']
-        cap  = agg['avg_capture_rate'] * 100
-        mfe  = agg['avg_mfe_pct']
-        mae  = agg['avg_mae_pct']
-        sl   = agg['sl_hit_ratio'] * 100
-        bwr  = agg['big_winner_ratio'] * 100
-        m10  = agg['mfe_10plus_ratio'] * 100
-
-        # 스윙 score: capture_rate × BW boost × MAE 패널티 × MDD 패널티
-        mdd_penalty = max(0.0, 1.0 - abs(agg['avg_mdd']) / 0.10)
-        mae_penalty = max(0.3, 1.0 - agg['mae_3plus_ratio'])   # MAE>3% 많으면 감점
-        bw_boost    = 1.0 + agg['big_winner_ratio'] * 2.0
-        score = (agg['avg_capture_rate'] * bw_boost * mdd_penalty * mae_penalty) if math.isfinite(cap) else 0.0
-
-        row = {
-            'tp':               tp,
-            'min_hold':         min_hold,
-            'trailing':         trail,
-            'be_trigger':       be_trig,
-            'trades':           agg['total_trades'],
-            'win_pct':          round(win, 1),
-            'rr':               rr,
-            'capture_rate':     round(cap, 1),
-            'avg_mfe_pct':      round(mfe, 2),
-            'avg_mae_pct':      round(mae, 2),
-            'mae_3plus_ratio':  round(agg['mae_3plus_ratio'] * 100, 1),
-            'sl_hit_ratio':     round(sl, 1),
-            'big_winner_ratio': round(bwr, 1),
-            'mfe_10plus_ratio': round(m10, 1),
-            'mdd':              round(mdd, 1),
-            'ret':              round(ret, 1),
-            'score':            round(score, 4),
-            'passed':           agg['passed_symbols'],
-            # 시간대별 수익
-            'ret_d1':     agg['ret_d1'],
-            'ret_d2_5':   agg['ret_d2_5'],
-            'ret_d6_14':  agg['ret_d6_14'],
-            'ret_d15plus': agg['ret_d15plus'],
-            'cnt_d1':     agg['cnt_d1'],
-            'cnt_d2_5':   agg['cnt_d2_5'],
-            'cnt_d6_14':  agg['cnt_d6_14'],
-            'cnt_d15plus': agg['cnt_d15plus'],
-        }
+    # be_trigger < trailing 이어야 의미 있음 (방어) — done 번호는 전체 조합 기준 유지
+    indexed = [
+        (done, combo) for done, combo in enumerate(combos, 1)
+        if combo[3] < combo[2]
+    ]
+    rows = _grid_rows(
+        data, config, adapter_kwargs, 'swing', indexed, workers, signal_cache,
+        sl_fixed=sl_fixed, mode=mode,
+        use_fitness=use_fitness, fitness_kwargs=fitness_kwargs,
+    )
+    for done, (row, line) in rows:
         grid_results.append(row)
 
         if on_progress:
-            on_progress(done, total, min_hold, trail, row)
+            on_progress(done, total, row['min_hold'], row['trailing'], row)
 
-        _log(
-            f'  {tp*100:>4.0f}%  {min_hold:>4}  {trail*100:>4.0f}%  {be_trig*100:>4.0f}%  '
-            f'{agg["total_trades"]:>6}  {win:>4.1f}%  {cap:>4.1f}%  '
-            f'{mfe:>4.1f}%  {mae:>4.1f}%  {sl:>3.0f}%  '
-            f'{bwr:>4.1f}%  {m10:>4.1f}%  '
-            f'{mdd:>5.1f}%  {ret:>+5.1f}%  {score:>+7.4f}  {agg["passed_symbols"]}'
-        )
+        _log(line)
 
     if not grid_results:
         _log('  [유효 조합 없음 — be_trigger < trailing 조건 불충족]')
@@ -547,6 +683,7 @@ def main():
     parser.add_argument('--trailing',    nargs='+',  type=float,    help='트레일링 % 목록 (예: 0.02 0.03 0.05)')
     parser.add_argument('--be-trigger',  nargs='+',  type=float,    help='BE 전환 % 목록 (예: 0.02 0.03 0.05)')
     parser.add_argument('--strategy',    default='B+VOL',           help='전략 이름')
+    parser.add_argument('--workers',     type=int,   default=1,     help='그리드 서치 병렬 프로세스 수')
     args = parser.parse_args()
 
     if args.swing_grid:
@@ -563,6 +700,7 @@ def main():
             be_trigger_range = args.be_trigger,
             strategy         = args.strategy,
             mode             = 'swing',
+            workers          = args.workers,
         )
     elif args.grid_search:
         run_grid_search(
@@ -575,6 +713,7 @@ def main():
             sl_range = args.sl_range,
             strategy = args.strategy,
             mode     = 'tp_sl',
+            workers  = args.workers,
         )
     else:
         run(
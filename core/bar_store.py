@@ -0,0 +1,288 @@
+"""
+core/bar_store.py — 종목별 분봉 상주 저장소 (NumPy 링버퍼)
+
+역할:
+  1. (종목, 타임프레임) 단위로 OHLCV 분봉을 메모리에 상주
+  2. 키움 ka10080 응답을 매 주기 전체 재파싱하지 않고 꼬리(tail)만 병합
+     - 마지막 저장 봉과 같은 시각 → 마지막 봉 갱신 (진행 중인 봉)
+     - 마지막 저장 봉 이후 시각  → 신규 봉 추가
+     - 그 이전 시각             → 이미 저장됨, 파싱 생략
+  3. 연속성 보장 불가(응답의 가장 오래된 봉이 저장 봉보다 최신) → 전체 재적재
+
+배경:
+  check_all_stocks 가 매 주기 종목당 최대 900봉을 DataFrame 으로 만들고
+  rename / to_numeric / abs / sort 를 반복 → 60~100 종목에서 LOOP_LAG 의 주원인.
+  실제로 바뀌는 봉은 주기당 1~2개뿐이므로, 응답(최신→과거 순)을 앞에서부터
+  읽다가 저장된 마지막 봉보다 과거가 나오면 즉시 중단한다.
+
+사용:
+  store = MinuteBarStore(capacity=900)
+  store.merge_chart_rows("005930", "5", result['stk_min_pole_chart_qry'])
+  df = store.get_frame("005930", "5")   # open/high/low/close/volume/cntr_tm (오름차순)
+
+v1.0 2026-10-16: 최초 작성
+"""
+import logging
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# ka10080 및 호환 API 컬럼 → 표준 OHLCV (check_all_stocks 매핑과 동일, 앞쪽 우선)
+_FIELD_KEYS: Dict[str, Tuple[str, ...]] = {
+    'close': ('cur_prc', 'stck_prpr', 'cur_price'),
+    'open': ('open_pric', 'stck_oprc', 'open_price'),
+    'high': ('high_pric', 'stck_hgpr', 'high_price'),
+    'low': ('low_pric', 'stck_lwpr', 'low_price'),
+    'volume': ('trde_qty', 'cntg_vol', 'acml_vol', 'vol', 'acml_tr_pbmn'),
+}
+_TIME_KEY = 'cntr_tm'
+_DEFAULT_VOLUME = 1000.0  # volume 컬럼 부재 시 기본값 (기존 동작 유지)
+
+
+def _to_abs_float(value: Any) -> float:
+    """키움 부호 문자열("-78800") → 절대값 float. 변환 불가 시 NaN."""
+    try:
+        return abs(float(value))
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _to_bar_time(value: Any) -> Optional[int]:
+    """cntr_tm("20260109090500") → int. 변환 불가 시 None."""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _pick(row: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        if key in row:
+            return row[key]
+    return None
+
+
+class BarRingBuffer:
+    """
+    고정 용량 OHLCV 링버퍼 (시간 오름차순 유지)
+
+    배열은 생성 시 한 번만 할당하며, 용량 초과 시 가장 오래된 봉을 덮어쓴다.
+    """
+
+    def __init__(self, capacity: int = 900):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+        self.capacity = capacity
+        self._ts = np.zeros(capacity, dtype=np.int64)
+        self._ohlcv = np.full((5, capacity), np.nan, dtype=np.float64)
+        self._start = 0  # 가장 오래된 봉의 물리 인덱스
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_time(self) -> Optional[int]:
+        """마지막(가장 최신) 봉 시각. 비어 있으면 None."""
+        if self._size == 0:
+            return None
+        return int(self._ts[(self._start + self._size - 1) % self.capacity])
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+
+    def _write(self, pos: int, ts: int, bar: Sequence[float]) -> None:
+        self._ts[pos] = ts
+        self._ohlcv[:, pos] = bar
+
+    def append(self, ts: int, bar: Sequence[float]) -> None:
+        """신규 봉 추가 (ts 는 last_time 보다 커야 함)."""
+        if self._size < self.capacity:
+            pos = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            pos = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._write(pos, ts, bar)
+
+    def last(self) -> Optional[Tuple[int, List[float]]]:
+        """마지막 봉 (시각, [open, high, low, close, volume]). 비어 있으면 None."""
+        if self._size == 0:
+            return None
+        pos = (self._start + self._size - 1) % self.capacity
+        return int(self._ts[pos]), self._ohlcv[:, pos].tolist()
+
+    def update_last(self, bar: Sequence[float]) -> None:
+        """마지막 봉 값 덮어쓰기 (진행 중인 봉 갱신)."""
+        if self._size == 0:
+            raise IndexError("update_last on empty buffer")
+        pos = (self._start + self._size - 1) % self.capacity
+        self._ohlcv[:, pos] = bar
+
+    def upsert(self, ts: int, bar: Sequence[float]) -> bool:
+        """
+        시각 기준 병합.
+
+        Returns:
+            True: 추가/갱신됨, False: 과거 봉이라 무시됨
+        """
+        last = self.last_time
+        if last is None or ts > last:
+            self.append(ts, bar)
+            return True
+        if ts == last:
+            self.update_last(bar)
+            return True
+        return False
+
+    def _ordered_index(self) -> np.ndarray:
+        return (self._start + np.arange(self._size)) % self.capacity
+
+    def times(self) -> np.ndarray:
+        """시간 오름차순 봉 시각 배열 (복사본)."""
+        return self._ts[self._ordered_index()]
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """시간 오름차순 (봉 시각, (5 × 봉) OHLCV) 배열 (복사본)."""
+        idx = self._ordered_index()
+        return self._ts[idx], self._ohlcv[:, idx]
+
+    def to_frame(self) -> pd.DataFrame:
+        """시간 오름차순 DataFrame (호출자가 자유롭게 수정 가능한 복사본)."""
+        ts, ohlcv = self.arrays()
+        return pd.DataFrame({
+            'open': ohlcv[0],
+            'high': ohlcv[1],
+            'low': ohlcv[2],
+            'close': ohlcv[3],
+            'volume': ohlcv[4],
+            _TIME_KEY: ts,
+        })
+
+
+class MinuteBarStore:
+    """
+    (종목, 타임프레임) → BarRingBuffer 상주 저장소
+
+    Args:
+        capacity: 종목당 보관 봉 수 (ka10080 1페이지 = 900봉)
+    """
+
+    def __init__(self, capacity: int = 900):
+        self.capacity = capacity
+        self._buffers: Dict[Tuple[str, str], BarRingBuffer] = {}
+        self.stats = {'merged_rows': 0, 'skipped_rows': 0, 'rebuilds': 0}
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._buffers and len(self._buffers[key]) > 0
+
+    def _buffer(self, symbol: str, timeframe: str) -> BarRingBuffer:
+        key = (symbol, str(timeframe))
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = BarRingBuffer(self.capacity)
+            self._buffers[key] = buf
+        return buf
+
+    @staticmethod
+    def _parse_row(row: Dict[str, Any], has_volume: bool) -> Optional[Tuple[int, List[float]]]:
+        ts = _to_bar_time(row.get(_TIME_KEY))
+        if ts is None:
+            return None
+        bar = [_to_abs_float(_pick(row, _FIELD_KEYS[f])) for f in ('open', 'high', 'low', 'close')]
+        bar.append(_to_abs_float(_pick(row, _FIELD_KEYS['volume'])) if has_volume else _DEFAULT_VOLUME)
+        return ts, bar
+
+    def merge_chart_rows(self, symbol: str, timeframe: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        키움 분봉 응답 행(최신→과거 순)을 저장소에 병합.
+
+        저장된 마지막 봉보다 과거 행이 나오면 파싱을 중단한다. 응답 전체가
+        저장 구간보다 최신이라 연속성을 확인할 수 없으면 버퍼를 재적재한다.
+
+        Returns:
+            추가/갱신된 봉 수
+        """
+        rows = list(rows or [])
+        if not rows:
+            return 0
+
+        buf = self._buffer(symbol, timeframe)
+        has_volume = _pick(rows[0], _FIELD_KEYS['volume']) is not None
+
+        # 응답 정렬 방향 확인 (ka10080 은 최신→과거. 반대면 뒤집어서 동일 처리)
+        first_ts = _to_bar_time(rows[0].get(_TIME_KEY))
+        last_ts = _to_bar_time(rows[-1].get(_TIME_KEY))
+        if first_ts is not None and last_ts is not None and first_ts < last_ts:
+            rows = rows[::-1]
+            first_ts, last_ts = last_ts, first_ts
+
+        stored_last = buf.last_time
+        if stored_last is not None and last_ts is not None and last_ts > stored_last:
+            # 응답의 가장 오래된 봉조차 저장 봉 이후 → 중간 공백 가능성, 전체 재적재
+            logger.debug(f"[BAR_STORE] {symbol}/{timeframe} gap → rebuild ({stored_last} < {last_ts})")
+            buf.clear()
+            self.stats['rebuilds'] += 1
+            stored_last = None
+
+        tail: List[Tuple[int, List[float]]] = []
+        for row in rows:
+            parsed = self._parse_row(row, has_volume)
+            if parsed is None:
+                continue
+            if stored_last is not None and parsed[0] < stored_last:
+                break
+            tail.append(parsed)
+
+        changed = 0
+        for ts, bar in reversed(tail):
+            if buf.upsert(ts, bar):
+                changed += 1
+
+        self.stats['merged_rows'] += changed
+        self.stats['skipped_rows'] += len(rows) - len(tail)
+        return changed
+
+    def upsert_bar(self, symbol: str, timeframe: str, ts: int, bar: Sequence[float]) -> bool:
+        """봉 1개 추가/갱신 (실시간 체결 집계용). 과거 봉이면 False."""
+        return self._buffer(symbol, timeframe).upsert(ts, bar)
+
+    def last_bar(self, symbol: str, timeframe: str) -> Optional[Tuple[int, List[float]]]:
+        buf = self._buffers.get((symbol, str(timeframe)))
+        return buf.last() if buf is not None else None
+
+    def clear(self, symbol: str, timeframe: str) -> None:
+        buf = self._buffers.get((symbol, str(timeframe)))
+        if buf is not None:
+            buf.clear()
+
+    def get_frame(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+        """저장된 봉을 오름차순 DataFrame 으로 반환. 없으면 None."""
+        buf = self._buffers.get((symbol, str(timeframe)))
+        if buf is None or len(buf) == 0:
+            return None
+        return buf.to_frame()
+
+    def get_arrays(self, symbol: str, timeframe: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """저장된 봉을 (봉 시각, (5 × 봉) OHLCV) 배열로 반환 (DataFrame 생성 없음). 없으면 None."""
+        buf = self._buffers.get((symbol, str(timeframe)))
+        if buf is None or len(buf) == 0:
+            return None
+        return buf.arrays()
+
+    def discard(self, symbol: str) -> None:
+        """종목의 모든 타임프레임 버퍼 제거."""
+        for key in [k for k in self._buffers if k[0] == symbol]:
+            del self._buffers[key]
+
+    def retain(self, symbols: Iterable[Hashable]) -> int:
+        """symbols 에 없는 종목 버퍼 제거 (워치리스트 이탈 종목 정리). 제거 수 반환."""
+        keep = set(symbols)
+        stale = [k for k in self._buffers if k[0] not in keep]
+        for key in stale:
+            del self._buffers[key]
+        return len(stale)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+core/chart_downloader.py
+
+키움 분봉/일봉 대량 히스토리 다운로더 (연속조회 재개 + 파이프라인 + 압축 컬럼 파일)
+
+기존 방식 (core/kiwoom_rest_client.get_all_minute_chart_data / get_historical_data_for_backtest):
+  cont-yn/next-key 페이지를 직렬로 받으며 페이지마다 고정 0.5초 sleep,
+  결과는 dict 리스트로 메모리에만 보관 → 유니버스 수개월 분봉 백필에 수 시간, 실패하면 처음부터.
+
+ChartDownloader:
+  - 페이지 파이프라인: 페이지 N 응답을 받는 즉시 N+1 요청을 발행하고, 그동안 N 을 파싱/기록
+    (속도 제한은 고정 sleep 대신 AsyncKiwoomAPI 의 앱 키 공용 RateGovernor 예산 — 우선순위 최하위라
+     장중 실행해도 주문/청산/진입 조회에 양보)
+  - 재개: 페이지마다 압축 part 파일 기록 후 state.json 에 다음 next_key 저장 (원자적 교체)
+    → 중단 후 다시 실행하면 마지막으로 기록된 페이지 다음부터 이어받음
+  - 출력: 행 dict 대신 컬럼 배열 → Parquet(zstd)
+      {root}/{tf}/{symbol}/part_00000.parquet ...   진행 중 (페이지 단위)
+      {root}/{tf}/{symbol}.parquet                  완료 (시간 오름차순, 중복 제거)
+  - 증분: 완료 파일이 있으면 그 최신 봉까지만 받아 병합 (full=True 면 since 까지 전체)
+  - max_pages: 실행 1회당 페이지 상한. 넘으면 받은 분량은 완료 파일에 병합하되 state.json
+    (next_key) 은 남겨 두고, 다음 실행이 그 위치부터 더 과거로 이어받음 (since 가 바뀌어도 유지)
+  - 여러 종목 동시 다운로드 (concurrency 개)
+
+컬럼: ts (int64, YYYYMMDDHHMMSS — 일봉은 HHMMSS=000000), open, high, low, close, volume (float64)
+
+사용:
+  api = AsyncKiwoomAPI()
+  downloader = ChartDownloader(api, timeframe='1')
+  results = await downloader.download_many(['005930', '000660'], since=datetime(2026, 7, 1))
+  df = load_bars('005930', '1')
+
+  python -m core.chart_downloader 005930 000660 --tf 1 --days 90 --concurrency 4
+
+v1.0 2026-10-16: 최초 작성
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core.bar_store import _FIELD_KEYS, _pick, _to_abs_float, _to_bar_time
+from utils.rate_governor import PRIORITY_DASHBOARD, rate_priority
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent / 'data' / 'chart_history'
+COLUMNS = ('ts', 'open', 'high', 'low', 'close', 'volume')
+COMPRESSION = 'zstd'
+
+# 응답 행 목록 키 (분봉 / 일봉)
+_ROW_KEYS = {
+    'minute': ('stk_min_pole_chart_qry', 'stk_mnut_pole_chart_qry', 'output', 'output1', 'data'),
+    'daily': ('stk_dt_pole_chart_qry', 'stk_day_pole_chart_qry', 'output', 'output1', 'data'),
+}
+
+
+def _ts_int(value: datetime) -> int:
+    return int(value.strftime('%Y%m%d%H%M%S'))
+
+
+def parse_rows(rows: List[Dict[str, Any]], daily: bool = False) -> Dict[str, np.ndarray]:
+    """
+    응답 행 → 컬럼 배열 (시각 파싱 불가 행 제외, 응답 순서 유지)
+
+    분봉은 cntr_tm(YYYYMMDDHHMMSS), 일봉은 dt(YYYYMMDD) 를 ts 로 사용.
+    """
+    n = len(rows)
+    if daily:
+        raw_ts = (_to_bar_time(r.get('dt')) for r in rows)
+        ts = np.fromiter((t * 1000000 if t is not None else -1 for t in raw_ts), np.int64, n)
+    else:
+        ts = np.fromiter((_to_bar_time(r.get('cntr_tm')) or -1 for r in rows), np.int64, n)
+    cols = {'ts': ts}
+    for field in ('open', 'high', 'low', 'close', 'volume'):
+        keys = _FIELD_KEYS[field]
+        cols[field] = np.fromiter((_to_abs_float(_pick(r, keys)) for r in rows), np.float64, n)
+    valid = ts > 0
+    if not valid.all():
+        cols = {k: v[valid] for k, v in cols.items()}
+    return cols
+
+
+def _write_parquet(path: Path, cols: Dict[str, np.ndarray]) -> None:
+    table = pa.table({name: cols[name] for name in COLUMNS})
+    tmp = path.with_name(path.name + '.tmp')
+    pq.write_table(table, tmp, compression=COMPRESSION)
+    os.replace(tmp, path)
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(json.dumps(data, ensure_ascii=False))
+    os.replace(tmp, path)
+
+
+def bars_path(symbol: str, timeframe: str, root: Optional[Path] = None) -> Path:
+    return Path(root or DEFAULT_ROOT) / str(timeframe) / f'{symbol}.parquet'
+
+
+def load_bars(symbol: str, timeframe: str, root: Optional[Path] = None) -> pd.DataFrame:
+    """완료 파일 → DataFrame (DatetimeIndex 'datetime', open/high/low/close/volume). 없으면 빈 DF."""
+    path = bars_path(symbol, timeframe, root)
+    if not path.exists():
+        return pd.DataFrame(columns=list(COLUMNS[1:]), index=pd.DatetimeIndex([], name='datetime'))
+    df = pq.read_table(path).to_pandas()
+    df.index = pd.DatetimeIndex(pd.to_datetime(df.pop('ts').astype(str), format='%Y%m%d%H%M%S'),
+                                name='datetime')
+    return df
+
+
+class ChartDownloader:
+    """
+    종목별 연속조회 다운로더
+
+    Args:
+        api: AsyncKiwoomAPI 호환 (get_minute_chart / get_daily_chart 가 next_key, cont_yn 포함 dict 반환)
+        timeframe: '1','3','5','10','15','30','45','60' (분봉) 또는 'D' (일봉)
+        root: 출력 디렉토리 (None → data/chart_history)
+        max_pages: 실행 1회당 종목별 최대 페이지 (초과분은 다음 실행에서 이어받음)
+        concurrency: download_many 동시 종목 수
+        priority: RateGovernor 우선순위 (기본 최하위 — 장중 매매 조회에 양보)
+    """
+
+    def __init__(self, api, timeframe: str = '1', root: Optional[Path] = None,
+                 max_pages: int = 2000, concurrency: int = 4,
+                 priority: int = PRIORITY_DASHBOARD):
+        self.api = api
+        self.timeframe = str(timeframe)
+        self.daily = self.timeframe.upper() == 'D'
+        self.root = Path(root or DEFAULT_ROOT) / self.timeframe
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.priority = priority
+        self.stats = {'pages': 0, 'rows': 0, 'resumed': 0, 'errors': 0}
+
+    # ── 경로 / 상태 ───────────────────────────────────────────────────────
+
+    def _work_dir(self, symbol: str) -> Path:
+        return self.root / symbol
+
+    def _load_state(self, symbol: str) -> Optional[Dict[str, Any]]:
+        path = self._work_dir(symbol) / 'state.json'
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _existing_newest(self, symbol: str) -> Optional[int]:
+        path = self.root / f'{symbol}.parquet'
+        if not path.exists():
+            return None
+        ts = pq.read_table(path, columns=['ts']).column('ts').to_numpy()
+        return int(ts.max()) if len(ts) else None
+
+    # ── 조회 ──────────────────────────────────────────────────────────────
+
+    async def _fetch_page(self, symbol: str, cont_yn: str, next_key: str) -> Dict[str, Any]:
+        if self.daily:
+            return await self.api.get_daily_chart(stock_code=symbol, upd_stkpc_tp="1",
+                                                  cont_yn=cont_yn, next_key=next_key)
+        return await self.api.get_minute_chart(stock_code=symbol, tic_scope=self.timeframe,
+                                               upd_stkpc_tp="1", cont_yn=cont_yn, next_key=next_key)
+
+    def _rows(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        for key in _ROW_KEYS['daily' if self.daily else 'minute']:
+            if result.get(key):
+                return result[key]
+        return []
+
+    async def download(self, symbol: str, since: datetime, full: bool = False,
+                       restart: bool = False) -> Dict[str, Any]:
+        """
+        종목 1개 다운로드 (중단된 진행분이 있으면 이어받음)
+
+        Args:
+            symbol: 종목코드
+            since: 이 시각 이후 봉까지 (이전 봉은 버림)
+            full: 완료 파일이 있어도 since 까지 다시 받음 (기본은 완료 파일 최신 봉까지만)
+            restart: 진행 중 상태를 버리고 처음부터
+
+        Returns:
+            {'symbol', 'status': 'done'|'error'|'max_pages', 'pages', 'rows', 'resumed'}
+            max_pages 면 받은 봉은 완료 파일에 병합되고 이어받기 위치는 유지됨
+        """
+        with rate_priority(self.priority):
+            return await self._download(symbol, since, full, restart)
+
+    async def _download(self, symbol: str, since: datetime, full: bool, restart: bool) -> Dict[str, Any]:
+        work = self._work_dir(symbol)
+        state = None if restart else self._load_state(symbol)
+        if state is not None and state.get('since') != _ts_int(since):
+            # 이어받기 위치는 since 와 무관하게 유효 (CLI --days 는 날마다 since 가 바뀜)
+            # → 버리면 중단/페이지 상한 이전 과거 구간이 영영 안 채워짐, 멈출 지점만 갱신
+            state['since'] = _ts_int(since)
+            state['stop_ts'] = max(state['stop_ts'], _ts_int(since))
+        if state is None:
+            shutil.rmtree(work, ignore_errors=True)
+            stop_ts = _ts_int(since)
+            newest = None if full else self._existing_newest(symbol)
+            if newest is not None:
+                stop_ts = max(stop_ts, newest)     # 완료 파일의 최신 봉까지만 (겹친 봉은 병합 시 교체)
+            state = {'symbol': symbol, 'timeframe': self.timeframe, 'since': _ts_int(since),
+                     'stop_ts': stop_ts, 'next_key': '', 'pages': 0, 'rows': 0}
+            resumed = False
+        else:
+            resumed = state['pages'] > 0
+            if resumed:
+                self.stats['resumed'] += 1
+                logger.info(f"[CHART_DL] {symbol} {self.timeframe} 이어받기 (page {state['pages']})")
+        work.mkdir(parents=True, exist_ok=True)
+
+        status = 'done'
+        start_pages = state['pages']
+        first = state['pages'] == 0
+        pending: Optional[asyncio.Future] = asyncio.ensure_future(
+            self._fetch_page(symbol, 'N' if first else 'Y', state['next_key']))
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                if not isinstance(result, dict) or result.get('return_code') != 0:
+                    status = 'error'
+                    self.stats['errors'] += 1
+                    logger.warning(f"[CHART_DL] {symbol} page {state['pages']} 실패: "
+                                   f"{(result or {}).get('return_msg', result)}")
+                    break
+
+                next_key = result.get('next_key', '')
+                more = result.get('cont_yn') == 'Y' and bool(next_key)
+                if more and state['pages'] - start_pages + 1 < self.max_pages:
+                    # N+1 요청을 먼저 내보내고 N 파싱/기록
+                    pending = asyncio.ensure_future(self._fetch_page(symbol, 'Y', next_key))
+                    await asyncio.sleep(0)      # 파싱 전에 요청이 실제로 나가도록 한 번 양보
+
+                cols = parse_rows(self._rows(result), self.daily)
+                reached = bool(len(cols['ts'])) and cols['ts'].min() <= state['stop_ts']
+                if reached:
+                    keep = cols['ts'] >= state['stop_ts']
+                    cols = {k: v[keep] for k, v in cols.items()}
+
+                await asyncio.to_thread(self._commit_page, work, state, cols, next_key)
+
+                if reached:
+                    break
+                if pending is None:
+                    if more:
+                        status = 'max_pages'
+                    break
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        if status != 'error':
+            await asyncio.to_thread(self._compact, symbol, work, status == 'max_pages')
+        return {'symbol': symbol, 'status': status, 'pages': state['pages'],
+                'rows': state['rows'], 'resumed': resumed}
+
+    def _commit_page(self, work: Path, state: Dict[str, Any], cols: Dict[str, np.ndarray],
+                     next_key: str) -> None:
+        """part 파일 기록 → 상태 갱신 (이 순서라 중단 시점과 무관하게 재개 위치가 항상 기록된 페이지 다음)"""
+        if len(cols['ts']):
+            _write_parquet(work / f"part_{state['pages']:05d}.parquet", cols)
+        state['pages'] += 1
+        state['rows'] += int(len(cols['ts']))
+        state['next_key'] = next_key
+        _write_json(work / 'state.json', state)
+        self.stats['pages'] += 1
+        self.stats['rows'] += int(len(cols['ts']))
+
+    def _compact(self, symbol: str, work: Path, keep_state: bool = False) -> None:
+        """
+        part + 기존 완료 파일 병합 → 시간 오름차순, 같은 ts 는 새로 받은 봉 우선.
+
+        keep_state: 페이지 상한으로 멈춘 경우 — part 만 지우고 state.json(이어받기 위치) 유지
+        """
+        parts = sorted(work.glob('part_*.parquet'))
+        tables = [pq.read_table(p) for p in parts]
+        final = self.root / f'{symbol}.parquet'
+        if final.exists():
+            tables.append(pq.read_table(final))     # 뒤에 둬야 중복 시 새 봉이 남음
+        if tables:
+            df = pa.concat_tables(tables).to_pandas()
+            df = df.drop_duplicates('ts', keep='first').sort_values('ts', kind='stable')
+            _write_parquet(final, {name: df[name].to_numpy() for name in COLUMNS})
+        if keep_state:
+            for p in parts:
+                p.unlink(missing_ok=True)
+            logger.info(f"[CHART_DL] {symbol} {self.timeframe} 페이지 상한 → 병합 후 이어받기 위치 유지")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    async def download_many(self, symbols: Iterable[str], since: datetime, full: bool = False,
+                            restart: bool = False) -> Dict[str, Dict[str, Any]]:
+        """여러 종목 동시 다운로드 (동시 concurrency 개, 예산은 RateGovernor 가 배분)."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _one(symbol: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.download(symbol, since, full=full, restart=restart)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    logger.error(f"[CHART_DL] {symbol} 다운로드 실패: {e}", exc_info=True)
+                    return {'symbol': symbol, 'status': 'error', 'pages': 0, 'rows': 0, 'resumed': False}
+
+        results = await asyncio.gather(*(_one(s) for s in dict.fromkeys(symbols)))
+        return {r['symbol']: r for r in results}
+
+
+async def _main(args) -> None:
+    from kiwoom_api_async import AsyncKiwoomAPI
+
+    api = AsyncKiwoomAPI()
+    downloader = ChartDownloader(api, timeframe=args.tf, concurrency=args.concurrency,
+                                 max_pages=args.max_pages,
+                                 root=Path(args.root) if args.root else None)
+    since = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=args.days)
+    try:
+        results = await downloader.download_many(args.symbols, since, full=args.full, restart=args.restart)
+    finally:
+        await api.close()
+    for symbol, r in results.items():
+        print(f"{symbol}: {r['status']} pages={r['pages']} rows={r['rows']}"
+              f"{' (resumed)' if r['resumed'] else ''}")
+    print(f"total: {downloader.stats}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='키움 분봉/일봉 대량 다운로드 (재개 가능)')
+    parser.add_argument('symbols', nargs='+', help='종목코드')
+    parser.add_argument('--tf', default='1', help="분봉 간격(1,3,5,...) 또는 D")
+    parser.add_argument('--days', type=int, default=90, help='오늘부터 과거 일수')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--max-pages', type=int, default=2000)
+    parser.add_argument('--root', default=None, help='출력 디렉토리 (기본 data/chart_history)')
+    parser.add_argument('--full', action='store_true', help='완료 파일 무시하고 since 까지 전체')
+    parser.add_argument('--restart', action='store_true', help='진행 중 상태 버리고 처음부터')
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(parser.parse_args()))
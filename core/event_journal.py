@@ -0,0 +1,281 @@
+"""
+core/event_journal.py — 트레이딩 이벤트 바이너리 저널 (append-only)
+
+기존 방식:
+  analysis/*, api_server 가 auto_trading_YYYYMMDD.log / smc_decision_*.log 를 정규식으로
+  다시 파싱해 ACCEPT/REJECT/CHoCH/매매 이벤트를 복원 — 다일 분석마다 수 GB 텍스트 재파싱,
+  로그 문구가 바뀌면 조용히 0건.
+
+이벤트 저널:
+  이벤트 발생 지점에서 타입별 스키마로 직렬화해 일자별 파일에 append.
+  data/journal/events_YYYYMMDD.bin (KIWOOM_EVENT_JOURNAL_DIR 로 변경 가능)
+
+  레코드 레이아웃 (little-endian, length-prefixed):
+    0  length   u32  payload 길이
+    4  type_id  u8   EVENT_SCHEMAS 의 타입 번호
+    5  ts       f64  epoch 초
+    13 payload  필드 순서대로  s: u16 길이 + utf-8 / i: i64 / f: f64
+
+  - 쓰기: 레코드 1건 = O_APPEND write() 1회 (다른 프로세스와 섞여도 레코드 단위 유지)
+  - 읽기: 헤더만 보고 관심 없는 타입은 length 만큼 건너뜀 (payload 디코딩 없음)
+  - 스키마 진화: 필드는 끝에만 추가 — 옛 레코드는 없는 필드 None, 새 필드는 옛 reader 가 무시
+  - 쓰는 중 잘린 마지막 레코드는 읽기에서 무시
+
+사용:
+  from core.event_journal import emit, read_events
+  emit('ACCEPT', stock_code='005930', price=71500, conf=0.62, alpha=1.1, pos_mult=0.8)
+  for ev in read_events(date(2026, 3, 20), types=('ACCEPT', 'REJECT')):
+      ev['type'], ev['ts'], ev['stock_code'], ...
+
+v1.0 2026-10-16: 최초 작성
+"""
+import logging
+import os
+import struct
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 타입 번호는 파일에 기록되므로 변경 금지 (새 타입은 새 번호, 새 필드는 끝에 추가)
+EVENT_SCHEMAS: Dict[str, Tuple[int, Tuple[Tuple[str, str], ...]]] = {
+    'ACCEPT': (1, (('stock_code', 's'), ('price', 'i'), ('conf', 'f'),
+                   ('alpha', 'f'), ('pos_mult', 'f'))),
+    'REJECT': (2, (('stock_code', 's'), ('level', 's'), ('reason', 's'))),
+    'CHOCH': (3, (('stock_code', 's'), ('direction', 's'), ('level', 'i'),
+                  ('wick', 'i'), ('close', 'i'), ('penetration', 'f'))),
+    'BUY': (4, (('stock_code', 's'), ('stock_name', 's'), ('price', 'i'),
+                ('quantity', 'i'), ('amount', 'f'), ('entry_reason', 's'),
+                ('trade_id', 'i'))),
+    'SELL': (5, (('stock_code', 's'), ('stock_name', 's'), ('price', 'i'),
+                 ('quantity', 'i'), ('pnl_pct', 'f'), ('realized_pnl', 'f'),
+                 ('exit_reason', 's'), ('hold_seconds', 'i'))),
+    'GATE_BLOCK': (6, (('stock_code', 's'), ('stock_name', 's'), ('tag', 's'),
+                       ('detail', 's'), ('entry_reason', 's'))),
+    'MKT_CTX': (7, (('status', 's'), ('summary', 's'), ('atr_mode', 's'))),
+    'TREND_SIG': (8, (('stock_code', 's'), ('entry_type', 's'), ('grade', 's'),
+                      ('detail', 's'))),
+}
+
+_HEADER = struct.Struct('<IBd')
+_STR_LEN = struct.Struct('<H')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+_MAX_STR = 0xFFFF
+_DEFAULTS = {'s': '', 'i': 0, 'f': 0.0}
+
+_TYPE_NAMES = {type_id: name for name, (type_id, _) in EVENT_SCHEMAS.items()}
+
+
+def default_journal_dir() -> Path:
+    """KIWOOM_EVENT_JOURNAL_DIR > <repo>/data/journal."""
+    env = os.environ.get('KIWOOM_EVENT_JOURNAL_DIR')
+    if env:
+        return Path(env)
+    return Path(__file__).parent.parent / 'data' / 'journal'
+
+
+def journal_path(day: date, directory: Optional[Path] = None) -> Path:
+    return Path(directory or default_journal_dir()) / f"events_{day.strftime('%Y%m%d')}.bin"
+
+
+# ─── 인코딩 / 디코딩 ─────────────────────────────────────────────────────────
+
+def encode_record(event_type: str, ts: float, fields: Dict) -> bytes:
+    """이벤트 1건 → 레코드 바이트. 알 수 없는 타입은 KeyError, 빠진 필드는 기본값."""
+    type_id, schema = EVENT_SCHEMAS[event_type]
+    parts: List[bytes] = []
+    for name, kind in schema:
+        value = fields.get(name)
+        if value is None:
+            value = _DEFAULTS[kind]
+        if kind == 's':
+            raw = str(value).encode('utf-8')[:_MAX_STR]
+            parts.append(_STR_LEN.pack(len(raw)))
+            parts.append(raw)
+        elif kind == 'i':
+            parts.append(_INT.pack(int(round(float(value)))))
+        else:
+            parts.append(_FLOAT.pack(float(value)))
+    payload = b''.join(parts)
+    return _HEADER.pack(len(payload), type_id, ts) + payload
+
+
+def _decode_payload(schema: Tuple[Tuple[str, str], ...], buf: bytes, pos: int, end: int) -> Dict:
+    event: Dict = {}
+    for name, kind in schema:
+        if pos >= end:
+            event[name] = None              # 필드 추가 이전에 기록된 레코드
+            continue
+        if kind == 's':
+            (length,) = _STR_LEN.unpack_from(buf, pos)
+            pos += _STR_LEN.size
+            event[name] = buf[pos:pos + length].decode('utf-8', errors='replace')
+            pos += length
+        elif kind == 'i':
+            event[name] = _INT.unpack_from(buf, pos)[0]
+            pos += _INT.size
+        else:
+            event[name] = _FLOAT.unpack_from(buf, pos)[0]
+            pos += _FLOAT.size
+    return event
+
+
+def iter_records(buf: bytes, types: Optional[Iterable[str]] = None) -> Iterator[Dict]:
+    """레코드 버퍼 순회. types 외 레코드는 헤더만 읽고 건너뜀."""
+    wanted = None
+    if types is not None:
+        wanted = {EVENT_SCHEMAS[t][0] for t in types if t in EVENT_SCHEMAS}
+    pos = 0
+    size = len(buf)
+    header = _HEADER.size
+    while pos + header <= size:
+        length, type_id, ts = _HEADER.unpack_from(buf, pos)
+        start = pos + header
+        end = start + length
+        if end > size:
+            break                           # 쓰는 중 잘린 마지막 레코드
+        pos = end
+        if wanted is not None and type_id not in wanted:
+            continue
+        name = _TYPE_NAMES.get(type_id)
+        if name is None:
+            continue                        # 더 새로운 writer 의 타입
+        event = _decode_payload(EVENT_SCHEMAS[name][1], buf, start, end)
+        event['type'] = name
+        event['ts'] = ts
+        yield event
+
+
+# ─── 쓰기 ────────────────────────────────────────────────────────────────────
+
+class EventJournal:
+    """
+    일자별 저널 파일 writer (스레드 안전, 실패해도 예외 전파 없음)
+
+    Args:
+        directory: 저널 디렉토리 (None → default_journal_dir())
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else default_journal_dir()
+        self._fd: Optional[int] = None
+        self._day: Optional[date] = None
+        self._lock = threading.Lock()
+        self.stats = {'events': 0, 'bytes': 0, 'errors': 0}
+
+    def _open(self, day: date) -> int:
+        if self._fd is not None and self._day == day:
+            return self._fd
+        self._close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(journal_path(day, self.directory),
+                           os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._day = day
+        return self._fd
+
+    def emit(self, event_type: str, ts: Optional[float] = None, **fields) -> bool:
+        """이벤트 1건 기록. 성공 여부 반환 (트레이딩 흐름은 결과와 무관하게 진행)."""
+        try:
+            ts = time.time() if ts is None else ts
+            record = encode_record(event_type, ts, fields)
+            with self._lock:
+                os.write(self._open(date.fromtimestamp(ts)), record)
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.debug(f"[JOURNAL] {event_type} 기록 실패: {e}")
+            return False
+        self.stats['events'] += 1
+        self.stats['bytes'] += len(record)
+        return True
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = None
+        self._day = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+
+_journal: Optional[EventJournal] = None
+_journal_lock = threading.Lock()
+
+
+def get_journal() -> EventJournal:
+    """프로세스 공용 저널 (지연 생성)."""
+    global _journal
+    if _journal is None:
+        with _journal_lock:
+            if _journal is None:
+                _journal = EventJournal()
+    return _journal
+
+
+def emit(event_type: str, **fields) -> bool:
+    """get_journal().emit 단축형."""
+    return get_journal().emit(event_type, **fields)
+
+
+# ─── 조회 ────────────────────────────────────────────────────────────────────
+
+def has_journal(day: date, directory: Optional[Path] = None) -> bool:
+    return journal_path(day, directory).exists()
+
+
+def read_events(
+    day: date,
+    types: Optional[Iterable[str]] = None,
+    stock_code: Optional[str] = None,
+    directory: Optional[Path] = None,
+) -> List[Dict]:
+    """
+    하루치 이벤트 (기록 순).
+
+    Args:
+        day: 거래일
+        types: 이벤트 타입 필터 (None → 전체)
+        stock_code: 종목 필터
+        directory: 저널 디렉토리 (None → default_journal_dir())
+
+    Returns:
+        list of dict — 스키마 필드 + type, ts(epoch 초). 저널 없으면 []
+    """
+    path = journal_path(day, directory)
+    try:
+        buf = path.read_bytes()
+    except OSError:
+        return []
+    events = iter_records(buf, types)
+    if stock_code is not None:
+        return [ev for ev in events if ev.get('stock_code') == stock_code]
+    return list(events)
+
+
+def read_range(
+    start: date,
+    end: date,
+    types: Optional[Iterable[str]] = None,
+    stock_code: Optional[str] = None,
+    directory: Optional[Path] = None,
+) -> Iterator[Tuple[date, List[Dict]]]:
+    """start~end (포함) 일자별 (day, events). 저널 없는 날은 건너뜀."""
+    types = tuple(types) if types is not None else None
+    day = start
+    while day <= end:
+        if has_journal(day, directory):
+            yield day, read_events(day, types, stock_code, directory)
+        day += timedelta(days=1)
+
+
+def event_time(event: Dict) -> datetime:
+    """이벤트 ts → 로컬 datetime."""
+    return datetime.fromtimestamp(event['ts'])
@@ -0,0 +1,457 @@
+"""
+core/indicator_panel.py — 워치리스트 전 종목 지표 일괄 계산 (symbols × bars 패널)
+
+역할:
+  1. 분봉 저장소(MinuteBarStore)의 종목별 봉을 (종목 × 봉) 패널로 정렬
+     - 오른쪽 정렬: 마지막 열 = 모든 종목의 최신 봉, 봉 수가 적은 종목은 왼쪽을 NaN 으로 채움
+  2. 지표 세트를 종목 루프 없이 패널 단위로 한 번에 계산 (float64 계산 → float32 저장)
+     - VWAP (이동/누적), ATR, RSI, EMA9/EMA20, MA20, 거래량 MA5/MA20
+     - RSVI (vol_ma20 / vol_std20 / vol_z20 / vroc10) — analyzers.volume_indicators 와 동일 정의
+     - 스퀴즈 모멘텀 (sqz_on / sqz_off / sqz_momentum / sqz_color) — utils.squeeze_momentum_realtime 과 동일 정의
+  3. 종목별 읽기 전용 뷰(SymbolIndicators) 제공 → SignalOrchestrator / 진입 체크에 DataFrame 으로 전달
+  4. 마지막 봉이 바뀌지 않은 종목은 직전 뷰 재사용
+
+배경:
+  check_all_stocks 가 종목마다 DataFrame 을 복사하고 calculate_vwap / calculate_atr /
+  attach_rsvi_indicators / calculate_squeeze_momentum 을 따로 호출 → 임시 컬럼 생성/삭제와
+  pandas 호출 오버헤드가 종목 수에 비례 (60종목 이상에서 LOOP_LAG).
+  패널 계산은 pandas 호출 수가 종목 수와 무관하므로 종목당 비용이 워치리스트가 클수록 줄어든다.
+
+사용:
+  engine = IndicatorEngine(vwap_window=20)
+  views = engine.views(store, ["005930", "000660"], "5")
+  view = views["005930"]
+  view.last("vwap"), view.squeeze_color       # 최신 봉 값
+  df = view.frame()                            # OHLCV + cntr_tm + 지표 (읽기 전용 배열 위 DataFrame)
+
+v1.0 2026-10-16: 최초 작성
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.linreg import rolling_linreg_slope
+
+logger = logging.getLogger(__name__)
+
+_OHLCV = ('open', 'high', 'low', 'close', 'volume')
+_TIME_KEY = 'cntr_tm'
+
+# analyzers.volume_indicators 상수와 동일 (core → analyzers 의존 회피)
+_RSVI_WINDOW = 20
+_VROC_LAG = 10
+_EPS = 1e-9
+
+INDICATOR_COLUMNS = (
+    'vwap', 'atr', 'rsi', 'ema9', 'ema20', 'ma20', 'volume_ma5', 'volume_ma20',
+    'vol_ma20', 'vol_std20', 'vol_z20', 'vroc10',
+    'sqz_on', 'sqz_off', 'sqz_momentum', 'sqz_color',
+)
+
+# check_all_stocks 가 기존에 붙이던 컬럼 + L6 RSVI 컬럼 (값 동일 → attach_rsvi_indicators 생략)
+FRAME_COLUMNS = (
+    'vwap', 'ma20', 'volume_ma5', 'volume_ma20',
+    'vol_ma20', 'vol_std20', 'vol_z20', 'vroc10',
+)
+
+# sqz_color 코드 → 문자열 (패널에는 float32 코드로 저장)
+SQZ_COLORS = ('gray', 'bright_green', 'dark_green', 'dark_red', 'bright_red')
+_BOOL_COLUMNS = ('sqz_on', 'sqz_off')
+
+
+def _read_only(arr: np.ndarray) -> np.ndarray:
+    arr.flags.writeable = False
+    return arr
+
+
+def _shift(x: np.ndarray, periods: int) -> np.ndarray:
+    out = np.full_like(x, np.nan)
+    out[:, periods:] = x[:, :-periods]
+    return out
+
+
+def _window_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """행별 이동 합 (누적합 차분, 앞쪽 window-1 칸은 부분 합)."""
+    cs = np.cumsum(x, axis=1)
+    out = cs.copy()
+    out[:, window:] -= cs[:, :-window]
+    return out
+
+
+def _rolling_stats(x: np.ndarray, window: int, min_periods: Optional[int] = None,
+                   ddof: Optional[int] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    행(종목)별 이동 (평균, 표준편차) — pandas rolling(window, min_periods).mean()/std(ddof) 와 동일 의미.
+
+    NaN 은 개수에서 제외하고, 유효 개수 < min_periods(기본 window) 인 칸은 NaN.
+    평균은 원값 누적합 차분 (거래량 0 구간 → 정확히 0), 분산은 행 평균으로 재중심화한 누적합.
+    값이 모두 같은 윈도우는 pandas 와 같이 평균 = 그 값, 표준편차 = 0 으로 고정 (누적합 잔차 제거).
+    ddof=None 이면 표준편차 생략.
+    """
+    min_periods = window if min_periods is None else min_periods
+    nan = np.isnan(x)
+    filled = np.where(nan, 0.0, x)
+    count = _window_sum((~nan).astype(np.float64), window)
+    short = count < max(min_periods, 1)
+    mean = _window_sum(filled, window) / np.maximum(count, 1)
+    mean[short] = np.nan
+    if ddof is None:
+        return mean, None
+    center = filled.sum(axis=1, keepdims=True) / np.maximum((~nan).sum(axis=1, keepdims=True), 1)
+    y = np.where(nan, 0.0, x - center)
+    s1 = _window_sum(y, window)
+    var = np.maximum(_window_sum(y * y, window) - s1 * s1 / np.maximum(count, 1), 0.0)
+    if window > 1:
+        # 윈도우 안 이웃 봉 쌍(window-1 개) 중 값이 바뀐 쌍이 없으면 평탄
+        changed = np.zeros_like(x)
+        changed[:, 1:] = ~nan[:, 1:] & ~nan[:, :-1] & (x[:, 1:] != x[:, :-1])
+        flat = (_window_sum(changed, window - 1) == 0) & ~short & ~nan
+        mean[flat] = x[flat]
+        var[flat] = 0.0
+    std = np.sqrt(var / np.maximum(count - ddof, 1))
+    std[short | (count <= ddof)] = np.nan
+    return mean, std
+
+
+def _rolling_extreme(x: np.ndarray, window: int, fn) -> np.ndarray:
+    """
+    행별 이동 최대/최소 — 윈도우 오프셋마다 원소 단위 비교 (window 회 벡터 연산).
+
+    fn=np.maximum/np.minimum → 윈도우 내 NaN·봉 부족 시 NaN (pandas rolling.max/min 과 동일).
+    """
+    padded = np.concatenate([np.full((x.shape[0], window - 1), np.nan), x], axis=1)
+    width = x.shape[1]
+    out = padded[:, :width].copy()
+    for k in range(1, window):
+        fn(out, padded[:, k:k + width], out=out)
+    return out
+
+
+def _ewm(series: Sequence[np.ndarray], spans: Sequence[int]) -> List[np.ndarray]:
+    """
+    여러 (종목 × 봉) 시계열의 ewm(span, adjust=False).mean() 을 한 번의 봉 루프로 계산.
+
+    pandas ewm(ignore_na=False) 점화식과 동일: 첫 유효값에서 시작, NaN 봉은 직전 값 유지 +
+    다음 유효값 반영 시 결측 구간만큼 감쇠된 가중치 사용. 루프 횟수 = 봉 수 (종목 수와 무관).
+    """
+    x = np.ascontiguousarray(np.concatenate(series, axis=0).T)       # (봉 × 시계열) — 봉 단위 연속 접근
+    alpha = np.concatenate([np.full(len(s), 1.0 / (1.0 + (span - 1) / 2.0)) for s, span in zip(series, spans)])
+    decay = 1.0 - alpha
+    out = np.empty_like(x)
+    weighted = np.full(x.shape[1], np.nan)
+    old_wt = np.ones(x.shape[1])
+    for t, cur in enumerate(x):
+        obs = cur == cur
+        has = weighted == weighted
+        old_wt = np.where(has, old_wt * decay, old_wt)
+        step = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        weighted = np.where(has & obs & (weighted != cur), step, weighted)
+        old_wt = np.where(has & obs, 1.0, old_wt)
+        weighted = np.where(~has & obs, cur, weighted)
+        out[t] = weighted
+    return np.split(out.T, np.cumsum([len(s) for s in series])[:-1])
+
+
+class SymbolIndicators:
+    """
+    종목 1개의 봉 + 지표 읽기 전용 뷰 (패널 행 슬라이스, 복사 없음)
+
+    view['vwap'] → float32 배열 (시간 오름차순), view.last('vwap') → 최신 봉 값
+    """
+
+    __slots__ = ('symbol', 'times', 'ohlcv', '_values')
+
+    def __init__(self, symbol: Hashable, times: np.ndarray, ohlcv: np.ndarray,
+                 values: Dict[str, np.ndarray]):
+        self.symbol = symbol
+        self.times = times
+        self.ohlcv = ohlcv
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name in _OHLCV:
+            return self.ohlcv[_OHLCV.index(name)]
+        return self._values[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in _OHLCV or name in self._values
+
+    @property
+    def last_time(self) -> Optional[int]:
+        return int(self.times[-1]) if len(self.times) else None
+
+    def last(self, name: str) -> float:
+        """최신 봉 값 (봉 없음 → NaN)."""
+        values = self[name]
+        return float(values[-1]) if len(values) else float('nan')
+
+    @property
+    def squeeze_color(self) -> str:
+        """최신 봉 스퀴즈 색상 (get_current_squeeze_signal()['color'] 와 동일)."""
+        code = self.last('sqz_color')
+        return SQZ_COLORS[int(code)] if code == code else 'gray'
+
+    def frame(self, columns: Optional[Sequence[str]] = FRAME_COLUMNS) -> pd.DataFrame:
+        """
+        open/high/low/close/volume/cntr_tm + 지표 컬럼 DataFrame.
+
+        숫자 컬럼은 패널 배열을 복사 없이 공유하므로 원소 단위 수정은 불가
+        (컬럼 추가/교체, .copy() 후 수정은 가능). columns=None 이면 전체 지표.
+        """
+        data = {name: self.ohlcv[i] for i, name in enumerate(_OHLCV)}
+        data[_TIME_KEY] = self.times
+        for name in (INDICATOR_COLUMNS if columns is None else columns):
+            values = self._values[name]
+            if name in _BOOL_COLUMNS:
+                values = _read_only(values == 1.0)
+            elif name == 'sqz_color':
+                values = np.asarray(SQZ_COLORS, dtype=object)[np.nan_to_num(values).astype(np.intp)]
+            data[name] = values
+        return pd.DataFrame(data, copy=False)
+
+
+class IndicatorPanel:
+    """
+    (종목 × 봉) 지표 패널 — 오른쪽 정렬, 봉 없는 칸은 NaN
+
+    Attributes:
+        symbols: 행 순서 종목 목록
+        lengths: 종목별 봉 수
+        values: 지표명 → (종목 × 봉) float32 읽기 전용 배열 (OHLCV 포함)
+    """
+
+    def __init__(self, symbols: List[Hashable], lengths: np.ndarray, times: List[np.ndarray],
+                 ohlcv: List[np.ndarray], values: Dict[str, np.ndarray]):
+        self.symbols = symbols
+        self.lengths = lengths
+        self.values = values
+        self._rows = {symbol: i for i, symbol in enumerate(symbols)}
+        self._times = times
+        self._ohlcv = ohlcv
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: Hashable) -> bool:
+        return symbol in self._rows
+
+    @property
+    def width(self) -> int:
+        return next(iter(self.values.values())).shape[1] if self.values else 0
+
+    def view(self, symbol: Hashable) -> SymbolIndicators:
+        row = self._rows[symbol]
+        start = self.width - int(self.lengths[row])
+        values = {name: arr[row, start:] for name, arr in self.values.items() if name not in _OHLCV}
+        return SymbolIndicators(symbol, self._times[row], self._ohlcv[row], values)
+
+
+class IndicatorEngine:
+    """
+    워치리스트 지표 일괄 계산기 (스레드 안전)
+
+    Args:
+        vwap_window: 이동 VWAP 윈도우 (config vwap.rolling_window)
+        use_rolling_vwap: False 면 누적 VWAP (저장소 봉에는 일자 컬럼이 없어 전체 누적)
+        atr_period / rsi_period: EWM(span, adjust=False) 기간 (EntryTimingAnalyzer 와 동일)
+        ema_periods: EMA 컬럼 (ema{n}) 기간
+        bb_length ~ mom_length: 스퀴즈 모멘텀 파라미터 (calculate_squeeze_momentum 기본값)
+        max_entries: 재사용용으로 보관할 종목 뷰 수
+    """
+
+    def __init__(self, vwap_window: int = 20, use_rolling_vwap: bool = True, atr_period: int = 14,
+                 rsi_period: int = 14, ema_periods: Tuple[int, ...] = (9, 20),
+                 bb_length: int = 20, bb_mult: float = 2.0, kc_length: int = 20,
+                 kc_mult: float = 1.5, mom_length: int = 20, max_entries: int = 2048):
+        self.vwap_window = vwap_window
+        self.use_rolling_vwap = use_rolling_vwap
+        self.atr_period = atr_period
+        self.rsi_period = rsi_period
+        self.ema_periods = tuple(ema_periods)
+        self.bb_length = bb_length
+        self.bb_mult = bb_mult
+        self.kc_length = kc_length
+        self.kc_mult = kc_mult
+        self.mom_length = mom_length
+        self.max_entries = max_entries
+        self._views: 'OrderedDict[Tuple[Hashable, str], Tuple[tuple, SymbolIndicators]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'computed': 0, 'batches': 0}
+
+    # ── 저장소 연동 ────────────────────────────────────────────────────────
+
+    def views(self, store, symbols: Iterable[Hashable], timeframe: str) -> Dict[Hashable, SymbolIndicators]:
+        """
+        저장소 봉 기준 종목별 지표 뷰. 봉이 없는 종목은 결과에서 제외.
+
+        마지막 봉(시각/OHLCV)과 봉 수가 직전 계산과 같으면 이전 뷰를 그대로 반환하고,
+        나머지 종목만 한 패널로 묶어 계산한다.
+        """
+        timeframe = str(timeframe)
+        result: Dict[Hashable, SymbolIndicators] = {}
+        pending: List[Tuple[Hashable, tuple, np.ndarray, np.ndarray]] = []
+        with self._lock:
+            for symbol in symbols:
+                arrays = store.get_arrays(symbol, timeframe)
+                if arrays is None:
+                    continue
+                times, ohlcv = arrays
+                key = (len(times), int(times[-1]), tuple(ohlcv[:, -1].tolist()))
+                cached = self._views.get((symbol, timeframe))
+                if cached is not None and cached[0] == key:
+                    self._views.move_to_end((symbol, timeframe))
+                    result[symbol] = cached[1]
+                    self.stats['hits'] += 1
+                    continue
+                pending.append((symbol, key, times, ohlcv))
+
+            if pending:
+                panel = self.compute([p[0] for p in pending], [p[2] for p in pending],
+                                     [p[3] for p in pending])
+                for symbol, key, _, _ in pending:
+                    view = panel.view(symbol)
+                    self._views[(symbol, timeframe)] = (key, view)
+                    self._views.move_to_end((symbol, timeframe))
+                    result[symbol] = view
+                while len(self._views) > self.max_entries:
+                    self._views.popitem(last=False)
+                self.stats['computed'] += len(pending)
+                self.stats['batches'] += 1
+        return result
+
+    def invalidate(self, symbol: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if symbol is None:
+                self._views.clear()
+            else:
+                for key in [k for k in self._views if k[0] == symbol]:
+                    del self._views[key]
+
+    # ── 패널 계산 ─────────────────────────────────────────────────────────
+
+    def compute(self, symbols: Sequence[Hashable], times: Sequence[np.ndarray],
+                ohlcv: Sequence[np.ndarray]) -> IndicatorPanel:
+        """
+        종목별 (봉 시각, (5 × 봉) OHLCV) 배열 → 지표 패널.
+
+        결과 배열과 입력 배열은 모두 읽기 전용으로 고정된다 (입력은 호출자 소유 복사본이어야 함).
+        """
+        symbols = list(symbols)
+        lengths = np.array([len(t) for t in times], dtype=np.int64)
+        width = int(lengths.max()) if len(lengths) else 0
+        raw = np.full((5, len(symbols), width), np.nan)
+        for row, bars in enumerate(ohlcv):
+            if lengths[row]:
+                raw[:, row, width - lengths[row]:] = bars
+            _read_only(bars)
+        for t in times:
+            _read_only(t)
+        valid = np.arange(width) >= (width - lengths)[:, None]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = self._indicators(*raw, valid)
+
+        out: Dict[str, np.ndarray] = {}
+        for name, arr in zip(_OHLCV, raw):
+            out[name] = _read_only(arr.astype(np.float32))
+        for name, arr in values.items():
+            arr = arr.astype(np.float32)
+            arr[~valid] = np.nan
+            out[name] = _read_only(arr)
+        return IndicatorPanel(symbols, lengths, list(times), list(ohlcv), out)
+
+    def _indicators(self, open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    volume: np.ndarray, valid: np.ndarray) -> Dict[str, np.ndarray]:
+        values: Dict[str, np.ndarray] = {}
+        prev_close = _shift(close, 1)
+
+        # VWAP (EntryTimingAnalyzer.calculate_vwap) — 윈도우 Σpv/Σv = 평균 pv/평균 v
+        pv = (high + low + close) / 3 * volume
+        if self.use_rolling_vwap:
+            values['vwap'] = (_rolling_stats(pv, self.vwap_window)[0]
+                              / _rolling_stats(volume, self.vwap_window)[0])
+        else:
+            cum_pv = np.where(np.isnan(pv), np.nan, np.cumsum(np.nan_to_num(pv), axis=1))
+            cum_v = np.where(np.isnan(volume), np.nan, np.cumsum(np.nan_to_num(volume), axis=1))
+            values['vwap'] = cum_pv / cum_v
+
+        # True Range — 세 값 중 NaN 제외 최대값 (첫 봉은 high - low)
+        true_range = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+
+        # RSI 상승/하락폭 — 첫 봉 변화량 NaN → 0 (calculate_rsi)
+        delta = close - prev_close
+        gain = np.where(valid, np.where(delta > 0, delta, 0.0), np.nan)
+        loss = np.where(valid, np.where(delta < 0, -delta, 0.0), np.nan)
+
+        # EWM 계열 (ATR / RSI / EMA) 은 한 번의 봉 루프로 일괄 계산
+        spans = [self.atr_period, self.rsi_period, self.rsi_period, *self.ema_periods]
+        atr, avg_gain, avg_loss, *emas = _ewm([true_range, gain, loss] + [close] * len(self.ema_periods), spans)
+        values['atr'] = atr
+        values['rsi'] = 100 - (100 / (1 + avg_gain / avg_loss))
+        for period, ema in zip(self.ema_periods, emas):
+            values[f'ema{period}'] = ema
+
+        # check_all_stocks 이동평균
+        values['ma20'] = _rolling_stats(close, 20)[0]
+        values['volume_ma5'] = _rolling_stats(volume, 5)[0]
+        values['volume_ma20'] = _rolling_stats(volume, 20)[0]
+
+        values.update(self._rsvi(volume, valid))
+        values.update(self._squeeze(high, low, close, true_range))
+        return values
+
+    @staticmethod
+    def _rsvi(volume: np.ndarray, valid: np.ndarray) -> Dict[str, np.ndarray]:
+        """attach_rsvi_indicators 와 동일 (거래량 NaN → 0, min_periods=1, ddof=0, ±5 클리핑)."""
+        vol = np.where(valid & np.isnan(volume), 0.0, volume)
+        vol_ma, vol_std = _rolling_stats(vol, _RSVI_WINDOW, min_periods=1, ddof=0)
+        vol_std = np.nan_to_num(vol_std, nan=0.0)
+
+        z = (vol - vol_ma) / (np.abs(vol_std) + _EPS)
+        z = np.clip(np.nan_to_num(z, nan=0.0, posinf=0.0, neginf=0.0), -5.0, 5.0)
+
+        prev = _shift(vol, _VROC_LAG)
+        prev[prev == 0] = np.nan
+        vroc = vol / (np.abs(prev) + _EPS) - 1.0
+        vroc = np.clip(np.nan_to_num(vroc, nan=-1.0, posinf=-1.0, neginf=-1.0), -5.0, 5.0)
+        return {'vol_ma20': vol_ma, 'vol_std20': vol_std, 'vol_z20': z, 'vroc10': vroc}
+
+    def _squeeze(self, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 true_range: np.ndarray) -> Dict[str, np.ndarray]:
+        """utils.squeeze_momentum_realtime.calculate_squeeze_momentum 과 동일 정의."""
+        bb_basis, bb_dev = _rolling_stats(close, self.bb_length, ddof=1)
+        bb_upper = bb_basis + self.bb_mult * bb_dev
+        bb_lower = bb_basis - self.bb_mult * bb_dev
+
+        kc_basis = bb_basis if self.kc_length == self.bb_length else _rolling_stats(close, self.kc_length)[0]
+        kc_range = _rolling_stats(true_range, self.kc_length)[0]
+        kc_upper = kc_basis + self.kc_mult * kc_range
+        kc_lower = kc_basis - self.kc_mult * kc_range
+
+        sqz_on = (bb_lower > kc_lower) & (bb_upper < kc_upper)
+        sqz_off = (bb_lower < kc_lower) & (bb_upper > kc_upper)
+
+        highest = _rolling_extreme(high, self.kc_length, np.maximum)
+        lowest = _rolling_extreme(low, self.kc_length, np.minimum)
+        momentum = close - ((highest + lowest) / 2 + kc_basis) / 2
+        sqz_momentum = rolling_linreg_slope(momentum, self.mom_length)
+
+        mom_diff = sqz_momentum - _shift(sqz_momentum, 1)
+        color = np.zeros_like(sqz_momentum)
+        color[(sqz_momentum > 0) & (mom_diff > 0)] = 1
+        color[(sqz_momentum > 0) & (mom_diff <= 0)] = 2
+        color[(sqz_momentum < 0) & (mom_diff < 0)] = 3
+        color[(sqz_momentum < 0) & (mom_diff >= 0)] = 4
+        return {
+            'sqz_on': sqz_on.astype(np.float64),
+            'sqz_off': sqz_off.astype(np.float64),
+            'sqz_momentum': sqz_momentum,
+            'sqz_color': color,
+        }
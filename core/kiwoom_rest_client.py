@@ -27,6 +27,8 @@ from tenacity import (
     before_sleep_log
 )
 
+from utils.rate_governor import get_governor, group_for, is_rate_limited
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
@@ -114,10 +116,9 @@ class KiwoomRESTClient:
         self.app_secret = app_secret
         self.base_url = self.PROD_BASE_URL  # 항상 실전 서버 사용
 
-        # Rate Limiting
+        # Rate Limiting (앱 키 공용 RateGovernor — KiwoomAPI / api_server 와 같은 예산)
         self.max_requests_per_second = max_requests_per_second
-        self.min_request_interval = 1.0 / max_requests_per_second
-        self.last_request_time = 0
+        self.governor = get_governor(app_key, rates={'tr': max_requests_per_second})
 
         # 토큰 관리
         self.token_info: Optional[TokenInfo] = None
@@ -165,17 +166,9 @@ class KiwoomRESTClient:
             await self.session.close()
             self.session = None
 
-    async def _wait_for_rate_limit(self):
-        """Rate Limit 대기"""
-        now = time.time()
-        elapsed = now - self.last_request_time
-
-        if elapsed < self.min_request_interval:
-            wait_time = self.min_request_interval - elapsed
-            logger.debug(f"Rate limit 대기: {wait_time:.3f}초")
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
+    async def _wait_for_rate_limit(self, api_id: str = ""):
+        """Rate Limit 대기 (우선순위는 호출측 rate_priority() 컨텍스트)"""
+        await self.governor.acquire_async(group_for(api_id))
 
     @retry(
         stop=stop_after_attempt(3),
@@ -286,7 +279,7 @@ class KiwoomRESTClient:
             응답 데이터
         """
         await self._ensure_token()
-        await self._wait_for_rate_limit()
+        await self._wait_for_rate_limit(api_id)
 
         url = f"{self.base_url}{path}"
         headers = {
@@ -306,6 +299,7 @@ class KiwoomRESTClient:
         try:
             async with self.session.post(url, headers=headers, json=body) as response:
                 result = await response.json()
+                self.governor.report(group_for(api_id), is_rate_limited(response.status, result))
 
                 # 에러 처리
                 if response.status != 200:
@@ -25,6 +25,8 @@ from typing import Dict, Optional, Tuple
 
 import pandas as pd
 
+from core import event_journal
+
 logger = logging.getLogger(__name__)
 
 KODEX200   = "069500"   # KODEX 200 (코스피 프록시)
@@ -505,6 +507,7 @@ class MarketContextChecker:
             msg = f"[MKT_CTX]{re_tag} {icon} {status} {_mode_icon}[ATR:{atr_mode}({atr_ratio:.2f})]: {summary}"
             logger.info(msg)
             print(msg, flush=True)
+            event_journal.emit('MKT_CTX', status=status, summary=summary, atr_mode=atr_mode)
 
             result = (status, summary, details)
             with self._refresh_lock:
@@ -0,0 +1,205 @@
+"""
+core/mtf_bars.py — 기준 분봉 → 상위 타임프레임(5/15/30/60분) 리샘플 + EMA/VWAP 증분 계산
+
+역할:
+  1. 호출 측이 이미 가진 기준 분봉(키움 1분/5분봉)을 상위 타임프레임으로 리샘플
+     (봉 경계는 자정 기준 → 09:00 은 5~60분봉 모두의 경계)
+  2. (종목, 타임프레임) 별 상태 유지
+     - 마감된 상위 봉 + 그 시점까지의 EMA / 당일 누적 VWAP(Σ전형가격×거래량, Σ거래량)
+     - 새 기준 봉이 오면 '진행 중인 상위 봉' 시작 시각 이후 꼬리만 다시 집계
+       → 새로 마감된 봉만 EMA/VWAP 누적에 반영, 진행 중 봉 값은 상태를 바꾸지 않고 계산
+  3. 기준 봉 마지막 (시각, 종가, 거래량) 이 같으면 직전 결과 그대로 반환
+  4. 연속성 보장 불가(기준 봉이 진행 중 상위 봉 시작보다 늦게 시작 / 시간 역행) → 전체 재계산
+
+배경:
+  L3 MultiTimeframeConsensus 가 후보마다 5분/15분봉을 yf.download 로 동기 조회
+  → 오케스트레이터 지연의 대부분 + 호출 시점마다 결과가 달라 재현 불가.
+
+사용:
+  provider = MTFBarProvider()
+  df_15 = provider.get("005930", df_base, 15)       # open/high/low/close/volume/ema/vwap (마지막 행은 진행 중 봉)
+  snap = provider.latest("005930", df_base, 15)     # {'time', 'close', 'ema', 'vwap', 'bars'}
+
+v1.0 2026-10-16: 최초 작성
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TIMEFRAMES = (5, 15, 30, 60)
+_OHLCV_AGG = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+
+
+def base_minutes(index: pd.DatetimeIndex) -> Optional[int]:
+    """기준 봉 간격(분) — 최근 봉 간격의 최빈값 (장 시작/점심 공백 영향 배제)."""
+    if len(index) < 2:
+        return None
+    seconds = index[-64:].values.astype('datetime64[s]').astype(np.int64)   # 해상도(ns/us) 무관
+    diffs = np.diff(seconds) // 60
+    diffs = diffs[diffs > 0]
+    if not len(diffs):
+        return None
+    values, counts = np.unique(diffs, return_counts=True)
+    return int(values[np.argmax(counts)])
+
+
+def resample_ohlcv(df: pd.DataFrame, minutes: int) -> pd.DataFrame:
+    """OHLCV 리샘플 (빈 구간 제거)."""
+    out = df[list(_OHLCV_AGG)].resample(f'{minutes}min', label='left', closed='left').agg(_OHLCV_AGG)
+    return out[out['close'].notna()]
+
+
+class _TFState:
+    """(종목, 타임프레임, EMA 기간) 증분 상태"""
+    __slots__ = ('closed', 'open_start', 'ema', 'vwap_day', 'cum_pv', 'cum_v', 'key', 'frame')
+
+    def __init__(self):
+        self.closed: Optional[pd.DataFrame] = None   # 마감된 상위 봉 (ema/vwap 포함)
+        self.open_start: Optional[pd.Timestamp] = None
+        self.ema: Optional[float] = None
+        self.vwap_day = None
+        self.cum_pv = 0.0
+        self.cum_v = 0.0
+        self.key: Optional[tuple] = None
+        self.frame: Optional[pd.DataFrame] = None
+
+
+class MTFBarProvider:
+    """
+    종목별 상위 타임프레임 봉 공급자 (스레드 안전)
+
+    Args:
+        ema_period: 기본 EMA 기간
+        max_bars: 타임프레임별 보관할 마감 봉 수
+        max_entries: 보관할 (종목, 타임프레임) 상태 수 (초과 시 오래 안 쓴 것부터 제거)
+    """
+
+    def __init__(self, ema_period: int = 20, max_bars: int = 500, max_entries: int = 2048):
+        self.ema_period = ema_period
+        self.max_bars = max_bars
+        self.max_entries = max_entries
+        self._states: 'OrderedDict[Tuple[Hashable, int, int], _TFState]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'updates': 0, 'rebuilds': 0}
+
+    def get(self, symbol: Hashable, df_base: pd.DataFrame, minutes: int,
+            ema_period: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """
+        상위 타임프레임 봉 (open/high/low/close/volume/ema/vwap, 시간 오름차순).
+
+        df_base: DatetimeIndex + 소문자 OHLCV 컬럼. minutes 가 기준 봉 간격의 배수가 아니면 None.
+        """
+        if df_base is None or len(df_base) == 0 or not isinstance(df_base.index, pd.DatetimeIndex):
+            return None
+        base = base_minutes(df_base.index)
+        if base is None or minutes < base or minutes % base:
+            return None
+        period = ema_period or self.ema_period
+
+        last = df_base.iloc[-1]
+        key = (df_base.index[-1], float(last['close']), float(last['volume']))
+        state_key = (symbol, minutes, period)
+        with self._lock:
+            state = self._states.get(state_key)
+            if state is None:
+                state = self._states[state_key] = _TFState()
+                while len(self._states) > self.max_entries:
+                    self._states.popitem(last=False)
+            else:
+                self._states.move_to_end(state_key)
+            if state.key == key:
+                self.stats['hits'] += 1
+                return state.frame
+            return self._update(state, df_base, minutes, period, key)
+
+    def latest(self, symbol: Hashable, df_base: pd.DataFrame, minutes: int,
+               ema_period: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """마지막(진행 중) 상위 봉 요약 {'time', 'close', 'ema', 'vwap', 'bars'}."""
+        frame = self.get(symbol, df_base, minutes, ema_period)
+        if frame is None or frame.empty:
+            return None
+        row = frame.iloc[-1]
+        return {'time': frame.index[-1], 'close': float(row['close']), 'ema': float(row['ema']),
+                'vwap': float(row['vwap']), 'bars': len(frame)}
+
+    def invalidate(self, symbol: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if symbol is None:
+                self._states.clear()
+            else:
+                for key in [k for k in self._states if k[0] == symbol]:
+                    del self._states[key]
+
+    # ── 증분 계산 ─────────────────────────────────────────────────────────
+
+    def _update(self, state: _TFState, df_base: pd.DataFrame, minutes: int, period: int,
+                key: tuple) -> Optional[pd.DataFrame]:
+        index = df_base.index
+        if not index.is_monotonic_increasing:
+            df_base = df_base.sort_index()
+            index = df_base.index
+        rebuild = (state.open_start is None or index[0] > state.open_start
+                   or index[-1] < state.open_start)
+        if rebuild:
+            state.__init__()
+            tail = df_base
+            self.stats['rebuilds'] += 1
+        else:
+            tail = df_base[index >= state.open_start]
+            self.stats['updates'] += 1
+
+        bars = resample_ohlcv(tail, minutes)
+        if bars.empty:
+            return state.frame
+
+        alpha = 2.0 / (period + 1)
+        closed = bars.iloc[:-1]
+        if len(closed):
+            ema_vals, vwap_vals = self._advance(state, closed, alpha)
+            closed = closed.assign(ema=ema_vals, vwap=vwap_vals)
+            state.closed = closed if state.closed is None else pd.concat([state.closed, closed])
+            if len(state.closed) > self.max_bars:
+                state.closed = state.closed.iloc[-self.max_bars:]
+
+        # 진행 중 봉 — 상태는 그대로 두고 값만 계산
+        open_bar = bars.iloc[-1:]
+        state.open_start = open_bar.index[0]
+        o = open_bar.iloc[0]
+        ema = float(o['close']) if state.ema is None else alpha * float(o['close']) + (1 - alpha) * state.ema
+        pv = (float(o['high']) + float(o['low']) + float(o['close'])) / 3 * float(o['volume'])
+        same_day = state.vwap_day == state.open_start.date()
+        cum_pv = (state.cum_pv if same_day else 0.0) + pv
+        cum_v = (state.cum_v if same_day else 0.0) + float(o['volume'])
+        vwap = cum_pv / cum_v if cum_v > 0 else float(o['close'])
+        open_bar = open_bar.assign(ema=[ema], vwap=[vwap])
+
+        state.frame = open_bar if state.closed is None else pd.concat([state.closed, open_bar])
+        state.key = key
+        return state.frame
+
+    @staticmethod
+    def _advance(state: _TFState, closed: pd.DataFrame, alpha: float) -> Tuple[np.ndarray, np.ndarray]:
+        """마감 봉들을 EMA / 당일 누적 VWAP 상태에 반영하고 봉별 값 반환."""
+        close = closed['close'].to_numpy(dtype=float)
+        volume = closed['volume'].to_numpy(dtype=float)
+        typical = (closed['high'].to_numpy(dtype=float) + closed['low'].to_numpy(dtype=float) + close) / 3
+        days = closed.index.date
+        ema_out = np.empty(len(close))
+        vwap_out = np.empty(len(close))
+        ema, day, cum_pv, cum_v = state.ema, state.vwap_day, state.cum_pv, state.cum_v
+        for i in range(len(close)):
+            ema = close[i] if ema is None else alpha * close[i] + (1 - alpha) * ema
+            if days[i] != day:
+                day, cum_pv, cum_v = days[i], 0.0, 0.0
+            cum_pv += typical[i] * volume[i]
+            cum_v += volume[i]
+            ema_out[i] = ema
+            vwap_out[i] = cum_pv / cum_v if cum_v > 0 else close[i]
+        state.ema, state.vwap_day, state.cum_pv, state.cum_v = ema, day, cum_pv, cum_v
+        return ema_out, vwap_out
@@ -0,0 +1,226 @@
+"""
+core/state_bus.py — 트레이딩 프로세스 → 대시보드 API 공유 메모리 상태 버스
+
+기존 방식:
+  main_auto_trading 이 매 주기 data/*.json 을 다시 쓰고 /api/refresh 를 HTTP 로 호출,
+  api_server 는 요청마다 같은 파일을 다시 열어 json.load.
+
+상태 버스:
+  섹션(positions / watchlist / monitoring_watchlist / heartbeat / events)마다
+  메모리 매핑 파일 1개 (/dev/shm 우선). 헤더의 시퀀스 번호로 버전 관리.
+
+  슬롯 레이아웃 (little-endian):
+    0  magic    4s   b'KSB1'
+    4  capacity u32  payload 최대 바이트
+    8  seq      u64  홀수 = 쓰는 중, 짝수 = 완료 (seqlock)
+    16 length   u32  payload 길이
+    20 crc32    u32  payload 체크섬
+    24 payload  (compact JSON, utf-8)
+
+  쓰기: seq+1(홀수) → payload/length/crc → seq+1(짝수). 파일 열기/fsync 없이 memcpy 만.
+  읽기: seq 가 마지막으로 디코딩한 값과 같으면 캐시 반환 (8바이트 비교, O(1)).
+        다르면 복사 → seq 재확인 + crc 검증 후 디코딩. 쓰는 중이면 직전 값 반환.
+
+단일 writer(트레이딩 프로세스) / 다중 reader 전제.
+
+사용:
+  bus = StateBusWriter()
+  bus.publish('positions', positions_dict)
+
+  reader = StateBusReader()
+  positions = reader.read('positions')        # 버스 없으면 None → 파일 폴백
+  reader.version('events')                    # 변경 감지용 시퀀스
+
+v1.0 2026-10-16: 최초 작성
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b'KSB1'
+_HEADER = struct.Struct('<4sIQII')
+_SEQ = struct.Struct('<Q')
+_SEQ_OFFSET = 8
+_DEFAULT_CAPACITY = 4 * 1024 * 1024
+_READ_RETRIES = 3
+
+
+def default_bus_dir() -> Path:
+    """KIWOOM_STATE_BUS_DIR > /dev/shm/kiwoom_state > 임시 디렉토리."""
+    env = os.environ.get('KIWOOM_STATE_BUS_DIR')
+    if env:
+        return Path(env)
+    shm = Path('/dev/shm')
+    if shm.is_dir():
+        return shm / 'kiwoom_state'
+    return Path(tempfile.gettempdir()) / 'kiwoom_state'
+
+
+def _slot_path(directory: Path, section: str) -> Path:
+    return directory / f'{section}.bus'
+
+
+def _encode(obj: Any) -> bytes:
+    # datetime 등은 str() — positions_state.json 저장 규칙과 동일
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+class StateBusWriter:
+    """
+    섹션별 메모리 매핑 슬롯에 스냅샷 발행 (트레이딩 프로세스 전용)
+
+    Args:
+        directory: 슬롯 파일 디렉토리 (None → default_bus_dir())
+        capacity: 섹션당 payload 최대 바이트
+    """
+
+    def __init__(self, directory: Optional[Path] = None, capacity: int = _DEFAULT_CAPACITY):
+        self.directory = Path(directory) if directory else default_bus_dir()
+        self.capacity = capacity
+        self._slots: Dict[str, Tuple[mmap.mmap, int]] = {}   # 섹션 → (mmap, seq)
+        self.stats = {'published': 0, 'bytes': 0, 'oversize': 0, 'errors': 0}
+
+    def _open(self, section: str) -> Tuple[mmap.mmap, int]:
+        slot = self._slots.get(section)
+        if slot is not None:
+            return slot
+        self.directory.mkdir(parents=True, exist_ok=True)
+        size = _HEADER.size + self.capacity
+        fd = os.open(_slot_path(self.directory, section), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        magic, capacity, seq, _, _ = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or capacity != self.capacity:
+            seq = 0
+        # 재시작해도 시퀀스는 증가만 (reader 캐시가 이전 값으로 오인하지 않도록), 짝수로 정렬
+        seq += seq & 1
+        _HEADER.pack_into(mm, 0, _MAGIC, self.capacity, seq, 0, 0)
+        self._slots[section] = (mm, seq)
+        return mm, seq
+
+    def publish(self, section: str, obj: Any) -> bool:
+        """스냅샷 발행. 직렬화 실패/용량 초과/IO 오류 시 False (호출측 파일 폴백)."""
+        try:
+            payload = _encode(obj)
+            if len(payload) > self.capacity:
+                self.stats['oversize'] += 1
+                logger.warning(f"[STATE_BUS] {section} {len(payload)}B > capacity {self.capacity}B")
+                return False
+            mm, seq = self._open(section)
+            _SEQ.pack_into(mm, _SEQ_OFFSET, seq + 1)
+            mm[_HEADER.size:_HEADER.size + len(payload)] = payload
+            _HEADER.pack_into(mm, 0, _MAGIC, self.capacity, seq + 1, len(payload), zlib.crc32(payload))
+            _SEQ.pack_into(mm, _SEQ_OFFSET, seq + 2)
+            self._slots[section] = (mm, seq + 2)
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.debug(f"[STATE_BUS] {section} 발행 실패: {e}")
+            return False
+        self.stats['published'] += 1
+        self.stats['bytes'] += len(payload)
+        return True
+
+    def close(self) -> None:
+        for mm, _ in self._slots.values():
+            try:
+                mm.close()
+            except Exception:
+                pass
+        self._slots.clear()
+
+
+class StateBusReader:
+    """
+    섹션 스냅샷 읽기 (대시보드 API 등 다중 reader). 변경 시에만 디코딩.
+
+    read() 가 돌려주는 객체는 캐시 공유본 — 호출측에서 수정하지 말 것.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else default_bus_dir()
+        self._maps: Dict[str, mmap.mmap] = {}
+        self._cache: Dict[str, Tuple[int, Any]] = {}         # 섹션 → (seq, 객체)
+        self.stats = {'hits': 0, 'decodes': 0, 'torn': 0}
+
+    def _map(self, section: str) -> Optional[mmap.mmap]:
+        mm = self._maps.get(section)
+        if mm is not None:
+            return mm
+        path = _slot_path(self.directory, section)
+        try:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(mm) < _HEADER.size or mm[:4] != _MAGIC:
+            mm.close()
+            return None
+        self._maps[section] = mm
+        return mm
+
+    def version(self, section: str) -> Optional[int]:
+        """현재 시퀀스 (버스 없으면 None). 홀수면 쓰는 중."""
+        mm = self._map(section)
+        if mm is None:
+            return None
+        return _SEQ.unpack_from(mm, _SEQ_OFFSET)[0]
+
+    def read(self, section: str, default: Any = None) -> Any:
+        """최신 스냅샷. 발행 이력이 없으면 default, 쓰는 중이면 직전 스냅샷."""
+        mm = self._map(section)
+        if mm is None:
+            return default
+        cached = self._cache.get(section)
+        for _ in range(_READ_RETRIES):
+            seq = _SEQ.unpack_from(mm, _SEQ_OFFSET)[0]
+            if cached is not None and cached[0] == seq:
+                self.stats['hits'] += 1
+                return cached[1]
+            if seq == 0:
+                return default
+            if seq & 1:
+                self.stats['torn'] += 1
+                continue
+            _, capacity, _, length, crc = _HEADER.unpack_from(mm, 0)
+            if length > capacity or _HEADER.size + length > len(mm):
+                # writer 가 용량을 바꿔 재생성 → 다시 매핑
+                self._drop(section)
+                mm = self._map(section)
+                if mm is None:
+                    break
+                continue
+            payload = bytes(mm[_HEADER.size:_HEADER.size + length])
+            if _SEQ.unpack_from(mm, _SEQ_OFFSET)[0] != seq or zlib.crc32(payload) != crc:
+                self.stats['torn'] += 1
+                continue
+            try:
+                obj = json.loads(payload)
+            except ValueError:
+                self.stats['torn'] += 1
+                continue
+            self._cache[section] = (seq, obj)
+            self.stats['decodes'] += 1
+            return obj
+        return cached[1] if cached is not None else default
+
+    def _drop(self, section: str) -> None:
+        mm = self._maps.pop(section, None)
+        if mm is not None:
+            mm.close()
+
+    def close(self) -> None:
+        for section in list(self._maps):
+            self._drop(section)
+        self._cache.clear()
@@ -0,0 +1,270 @@
+"""
+core/tick_bars.py — 키움 실시간 체결(REAL 0B) → 다중 타임프레임 분봉 집계
+
+역할:
+  1. REAL 체결 틱(체결시간/현재가/체결량)을 종목 × 타임프레임(1/3/5/30분) 봉으로 집계
+  2. 진행 중인 봉을 MinuteBarStore 링버퍼에 바로 반영 → get_frame() 이 항상 최신
+  3. 봉 마감 시 on_bar_close 콜백 호출 (다음 구간 첫 틱 또는 flush(now) 시각 경과)
+     체결마다 on_trade 콜백 호출 (보유 종목 틱 단위 청산 감시용)
+  4. REST 분봉(ka10080)은 종목별 1회 backfill (기동/재연결 시) → 이후 틱만으로 유지
+
+봉 시각(cntr_tm) 표기:
+  label='start' → 구간 시작 시각 (09:00:00~09:04:59 → 090000)
+  label='end'   → 구간 종료 시각 (09:00:00~09:04:59 → 090500)
+  backfill 응답의 진행 중 봉이 현재 시각보다 미래면 'end' 표기로 판단해 자동 전환
+  (REST 봉과 틱 봉의 시각 표기가 어긋나면 같은 구간이 두 봉으로 갈라짐)
+
+사용:
+  builder = TickBarBuilder(bar_store)
+  builder.on_bar_close(lambda symbol, tf, ts, bar: ...)
+  builder.on_real(frame)                       # WebSocketDemux.subscribe('REAL') 프레임
+  builder.backfill("005930", "5", chart_rows)  # REST 1회
+  builder.flush(datetime.now())                # 틱 없는 종목의 봉 마감 처리
+
+v1.0 2026-10-16: 최초 작성
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.bar_store import MinuteBarStore
+
+logger = logging.getLogger(__name__)
+
+TIMEFRAMES: Tuple[str, ...] = ('1', '3', '5', '30')
+
+# REAL 0B(주식체결) values 필드
+_F_TIME = '20'     # 체결시간 HHMMSS
+_F_PRICE = '10'    # 현재가 (부호 포함)
+_F_VOLUME = '15'   # 거래량 (부호 = 매수/매도 체결 구분)
+_TICK_TYPE = '0B'
+
+
+def _bar_time(dt: datetime) -> int:
+    return int(dt.strftime('%Y%m%d%H%M%S'))
+
+
+def _parse_time(value: Any, day: datetime) -> Optional[datetime]:
+    """체결시간 "093512" → day 날짜의 datetime. 변환 불가 시 None."""
+    text = str(value if value is not None else '').strip()
+    if not text:
+        return None
+    try:
+        text = text.zfill(6)
+        return day.replace(hour=int(text[0:2]), minute=int(text[2:4]),
+                           second=int(text[4:6]), microsecond=0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _abs_number(value: Any) -> Optional[float]:
+    try:
+        return abs(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class TickBarBuilder:
+    """
+    체결 틱 → 분봉 집계기 (이벤트 루프 단일 스레드에서 사용)
+
+    Args:
+        store: 봉을 반영할 MinuteBarStore (check_all_stocks 와 공유)
+        timeframes: 집계할 분 단위 타임프레임
+        label: 봉 시각 표기 'start' | 'end'
+    """
+
+    def __init__(self, store: MinuteBarStore, timeframes: Sequence = TIMEFRAMES, label: str = 'start'):
+        if label not in ('start', 'end'):
+            raise ValueError(f"label must be 'start' or 'end': {label}")
+        self.store = store
+        self.timeframes = tuple(str(tf) for tf in timeframes)
+        self.label = label
+        # (종목, tf) → [ts, open, high, low, close, volume, 구간 종료 datetime, 마감 여부]
+        self._bars: Dict[Tuple[str, str], list] = {}
+        self._last_price: Dict[str, float] = {}
+        self._backfilled: set = set()           # (종목, tf)
+        self._callbacks: List[Callable] = []
+        self._trade_callbacks: List[Callable] = []
+        self.stats = {'ticks': 0, 'bad_ticks': 0, 'late_ticks': 0,
+                      'bars_closed': 0, 'backfills': 0, 'label_switches': 0}
+
+    # ── 콜백 ──────────────────────────────────────────────────────────────
+
+    def on_bar_close(self, callback: Callable[[str, str, int, List[float]], None]) -> None:
+        """봉 마감 콜백 등록: callback(symbol, timeframe, ts, [o, h, l, c, v])"""
+        self._callbacks.append(callback)
+
+    def on_trade(self, callback: Callable[[str, float, datetime], None]) -> None:
+        """체결 콜백 등록: callback(symbol, price, when) — 봉 반영 후 호출"""
+        self._trade_callbacks.append(callback)
+
+    def _emit(self, symbol: str, tf: str, state: list) -> None:
+        state[7] = True
+        self.stats['bars_closed'] += 1
+        bar = state[1:6]
+        for callback in self._callbacks:
+            try:
+                callback(symbol, tf, state[0], bar)
+            except Exception as e:
+                logger.error(f"[TICK_BARS] bar close callback error: {e}")
+
+    # ── 집계 ──────────────────────────────────────────────────────────────
+
+    def _bucket(self, dt: datetime, tf: str) -> Tuple[int, datetime]:
+        """틱 시각 → (봉 시각, 구간 종료 시각)"""
+        minutes = int(tf)
+        start = dt.replace(second=0, microsecond=0)
+        start -= timedelta(minutes=(dt.hour * 60 + dt.minute) % minutes)
+        end = start + timedelta(minutes=minutes)
+        return _bar_time(start if self.label == 'start' else end), end
+
+    def on_tick(self, symbol: str, price: float, volume: float, when: datetime) -> int:
+        """
+        체결 1건 반영.
+
+        Returns:
+            이 틱으로 마감된 봉 수
+        """
+        self.stats['ticks'] += 1
+        self._last_price[symbol] = price
+        closed = 0
+        for tf in self.timeframes:
+            key = (symbol, tf)
+            ts, end = self._bucket(when, tf)
+            state = self._bars.get(key)
+            if state is not None and ts < state[0]:
+                self.stats['late_ticks'] += 1
+                continue
+            if state is not None and ts == state[0]:
+                state[2] = max(state[2], price)
+                state[3] = min(state[3], price)
+                state[4] = price
+                state[5] += volume
+            else:
+                if state is not None and not state[7]:
+                    self._emit(symbol, tf, state)
+                    closed += 1
+                state = [ts, price, price, price, price, volume, end, False]
+                self._bars[key] = state
+            self.store.upsert_bar(symbol, tf, state[0], state[1:6])
+        for callback in self._trade_callbacks:
+            try:
+                callback(symbol, price, when)
+            except Exception as e:
+                logger.error(f"[TICK_BARS] trade callback error: {e}")
+        return closed
+
+    def on_real(self, frame: Dict[str, Any], now: Optional[datetime] = None) -> int:
+        """
+        REAL 프레임 1개 처리 ({"trnm": "REAL", "data": [{"type": "0B", "item": 코드, "values": {...}}]})
+
+        Returns:
+            반영한 체결 수
+        """
+        day = now or datetime.now()
+        applied = 0
+        for item in frame.get('data') or ():
+            if item.get('type') != _TICK_TYPE:
+                continue
+            values = item.get('values') or {}
+            symbol = str(item.get('item') or '')
+            when = _parse_time(values.get(_F_TIME), day)
+            price = _abs_number(values.get(_F_PRICE))
+            volume = _abs_number(values.get(_F_VOLUME))
+            if not symbol or when is None or not price or volume is None:
+                self.stats['bad_ticks'] += 1
+                continue
+            self.on_tick(symbol, price, volume, when)
+            applied += 1
+        return applied
+
+    def flush(self, now: datetime) -> int:
+        """구간이 끝났는데 다음 틱이 없는 봉 마감 처리 (거래 뜸한 종목). 마감 수 반환."""
+        closed = 0
+        for (symbol, tf), state in self._bars.items():
+            if not state[7] and now >= state[6]:
+                self._emit(symbol, tf, state)
+                closed += 1
+        return closed
+
+    # ── REST 보충 ─────────────────────────────────────────────────────────
+
+    def backfill(self, symbol: str, tf: str, rows: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> int:
+        """
+        REST 분봉 응답으로 버퍼 재적재 후 진행 중인 틱 봉과 합침.
+
+        - 같은 구간: REST 봉(구간 시작부터) 기준으로 고가/저가 확장, 종가는 최신 틱
+        - 틱 봉이 더 최신: 버퍼 끝에 다시 추가
+        - 틱 봉이 없거나 과거: REST 마지막 봉을 진행 중 봉으로 이어받음
+
+        Returns:
+            적재된 봉 수
+        """
+        tf = str(tf)
+        rows = list(rows or [])
+        if not rows:
+            return 0
+        now = now or datetime.now()
+        self.store.clear(symbol, tf)
+        merged = self.store.merge_chart_rows(symbol, tf, rows)
+        last = self.store.last_bar(symbol, tf)
+        if last is None:
+            return merged
+
+        last_ts, bar = last
+        if self.label == 'start' and last_ts > _bar_time(now):
+            self._switch_label('end')
+
+        key = (symbol, tf)
+        state = self._bars.get(key)
+        if state is not None and state[0] == last_ts:
+            state[1] = bar[0]
+            state[2] = max(state[2], bar[1])
+            state[3] = min(state[3], bar[2])
+            state[5] = max(state[5], bar[4])
+            self.store.upsert_bar(symbol, tf, state[0], state[1:6])
+        elif state is not None and state[0] > last_ts:
+            self.store.upsert_bar(symbol, tf, state[0], state[1:6])
+        else:
+            minutes = int(tf)
+            label_dt = datetime.strptime(str(last_ts), '%Y%m%d%H%M%S')
+            end = label_dt + timedelta(minutes=minutes) if self.label == 'start' else label_dt
+            self._bars[key] = [last_ts, *bar, end, now >= end]
+            self._last_price.setdefault(symbol, bar[3])
+
+        self._backfilled.add(key)
+        self.stats['backfills'] += 1
+        return merged
+
+    def _switch_label(self, label: str) -> None:
+        """REST 표기와 맞추기 — 기존 틱 봉은 표기가 달라 버리고 재 backfill 대상으로."""
+        logger.info(f"[TICK_BARS] 봉 시각 표기 {self.label} → {label}")
+        self.label = label
+        self._bars.clear()
+        self._backfilled.clear()
+        self.stats['label_switches'] += 1
+
+    # ── 상태 ──────────────────────────────────────────────────────────────
+
+    def is_live(self, symbol: str, tf: str = '5') -> bool:
+        """REST backfill 이후 틱으로 유지 중인지 (REST 차트 조회 생략 가능)."""
+        return (symbol, str(tf)) in self._backfilled
+
+    def last_price(self, symbol: str) -> Optional[float]:
+        return self._last_price.get(symbol)
+
+    def reset(self) -> None:
+        """재연결 — 끊긴 동안 틱 유실 가능, 모든 종목을 다시 backfill 대상으로."""
+        self._backfilled.clear()
+
+    def retain(self, symbols: Iterable[str]) -> int:
+        """symbols 에 없는 종목 상태 제거. 제거 수 반환."""
+        keep = set(symbols)
+        stale = [k for k in self._bars if k[0] not in keep]
+        for key in stale:
+            del self._bars[key]
+        self._backfilled = {k for k in self._backfilled if k[0] in keep}
+        for symbol in [s for s in self._last_price if s not in keep]:
+            del self._last_price[symbol]
+        return len(stale)
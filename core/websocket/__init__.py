@@ -1,4 +1,5 @@
 """WebSocket 관리 모듈"""
 from core.websocket.websocket_manager import WebSocketManager
+from core.websocket.demux import WebSocketDemux
 
-__all__ = ['WebSocketManager']
+__all__ = ['WebSocketManager', 'WebSocketDemux']
@@ -0,0 +1,219 @@
+"""
+WebSocket 단일 리더 디멀티플렉서
+
+키움 WebSocket 은 요청 응답(LOGIN, CNSRLST, CNSRREQ ...)과 서버 푸시(REAL 시세,
+조건검색 실시간 편입/이탈, PING)가 한 연결로 섞여 들어온다.
+recv() 를 호출한 쪽이 기대하지 않은 프레임을 버리면 다른 대기자의 응답이 유실되므로,
+리더 태스크 하나만 recv() 하고 프레임을 1회 파싱해 라우팅한다.
+
+라우팅 순서:
+  1. PING → 그대로 돌려보냄 (keep-alive), 카운터만 증가
+  2. subscribe(trnm) 큐 → 해당 trnm 프레임 전부 (REAL 등 스트림)
+  3. wait()/request() 대기자 → (trnm, seq) 가 맞는 가장 오래된 대기자 1명
+  4. 아무도 받지 않은 프레임 → 최근 unclaimed_max 개 보관, 이후 wait() 가 먼저 확인
+
+연결 종료 시 대기 중인 future 에 예외 전달 (호출측 재연결 로직 그대로 동작),
+구독 큐에는 종료 표시로 None 적재.
+"""
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _match(want_trnm, want_seq, trnm, seq) -> bool:
+    if want_trnm is not None and want_trnm != trnm:
+        return False
+    if want_seq is not None and str(want_seq) != str(seq):
+        return False
+    return True
+
+
+class WebSocketDemux:
+    """
+    연결 1개당 리더 태스크 1개.
+
+    Args:
+        ws: websockets 클라이언트 연결 (recv/send)
+        echo_ping: PING 프레임을 서버로 되돌려 보낼지 (키움 샘플 동작)
+        unclaimed_max: 주인 없는 프레임 보관 개수
+        queue_max: 구독 큐 최대 길이 (가득 차면 가장 오래된 프레임 폐기)
+    """
+
+    def __init__(self, ws, echo_ping: bool = True, unclaimed_max: int = 64, queue_max: int = 10000):
+        self.ws = ws
+        self.echo_ping = echo_ping
+        self.queue_max = queue_max
+        self._waiters: list = []                 # [(trnm, seq, future)]
+        self._subs: Dict[str, list] = {}         # trnm → [asyncio.Queue]
+        self._unclaimed: deque = deque(maxlen=unclaimed_max)
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self.stats = {
+            'frames': 0, 'pings': 0, 'replies': 0, 'pushed': 0,
+            'unclaimed': 0, 'unclaimed_dropped': 0, 'queue_dropped': 0,
+            'parse_errors': 0, 'timeouts': 0,
+        }
+
+    # ── 수명 ──────────────────────────────────────────────────────────────
+
+    def start(self) -> 'WebSocketDemux':
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._reader())
+        return self
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def close(self) -> None:
+        """리더 태스크 중지 (연결 자체는 호출측이 닫음)."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._fail_all(ConnectionError('demux closed'))
+
+    # ── 수신 API ──────────────────────────────────────────────────────────
+
+    async def wait(self, trnm: str = None, seq: Any = None, timeout: float = 10.0) -> Optional[dict]:
+        """
+        (trnm, seq) 에 맞는 다음 프레임. trnm=None → PING 외 아무 프레임.
+        타임아웃 시 None, 연결 종료 시 종료 예외 재발생.
+        """
+        for i, frame in enumerate(self._unclaimed):
+            if _match(trnm, seq, frame.get('trnm'), frame.get('seq')):
+                del self._unclaimed[i]
+                return frame
+        future = self._register(trnm, seq)
+        return await self._await(future, timeout)
+
+    async def request(self, trnm: str, data: dict = None, seq: Any = None,
+                      timeout: float = 10.0) -> Optional[dict]:
+        """대기자 등록 → 전송 → 응답 대기 (등록이 먼저라 빠른 응답도 놓치지 않음)."""
+        future = self._register(trnm, seq)
+        message = {'trnm': trnm}
+        if data:
+            message.update(data)
+        try:
+            await self.ws.send(json.dumps(message))
+        except Exception:
+            self._discard(future)
+            raise
+        return await self._await(future, timeout)
+
+    def subscribe(self, trnm: str, maxsize: int = None) -> asyncio.Queue:
+        """trnm 프레임 스트림 구독 (REAL 시세 등). 연결 종료 시 None 이 들어옴."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize or self.queue_max)
+        self._subs.setdefault(trnm, []).append(queue)
+        return queue
+
+    def unsubscribe(self, trnm: str, queue: asyncio.Queue) -> None:
+        queues = self._subs.get(trnm, [])
+        if queue in queues:
+            queues.remove(queue)
+
+    def snapshot(self) -> dict:
+        return {
+            **self.stats,
+            'waiters': len(self._waiters),
+            'subscriptions': {k: len(v) for k, v in self._subs.items() if v},
+            'buffered': len(self._unclaimed),
+        }
+
+    # ── 내부 ──────────────────────────────────────────────────────────────
+
+    def _register(self, trnm, seq) -> asyncio.Future:
+        if self._error is not None:
+            raise self._error
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((trnm, seq, future))
+        return future
+
+    def _discard(self, future) -> None:
+        self._waiters = [w for w in self._waiters if w[2] is not future]
+
+    async def _await(self, future, timeout) -> Optional[dict]:
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += 1
+            return None
+        finally:
+            self._discard(future)
+
+    async def _reader(self) -> None:
+        try:
+            while True:
+                raw = await self.ws.recv()
+                self._dispatch(raw)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f'[WS_DEMUX] 리더 종료: {type(e).__name__}: {e}')
+            self._fail_all(e)
+
+    def _dispatch(self, raw) -> None:
+        self.stats['frames'] += 1
+        try:
+            frame = json.loads(raw)
+        except (TypeError, ValueError):
+            self.stats['parse_errors'] += 1
+            return
+        if not isinstance(frame, dict):
+            self.stats['parse_errors'] += 1
+            return
+
+        trnm, seq = frame.get('trnm'), frame.get('seq')
+        if trnm == 'PING':
+            self.stats['pings'] += 1
+            if self.echo_ping:
+                asyncio.get_running_loop().create_task(self._echo(raw))
+            return
+
+        claimed = False
+        for queue in self._subs.get(trnm, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.stats['queue_dropped'] += 1
+            queue.put_nowait(frame)
+            claimed = True
+        if claimed:
+            self.stats['pushed'] += 1
+
+        for i, (want_trnm, want_seq, future) in enumerate(self._waiters):
+            if not future.done() and _match(want_trnm, want_seq, trnm, seq):
+                del self._waiters[i]
+                future.set_result(frame)
+                self.stats['replies'] += 1
+                return
+
+        if not claimed:
+            if len(self._unclaimed) == self._unclaimed.maxlen:
+                self.stats['unclaimed_dropped'] += 1
+            self._unclaimed.append(frame)
+            self.stats['unclaimed'] += 1
+
+    async def _echo(self, raw) -> None:
+        try:
+            await self.ws.send(raw)
+        except Exception as e:
+            logger.debug(f'[WS_DEMUX] PING 응답 실패: {e}')
+
+    def _fail_all(self, error: BaseException) -> None:
+        if self._error is None:
+            self._error = error
+        waiters, self._waiters = self._waiters, []
+        for _, _, future in waiters:
+            if not future.done():
+                future.set_exception(error)
+        for queues in self._subs.values():
+            for queue in queues:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(None)
@@ -0,0 +1,244 @@
+"""
+database/dashboard_db.py — 대시보드(api_server) 전용 읽기 DB 계층
+
+- 연결: ThreadedConnectionPool (autocommit + readonly, 최대 DASHBOARD_PG_POOL_MAX 개)
+  → 브라우저 여러 개가 몇 초마다 폴링해도 매매 프로세스와 경쟁하는 연결 수 상한 고정
+- 쿼리: 이름 붙은 statement 를 연결당 1회 서버측 PREPARE, 이후 EXECUTE 만 전송
+- 캐시: trades 에 의존하는 statement 결과는 (이름, 인자) 별로 보관,
+        trades 버전 토큰(MAX(trade_id) + pg_stat 삽입/수정/삭제 수)이 바뀌면 무효화
+        버전 확인 자체도 version_ttl 초마다 1회로 제한, cache_ttl 초 지나면 무조건 재조회
+- async: run(fn) 은 연결 수와 같은 크기의 전용 스레드풀에서 실행 → 이벤트 루프 비차단
+
+사용처: api_server (compute_performance, build_trades, _compute_risk_metrics 등)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+
+logger = logging.getLogger(__name__)
+
+# name → (SQL ($1.. 위치 인자), trades 버전으로 캐시할지)
+STATEMENTS = {
+    "trades_version": ("""
+        SELECT COALESCE(MAX(trade_id), 0),
+               (SELECT COALESCE(n_tup_ins + n_tup_upd + n_tup_del, 0)
+                FROM pg_stat_user_tables WHERE relname = 'trades')
+        FROM trades
+    """, False),
+    "trade_ledger": ("""
+        SELECT trade_id, stock_code, trade_type, realized_profit, strategy_name,
+               trade_time::date
+        FROM trades
+        ORDER BY trade_id
+    """, True),
+    "trades_range": ("""
+        SELECT trade_id,
+               trade_time::date,
+               trade_time,
+               stock_code, stock_name, trade_type,
+               quantity, price, realized_profit,
+               COALESCE(exit_reason, entry_reason, ''),
+               COALESCE(strategy_name, 'SMC')
+        FROM trades
+        WHERE trade_time::date >= $1::date AND trade_time::date <= $2::date
+        ORDER BY trade_id ASC
+    """, True),
+    "sell_after": ("""
+        SELECT trade_id FROM trades
+        WHERE stock_code = $1 AND trade_type = 'SELL' AND trade_time >= $2::timestamp
+        LIMIT 1
+    """, True),
+    "account_snapshot_latest": ("""
+        SELECT deposit, holding_value, total_assets, eval_profit, snapshot_at
+        FROM account_snapshot
+        WHERE total_assets > 0
+        ORDER BY snapshot_at DESC
+        LIMIT 1
+    """, False),
+}
+
+
+def _dsn() -> dict:
+    return {
+        "host":     os.getenv("POSTGRES_HOST", "localhost"),
+        "port":     int(os.getenv("POSTGRES_PORT", "5432")),
+        "dbname":   os.getenv("POSTGRES_DB", "trading_system"),
+        "user":     os.getenv("POSTGRES_USER", "postgres"),
+        "password": os.getenv("POSTGRES_PASSWORD", ""),
+    }
+
+
+class _PreparedConnection(psycopg2.extensions.connection):
+    """연결 단위로 PREPARE 완료된 statement 이름 기록."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: set = set()
+
+
+class DashboardDB:
+    """
+    연결 풀 + prepared statement + trades 버전 캐시.
+
+    Args:
+        max_conn: 최대 연결 수 (= async 실행 스레드 수)
+        version_ttl: trades 버전 토큰 재확인 간격 (초)
+        cache_ttl: 버전이 그대로여도 결과를 재조회하는 최대 보관 시간 (초)
+        pool_factory: 테스트용 — getconn/putconn 을 가진 풀 객체 생성 함수
+    """
+
+    def __init__(
+        self,
+        max_conn: int = int(os.getenv("DASHBOARD_PG_POOL_MAX", "4")),
+        version_ttl: float = 1.0,
+        cache_ttl: float = 60.0,
+        pool_factory: Optional[Callable] = None,
+    ):
+        self.max_conn = max(1, max_conn)
+        self.version_ttl = version_ttl
+        self.cache_ttl = cache_ttl
+        self._pool_factory = pool_factory or (lambda: psycopg2.pool.ThreadedConnectionPool(
+            1, self.max_conn, connection_factory=_PreparedConnection, **_dsn()))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_conn)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cache: dict = {}           # (name, params) → (version, 적재 시각, rows)
+        self._cache_lock = threading.Lock()
+        self._version = None
+        self._version_at = 0.0
+        self.stats = {"queries": 0, "prepares": 0, "hits": 0, "misses": 0, "invalidations": 0}
+
+    # ── 연결 ──────────────────────────────────────────────────────────────
+
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None or getattr(self._pool, "closed", False):
+                self._pool = self._pool_factory()
+            return self._pool
+
+    @contextmanager
+    def connection(self):
+        """풀 연결 대여 (풀이 가득 차면 PoolError 대신 반납될 때까지 대기)."""
+        with self._slots:
+            pool = self._get_pool()
+            conn = pool.getconn()
+            broken = False
+            try:
+                if hasattr(conn, "set_session") and not conn.autocommit:
+                    conn.set_session(readonly=True, autocommit=True)
+                yield conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                broken = True
+                raise
+            finally:
+                pool.putconn(conn, close=broken or bool(getattr(conn, "closed", False)))
+
+    def _execute(self, conn, name: str, params: tuple) -> list:
+        cur = conn.cursor()
+        if name not in conn.prepared:
+            cur.execute(f"PREPARE {name} AS {STATEMENTS[name][0]}")
+            conn.prepared.add(name)
+            self.stats["prepares"] += 1
+        if params:
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cur.execute(f"EXECUTE {name}")
+        self.stats["queries"] += 1
+        return cur.fetchall()
+
+    # ── 조회 ──────────────────────────────────────────────────────────────
+
+    def query(self, name: str, *params) -> list:
+        """
+        prepared statement 실행 → 행 목록.
+        trades 의존 statement 는 trades 버전이 같고 cache_ttl 이내면 캐시 결과 반환.
+        """
+        cached = STATEMENTS[name][1]
+        if not cached:
+            with self.connection() as conn:
+                return self._execute(conn, name, params)
+
+        key = (name, params)
+        version = self.trades_version()
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == version and now - entry[1] < self.cache_ttl:
+                self.stats["hits"] += 1
+                return entry[2]
+        self.stats["misses"] += 1
+        with self.connection() as conn:
+            rows = self._execute(conn, name, params)
+        with self._cache_lock:
+            self._cache[key] = (version, now, rows)
+        return rows
+
+    def trades_version(self) -> tuple:
+        """trades 변경 토큰 — version_ttl 초 동안은 마지막 값 재사용."""
+        now = time.monotonic()
+        if self._version is not None and now - self._version_at < self.version_ttl:
+            return self._version
+        with self.connection() as conn:
+            rows = self._execute(conn, "trades_version", ())
+        version = tuple(rows[0]) if rows else None
+        if self._version is not None and version != self._version:
+            self._drop_stale(version)
+        self._version, self._version_at = version, now
+        return version
+
+    def _drop_stale(self, version) -> None:
+        with self._cache_lock:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] == version}
+        self.stats["invalidations"] += 1
+
+    def invalidate(self) -> None:
+        """캐시 전체 + 버전 토큰 즉시 만료 (거래 발생 알림 시)."""
+        with self._cache_lock:
+            self._cache.clear()
+        self._version = None
+        self.stats["invalidations"] += 1
+
+    # ── async ─────────────────────────────────────────────────────────────
+
+    async def run(self, fn: Callable, *args):
+        """fn(*args) 를 DB 전용 스레드풀에서 실행 (동시 실행 수 = 연결 수)."""
+        if self._executor is None:
+            with self._pool_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_conn, thread_name_prefix="dashboard-db")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        with self._pool_lock:
+            if self._pool is not None and hasattr(self._pool, "closeall"):
+                self._pool.closeall()
+            self._pool = None
+
+
+_default_db: Optional[DashboardDB] = None
+_default_lock = threading.Lock()
+
+
+def get_dashboard_db() -> DashboardDB:
+    """프로세스 공용 인스턴스."""
+    global _default_db
+    with _default_lock:
+        if _default_db is None:
+            _default_db = DashboardDB()
+        return _default_db
@@ -8,17 +8,35 @@ database/decision_trace.py — 의사결정 추적 DB 모듈
   - execute_sell() → record_exit_signal()  → trade_signals + ml_dataset 자동 생성
   - check_entry_signal() → save_feature_snapshot() (선택적, 호출 비용 주의)
 
+DB 접근 경로:
+  - id 를 반환해야 하는 함수 (start_filter_run, record_entry_signal, log_ml_decision 등)
+    → ThreadedConnectionPool 연결 재사용 (_pooled), 호출 스레드에서 동기 실행
+  - fire-and-forget 기록 (record_filter_stage, insert_blocked_trade,
+    save_rejected_candidate, log_strategy_change)
+    → 메모리 큐에 적재 후 즉시 반환, 백그라운드 writer 가 execute_values 다중행 INSERT
+      (DTRACE_BATCH_SIZE 행 또는 DTRACE_FLUSH_SEC 초마다 flush)
+  - Postgres 장애 / 큐 포화 → data/decision_trace_spill.jsonl 에 append (fsync),
+    DB 복구 후 다음 flush 에서 먼저 재적재
+  - 큐/배치 지표: writer_stats()
+
 모든 함수는 예외를 삼켜서 거래 흐름을 방해하지 않는다.
 """
 
 import os
 import re
 import json
+import time
+import queue
+import atexit
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +74,336 @@ def _get_conn():
     return psycopg2.connect(**_PG_DSN)
 
 
+# ─────────────────────────────────────────────────────────────
+# 0. 연결 풀 + 백그라운드 배치 writer
+# ─────────────────────────────────────────────────────────────
+
+_POOL_MAX = int(os.getenv("DTRACE_POOL_MAX", "4"))
+_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """프로세스 공용 연결 풀 (첫 사용 시 생성, 생성 실패 시 다음 호출에서 재시도)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.closed:
+            _pool = psycopg2.pool.ThreadedConnectionPool(1, _POOL_MAX, **_PG_DSN)
+        return _pool
+
+
+@contextmanager
+def _pooled():
+    """
+    풀 연결 대여 — 정상 종료 시 commit, 예외 시 rollback 후 재발생.
+    끊긴 연결은 풀에 돌려주지 않고 폐기. 풀이 가득 차면 1회성 연결로 대체.
+    """
+    try:
+        pool = _get_pool()
+        conn = pool.getconn()
+    except psycopg2.pool.PoolError:
+        pool, conn = None, _get_conn()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        raise
+    finally:
+        if pool is None:
+            conn.close()
+        else:
+            pool.putconn(conn, close=bool(conn.closed))
+
+
+# key → (INSERT ... VALUES %s, execute_values 행 템플릿)
+_STATEMENTS = {
+    "filter_stage": ("""
+        INSERT INTO filter_stage_results
+            (run_id, stage, stock_code, stock_name, passed,
+             news_score, supply_score, technical_score, volume_score, reason_tags,
+             created_at)
+        VALUES %s
+    """, None),
+    "blocked_trade": ("""
+        INSERT INTO blocked_trades
+            (stock_code, stock_name, block_reason,
+             rvol, price_vs_breakout, vwap_distance,
+             ema_slope, atr_ratio, volume_trend,
+             entry_type, pending_duration, entry_reason,
+             created_at)
+        VALUES %s
+    """, None),
+    "rejected_candidate": ("""
+        INSERT INTO ml_dataset
+            (stock_code, entry_time, features,
+             label_pnl, label_pnl_pct, label_binary,
+             label_updown, label_quality, label_risk,
+             source_type)
+        VALUES %s
+    """, "(%s, %s, %s::jsonb, 0, 0, 0, 0, 0, NULL, %s)"),
+    "strategy_change": ("""
+        INSERT INTO strategy_change_log
+            (strategy_name, param_key, value_before, value_after,
+             change_type, description, expected_effect,
+             created_at)
+        VALUES %s
+    """, None),
+}
+
+_SPILL_PATH = Path(os.getenv(
+    "DTRACE_SPILL_PATH",
+    Path(__file__).resolve().parent.parent / "data" / "decision_trace_spill.jsonl",
+))
+_RETRY_SEC = 5.0      # DB 실패 후 재시도 대기 (그 사이 배치는 곧바로 spill)
+
+# 연결 자체가 안 되는 오류 → spill 후 재시도 / 그 외 psycopg2.Error → 행 단위 격리
+_CONN_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError, psycopg2.pool.PoolError)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} 직렬화 불가")
+
+
+class _TraceWriter:
+    """
+    fire-and-forget 기록용 백그라운드 writer.
+
+    put(key, row) 는 큐 적재만 하고 즉시 반환. 데몬 스레드가 batch_size 행 또는
+    flush_interval 초마다 key 별로 묶어 execute_values 로 한 트랜잭션에 INSERT.
+
+    Args:
+        connect: 연결 context manager 팩토리 (기본 _pooled)
+        spill_path: DB 장애 / 큐 포화 시 행을 보관할 JSONL 파일
+        maxsize: 큐 최대 길이 (초과분은 호출 스레드에서 바로 spill)
+    """
+
+    def __init__(
+        self,
+        connect=None,
+        spill_path=None,
+        maxsize: int = int(os.getenv("DTRACE_QUEUE_MAX", "10000")),
+        batch_size: int = int(os.getenv("DTRACE_BATCH_SIZE", "200")),
+        flush_interval: float = float(os.getenv("DTRACE_FLUSH_SEC", "0.5")),
+    ):
+        self._connect = connect or _pooled
+        self.spill_path = Path(spill_path) if spill_path else _SPILL_PATH
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._spill_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._retry_at = 0.0
+        self.stats = {
+            "enqueued": 0, "written": 0, "batches": 0, "spilled": 0, "replayed": 0,
+            "dropped": 0, "queue_full": 0, "max_queue_depth": 0,
+            "last_flush_ms": None, "last_error": None,
+        }
+
+    # ── 생산자 (거래 스레드) ──────────────────────────────────────────────
+
+    def put(self, key: str, row: tuple) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((key, row))
+        except queue.Full:
+            self.stats["queue_full"] += 1
+            self._spill([(key, row)])
+            return
+        self.stats["enqueued"] += 1
+        depth = self._queue.qsize()
+        if depth > self.stats["max_queue_depth"]:
+            self.stats["max_queue_depth"] = depth
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="dtrace-writer", daemon=True)
+                self._thread.start()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """큐에 쌓인 행이 모두 처리(기록 또는 spill)될 때까지 대기. 시간 초과 시 False."""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 큐를 비우고 스레드 종료 (atexit)."""
+        if self._thread is None:
+            return
+        self.flush(timeout)
+        self._stop.set()
+        self._thread.join(timeout=self.flush_interval + 1.0)
+        self._thread = None
+
+    # ── 소비자 (writer 스레드) ────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                if self.spill_path.exists() or self._replay_path.exists():
+                    self._write([])
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception as e:
+                self.stats["dropped"] += len(batch)
+                self.stats["last_error"] = str(e)
+                logger.warning(f"[DTRACE] writer 예외 → {len(batch)}행 유실: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, items: list) -> None:
+        if time.monotonic() < self._retry_at:
+            self._spill(items)
+            return
+
+        replay = self._take_spill()
+        t0 = time.perf_counter()
+        try:
+            with self._connect() as conn:
+                dropped = self._execute(conn, replay + items)
+        except _CONN_ERRORS as e:
+            self._retry_at = time.monotonic() + _RETRY_SEC
+            self.stats["last_error"] = str(e).strip()
+            self._spill(items)
+            logger.debug(f"[DTRACE] DB 기록 실패 → spill {len(items)}행: {e}")
+            return
+
+        if replay:
+            self._replay_path.unlink(missing_ok=True)
+            self.stats["replayed"] += len(replay)
+            logger.info(f"[DTRACE] spill {len(replay)}행 재적재 완료")
+        self.stats["written"] += len(replay) + len(items) - dropped
+        self.stats["dropped"] += dropped
+        self.stats["batches"] += 1
+        self.stats["last_flush_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+
+    def _execute(self, conn, items: list) -> int:
+        """key 별 execute_values. 데이터 오류가 난 key 는 행 단위로 재시도해 불량 행만 버림."""
+        groups: dict = {}
+        for key, row in items:
+            groups.setdefault(key, []).append(row)
+
+        dropped = 0
+        cur = conn.cursor()
+        for key, rows in groups.items():
+            sql, template = _STATEMENTS[key]
+            cur.execute("SAVEPOINT dtrace_batch")
+            try:
+                psycopg2.extras.execute_values(cur, sql, rows, template=template, page_size=self.batch_size)
+                cur.execute("RELEASE SAVEPOINT dtrace_batch")
+                continue
+            except _CONN_ERRORS:
+                raise
+            except psycopg2.Error as e:
+                cur.execute("ROLLBACK TO SAVEPOINT dtrace_batch")
+                self.stats["last_error"] = str(e).strip()
+
+            for row in rows:
+                cur.execute("SAVEPOINT dtrace_row")
+                try:
+                    psycopg2.extras.execute_values(cur, sql, [row], template=template)
+                    cur.execute("RELEASE SAVEPOINT dtrace_row")
+                except _CONN_ERRORS:
+                    raise
+                except psycopg2.Error as e:
+                    cur.execute("ROLLBACK TO SAVEPOINT dtrace_row")
+                    dropped += 1
+                    logger.debug(f"[DTRACE] {key} 행 기록 실패 → 버림: {e}")
+        return dropped
+
+    # ── spill 파일 ────────────────────────────────────────────────────────
+
+    @property
+    def _replay_path(self) -> Path:
+        return self.spill_path.with_name(self.spill_path.name + ".replay")
+
+    def _spill(self, items: list) -> None:
+        if not items:
+            return
+        lines = "".join(
+            json.dumps({"key": key, "row": list(row)}, ensure_ascii=False, default=_json_default) + "\n"
+            for key, row in items
+        )
+        try:
+            with self._spill_lock:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+            self.stats["spilled"] += len(items)
+        except Exception as e:
+            self.stats["dropped"] += len(items)
+            logger.warning(f"[DTRACE] spill 실패 → {len(items)}행 유실: {e}")
+
+    def _take_spill(self) -> list:
+        """
+        spill 파일 → .replay 로 옮겨 읽음 (기록 중 추가되는 spill 과 분리).
+        재적재 실패 시 .replay 는 남아 다음 시도에서 다시 읽힘.
+        """
+        with self._spill_lock:
+            if not self._replay_path.exists() and self.spill_path.exists():
+                os.replace(self.spill_path, self._replay_path)
+        if not self._replay_path.exists():
+            return []
+        items = []
+        with open(self._replay_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                    if rec["key"] in _STATEMENTS:
+                        items.append((rec["key"], tuple(rec["row"])))
+                except (ValueError, KeyError):
+                    continue    # 비정상 종료로 잘린 마지막 줄
+        return items
+
+    def snapshot(self) -> dict:
+        return {**self.stats, "queue_depth": self._queue.qsize()}
+
+
+_writer = _TraceWriter()
+atexit.register(_writer.close)
+
+
+def writer_stats() -> dict:
+    """백그라운드 writer 지표 (enqueued/written/spilled/queue_depth/last_flush_ms 등)."""
+    return _writer.snapshot()
+
+
+def flush(timeout: float = 5.0) -> bool:
+    """대기 중인 fire-and-forget 기록을 모두 처리. 배치 스크립트 종료 직전 등에 사용."""
+    return _writer.flush(timeout)
+
+
 # ─────────────────────────────────────────────────────────────
 # 1. filter_pipeline_runs
 # ─────────────────────────────────────────────────────────────
@@ -74,15 +422,13 @@ def start_filter_run(market_phase: str = None, stock_count: int = 0) -> Optional
         else:
             market_phase = "close"
     try:
-        conn = _get_conn()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO filter_pipeline_runs (market_phase, strategy_version, stock_count)
-            VALUES (%s, %s, %s) RETURNING run_id
-        """, (market_phase, STRATEGY_VERSION, stock_count))
-        run_id = cur.fetchone()[0]
-        conn.commit()
-        conn.close()
+        with _pooled() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                INSERT INTO filter_pipeline_runs (market_phase, strategy_version, stock_count)
+                VALUES (%s, %s, %s) RETURNING run_id
+            """, (market_phase, STRATEGY_VERSION, stock_count))
+            run_id = cur.fetchone()[0]
         return run_id
     except Exception as e:
         logger.debug(f"[DTRACE] start_filter_run 실패: {e}")
@@ -159,25 +505,23 @@ def save_feature_snapshot(
         else:
             gap_pct = None
 
-        conn = _get_conn()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO filter_feature_snapshot
-                (run_id, stock_code, stock_name, price, volume, vol_ratio,
-                 vwap, rsi, ema9, ema20, ema60, atr, atr_ratio, gap_pct,
-                 market_regime, market_context)
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            RETURNING id
-        """, (
-            run_id, stock_code, stock_name,
-            _safe(price), int(curr_vol) if curr_vol else None, _safe(vol_ratio),
-            _safe(vwap_val), _safe(rsi), _safe(ema9), _safe(ema20), _safe(ema60),
-            _safe(atr), _safe(atr_ratio), _safe(gap_pct),
-            market_regime, market_context,
-        ))
-        snap_id = cur.fetchone()[0]
-        conn.commit()
-        conn.close()
+        with _pooled() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                INSERT INTO filter_feature_snapshot
+                    (run_id, stock_code, stock_name, price, volume, vol_ratio,
+                     vwap, rsi, ema9, ema20, ema60, atr, atr_ratio, gap_pct,
+                     market_regime, market_context)
+                VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+                RETURNING id
+            """, (
+                run_id, stock_code, stock_name,
+                _safe(price), int(curr_vol) if curr_vol else None, _safe(vol_ratio),
+                _safe(vwap_val), _safe(rsi), _safe(ema9), _safe(ema20), _safe(ema60),
+                _safe(atr), _safe(atr_ratio), _safe(gap_pct),
+                market_regime, market_context,
+            ))
+            snap_id = cur.fetchone()[0]
         return snap_id
     except Exception as e:
         logger.debug(f"[DTRACE] save_feature_snapshot 실패 {stock_code}: {e}")
@@ -201,26 +545,18 @@ def record_filter_stage(
     stage: 1=1차필터, 2=2차필터, 3=진입직전
     scores: {'news': 0.0, 'supply': 0.0, 'technical': 0.0, 'volume': 0.0}
     reason_tags: ['RVOL_LOW', 'HTF_FAIL', ...]
+    백그라운드 writer 큐에 적재 (created_at 은 호출 시각).
     """
     if run_id is None:
         return
     scores = scores or {}
     try:
-        conn = _get_conn()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO filter_stage_results
-                (run_id, stage, stock_code, stock_name, passed,
-                 news_score, supply_score, technical_score, volume_score, reason_tags)
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        """, (
+        _writer.put("filter_stage", (
             run_id, stage, stock_code, stock_name, passed,
             scores.get('news'), scores.get('supply'),
             scores.get('technical'), scores.get('volume'),
-            reason_tags or [],
+            list(reason_tags or []), datetime.now(),
         ))
-        conn.commit()
-        conn.close()
     except Exception as e:
         logger.debug(f"[DTRACE] record_filter_stage 실패 {stock_code}: {e}")
 
@@ -275,24 +611,22 @@ def record_entry_signal(
         pass
 
     try:
-        conn = _get_conn()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO trade_signals
-                (stock_code, stock_name, signal_type, strategy_name, strategy_version,
-                 trigger_reason, price, volume, rsi, vwap, ema9, ema60, atr_ratio,
-                 market_regime, market_context, choch_grade)
-            VALUES (%s,%s,'entry',%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            RETURNING signal_id
-        """, (
-            stock_code, stock_name,
-            strategy, STRATEGY_VERSION, entry_reason,
-            price, volume, rsi, vwap_val, ema9_val, ema60_val, atr_ratio,
-            market_regime, market_context, choch_grade,
-        ))
-        signal_id = cur.fetchone()[0]
-        conn.commit()
-        conn.close()
+        with _pooled() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                INSERT INTO trade_signals
+                    (stock_code, stock_name, signal_type, strategy_name, strategy_version,
+                     trigger_reason, price, volume, rsi, vwap, ema9, ema60, atr_ratio,
+                     market_regime, market_context, choch_grade)
+                VALUES (%s,%s,'entry',%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+                RETURNING signal_id
+            """, (
+                stock_code, stock_name,
+                strategy, STRATEGY_VERSION, entry_reason,
+                price, volume, rsi, vwap_val, ema9_val, ema60_val, atr_ratio,
+                market_regime, market_context, choch_grade,
+            ))
+            signal_id = cur.fetchone()[0]
         logger.debug(f"[DTRACE] entry_signal {signal_id} {stock_code} {strategy}")
         return signal_id
     except Exception as e:
@@ -331,60 +665,59 @@ def record_exit_signal(
         pnl_pct = (price - entry_price) / entry_price * 100
 
     try:
-        conn = _get_conn()
-        cur = conn.cursor()
+        with _pooled() as conn:
+            cur = conn.cursor()
 
-        # exit signal 삽입
-        cur.execute("""
-            INSERT INTO trade_signals
-                (stock_code, stock_name, signal_type, strategy_name, strategy_version,
-                 trigger_reason, price)
-            VALUES (%s,%s,'exit',%s,%s,%s,%s)
-            RETURNING signal_id
-        """, (stock_code, stock_name, strategy, STRATEGY_VERSION, exit_reason, price))
-        signal_id = cur.fetchone()[0]
-
-        # trades 업데이트
-        if trade_id:
+            # exit signal 삽입
             cur.execute("""
-                UPDATE trades
-                SET exit_signal_id = %s,
-                    exit_time      = NOW(),
-                    exit_reason    = %s,
-                    realized_profit = %s,
-                    profit_rate    = %s,
-                    holding_minutes = %s
-                WHERE trade_id = %s
-                  AND exit_signal_id IS NULL
-            """, (signal_id, exit_reason, realized_profit, pnl_pct, holding_minutes, trade_id))
-
-        conn.commit()
-
-        # ml_dataset UPDATE (BUY 시 INSERT된 row에 label 채우기)
-        if trade_id and realized_profit is not None:
-            updated = _update_ml_exit(
-                cur, conn, trade_id, realized_profit, pnl_pct,
-                mae_pct, mfe_pct, holding_minutes, exit_reason, signal_id,
-            )
-            # row가 없으면 (구 데이터) 기존 INSERT 방식 fallback
-            if not updated:
-                _insert_ml_dataset(
-                    cur, conn, trade_id, signal_id, stock_code,
-                    realized_profit, pnl_pct,
-                    mae_pct=mae_pct, mfe_pct=mfe_pct,
-                    extra_features=extra_features,
-                    holding_minutes=holding_minutes,
-                    exit_reason=exit_reason,
+                INSERT INTO trade_signals
+                    (stock_code, stock_name, signal_type, strategy_name, strategy_version,
+                     trigger_reason, price)
+                VALUES (%s,%s,'exit',%s,%s,%s,%s)
+                RETURNING signal_id
+            """, (stock_code, stock_name, strategy, STRATEGY_VERSION, exit_reason, price))
+            signal_id = cur.fetchone()[0]
+
+            # trades 업데이트
+            if trade_id:
+                cur.execute("""
+                    UPDATE trades
+                    SET exit_signal_id = %s,
+                        exit_time      = NOW(),
+                        exit_reason    = %s,
+                        realized_profit = %s,
+                        profit_rate    = %s,
+                        holding_minutes = %s
+                    WHERE trade_id = %s
+                      AND exit_signal_id IS NULL
+                """, (signal_id, exit_reason, realized_profit, pnl_pct, holding_minutes, trade_id))
+
+            conn.commit()
+
+            # ml_dataset UPDATE (BUY 시 INSERT된 row에 label 채우기)
+            if trade_id and realized_profit is not None:
+                updated = _update_ml_exit(
+                    cur, conn, trade_id, realized_profit, pnl_pct,
+                    mae_pct, mfe_pct, holding_minutes, exit_reason, signal_id,
                 )
+                # row가 없으면 (구 데이터) 기존 INSERT 방식 fallback
+                if not updated:
+                    _insert_ml_dataset(
+                        cur, conn, trade_id, signal_id, stock_code,
+                        realized_profit, pnl_pct,
+                        mae_pct=mae_pct, mfe_pct=mfe_pct,
+                        extra_features=extra_features,
+                        holding_minutes=holding_minutes,
+                        exit_reason=exit_reason,
+                    )
+
+            # ml_decisions later_outcome 채우기 ("막았던 거래가 실제로 어땠는지")
+            if trade_id and pnl_pct is not None:
+                try:
+                    update_ml_decision_outcome(trade_id, pnl_pct)
+                except Exception:
+                    pass
 
-        # ml_decisions later_outcome 채우기 ("막았던 거래가 실제로 어땠는지")
-        if trade_id and pnl_pct is not None:
-            try:
-                update_ml_decision_outcome(trade_id, pnl_pct)
-            except Exception:
-                pass
-
-        conn.close()
         logger.debug(f"[DTRACE] exit_signal {signal_id} {stock_code} pnl={realized_profit}")
         return signal_id
     except Exception as e:
@@ -632,36 +965,33 @@ def insert_ml_entry(
         feats = _extract_features_from_df(df, price) if df is not None else {}
         feats_json = json.dumps({**feats, 'entry_reason': entry_reason or ''})
 
-        conn = _get_conn()
-        cur = conn.cursor()
+        with _pooled() as conn:
+            cur = conn.cursor()
 
-        # 중복 방지: 이미 같은 trade_id 존재하면 skip
-        cur.execute("SELECT 1 FROM ml_dataset WHERE trade_id = %s", (trade_id,))
-        if cur.fetchone():
-            conn.close()
-            return
+            # 중복 방지: 이미 같은 trade_id 존재하면 skip
+            cur.execute("SELECT 1 FROM ml_dataset WHERE trade_id = %s", (trade_id,))
+            if cur.fetchone():
+                return
 
-        cur.execute("""
-            INSERT INTO ml_dataset
-                (trade_id, stock_code, entry_time,
-                 rvol, price_vs_breakout, vwap_distance,
-                 ema_slope, atr_ratio, volume_trend,
-                 entry_type, pending_duration,
-                 features, source_type)
-            VALUES (%s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s,
-                    %s::jsonb, 'trade')
-        """, (
-            trade_id, stock_code, entry_time,
-            feats.get('rvol'), feats.get('price_vs_breakout'), feats.get('vwap_distance'),
-            feats.get('ema_slope'), feats.get('atr_ratio'), feats.get('volume_trend'),
-            entry_type, pending_duration,
-            feats_json,
-        ))
-        conn.commit()
-        conn.close()
+            cur.execute("""
+                INSERT INTO ml_dataset
+                    (trade_id, stock_code, entry_time,
+                     rvol, price_vs_breakout, vwap_distance,
+                     ema_slope, atr_ratio, volume_trend,
+                     entry_type, pending_duration,
+                     features, source_type)
+                VALUES (%s, %s, %s,
+                        %s, %s, %s,
+                        %s, %s, %s,
+                        %s, %s,
+                        %s::jsonb, 'trade')
+            """, (
+                trade_id, stock_code, entry_time,
+                feats.get('rvol'), feats.get('price_vs_breakout'), feats.get('vwap_distance'),
+                feats.get('ema_slope'), feats.get('atr_ratio'), feats.get('volume_trend'),
+                entry_type, pending_duration,
+                feats_json,
+            ))
         logger.debug(f"[DTRACE] ml_entry INSERT trade_id={trade_id} entry_type={entry_type} feats={list(feats.keys())}")
     except Exception as e:
         logger.debug(f"[DTRACE] insert_ml_entry 실패 trade_id={trade_id}: {e}")
@@ -680,30 +1010,17 @@ def insert_blocked_trade(
     """
     진입 차단 시 호출 — blocked_trades에 차단 컨텍스트 + 피처 INSERT.
     ML이 "왜 안 들어갔는지"도 학습하도록.
+    피처 계산만 호출 스레드에서, INSERT 는 백그라운드 writer 큐 (created_at 은 호출 시각).
     """
     try:
         feats = _extract_features_from_df(df, price) if df is not None else {}
-        conn = _get_conn()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO blocked_trades
-                (stock_code, stock_name, block_reason,
-                 rvol, price_vs_breakout, vwap_distance,
-                 ema_slope, atr_ratio, volume_trend,
-                 entry_type, pending_duration, entry_reason)
-            VALUES (%s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s, %s)
-        """, (
+        _writer.put("blocked_trade", (
             stock_code, stock_name, block_reason,
             feats.get('rvol'), feats.get('price_vs_breakout'), feats.get('vwap_distance'),
             feats.get('ema_slope'), feats.get('atr_ratio'), feats.get('volume_trend'),
-            entry_type, pending_duration, entry_reason,
+            entry_type, pending_duration, entry_reason, datetime.now(),
         ))
-        conn.commit()
-        conn.close()
-        logger.debug(f"[DTRACE] blocked_trade INSERT {stock_code} reason={block_reason}")
+        logger.debug(f"[DTRACE] blocked_trade 적재 {stock_code} reason={block_reason}")
     except Exception as e:
         logger.debug(f"[DTRACE] insert_blocked_trade 실패 {stock_code}: {e}")
 
@@ -727,27 +1044,16 @@ def save_rejected_candidate(
     호출 위치:
       - record_filter_stage(..., passed=False) 이후
       - check_entry_signal 에서 REJECT 반환 시
+
+    백그라운드 writer 큐에 적재 (entry_time 은 호출 시각).
     """
     try:
-        conn = _get_conn()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO ml_dataset
-                (stock_code, entry_time, features,
-                 label_pnl, label_pnl_pct, label_binary,
-                 label_updown, label_quality, label_risk,
-                 source_type)
-            VALUES (%s, NOW(), %s,
-                    0, 0, 0,
-                    0, 0, NULL,
-                    %s)
-        """, (
+        _writer.put("rejected_candidate", (
             stock_code,
-            psycopg2.extras.Json({**features, 'reason_tags': reason_tags}),
+            datetime.now(),
+            json.dumps({**features, 'reason_tags': reason_tags}, default=str),
             source_type,
         ))
-        conn.commit()
-        conn.close()
     except Exception as e:
         logger.debug(f"[DTRACE] save_rejected_candidate 실패 {stock_code}: {e}")
 
@@ -765,22 +1071,13 @@ def log_strategy_change(
     description: str = None,
     expected_effect: str = None,
 ) -> None:
-    """전략 파라미터 변경 기록. 수동 호출 또는 YAML diff 감지 시 호출."""
+    """전략 파라미터 변경 기록. 수동 호출 또는 YAML diff 감지 시 호출 (created_at 은 호출 시각)."""
     try:
-        conn = _get_conn()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO strategy_change_log
-                (strategy_name, param_key, value_before, value_after,
-                 change_type, description, expected_effect)
-            VALUES (%s,%s,%s,%s,%s,%s,%s)
-        """, (
+        _writer.put("strategy_change", (
             strategy_name, param_key,
             str(value_before), str(value_after),
-            change_type, description, expected_effect,
+            change_type, description, expected_effect, datetime.now(),
         ))
-        conn.commit()
-        conn.close()
         logger.info(f"[DTRACE] strategy_change {strategy_name}.{param_key}: {value_before}→{value_after}")
     except Exception as e:
         logger.debug(f"[DTRACE] log_strategy_change 실패: {e}")
@@ -807,31 +1104,29 @@ def log_ml_decision(
     Returns: decision_id (포지션 dict에 저장해 두면 SELL 시 업데이트 가능)
     """
     try:
-        conn = _get_conn()
-        cur  = conn.cursor()
-        cur.execute("""
-            INSERT INTO ml_decisions
-                (trade_id, stock_code, prob, threshold, model_version,
-                 shadow_mode, blocked, entry_type,
-                 rvol, price_vs_breakout, vwap_distance,
-                 ema_slope, atr_ratio, volume_trend)
-            VALUES (%s,%s,%s,%s,%s, %s,%s,%s, %s,%s,%s, %s,%s,%s)
-            RETURNING id
-        """, (
-            trade_id, stock_code,
-            prob, threshold, model_version,
-            shadow_mode, blocked,
-            entry_type or features.get('entry_type'),
-            features.get('rvol'),
-            features.get('price_vs_breakout'),
-            features.get('vwap_distance'),
-            features.get('ema_slope'),
-            features.get('atr_ratio'),
-            features.get('volume_trend'),
-        ))
-        decision_id = cur.fetchone()[0]
-        conn.commit()
-        conn.close()
+        with _pooled() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                INSERT INTO ml_decisions
+                    (trade_id, stock_code, prob, threshold, model_version,
+                     shadow_mode, blocked, entry_type,
+                     rvol, price_vs_breakout, vwap_distance,
+                     ema_slope, atr_ratio, volume_trend)
+                VALUES (%s,%s,%s,%s,%s, %s,%s,%s, %s,%s,%s, %s,%s,%s)
+                RETURNING id
+            """, (
+                trade_id, stock_code,
+                prob, threshold, model_version,
+                shadow_mode, blocked,
+                entry_type or features.get('entry_type'),
+                features.get('rvol'),
+                features.get('price_vs_breakout'),
+                features.get('vwap_distance'),
+                features.get('ema_slope'),
+                features.get('atr_ratio'),
+                features.get('volume_trend'),
+            ))
+            decision_id = cur.fetchone()[0]
         tag      = '[ML_SHADOW_BLOCK]' if (blocked and shadow_mode) else ('[ML_BLOCK]' if blocked else '[ML_PASS]')
         prob_str = f'{prob:.3f}' if prob is not None else 'N/A'
         logger.info(
@@ -855,17 +1150,15 @@ def update_ml_decision_outcome(
     Returns True if updated.
     """
     try:
-        conn = _get_conn()
-        cur  = conn.cursor()
-        cur.execute("""
-            UPDATE ml_decisions
-            SET later_outcome = %s
-            WHERE trade_id = %s
-              AND later_outcome IS NULL
-        """, (later_outcome, trade_id))
-        conn.commit()
-        updated = cur.rowcount > 0
-        conn.close()
+        with _pooled() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                UPDATE ml_decisions
+                SET later_outcome = %s
+                WHERE trade_id = %s
+                  AND later_outcome IS NULL
+            """, (later_outcome, trade_id))
+            updated = cur.rowcount > 0
         return updated
     except Exception as e:
         logger.debug(f"[DTRACE] update_ml_decision_outcome 실패 trade_id={trade_id}: {e}")
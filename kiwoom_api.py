@@ -2,6 +2,7 @@
 키움증권 REST API 접속 모듈
 """
 import json
+import logging
 import os
 import requests
 import time
@@ -23,6 +24,58 @@ from exceptions import (
     OrderFailedError,
     InsufficientFundsError
 )
+from utils.rate_governor import (
+    GROUP_ORDER,
+    PRIORITY_ENTRY,
+    PRIORITY_ORDER,
+    current_priority,
+    get_governor,
+    group_for,
+    is_rate_limited,
+)
+
+
+class _GovernedSession(requests.Session):
+    """
+    모든 TR 요청을 앱 키 공용 RateGovernor 에 통과시키는 세션
+
+    - 그룹: api-id 헤더 기준 (주문 kt10000~kt10003 → 'order', 그 외 → 'tr'), OAuth 는 제외
+    - 우선순위: 주문은 항상 PRIORITY_ORDER, 그 외는 rate_priority() 컨텍스트 → 인스턴스 기본값
+    - 비정상 응답(429/1687/1700)은 governor 에 보고 → 적응형 백오프
+    - 이벤트 루프 스레드: 조회는 토큰이 없으면 APIException (루프 비차단),
+      주문은 제한 시간(governor._LOOP_WAIT_MAX) 대기 후에도 토큰이 없으면 그대로 전송 — 청산 주문을 버리지 않음
+    """
+
+    def __init__(self, governor, default_priority: int):
+        super().__init__()
+        self.governor = governor
+        self.default_priority = default_priority
+
+    def request(self, method, url, *args, **kwargs):
+        if '/oauth2/' in str(url):
+            return super().request(method, url, *args, **kwargs)
+        api_id = (kwargs.get('headers') or {}).get('api-id')
+        group = group_for(api_id)
+        priority = PRIORITY_ORDER if api_id and group == 'order' else current_priority(self.default_priority)
+        if not self.governor.acquire(group, priority):
+            if group == GROUP_ORDER:
+                logging.getLogger(__name__).warning(
+                    f"[RATE] 주문 토큰 대기 초과 ({api_id}) — 주문은 버리지 않고 전송"
+                )
+            else:
+                raise APIException(
+                    f"rate governor 토큰 없음 ({group}) — 이벤트 루프 스레드 대기 제한 초과",
+                    details={'api_id': api_id, 'group': group},
+                )
+        response = super().request(method, url, *args, **kwargs)
+        body = None
+        if response.status_code != 200:
+            try:
+                body = response.json()
+            except ValueError:
+                pass
+        self.governor.report(group, is_rate_limited(response.status_code, body))
+        return response
 
 
 class KiwoomAPI:
@@ -32,7 +85,8 @@ class KiwoomAPI:
     BASE_URL = "https://api.kiwoom.com"
 
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
-                 account_number: Optional[str] = None, user_id: Optional[str] = None):
+                 account_number: Optional[str] = None, user_id: Optional[str] = None,
+                 rate_priority: int = PRIORITY_ENTRY):
         """
         초기화
 
@@ -41,6 +95,8 @@ class KiwoomAPI:
             api_secret: API 시크릿 (없으면 .env에서 로드)
             account_number: 계좌번호 (없으면 .env에서 로드)
             user_id: 사용자 ID (없으면 .env에서 로드)
+            rate_priority: rate_priority() 컨텍스트 밖 TR 요청의 기본 우선순위
+                (utils.rate_governor — 대시보드는 PRIORITY_DASHBOARD)
         """
         # .env 파일 로드
         load_dotenv()
@@ -62,8 +118,8 @@ class KiwoomAPI:
         self.access_token: Optional[str] = None
         self.token_expires_at: Optional[float] = None
 
-        # 세션 생성
-        self.session = requests.Session()
+        # 세션 생성 (앱 키 공용 Rate Governor 경유 — 다른 프로세스와 TR 예산 공유)
+        self.session = _GovernedSession(get_governor(self.api_key), rate_priority)
 
     def _generate_signature(self, method: str, path: str, params: Dict[str, Any] = None,
                           body: Dict[str, Any] = None) -> str:
@@ -0,0 +1,656 @@
+"""
+키움증권 REST API 비동기 클라이언트 (KiwoomAPI 와 같은 메서드 / 반환 형식)
+
+기존 방식:
+  main_auto_trading 이 asyncio.to_thread(self.api.get_minute_chart, ...) 로 동기 requests 호출을
+  스레드 풀에 넘김 — 스캔 종목 수만큼 워커 스레드 점유, 기본 풀(min(32, CPU+4))이 차면 대기.
+
+AsyncKiwoomAPI:
+  - 연결: utils.http_client.HTTPSessionManager('kiwoom') 의 aiohttp 세션
+    (TCPConnector 연결 풀 + keep-alive → 동시 요청이 TLS 연결 재사용)
+  - 요청 마감시간(deadline): Rate Governor 대기 + 토큰 갱신 + HTTP 왕복 전체에 적용
+    초과 시 TimeoutError (조회 메서드는 handle_api_errors 가 기본값 반환으로 변환)
+  - 토큰 갱신 병합: 동시 N개 요청이 401/8005 를 받아도 발급은 1회, 나머지는 새 토큰으로 1회 재시도
+  - Rate Governor: 동기 클라이언트와 같은 앱 키 버킷 / 우선순위 규칙 (주문은 PRIORITY_ORDER)
+  - from_sync(api): 동기 KiwoomAPI 와 토큰 공유 — 어느 쪽에서 재발급해도 다른 쪽이 이어받음
+
+HTTP/2 는 aiohttp 미지원 → keep-alive 연결 풀 + 동시 요청으로 대체.
+
+사용:
+  api = AsyncKiwoomAPI.from_sync(kiwoom_api)
+  chart = await api.get_minute_chart('005930', tic_scope='5')
+  await api.close()
+
+v1.0 2026-10-16: 최초 작성
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+from dotenv import load_dotenv
+
+from exceptions import (
+    handle_api_errors,
+    handle_trading_errors,
+    retry_on_error,
+    AuthenticationError,
+    ConnectionError as TradingConnectionError,
+    TimeoutError as TradingTimeoutError,
+    APIException,
+    ConfigurationError,
+    OrderFailedError,
+    InsufficientFundsError
+)
+from utils.http_client import HTTPSessionManager, KiwoomHTTPConfig
+from utils.rate_governor import (
+    PRIORITY_ENTRY,
+    PRIORITY_ORDER,
+    current_priority,
+    get_governor,
+    group_for,
+    is_rate_limited,
+)
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_INVALID_CODE = 8005      # "Token이 유효하지 않습니다"
+_TOKEN_MARGIN = 300             # 만료 5분 전부터 재발급 (동기 클라이언트와 동일)
+
+
+class AsyncKiwoomAPI:
+    """키움증권 REST API 비동기 클라이언트"""
+
+    BASE_URL = "https://api.kiwoom.com"
+
+    # 요청 마감시간 기본값 (초) — 동기 클라이언트의 requests timeout 과 같은 값
+    QUERY_DEADLINE = 10.0
+    ORDER_DEADLINE = 15.0
+    TOKEN_DEADLINE = 30.0
+
+    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                 account_number: Optional[str] = None, user_id: Optional[str] = None,
+                 rate_priority: int = PRIORITY_ENTRY, token_source: Any = None,
+                 http: Optional[HTTPSessionManager] = None):
+        """
+        초기화
+
+        Args:
+            api_key / api_secret / account_number / user_id: 없으면 .env 에서 로드
+            rate_priority: rate_priority() 컨텍스트 밖 TR 요청의 기본 우선순위
+            token_source: 토큰을 공유할 동기 KiwoomAPI (access_token / token_expires_at)
+            http: aiohttp 세션 관리자 (None → HTTPSessionManager 'kiwoom' 싱글톤)
+        """
+        load_dotenv()
+
+        self.api_key = api_key or os.getenv("KIWOOM_APP_KEY")
+        self.api_secret = api_secret or os.getenv("KIWOOM_APP_SECRET")
+        self.account_number = account_number or os.getenv("KIWOOM_ACCOUNT_NUMBER")
+        self.user_id = user_id or os.getenv("KIWOOM_USER_ID")
+
+        if not all([self.api_key, self.api_secret]):
+            raise ConfigurationError(
+                "API 키 정보가 필요합니다. .env 파일을 확인하세요.",
+                config_key="KIWOOM_APP_KEY or KIWOOM_APP_SECRET"
+            )
+
+        self.access_token: Optional[str] = None
+        self.token_expires_at: Optional[float] = None
+        self._token_source = token_source
+        self._refresh_task: Optional[asyncio.Future] = None
+
+        self.default_priority = rate_priority
+        self.governor = get_governor(self.api_key)
+        self.http = http or HTTPSessionManager.get_instance("kiwoom", KiwoomHTTPConfig())
+
+        self.stats = {
+            'requests': 0,
+            'token_refreshes': 0,
+            'refresh_coalesced': 0,
+            'auth_retries': 0,
+            'deadline_exceeded': 0,
+        }
+
+    @classmethod
+    def from_sync(cls, api, rate_priority: int = PRIORITY_ENTRY, **kwargs) -> 'AsyncKiwoomAPI':
+        """동기 KiwoomAPI 의 인증 정보 / 토큰을 공유하는 비동기 클라이언트."""
+        return cls(
+            api_key=api.api_key,
+            api_secret=api.api_secret,
+            account_number=api.account_number,
+            user_id=getattr(api, 'user_id', None),
+            rate_priority=rate_priority,
+            token_source=api,
+            **kwargs
+        )
+
+    # ─── 토큰 ────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _fresh(token: Optional[str], expires_at: Optional[float]) -> bool:
+        return bool(token) and (not expires_at or time.time() < expires_at - _TOKEN_MARGIN)
+
+    def _adopt_source_token(self) -> None:
+        """동기 클라이언트가 더 새 토큰을 받았으면 이어받음."""
+        src = self._token_source
+        if src is None:
+            return
+        token = getattr(src, 'access_token', None)
+        expires_at = getattr(src, 'token_expires_at', None)
+        if token and token != self.access_token and self._fresh(token, expires_at):
+            self.access_token = token
+            self.token_expires_at = expires_at
+
+    async def _current_token(self) -> str:
+        self._adopt_source_token()
+        if self._fresh(self.access_token, self.token_expires_at):
+            return self.access_token
+        return await self._refresh_token(self.access_token)
+
+    async def _refresh_token(self, stale: Optional[str]) -> str:
+        """
+        stale 토큰 재발급 (병합)
+
+        - 이미 다른 요청이 새 토큰을 받아 왔으면 발급 없이 그 토큰 반환
+        - 발급 중이면 같은 발급 결과를 기다림 (shield — 기다리던 요청이 마감시간으로
+          취소돼도 발급 자체는 끝까지 진행)
+        """
+        self._adopt_source_token()
+        if self.access_token != stale and self._fresh(self.access_token, self.token_expires_at):
+            self.stats['refresh_coalesced'] += 1
+            return self.access_token
+        task = self._refresh_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._issue_token())
+            # 기다리던 요청이 모두 취소된 경우에도 예외 미회수 경고가 남지 않도록
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._refresh_task = task
+        else:
+            self.stats['refresh_coalesced'] += 1
+        return await asyncio.shield(task)
+
+    async def _issue_token(self) -> str:
+        """접근 토큰 발급 (/oauth2/token) 후 공유 대상 동기 클라이언트에도 반영."""
+        body = {
+            "grant_type": "client_credentials",
+            "appkey": self.api_key,
+            "secretkey": self.api_secret
+        }
+        headers = {"Content-Type": "application/json;charset=UTF-8"}
+        try:
+            status, _, result = await asyncio.wait_for(
+                self._send("POST", f"{self.BASE_URL}/oauth2/token", headers, body),
+                self.TOKEN_DEADLINE
+            )
+        except asyncio.TimeoutError as e:
+            raise TradingTimeoutError(
+                "토큰 발급 요청 타임아웃",
+                timeout_seconds=self.TOKEN_DEADLINE
+            ) from e
+
+        if status == 401:
+            raise AuthenticationError("API 키 인증 실패", response_data=result)
+        if status != 200 or not isinstance(result, dict):
+            raise APIException("토큰 발급 API 오류", status_code=status, response_data=result)
+        if result.get("return_code") != 0:
+            raise AuthenticationError(
+                f"토큰 발급 실패: [{result.get('return_code')}] {result.get('return_msg')}",
+                response_data=result
+            )
+
+        token = result.get("token")
+        expires_dt = result.get("expires_dt")
+        if expires_dt:
+            expires_at = datetime.strptime(expires_dt, "%Y%m%d%H%M%S").timestamp()
+        else:
+            expires_at = time.time() + 86400  # 기본 24시간
+
+        self.access_token = token
+        self.token_expires_at = expires_at
+        if self._token_source is not None:
+            self._token_source.access_token = token
+            self._token_source.token_expires_at = expires_at
+        self.stats['token_refreshes'] += 1
+        logger.info(f"[ASYNC_API] 접근 토큰 발급 (만료 {expires_dt})")
+        return token
+
+    @retry_on_error(max_retries=2, delay=1.0, backoff=2.0, exceptions=(TradingConnectionError, TradingTimeoutError))
+    @handle_api_errors(raise_on_auth_error=True, log_errors=True)
+    async def get_access_token(self) -> str:
+        """접근 토큰 (유효하면 재사용, 만료 임박 시 재발급)"""
+        return await self._current_token()
+
+    # ─── 전송 ────────────────────────────────────────────────────────────────
+
+    async def _send(self, method: str, url: str, headers: Dict[str, str],
+                    body: Optional[Dict[str, Any]] = None) -> Tuple[int, Any, Any]:
+        """
+        HTTP 1회 (연결 풀 세션). 상태 코드 판단은 호출 측에서.
+
+        Returns:
+            (status, response headers, JSON 본문 또는 None)
+        """
+        session = await self.http.get_session()
+        try:
+            async with session.request(method, url, headers=headers, json=body) as response:
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    data = None
+                return response.status, response.headers.copy(), data
+        except aiohttp.ClientConnectionError as e:
+            raise TradingConnectionError(f"연결 실패: {e}") from e
+        except aiohttp.ClientError as e:
+            raise APIException(f"요청 실패: {e}") from e
+
+    @staticmethod
+    def _token_rejected(status: int, result: Any) -> bool:
+        if status == 401:
+            return True
+        if not isinstance(result, dict):
+            return False
+        if _TOKEN_INVALID_CODE in (result.get('return_code'), result.get('error_code')):
+            return True
+        return str(_TOKEN_INVALID_CODE) in str(result.get('return_msg') or '')
+
+    def _signed_headers(self, method: str, path: str, token: str) -> Dict[str, str]:
+        """서명 헤더 (KiwoomAPI._get_headers 와 같은 규칙, 본문/쿼리 없는 GET 용)"""
+        timestamp = str(int(time.time() * 1000))
+        message = f"{method.upper()}\n{path}\n{timestamp}"
+        signature = hmac.new(
+            self.api_secret.encode('utf-8'),
+            message.encode('utf-8'),
+            hashlib.sha256
+        ).digest()
+        return {
+            "Content-Type": "application/json; charset=utf-8",
+            "apikey": self.api_key,
+            "timestamp": timestamp,
+            "signature": base64.b64encode(signature).decode('utf-8'),
+            "authorization": f"Bearer {token}",
+        }
+
+    async def _call(self, method: str, path: str, api_id: Optional[str],
+                    body: Optional[Dict[str, Any]], cont_yn: str, next_key: str,
+                    operation: str) -> Tuple[int, Any, Any]:
+        group = group_for(api_id)
+        priority = PRIORITY_ORDER if api_id and group == 'order' else current_priority(self.default_priority)
+        url = f"{self.BASE_URL}{path}"
+
+        for attempt in range(2):
+            token = await self._current_token()
+            if api_id:
+                headers = {
+                    'Content-Type': 'application/json;charset=UTF-8',
+                    'authorization': f'Bearer {token}',
+                    'cont-yn': cont_yn,
+                    'next-key': next_key,
+                    'api-id': api_id,
+                }
+            else:
+                headers = self._signed_headers(method, path, token)
+
+            await self.governor.acquire_async(group, priority)
+            self.stats['requests'] += 1
+            status, response_headers, result = await self._send(method, url, headers, body)
+            self.governor.report(group, is_rate_limited(status, result))
+
+            if attempt == 0 and self._token_rejected(status, result):
+                # 만료/무효 토큰 → 병합 재발급 후 1회 재시도
+                self.stats['auth_retries'] += 1
+                await self._refresh_token(token)
+                continue
+            break
+
+        if self._token_rejected(status, result):
+            raise AuthenticationError(f"{operation} 인증 만료", response_data=result)
+        return status, response_headers, result
+
+    async def _request(self, path: str, api_id: Optional[str], body: Optional[Dict[str, Any]],
+                       operation: str, cont_yn: str = "N", next_key: str = "",
+                       method: str = "POST", deadline: Optional[float] = None) -> Tuple[int, Any, Any]:
+        """
+        요청 1건 (마감시간 = governor 대기 + 토큰 + HTTP 왕복 전체)
+
+        Raises:
+            TimeoutError: 마감시간 초과
+            ConnectionError: 연결 실패
+            AuthenticationError: 재발급 후에도 토큰 거부
+        """
+        if deadline is None:
+            deadline = self.ORDER_DEADLINE if group_for(api_id) == 'order' else self.QUERY_DEADLINE
+        try:
+            return await asyncio.wait_for(
+                self._call(method, path, api_id, body, cont_yn, next_key, operation),
+                deadline
+            )
+        except asyncio.TimeoutError as e:
+            self.stats['deadline_exceeded'] += 1
+            raise TradingTimeoutError(f"{operation} 타임아웃", timeout_seconds=deadline) from e
+
+    async def _post(self, path: str, api_id: str, body: Dict[str, Any], operation: str,
+                    cont_yn: str = "N", next_key: str = "", paged: bool = True,
+                    deadline: Optional[float] = None) -> Dict[str, Any]:
+        """TR POST → 응답 dict (paged 면 응답 헤더의 next_key / cont_yn 병합)"""
+        status, headers, result = await self._request(
+            path, api_id, body, operation, cont_yn, next_key, deadline=deadline
+        )
+        if status != 200:
+            raise APIException(f"{operation} API 오류", status_code=status, response_data=result)
+        result = result if isinstance(result, dict) else {}
+        if not paged:
+            return result
+        return {
+            **result,
+            'next_key': headers.get('next-key', ''),
+            'cont_yn': headers.get('cont-yn', 'N')
+        }
+
+    # ─── 시세 / 계좌 조회 ────────────────────────────────────────────────────
+
+    @handle_api_errors(default_return=None, log_errors=True)
+    async def get_stock_price(self, stock_code: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """주식 현재가 조회 (실패 시 None — 호출 측은 5분봉 데이터 사용)"""
+        path = f"/v1/kr/stock/price/{stock_code}"
+        try:
+            status, _, result = await self._request(
+                path, None, None, f"현재가 조회({stock_code})", method="GET", deadline=deadline
+            )
+        except (TradingConnectionError, TradingTimeoutError, AuthenticationError):
+            return None
+        return result if status == 200 else None
+
+    @handle_api_errors(default_return=None, log_errors=True)
+    async def get_balance(self, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """계좌 잔고 조회 (예수금 상세 현황, kt00001)"""
+        if not self.account_number:
+            raise ConfigurationError(
+                "계좌번호가 설정되지 않았습니다.",
+                config_key="KIWOOM_ACCOUNT_NUMBER"
+            )
+        return await self._post('/api/dostk/acnt', 'kt00001', {'qry_tp': '3'},
+                                "계좌 잔고 조회", paged=False, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': []}, log_errors=True)
+    async def get_account_info(self, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """계좌 보유 종목 조회 (일별잔고수익률, ka01690)"""
+        if not self.account_number:
+            raise ValueError("계좌번호가 설정되지 않았습니다.")
+        data = {'qry_dt': datetime.now().strftime('%Y%m%d')}
+        return await self._post('/api/dostk/acnt', 'ka01690', data,
+                                "계좌 정보 조회", paged=False, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'data': []}, log_errors=True)
+    async def get_daily_chart(self, stock_code: str, base_dt: str = None,
+                              upd_stkpc_tp: str = "1", cont_yn: str = "N",
+                              next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """주식 일봉 차트 조회 (ka10081)"""
+        data = {
+            "stk_cd": stock_code,
+            "base_dt": base_dt or datetime.now().strftime("%Y%m%d"),
+            "upd_stkpc_tp": upd_stkpc_tp
+        }
+        return await self._post('/api/dostk/chart', 'ka10081', data, "일봉 차트 조회",
+                                cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'data': []}, log_errors=True)
+    async def get_minute_chart(self, stock_code: str, tic_scope: str = "1",
+                               upd_stkpc_tp: str = "1", cont_yn: str = "N",
+                               next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """주식 분봉 차트 조회 (ka10080)"""
+        data = {
+            "stk_cd": stock_code,
+            "tic_scope": tic_scope,
+            "upd_stkpc_tp": upd_stkpc_tp
+        }
+        return await self._post('/api/dostk/chart', 'ka10080', data, "분봉 차트 조회",
+                                cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': []}, log_errors=True)
+    async def get_foreign_investor_trend(self, stock_code: str, cont_yn: str = "N",
+                                         next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """외국인 종목별 매매 동향 조회 (ka10008)"""
+        return await self._post('/api/dostk/frgnistt', 'ka10008', {"stk_cd": stock_code},
+                                "외국인 매매 동향 조회", cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': []}, log_errors=True)
+    async def get_investor_trend(self, stock_code: str, dt: str = None,
+                                 amt_qty_tp: str = "1", trde_tp: str = "0",
+                                 unit_tp: str = "1000", cont_yn: str = "N",
+                                 next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """종목별 투자자 기관별 매매 동향 조회 (ka10059)"""
+        data = {
+            "dt": dt or datetime.now().strftime("%Y%m%d"),
+            "stk_cd": stock_code,
+            "amt_qty_tp": amt_qty_tp,
+            "trde_tp": trde_tp,
+            "unit_tp": unit_tp
+        }
+        return await self._post('/api/dostk/stkinfo', 'ka10059', data, "투자자 매매 동향 조회",
+                                cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': []}, log_errors=True)
+    async def get_program_trading(self, dt: str = None, mrkt_tp: str = "P00101",
+                                  stex_tp: str = "1", cont_yn: str = "N",
+                                  next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """프로그램 매매 동향 조회 (ka90004)"""
+        data = {
+            "dt": dt or datetime.now().strftime("%Y%m%d"),
+            "mrkt_tp": mrkt_tp,
+            "stex_tp": stex_tp
+        }
+        return await self._post('/api/dostk/stkinfo', 'ka90004', data, "프로그램 매매 조회",
+                                cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': {}}, log_errors=True)
+    async def get_stock_info(self, stock_code: str, cont_yn: str = "N",
+                             next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """주식 기본정보 조회 (ka10001). 429 는 예외 없이 sentinel 반환 (caller 가 backoff)"""
+        status, headers, result = await self._request(
+            '/api/dostk/stkinfo', 'ka10001', {"stk_cd": stock_code}, "주식 기본정보 조회",
+            cont_yn, next_key, deadline=deadline
+        )
+        if status == 429:
+            logger.warning(f"[ka10001] 429 rate limit ({stock_code}) — backoff required")
+            return {'return_code': 429, 'return_msg': 'rate_limited'}
+        if status != 200:
+            raise APIException("주식 기본정보 조회 API 오류", status_code=status, response_data=result)
+        return {
+            **(result if isinstance(result, dict) else {}),
+            'next_key': headers.get('next-key', ''),
+            'cont_yn': headers.get('cont-yn', 'N')
+        }
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': []}, log_errors=True)
+    async def get_unexecuted_orders(self, dmst_stex_tp: str = "KRX", cont_yn: str = "N",
+                                    next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """미체결 주문 조회 (ka10075)"""
+        return await self._post('/api/dostk/acnt', 'ka10075', {"dmst_stex_tp": dmst_stex_tp},
+                                "미체결 주문 조회", cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': []}, log_errors=True)
+    async def get_executed_orders(self, qry_dt: str = None, dmst_stex_tp: str = "KRX",
+                                  cont_yn: str = "N", next_key: str = "",
+                                  deadline: Optional[float] = None) -> Dict[str, Any]:
+        """체결 주문 조회 (ka10076)"""
+        data = {
+            "qry_tp": "0",
+            "sell_tp": "0",
+            "stex_tp": "0",
+            "qry_dt": qry_dt or datetime.now().strftime("%Y%m%d"),
+            "dmst_stex_tp": dmst_stex_tp
+        }
+        return await self._post('/api/dostk/acnt', 'ka10076', data, "체결 주문 조회",
+                                cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': []}, log_errors=True)
+    async def get_account_evaluation(self, cont_yn: str = "N", next_key: str = "",
+                                     deadline: Optional[float] = None) -> Dict[str, Any]:
+        """계좌평가현황 조회 (kt00004)"""
+        return await self._post('/api/dostk/acnt', 'kt00004', {}, "계좌평가현황 조회",
+                                cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': {}}, log_errors=True)
+    async def get_stock_quote(self, stock_code: str, cont_yn: str = "N",
+                              next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """주식 호가 조회 (ka10004)"""
+        return await self._post('/api/dostk/mrkcond', 'ka10004', {"stk_cd": stock_code},
+                                "호가 조회", cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'output': []}, log_errors=True)
+    async def get_execution_info(self, stock_code: str, cont_yn: str = "N",
+                                 next_key: str = "", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """체결정보 조회 (ka10003)"""
+        return await self._post('/api/dostk/stkinfo', 'ka10003', {"stk_cd": stock_code},
+                                "체결정보 조회", cont_yn, next_key, deadline=deadline)
+
+    @handle_api_errors(default_return={'return_code': -1, 'data': []}, log_errors=True)
+    async def get_ohlcv_data(self, stock_code: str, period: str = 'D', count: int = 30) -> Dict[str, Any]:
+        """OHLCV 데이터 조회 (일봉 'D' / 5분봉 'M', 차트 키를 data 로 정규화)"""
+        if period.upper() == 'D':
+            result = await self.get_daily_chart(stock_code=stock_code)
+            keys = ['stk_dt_pole_chart_qry', 'stk_day_pole_chart_qry', 'output', 'output1', 'data']
+        elif period.upper() == 'M':
+            result = await self.get_minute_chart(stock_code=stock_code, tic_scope="5")
+            keys = ['stk_min_pole_chart_qry', 'stk_mnut_pole_chart_qry', 'output', 'output1', 'data']
+        else:
+            return {
+                'return_code': -1,
+                'return_msg': f'지원하지 않는 기간: {period}',
+                'data': []
+            }
+
+        if result.get('return_code') == 0:
+            for key in keys:
+                if result.get(key):
+                    result['data'] = result[key][:count]
+                    break
+            result.setdefault('data', [])
+        return result
+
+    # ─── 주문 ────────────────────────────────────────────────────────────────
+
+    @retry_on_error(max_retries=1, delay=1.0, exceptions=(TradingConnectionError, TradingTimeoutError))
+    @handle_trading_errors(notify_user=True, log_errors=True)
+    @handle_api_errors(raise_on_auth_error=True, log_errors=True)
+    async def order_buy(self, stock_code: str, quantity: int, price: int = 0,
+                        trade_type: str = "0", dmst_stex_tp: str = "KRX",
+                        deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        주식 매수 주문 (kt10000) — 인자 / 반환 / 예외는 KiwoomAPI.order_buy 와 동일
+
+        Raises:
+            InsufficientFundsError: 잔고 부족 시
+            OrderFailedError: 주문 실패 시
+        """
+        data = {
+            "dmst_stex_tp": dmst_stex_tp,
+            "stk_cd": stock_code,
+            "ord_qty": str(quantity),
+            "ord_uv": str(price) if price > 0 else "",
+            "trde_tp": trade_type,
+            "cond_uv": ""
+        }
+        result = await self._post('/api/dostk/ordr', 'kt10000', data, f"매수 주문({stock_code})",
+                                  paged=False, deadline=deadline)
+
+        return_code = result.get('return_code')
+        return_msg = result.get('return_msg', '')
+        ord_no = result.get('ord_no')
+        if return_code == 0:
+            logger.info(f"[ASYNC_API] 매수 주문 성공 {stock_code} x{quantity} - 주문번호: {ord_no}")
+            return result
+        if '잔고' in return_msg or '예수금' in return_msg or 'insufficient' in return_msg.lower():
+            raise InsufficientFundsError(
+                required_amount=price * quantity if price > 0 else 0,
+                available_amount=0,
+                stock_code=stock_code,
+                details={'return_code': return_code, 'return_msg': return_msg}
+            )
+        raise OrderFailedError(
+            f"매수 주문 실패: {return_msg}",
+            order_id=ord_no,
+            stock_code=stock_code,
+            order_type='buy',
+            details={'return_code': return_code, 'quantity': quantity, 'price': price}
+        )
+
+    @retry_on_error(max_retries=1, delay=1.0, exceptions=(TradingConnectionError, TradingTimeoutError))
+    @handle_trading_errors(notify_user=True, log_errors=True)
+    @handle_api_errors(raise_on_auth_error=True, log_errors=True)
+    async def order_sell(self, stock_code: str, quantity: int, price: int = 0,
+                         trade_type: str = "0", dmst_stex_tp: str = "KRX",
+                         deadline: Optional[float] = None) -> Dict[str, Any]:
+        """주식 매도 주문 (kt10001) — 인자 / 반환 / 예외는 KiwoomAPI.order_sell 과 동일"""
+        data = {
+            "dmst_stex_tp": dmst_stex_tp,
+            "stk_cd": stock_code,
+            "ord_qty": str(quantity),
+            "ord_uv": str(price) if price > 0 else "",
+            "trde_tp": trade_type,
+            "cond_uv": ""
+        }
+        result = await self._post('/api/dostk/ordr', 'kt10001', data, f"매도 주문({stock_code})",
+                                  paged=False, deadline=deadline)
+
+        return_code = result.get('return_code')
+        ord_no = result.get('ord_no')
+        if return_code == 0:
+            logger.info(f"[ASYNC_API] 매도 주문 성공 {stock_code} x{quantity} - 주문번호: {ord_no}")
+            return result
+        raise OrderFailedError(
+            f"매도 주문 실패: {result.get('return_msg', '')}",
+            order_id=ord_no,
+            stock_code=stock_code,
+            order_type='sell',
+            details={'return_code': return_code, 'quantity': quantity, 'price': price}
+        )
+
+    @handle_api_errors(default_return={'return_code': -1, 'order_number': None}, log_errors=True)
+    async def order_modify(self, orig_ord_no: str, stock_code: str, quantity: int,
+                           price: int, dmst_stex_tp: str = "KRX",
+                           deadline: Optional[float] = None) -> Dict[str, Any]:
+        """주식 정정 주문 (kt10002)"""
+        data = {
+            "dmst_stex_tp": dmst_stex_tp,
+            "orig_ord_no": orig_ord_no,
+            "stk_cd": stock_code,
+            "mdfy_qty": str(quantity),
+            "mdfy_uv": str(price),
+            "mdfy_cond_uv": ""
+        }
+        return await self._post('/api/dostk/ordr', 'kt10002', data, f"정정 주문({stock_code})",
+                                paged=False, deadline=deadline)
+
+    @retry_on_error(max_retries=1, delay=1.0, exceptions=(TradingConnectionError, TradingTimeoutError))
+    @handle_trading_errors(notify_user=True, log_errors=True)
+    @handle_api_errors(raise_on_auth_error=True, log_errors=True)
+    async def order_cancel(self, orig_ord_no: str, stock_code: str, quantity: int = 0,
+                           dmst_stex_tp: str = "KRX", deadline: Optional[float] = None) -> Dict[str, Any]:
+        """주식 취소 주문 (kt10003, quantity=0 → 잔량 전부)"""
+        data = {
+            "dmst_stex_tp": dmst_stex_tp,
+            "orig_ord_no": orig_ord_no,
+            "stk_cd": stock_code,
+            "cncl_qty": str(quantity)
+        }
+        return await self._post('/api/dostk/ordr', 'kt10003', data, f"취소 주문({stock_code})",
+                                paged=False, deadline=deadline)
+
+    # ─── 수명 ────────────────────────────────────────────────────────────────
+
+    async def close(self):
+        """세션 종료 (공용 'kiwoom' 세션 — 프로세스 종료 시 1회)"""
+        await self.http.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, _exc_type, _exc_val, _exc_tb):
+        await self.close()
@@ -25,6 +25,8 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from kiwoom_api import KiwoomAPI
+from kiwoom_api_async import AsyncKiwoomAPI  # ✅ aiohttp 연결 풀 비동기 클라이언트 (시세 조회)
+from utils.tr_cache import TRCache, CachedKiwoomAPI  # ✅ 중복 TR 조회 병합 + 짧은 TTL 캐시
 from korea_invest_api import KoreaInvestAPI  # 🔧 2026-04-02: HTS 뉴스 조회
 from analyzers.pre_trade_validator import PreTradeValidator
 from analyzers.entry_timing_analyzer import EntryTimingAnalyzer
@@ -38,6 +40,7 @@ from rich.console import Console
 from rich.table import Table
 from rich import box
 from trading.exit_logic_optimized import OptimizedExitLogic
+from trading.exit_guard import ExitGuard  # ✅ 보유 종목 틱 단위 청산 임계가 감시
 from trading.eod_manager import EODManager  # ✅ EOD Manager Phase 1
 from trading.bottom_pullback_manager import BottomPullbackManager  # ✅ Bottom Pullback 전략
 from trading.trade_state_manager import (  # ✅ Trade State Manager (중복 진입 방지)
@@ -46,6 +49,14 @@ from trading.trade_state_manager import (  # ✅ Trade State Manager (중복 진
 )
 from core.trade_reconciliation import TradeReconciliation  # ✅ 거래 검증 및 동기화
 from core.trade_capture import capture_entry, capture_exit # ✅ 진입/청산 지표 자동 캡처
+from core.bar_store import MinuteBarStore  # ✅ 종목별 분봉 링버퍼 저장소
+from core.indicator_panel import IndicatorEngine  # ✅ 워치리스트 지표 일괄 계산 (종목 × 봉 패널)
+from utils.rate_limiter import TokenBucket, PRIORITY_HELD, PRIORITY_SCAN  # ✅ TR 예산 토큰 버킷
+from utils.rate_governor import get_governor, rate_priority, PRIORITY_EXIT, PRIORITY_ENTRY  # ✅ 앱 키 공용 Rate Governor
+from core.websocket.demux import WebSocketDemux  # ✅ WebSocket 단일 리더 (trnm/seq 라우팅)
+from core.tick_bars import TickBarBuilder  # ✅ REAL 체결 → 1/3/5/30분봉 집계
+from core.state_bus import StateBusWriter  # ✅ 대시보드 공유 메모리 상태 버스
+from core import event_journal  # ✅ 타입별 이벤트 저널 (로그 정규식 파싱 대체)
 from market_utils import is_trading_day, get_next_trading_day  # ✅ 휴장일 체크
 from strategy.ai_rules_active import is_strategy_allowed
 from analyzers.squeeze_with_orderbook import SqueezeWithOrderBook  # ✅ 스퀴즈 + 호가창 통합 전략
@@ -365,6 +376,10 @@ class IntegratedTradingSystem:
         # 설정 로드
         self.config = load_config("config/strategy_hybrid.yaml")
 
+        # 🔧 2026-10-16: 같은 주기 안 중복 TR 조회 병합 + 짧은 TTL 캐시 (이후 생성되는 모듈 모두 공유)
+        self.tr_cache = TRCache(ttls=(self.config.get('kiwoom_tr_cache', {}) or {}).get('ttl'))
+        self.api = CachedKiwoomAPI(api, self.tr_cache)
+
         # 최적화된 청산 로직 초기화
         self.exit_logic = OptimizedExitLogic(self.config)
 
@@ -586,6 +601,7 @@ class IntegratedTradingSystem:
 
         # WebSocket
         self.websocket = None
+        self.ws_demux: Optional[WebSocketDemux] = None  # 리더 태스크 1개가 recv() 전담
         self.connected = False
         self.running = True
 
@@ -628,6 +644,11 @@ class IntegratedTradingSystem:
 
         # Watchdog 하트비트 (좀비 프로세스 감지용)
         self._heartbeat_path = Path('/tmp/kiwoom_heartbeat.json')
+        self._heartbeat_file_interval = 30       # 파일은 watchdog 용 (10분 기준) → 30초마다만
+        self._heartbeat_file_state: tuple = ("", None)   # (stage, 마지막 파일 기록 시각)
+
+        # 🔧 2026-10-16: 대시보드 상태 버스 (매 주기 JSON 파일 재작성/HTTP refresh 대체)
+        self.state_bus = StateBusWriter()
 
         # Dry-run 모드 (백테스트 검증용)
         self.dry_run_mode = False
@@ -668,6 +689,41 @@ class IntegratedTradingSystem:
         self._last_positions_keys: set = set()
         self._table_refresh_cycles: int = 10  # 10주기(=10분)마다 sim/history 테이블 갱신
         self._entry_scan_cycles: int = 5    # 워치리스트 OHLCV+진입체크 주기 (=5분, 보유종목은 항상)
+
+        # 🔧 2026-10-16: 종목별 5분봉 상주 저장소 (매 주기 900봉 재파싱 → 꼬리 병합)
+        self.bar_store = MinuteBarStore(capacity=900)
+
+        # 🔧 2026-10-16: REAL 체결 틱으로 분봉 유지 (REST 분봉은 종목별 1회 backfill)
+        self.tick_bars = TickBarBuilder(self.bar_store)
+        self.tick_bars.on_bar_close(self._on_bar_close)
+        self._real_task: Optional[asyncio.Task] = None   # REAL 구독 큐 소비 태스크
+        self._real_symbols: Set[str] = set()             # REG 등록된 종목
+        self._bar_close_pending: bool = False            # 5분봉 마감 → 즉시 체크 요청
+
+        # 🔧 2026-10-16: 워치리스트 지표 패널 (도착 묶음마다 전 종목 일괄 계산 → 종목별 읽기 전용 뷰)
+        self.indicator_engine = IndicatorEngine()
+
+        # 🔧 2026-10-16: 보유 종목 틱 청산 감시 (임계가 통과 시에만 check_exit_signal)
+        self.exit_guard = ExitGuard.from_config(self.config)
+        self.tick_bars.on_trade(self._on_trade_tick)
+        self._exit_escalations: Dict[str, str] = {}      # 종목 → 넘은 임계값
+        self._exit_inflight: Set[str] = set()            # 워커 스레드에서 청산 평가 중인 종목 (종목당 1건)
+        self._exit_tasks: Set[asyncio.Task] = set()      # 승격 태스크 참조 유지
+
+        # 🔧 2026-10-16: 키움 TR 초당 제한 토큰 버킷 (check_all_stocks 동시 조회용)
+        _rl_cfg = self.config.get('kiwoom_rate_limit', {}) or {}
+        self._tr_bucket = TokenBucket(
+            rate=_rl_cfg.get('requests_per_second', 5.0),
+            capacity=_rl_cfg.get('burst', 5),
+        )
+        # 🔧 2026-10-16: 프로세스 간 공용 예산 (api_server 대시보드 조회와 공유, 주문 > 청산 > 진입 > 대시보드)
+        get_governor(getattr(self.api, 'api_key', None)).configure(
+            rates={'tr': _rl_cfg.get('requests_per_second', 5.0),
+                   'order': _rl_cfg.get('orders_per_second', 5.0)},
+            burst=_rl_cfg.get('burst', 5),
+        )
+        # 🔧 2026-10-16: 시세 조회는 비동기 클라이언트 (연결 풀 + 요청 마감시간, 동기 api 와 토큰 공유)
+        self.async_api = CachedKiwoomAPI(AsyncKiwoomAPI.from_sync(api), self.tr_cache)
         self._prev_mkt_ctx_status: str = ""   # MKT_CTX 상태 변화 감지용
 
         # 🔧 2026-03-18: Signal 큐 (detect → execute 분리)
@@ -838,6 +894,9 @@ class IntegratedTradingSystem:
         """차단 이벤트를 log_trade_events(kind='blocked')에 기록.
         실패해도 트레이딩 흐름에 영향 없음 (silent try/except).
         """
+        # 🔧 2026-10-16: DB 연결 여부와 무관하게 이벤트 저널에도 기록
+        event_journal.emit('GATE_BLOCK', stock_code=stock_code, stock_name=stock_name,
+                           tag=block_tag, detail=block_detail, entry_reason=entry_reason)
         try:
             import psycopg2 as _psycopg2
             _now = datetime.now()
@@ -1515,9 +1574,10 @@ class IntegratedTradingSystem:
                     "last_check_time": datetime.now().isoformat()
                 })
 
-            # JSON 파일로 저장
+            # JSON 파일로 저장 (재시작/외부 도구용) + 상태 버스 발행 (대시보드)
             with open(watchlist_path, 'w', encoding='utf-8') as f:
-                json.dump(watchlist_data, f, ensure_ascii=False, indent=2)
+                json.dump(watchlist_data, f, ensure_ascii=False)
+            self.state_bus.publish('watchlist', watchlist_data)
 
             console.print(f"[dim]✓ Watchlist 저장: data/watchlist.json ({len(watchlist_data)}개 종목)[/dim]")
 
@@ -1525,7 +1585,7 @@ class IntegratedTradingSystem:
             console.print(f"[yellow]⚠️ Watchlist 저장 실패: {e}[/yellow]")
 
     def _save_monitoring_watchlist(self):
-        """현재 self.watchlist(실시간 모니터링 종목)를 data/monitoring_watchlist.json에 저장."""
+        """현재 self.watchlist(실시간 모니터링 종목)를 상태 버스에 발행 (실패 시 data/monitoring_watchlist.json)."""
         try:
             data = []
             for code in self.watchlist:
@@ -1534,25 +1594,28 @@ class IntegratedTradingSystem:
                     'stock_code': code,
                     'stock_name': info.get('name', code),
                 })
+            snapshot = {
+                'updated_at': datetime.now().isoformat(),
+                'symbols': data,
+            }
+            if self.state_bus.publish('monitoring_watchlist', snapshot):
+                return
             import json as _json
             from pathlib import Path as _Path
             _path = _Path('data/monitoring_watchlist.json')
             _path.parent.mkdir(parents=True, exist_ok=True)
             with open(_path, 'w', encoding='utf-8') as f:
-                _json.dump({
-                    'updated_at': datetime.now().isoformat(),
-                    'symbols': data,
-                }, f, ensure_ascii=False)
+                _json.dump(snapshot, f, ensure_ascii=False)
         except Exception:
             pass
 
     def _refresh_dashboard_cache(self):
-        """매수/매도 완료 직후 대시보드 API 캐시 즉시 갱신."""
-        try:
-            import urllib.request as _req
-            _req.urlopen('http://127.0.0.1:8765/api/refresh', data=b'', timeout=2)
-        except Exception:
-            pass
+        """매수/매도 완료 직후 대시보드 API 캐시 갱신 신호 (상태 버스 events 시퀀스 증가)."""
+        self.state_bus.publish('events', {
+            'kind': 'refresh',
+            'time': datetime.now().isoformat(),
+            'positions': len(self.positions),
+        })
 
     def _handle_data_quality_failure(self, stock_code: str, stock_name: str, failure_reason: str):
         """
@@ -1662,7 +1725,17 @@ class IntegratedTradingSystem:
                 ping_interval=20,  # 20초마다 ping
                 ping_timeout=10,   # 10초 타임아웃
             )
+            # 재연결 시 이전 연결의 리더 태스크 정리 후 새 리더 시작
+            if self.ws_demux:
+                await self.ws_demux.close()
+            self.ws_demux = WebSocketDemux(self.websocket).start()
             self.connected = True
+            # 끊긴 동안 틱 유실 가능 → 전 종목 재등록 + 재 backfill
+            self._real_symbols.clear()
+            self.tick_bars.reset()
+            if self._real_task and not self._real_task.done():
+                self._real_task.cancel()
+            self._real_task = asyncio.create_task(self._consume_real(self.ws_demux))
             console.print("=" * 120, style="bold green")
             console.print(f"{'키움 통합 자동매매 시스템':^120}", style="bold green")
             console.print("=" * 120, style="bold green")
@@ -1685,46 +1758,121 @@ class IntegratedTradingSystem:
     async def receive_message(self, timeout: float = 10.0, expected_trnm: str = None, expected_seq: str = None):
         """WebSocket 메시지 수신 (타임아웃 추가, PING 무시, 특정 trnm/seq 필터링)
 
+        recv() 는 WebSocketDemux 리더 태스크만 호출 — 여기서는 (trnm, seq) 대기자로 등록.
+        다른 trnm/seq 프레임은 버리지 않고 해당 대기자/구독 큐로 전달됨.
+
         Args:
             timeout: 타임아웃 시간 (초)
             expected_trnm: 기대하는 trnm 값 (None이면 PING만 제외하고 모든 메시지 수신)
             expected_seq: 기대하는 seq 값 (None이면 seq 무시, trnm만 체크)
         """
-        if not self.websocket or not self.connected:
+        if not self.websocket or not self.connected or not self.ws_demux:
             raise Exception("WebSocket이 연결되지 않았습니다.")
 
+        data = await self.ws_demux.wait(expected_trnm, expected_seq, timeout=timeout)
+        if data is None:
+            console.print(f"[yellow]⚠️  응답 대기 시간 초과 ({timeout}초)[/yellow]")
+        return data
+
+    async def request_message(self, trnm: str, data: dict = None, timeout: float = 10.0, seq: str = None):
+        """요청 전송 + 같은 trnm(/seq) 응답 대기. 대기자 등록 후 전송하므로 빠른 응답도 유실 없음."""
+        if not self.websocket or not self.connected or not self.ws_demux:
+            raise Exception("WebSocket이 연결되지 않았습니다.")
+
+        response = await self.ws_demux.request(trnm, data, seq=seq, timeout=timeout)
+        if response is None:
+            console.print(f"[yellow]⚠️  응답 대기 시간 초과 ({timeout}초)[/yellow]")
+        return response
+
+    async def _consume_real(self, demux: WebSocketDemux):
+        """REAL 프레임 → TickBarBuilder. 연결 종료(None) 시 REST 분봉 조회로 복귀."""
+        queue = demux.subscribe('REAL')
         try:
-            start_time = time.time()
             while True:
-                remaining_time = timeout - (time.time() - start_time)
-                if remaining_time <= 0:
-                    raise asyncio.TimeoutError()
-
-                message = await asyncio.wait_for(self.websocket.recv(), timeout=remaining_time)
-                data = json.loads(message)
-                trnm = data.get('trnm')
-                seq = data.get('seq')
+                frame = await queue.get()
+                if frame is None:
+                    break
+                self.tick_bars.on_real(frame)
+                if self._exit_escalations:
+                    self._dispatch_exit_escalations()
+        finally:
+            demux.unsubscribe('REAL', queue)
+            if demux is self.ws_demux:
+                self._real_symbols.clear()
+                self.tick_bars.reset()
+
+    async def _sync_real_subscriptions(self, stock_codes: Set[str]):
+        """모니터링 종목과 REAL 체결(0B) 등록 종목 맞추기 (추가분 REG, 이탈분 REMOVE)."""
+        if not self.connected or not self.ws_demux:
+            return
+        added = sorted(set(stock_codes) - self._real_symbols)
+        removed = sorted(self._real_symbols - set(stock_codes))
+        try:
+            if removed:
+                await self.send_message("REMOVE", {
+                    "grp_no": "1", "refresh": "1",
+                    "data": [{"item": removed, "type": ["0B"]}],
+                })
+                self._real_symbols.difference_update(removed)
+            if added:
+                response = await self.request_message("REG", {
+                    "grp_no": "1", "refresh": "1",
+                    "data": [{"item": added, "type": ["0B"]}],
+                }, timeout=5.0)
+                if response and str(response.get('return_code', 0)) == '0':
+                    self._real_symbols.update(added)
+                else:
+                    logger.warning(f"[REAL] REG 실패: {response}")
+        except Exception as e:
+            logger.warning(f"[REAL] 구독 갱신 실패: {e}")
 
-                # 🔧 CRITICAL FIX: PING 메시지 무시
-                if trnm == 'PING':
-                    console.print(f"[dim]  ♥ PING (keep-alive)[/dim]")
-                    continue  # PING 무시하고 다음 메시지 대기
+    def _on_trade_tick(self, symbol: str, price: float, when: datetime):
+        """체결 콜백 — 보유 종목 임계가 O(1) 비교, 넘으면 프레임 처리 후 전체 청산 로직 실행."""
+        reason = self.exit_guard.check(symbol, price, when)
+        if reason:
+            self._exit_escalations[symbol] = reason
 
-                # 🔧 NEW: 특정 trnm을 기대하는 경우, 해당 메시지만 받음
-                if expected_trnm and trnm != expected_trnm:
-                    console.print(f"[dim]  ⚠ 무시: trnm={trnm} (기대값: {expected_trnm})[/dim]")
-                    continue  # 기대하지 않은 메시지 무시
+    def _dispatch_exit_escalations(self):
+        """
+        임계가를 넘은 보유 종목을 워커로 넘김 (틱 경로는 O(1) — 블로킹 조회/주문은 루프 밖).
 
-                # 🔧 CRITICAL FIX: seq 매칭 (조건검색 재실행 시 이전 응답 무시)
-                if expected_seq and seq != expected_seq:
-                    console.print(f"[dim]  ⚠ 무시: seq={seq} (기대값: {expected_seq}, trnm={trnm})[/dim]")
-                    continue  # seq가 다른 응답 무시
+        같은 종목 평가가 진행 중이면 새 승격은 버림 (평가 종료 시 재무장 → 다음 틱에서 다시 비교).
+        """
+        pending, self._exit_escalations = self._exit_escalations, {}
+        for stock_code, reason in pending.items():
+            if stock_code in self._exit_inflight:
+                continue
+            if stock_code not in self.positions:
+                self.exit_guard.disarm(stock_code)
+                continue
+            self._exit_inflight.add(stock_code)
+            task = asyncio.create_task(self._escalate_exit(stock_code, reason))
+            self._exit_tasks.add(task)
+            task.add_done_callback(self._exit_tasks.discard)
 
-                return data  # 원하는 응답만 리턴
+    async def _escalate_exit(self, stock_code: str, reason: str):
+        """DataFrame 기반 check_exit_signal(+execute_sell) 을 워커 스레드에서 실행 후 재무장."""
+        try:
+            logger.info(
+                f"[EXIT_TICK] {stock_code} {reason} "
+                f"price={self.tick_bars.last_price(stock_code)} guard={self.exit_guard.snapshot(stock_code)}"
+            )
+            df = self.bar_store.get_frame(stock_code, "5")
+            with rate_priority(PRIORITY_EXIT):
+                await asyncio.to_thread(self.check_exit_signal, stock_code, df)
+        except Exception as e:
+            logger.error(f"[EXIT_TICK] {stock_code} 청산 평가 실패: {e}")
+        finally:
+            self._exit_inflight.discard(stock_code)
+            if stock_code in self.positions:
+                self.exit_guard.arm(stock_code, self.positions[stock_code])
+            else:
+                self.exit_guard.disarm(stock_code)
 
-        except asyncio.TimeoutError:
-            console.print(f"[yellow]⚠️  응답 대기 시간 초과 ({timeout}초)[/yellow]")
-            return None
+    def _on_bar_close(self, symbol: str, timeframe: str, ts: int, bar: list):
+        """봉 마감 콜백 — 5분봉 마감 시 다음 루프에서 즉시 check_all_stocks 실행."""
+        if timeframe == "5" and (symbol in self.positions or symbol in self.watchlist):
+            self._bar_close_pending = True
 
     def _write_heartbeat(self, stage: str = "monitoring"):
         """Watchdog 하트비트 파일 갱신 (좀비 프로세스 감지용)
@@ -1734,12 +1882,20 @@ class IntegratedTradingSystem:
         """
         import json as _json
         try:
+            now = datetime.now()
             data = {
                 "pid": os.getpid(),
                 "stage": stage,
-                "time": datetime.now().isoformat(),
+                "time": now.isoformat(),
+                "tr_cache": {k: v for k, v in self.tr_cache.summary().items() if k != 'by_tr'},
             }
-            self._heartbeat_path.write_text(_json.dumps(data))
+            self.state_bus.publish('heartbeat', data)
+            # 파일은 stage 변경 시 또는 _heartbeat_file_interval 초마다만 (매 루프 재작성 제거)
+            _last_stage, _last_written = self._heartbeat_file_state
+            if (stage != _last_stage or _last_written is None
+                    or (now - _last_written).total_seconds() >= self._heartbeat_file_interval):
+                self._heartbeat_path.write_text(_json.dumps(data))
+                self._heartbeat_file_state = (stage, now)
         except Exception:
             pass  # heartbeat 실패 시 무시 (주요 로직 방해 금지)
 
@@ -1766,7 +1922,8 @@ class IntegratedTradingSystem:
                 entry['_saved_date'] = today
                 state[code] = entry
             with open(self._POSITIONS_STATE_PATH, 'w', encoding='utf-8') as f:
-                _json.dump(state, f, ensure_ascii=False, indent=2)
+                _json.dump(state, f, ensure_ascii=False)
+            self.state_bus.publish('positions', state)
         except Exception as e:
             logger.warning(f"[POS_STATE] 저장 실패: {e}")
 
@@ -1845,7 +2002,7 @@ class IntegratedTradingSystem:
             console.print("[cyan]🔍 Token 유효성 검증 중...[/cyan]")
 
             # 간단한 API 호출로 토큰 테스트 (계좌 잔고 조회)
-            balance_info = self.api.get_balance()
+            balance_info = await asyncio.to_thread(self.api.get_balance)
 
             # return_code가 0이면 성공
             return_code = balance_info.get('return_code', -1)
@@ -1885,12 +2042,8 @@ class IntegratedTradingSystem:
                 console.print()
                 console.print(f"[{datetime.now().strftime('%H:%M:%S')}] WebSocket 로그인 시도 ({attempt}/{max_retries})")
 
-                # 로그인 패킷 전송
-                login_packet = {'trnm': 'LOGIN', 'token': self.access_token}
-                await self.websocket.send(json.dumps(login_packet))
-
-                # 응답 수신
-                response = await self.receive_message(timeout=10.0)
+                # 로그인 패킷 전송 + 응답 수신
+                response = await self.request_message('LOGIN', {'token': self.access_token}, timeout=10.0)
 
                 if not response:
                     console.print(f"[yellow]⚠️  응답 없음 (시도 {attempt}/{max_retries})[/yellow]")
@@ -1993,14 +2146,14 @@ class IntegratedTradingSystem:
 
         try:
             # 1. 계좌 잔고 조회 (API-ID: kt00001)
-            balance_info = self.api.get_balance()
+            balance_info = await asyncio.to_thread(self.api.get_balance)
 
             # 예수금 파싱 (15자리 문자열 → 숫자)
             cash_str = balance_info.get('entr', '000000000000000')
             self.current_cash = float(cash_str)
 
             # 2. 보유 종목 조회 (API-ID: ka01690)
-            account_info = self.api.get_account_info()
+            account_info = await asyncio.to_thread(self.api.get_account_info)
             positions = account_info.get('day_bal_rt', [])
 
             # 3. 보유 포지션 평가액 계산
@@ -2123,7 +2276,8 @@ class IntegratedTradingSystem:
                 for stock_code, position in self.positions.items():
                     try:
                         # OHLCV 데이터 조회 (5분봉)
-                        result = self.api.get_minute_chart(
+                        result = await asyncio.to_thread(
+                            self.api.get_minute_chart,
                             stock_code=stock_code,
                             tic_scope="5",
                             upd_stkpc_tp="1"
@@ -2189,7 +2343,8 @@ class IntegratedTradingSystem:
                                         )
                                         # 절반 시장가 매도 (execute_sell의 경량 버전)
                                         try:
-                                            self.api.send_order(
+                                            await asyncio.to_thread(
+                                                self.api.send_order,
                                                 stock_code=stock_code,
                                                 order_type='2',  # 매도
                                                 quantity=_reduce_qty,
@@ -2316,12 +2471,12 @@ class IntegratedTradingSystem:
         """거래 후 실시간 잔고 업데이트"""
         try:
             # 1. 계좌 잔고 조회 (API-ID: kt00001)
-            balance_info = self.api.get_balance()
+            balance_info = await asyncio.to_thread(self.api.get_balance)
             cash_str = balance_info.get('entr', str(int(self.current_cash)).zfill(15))
             self.current_cash = float(cash_str)
 
             # 2. 보유 종목 조회 (API-ID: ka01690)
-            account_info = self.api.get_account_info()
+            account_info = await asyncio.to_thread(self.api.get_account_info)
             positions = account_info.get('day_bal_rt', [])
 
             # 3. 보유 포지션 평가액 계산
@@ -2394,10 +2549,9 @@ class IntegratedTradingSystem:
         console.print("[1] 조건검색식 목록 조회")
         console.print()
 
-        await self.send_message("CNSRLST")
-        response = await self.receive_message()
+        response = await self.request_message("CNSRLST")
 
-        if response.get("return_code") == 0:
+        if response and response.get("return_code") == 0:
             self.condition_list = response.get("data", [])
             console.print(f"✅ 총 {len(self.condition_list)}개 조건검색식 조회 완료", style="green")
             console.print()
@@ -2422,15 +2576,13 @@ class IntegratedTradingSystem:
         try:
             # 요청 전송
             start_time = time.time()
-            await self.send_message("CNSRREQ", {
+            # 응답 수신 (타임아웃 30초 - 조건검색은 시간 소요가 길 수 있음)
+            # 🔧 CRITICAL FIX: CNSRREQ 응답만 기다림 + seq 매칭 (재실행 시 이전 응답 무시)
+            response = await self.request_message("CNSRREQ", {
                 "seq": seq,
                 "search_type": "1",
                 "stex_tp": "K"
-            })
-
-            # 응답 수신 (타임아웃 30초 - 조건검색은 시간 소요가 길 수 있음)
-            # 🔧 CRITICAL FIX: CNSRREQ 응답만 기다림 + seq 매칭 (재실행 시 이전 응답 무시)
-            response = await self.receive_message(timeout=30.0, expected_trnm="CNSRREQ", expected_seq=seq)
+            }, timeout=30.0, seq=seq)
             elapsed = time.time() - start_time
 
             if response is None:
@@ -2681,7 +2833,7 @@ class IntegratedTradingSystem:
                     # 종목명 재조회 (RS 필터에서 못 가져온 경우)
                     if stock_name == stock_code:
                         try:
-                            result = self._get_stock_info_with_cache(stock_code)
+                            result = await asyncio.to_thread(self._get_stock_info_with_cache, stock_code)
                             if result:
                                 stock_name = self._extract_stock_name(result, stock_code)
                         except Exception:
@@ -2869,7 +3021,7 @@ class IntegratedTradingSystem:
                         # 차트 데이터 조회 (일봉 30일)
                         chart_data = None
                         try:
-                            result = self.api.get_ohlcv_data(stock_code, period='D', count=30)
+                            result = await asyncio.to_thread(self.api.get_ohlcv_data, stock_code, period='D', count=30)
                             if result and result.get("return_code") == 0:
                                 chart_data = result.get("data", [])
                                 console.print(f"  [dim]✓ 일봉 {len(chart_data) if chart_data else 0}개 수집[/dim]")
@@ -2882,7 +3034,7 @@ class IntegratedTradingSystem:
                         # 종목 기본 정보 조회 (캐시 사용)
                         basic_info = None
                         try:
-                            result = self._get_stock_info_with_cache(stock_code)
+                            result = await asyncio.to_thread(self._get_stock_info_with_cache, stock_code)
                             if result:
                                 basic_info = result
                                 console.print(f"  [dim]✓ 종목 정보 수집 (PER: {result.get('per', 'N/A')}, PBR: {result.get('pbr', 'N/A')})[/dim]")
@@ -2894,7 +3046,7 @@ class IntegratedTradingSystem:
                         try:
                             from datetime import datetime as dt
                             today = dt.now().strftime('%Y%m%d')
-                            result = self.api.get_investor_trend(stock_code, dt=today)
+                            result = await asyncio.to_thread(self.api.get_investor_trend, stock_code, dt=today)
                             if result and result.get("return_code") == 0:
                                 investor_data = result.get("stk_invsr_orgn", [])
                                 console.print(f"  [dim]✓ 투자자 동향 {len(investor_data) if investor_data else 0}개 수집[/dim]")
@@ -3031,7 +3183,7 @@ class IntegratedTradingSystem:
 
         for i, code in enumerate(unique_stocks, 1):
             try:
-                result = self._get_stock_info_with_cache(code)
+                result = await asyncio.to_thread(self._get_stock_info_with_cache, code)
                 stock_name = self._extract_stock_name(result, code) if result else code
 
                 if stock_name == code:
@@ -3041,7 +3193,7 @@ class IntegratedTradingSystem:
 
                 if stock_name == code:
                     try:
-                        price_result = self.api.get_stock_price(code)
+                        price_result = await asyncio.to_thread(self.api.get_stock_price, code)
                         stock_name = self._extract_stock_name(price_result, stock_name)
                     except Exception:
                         pass
@@ -3613,8 +3765,9 @@ class IntegratedTradingSystem:
 
                         last_sync = current_time
 
-                    # 1분마다 종목 체크
-                    elif (current_time - last_check).seconds >= check_interval:
+                    # 1분마다 종목 체크 (REAL 5분봉 마감 시 즉시)
+                    elif ((current_time - last_check).seconds >= check_interval
+                          or (self._bar_close_pending and (current_time - last_check).seconds >= 5)):
                         await self.check_all_stocks()
 
                         # ✅ 5분마다 한투 중기 포지션 조회, 평가, STOP_LOSS 실행
@@ -3655,6 +3808,133 @@ class IntegratedTradingSystem:
             self.shutdown()
             return  # 즉시 종료
 
+    def _should_skip_ohlcv(self, stock_code: str) -> bool:
+        """NO_TRADE_DAY + 비보유 종목은 5분봉 불필요 (DEFENSIVE 모드 활성 시엔 RSI/EMA/VWAP 계산 필요)"""
+        _mkt_status = getattr(self, '_market_context_status', 'TRADE_OK')
+        _def_active = self.config.get('defensive_mode', {}).get('enabled', False)
+        return (
+            _mkt_status == 'NO_TRADE_DAY'
+            and stock_code not in self.positions
+            and not _def_active
+        )
+
+    async def _fetch_market_data(self, stock_code: str, priority: int) -> Tuple[str, Optional[float], Optional[list]]:
+        """
+        종목 1개의 현재가 + 5분봉 조회 (TR 토큰 버킷 예산 내, 이벤트 루프 비차단)
+
+        Returns:
+            (stock_code, realtime_price, chart_rows) — 실패/장외 항목은 None
+        """
+        now = datetime.now()
+        realtime_price = None
+        chart_rows = None
+
+        # 장중(9:00~16:00)에만 키움 API 호출, 현재가는 15:30 장마감 전까지만
+        if not (9 <= now.hour < 16):
+            return stock_code, realtime_price, chart_rows
+
+        # REAL 체결로 유지 중인 종목은 REST 현재가/분봉 조회 생략
+        if self.tick_bars.is_live(stock_code, "5"):
+            return stock_code, self.tick_bars.last_price(stock_code), chart_rows
+
+        # 보유 종목 조회는 청산 판단용 → Rate Governor 에서 진입 스캔보다 먼저
+        _gov_priority = PRIORITY_EXIT if priority == PRIORITY_HELD else PRIORITY_ENTRY
+
+        if not (now.hour == 15 and now.minute >= 30):
+            try:
+                await self._tr_bucket.acquire(priority)
+                with rate_priority(_gov_priority):
+                    price_result = await self.async_api.get_stock_price(stock_code)
+                if price_result and price_result.get('return_code') == 0:
+                    output = price_result.get('output') or price_result.get('output1')
+                    if output:
+                        # 현재가 추출 (여러 키 시도)
+                        for key in ['stck_prpr', 'cur_prc', 'price', 'current_price']:
+                            if key in output:
+                                realtime_price = float(output[key])
+                                break
+            except Exception:
+                # API 실패는 정상 동작 (5분봉 데이터 사용)
+                pass
+
+        if self._should_skip_ohlcv(stock_code):
+            return stock_code, realtime_price, chart_rows
+
+        try:
+            await self._tr_bucket.acquire(priority)
+            with rate_priority(_gov_priority):
+                result = await self.async_api.get_minute_chart(
+                    stock_code=stock_code,
+                    tic_scope="5",
+                    upd_stkpc_tp="1"
+                )
+            if result.get('return_code') == 0:
+                # 응답 데이터 키 탐색
+                for key in ['stk_min_pole_chart_qry', 'stk_mnut_pole_chart_qry', 'output', 'output1', 'output2', 'data']:
+                    if key in result and result[key]:
+                        chart_rows = result[key]
+                        break
+        except Exception as e:
+            logger.debug(f"[API_ERR] {stock_code}: {e}")
+
+        return stock_code, realtime_price, chart_rows
+
+    def _merge_chart_bars(self, stock_code: str, chart_rows: Optional[list]) -> bool:
+        """
+        조회한 5분봉을 상주 저장소에 병합. 이번 주기에 저장소 봉을 쓸 수 있으면 True.
+
+        - ka10080 응답(최신→과거)에서 마지막 저장 봉 이후만 파싱
+        - 컬럼 매핑 / 절대값 변환 / cntr_tm 오름차순은 저장소가 보장
+        - REAL 등록 종목은 1회 backfill → 이후 틱으로 유지
+        """
+        if self._should_skip_ohlcv(stock_code):
+            return False
+        if chart_rows:
+            try:
+                if stock_code in self._real_symbols:
+                    _merged = self.tick_bars.backfill(stock_code, "5", chart_rows)
+                else:
+                    _merged = self.bar_store.merge_chart_rows(stock_code, "5", chart_rows)
+                logger.debug(f"[DATA] {stock_code} kiwoom merged={_merged}")
+                return True
+            except Exception as e:
+                logger.debug(f"[API_ERR] {stock_code}: {e}")
+                return False
+        return self.tick_bars.is_live(stock_code, "5")
+
+    async def _stream_market_data(self, stock_codes: List[str]):
+        """
+        전 종목 조회를 동시에 발행하고 완료 묶음 순서대로 (code, price, chart_rows, indicators) 산출.
+
+        주기 지연은 N × 왕복시간이 아니라 TR 예산(초당 요청 수)에 비례한다.
+        보유 종목은 높은 우선순위로 토큰을 먼저 받는다.
+
+        🔧 2026-10-16: 완료된 조회를 묶음으로 모아 저장소에 병합하고 지표 패널을 묶음당 1회 계산
+          (지표 비용이 종목 수가 아니라 묶음 수에 비례). indicators 는 5분봉 + 지표 읽기 전용 뷰
+          (SymbolIndicators), 저장소 봉을 쓸 수 없는 종목은 None.
+        """
+        tasks = [
+            asyncio.create_task(self._fetch_market_data(
+                code, PRIORITY_HELD if code in self.positions else PRIORITY_SCAN
+            ))
+            for code in stock_codes
+        ]
+        order = {task: i for i, task in enumerate(tasks)}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                batch = [task.result() for task in sorted(done, key=order.get)]
+                ready = [code for code, _, chart_rows in batch if self._merge_chart_bars(code, chart_rows)]
+                views = self.indicator_engine.views(self.bar_store, ready, "5") if ready else {}
+                for stock_code, realtime_price, chart_rows in batch:
+                    yield stock_code, realtime_price, chart_rows, views.get(stock_code)
+        finally:
+            # 소비 측 예외/중단 시 남은 조회 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
     async def check_all_stocks(self):
         """모든 종목 체크 및 실시간 테이블 갱신 (매수 조건 + 보유 종목 포함)"""
         from rich.table import Table
@@ -3709,7 +3989,36 @@ class IntegratedTradingSystem:
         # 모니터링 대상: watchlist + 보유 종목 (중복 제거)
         all_stocks = set(self.watchlist) | set(self.positions.keys())
 
+        # 워치리스트/보유에서 빠진 종목의 분봉 버퍼 정리
+        self.bar_store.retain(all_stocks)
+        self.tick_bars.retain(all_stocks)
+
+        # REAL 체결 구독 동기화 + 틱 없는 종목의 봉 마감 처리
+        self._bar_close_pending = False
+        await self._sync_real_subscriptions(all_stocks)
+        self.tick_bars.flush(datetime.now())
+
+        # ─── 조회 대상 선정: 보유 종목은 매 사이클, 워치리스트는 N사이클마다 (LOOP_LAG 완화) ───
+        _entry_scan_due = (self._cycle_count % self._entry_scan_cycles == 0)
+        _fetch_targets = []
         for stock_code in all_stocks:
+            if stock_code not in self.validated_stocks and stock_code not in self.positions:
+                console.print(f"[dim]⚠️  {stock_code}: 정보 없음[/dim]")
+                continue
+            if stock_code not in self.positions and not _entry_scan_due:
+                # 이번 사이클은 진입 스캔 제외 → OHLCV 조회/지표 계산 전체 스킵
+                logger.debug(f"[SCAN_SKIP] {stock_code} cycle={self._cycle_count} (비보유, 스캔 주기 아님)")
+                continue
+            _fetch_targets.append(stock_code)
+
+        # 🔧 2026-10-16: VWAP 설정이 바뀌면 지표 엔진 재생성 (캐시된 뷰 폐기)
+        vwap_config = self.config.get_section('vwap')
+        _vwap_params = (vwap_config.get('rolling_window', 20), vwap_config.get('use_rolling', True))
+        if (self.indicator_engine.vwap_window, self.indicator_engine.use_rolling_vwap) != _vwap_params:
+            self.indicator_engine = IndicatorEngine(vwap_window=_vwap_params[0], use_rolling_vwap=_vwap_params[1])
+
+        # 현재가/5분봉 동시 조회 (토큰 버킷 예산 내, 보유 종목 우선) → 도착 묶음마다 지표 일괄 계산 후 평가
+        async for stock_code, realtime_price, chart_rows, indicators in self._stream_market_data(_fetch_targets):
             try:
                 # watchlist 종목은 validated_stocks에서, 보유 종목은 positions에서 정보 가져오기
                 if stock_code in self.validated_stocks:
@@ -3719,7 +4028,7 @@ class IntegratedTradingSystem:
                     # 종목명이 코드와 같으면 (조회 실패) 다시 조회
                     if stock_name == stock_code:
                         try:
-                            result = self._get_stock_info_with_cache(stock_code)
+                            result = await asyncio.to_thread(self._get_stock_info_with_cache, stock_code)
                             if result:
                                 stock_name = self._extract_stock_name(result, stock_code)
                                 # validated_stocks 업데이트
@@ -3735,7 +4044,7 @@ class IntegratedTradingSystem:
                     # 종목명이 코드와 같으면 (조회 실패) 다시 조회
                     if stock_name == stock_code:
                         try:
-                            result = self._get_stock_info_with_cache(stock_code)
+                            result = await asyncio.to_thread(self._get_stock_info_with_cache, stock_code)
                             if result:
                                 stock_name = self._extract_stock_name(result, stock_code)
                                 # positions 업데이트
@@ -3746,122 +4055,22 @@ class IntegratedTradingSystem:
                     console.print(f"[dim]⚠️  {stock_code}: 정보 없음[/dim]")
                     continue
 
-                # ─── LOOP_LAG 완화: 보유 종목은 매 사이클, 워치리스트는 N사이클마다 ───
-                _is_held = stock_code in self.positions
-                _entry_scan_due = (self._cycle_count % self._entry_scan_cycles == 0)
-                if not _is_held and not _entry_scan_due:
-                    # 이번 사이클은 진입 스캔 제외 → OHLCV 조회/지표 계산 전체 스킵
-                    logger.debug(f"[SCAN_SKIP] {stock_code} cycle={self._cycle_count} (비보유, 스캔 주기 아님)")
-                    continue
-
-                # 1차: 키움 API에서 5분봉 데이터 조회 (최근 900개)
-                current_hour = datetime.now().hour
-                current_minute = datetime.now().minute
-
+                # 1차: 키움 API 5분봉 (조회 단계에서 수신한 최근 900개)
                 df = None
                 kiwoom_bars = 0
-                realtime_price = None  # 실시간 현재가
-
-                # 모든 종목의 실시간 현재가 우선 조회 (장중에만)
-                if 9 <= current_hour < 16:
-                    try:
-                        # 장마감 시간(15:30) 체크
-                        is_market_open = not (current_hour == 15 and current_minute >= 30)
-
-                        if is_market_open:
-                            price_result = self.api.get_stock_price(stock_code)
-                            if price_result and price_result.get('return_code') == 0:
-                                output = price_result.get('output') or price_result.get('output1')
-                                if output:
-                                    # 현재가 추출 (여러 키 시도)
-                                    for key in ['stck_prpr', 'cur_prc', 'price', 'current_price']:
-                                        if key in output:
-                                            realtime_price = float(output[key])
-                                            pass  # 실시간 가격 수신 (노이즈 제거)
-                                            break
-                    except Exception as e:
-                        # API 실패는 정상 동작 (5분봉 데이터 사용)
-                        pass
 
-                # NO_TRADE_DAY + 포지션 없는 종목은 5분봉 스킵 (루프 속도 개선)
-                # DEFENSIVE 모드 활성화 시엔 스킵하지 않음 (RSI/EMA/VWAP 계산 필요)
-                _mkt_status = getattr(self, '_market_context_status', 'TRADE_OK')
-                _def_active = self.config.get('defensive_mode', {}).get('enabled', False)
-                _skip_ohlcv = (
-                    _mkt_status == 'NO_TRADE_DAY'
-                    and stock_code not in self.positions
-                    and not _def_active
-                )
-                if _skip_ohlcv:
+                # NO_TRADE_DAY + 포지션 없는 종목은 5분봉 스킵 (조회 단계에서 차트 요청 생략됨)
+                if self._should_skip_ohlcv(stock_code):
                     stock_data.append({'code': stock_code, 'name': stock_name, 'df': None,
                                        'realtime_price': realtime_price})
                     continue
 
-                # 장중(9:00~15:30)에만 5분봉 키움 API 호출
-                if 9 <= current_hour < 16:
-                    try:
-                        import asyncio as _asyncio_chart
-                        result = await _asyncio_chart.to_thread(
-                            self.api.get_minute_chart,
-                            stock_code=stock_code,
-                            tic_scope="5",
-                            upd_stkpc_tp="1"
-                        )
-
-                        if result.get('return_code') == 0:
-                            # 응답 데이터 키 탐색
-                            data = None
-                            for key in ['stk_min_pole_chart_qry', 'stk_mnut_pole_chart_qry', 'output', 'output1', 'output2', 'data']:
-                                if key in result and result[key]:
-                                    data = result[key]
-                                    break
-
-                            if data and len(data) > 0:
-                                import pandas as pd
-                                df = pd.DataFrame(data)
-
-                                logger.debug(f"[API_COLS] {stock_code} cols={list(df.columns)}")
-
-                                # 컬럼 매핑 (ka10080 API 기준)
-                                column_mapping = {
-                                    'cur_prc': 'close',      # 현재가
-                                    'open_pric': 'open',     # 시가
-                                    'high_pric': 'high',     # 고가
-                                    'low_pric': 'low',       # 저가
-                                    'trde_qty': 'volume',    # 거래량
-                                    # 다른 API 호환성
-                                    'stck_prpr': 'close', 'cur_price': 'close',
-                                    'stck_oprc': 'open', 'open_price': 'open',
-                                    'stck_hgpr': 'high', 'high_price': 'high',
-                                    'stck_lwpr': 'low', 'low_price': 'low',
-                                    'cntg_vol': 'volume', 'acml_vol': 'volume', 'vol': 'volume',
-                                    'acml_tr_pbmn': 'volume'
-                                }
-                                df.rename(columns={k: v for k, v in column_mapping.items() if k in df.columns}, inplace=True)
-
-                                # 🔧 CRITICAL: 키움 API는 음수 부호로 하락을 표시 → 절대값 변환 필수!
-                                # 예: cur_prc="-78800" → 실제 가격은 78,800원
-                                for col in ['open', 'high', 'low', 'close', 'volume']:
-                                    if col in df.columns:
-                                        # 문자열 → 숫자 변환 후 절대값 적용
-                                        df[col] = pd.to_numeric(df[col], errors='coerce').abs()
-
-                                # volume 컬럼이 없으면 기본값 추가
-                                if 'volume' not in df.columns:
-                                    logger.debug(f"[VOL_COL] {stock_code}: volume 컬럼 없음")
-                                    df['volume'] = 1000  # 기본 거래량
-
-                                # 시간 정렬: cntr_tm으로 정렬 (최신 데이터가 마지막에 오도록)
-                                if 'cntr_tm' in df.columns:
-                                    df['cntr_tm'] = pd.to_numeric(df['cntr_tm'], errors='coerce')
-                                    df = df.sort_values('cntr_tm', ascending=True).reset_index(drop=True)
-                                    logger.debug(f"[DATA] {stock_code} kiwoom {len(df)}봉")
-                                else:
-                                    logger.debug(f"[DATA] {stock_code} kiwoom {len(df)}봉")
-
-                                kiwoom_bars = len(df)
-                    except Exception as e:
-                        logger.debug(f"[API_ERR] {stock_code}: {e}")
+                # 🔧 2026-10-16: 저장소 병합 + VWAP/MA20/거래량 MA/RSVI/스퀴즈 계산은 묶음 단위로 완료됨
+                # - 뷰 기반 DataFrame: 컬럼 추가/교체는 가능, 원소 단위 수정 불가 (필요 시 .copy())
+                if indicators is not None:
+                    df = indicators.frame()
+                    kiwoom_bars = len(df)
+                    logger.debug(f"[DATA] {stock_code} {'kiwoom' if chart_rows else 'tick'} {kiwoom_bars}봉")
 
                 # 2차: 데이터 부족 시 Yahoo Finance로 보충
                 if df is None or len(df) < 20:
@@ -3883,6 +4092,7 @@ class IntegratedTradingSystem:
                     yahoo_df = await asyncio.to_thread(download_stock_data_sync, ticker, days=days_needed)
 
                     if yahoo_df is not None and len(yahoo_df) > 0:
+                        indicators = None  # 야후 보충 데이터 → 종목별 계산
                         if df is not None:
                             # 키움 + 야후 결합
                             df = pd.concat([yahoo_df, df], ignore_index=True).drop_duplicates()
@@ -3921,16 +4131,14 @@ class IntegratedTradingSystem:
                     })
                     continue
 
-                # VWAP 설정 가져오기
-                vwap_config = self.config.get_section('vwap')
-                use_rolling = vwap_config.get('use_rolling', True)
-                rolling_window = vwap_config.get('rolling_window', 20)
-
-                # VWAP, MA20, ATR 계산
-                df = self.analyzer.calculate_vwap(df, use_rolling=use_rolling, rolling_window=rolling_window)
-                df['ma20'] = df['close'].rolling(window=20).mean()
-                df['volume_ma5'] = df['volume'].rolling(window=5).mean()
-                df['volume_ma20'] = df['volume'].rolling(window=20).mean()
+                # VWAP, MA20, ATR 계산 (패널 뷰가 없는 야후 보충 데이터만)
+                if indicators is None:
+                    use_rolling = vwap_config.get('use_rolling', True)
+                    rolling_window = vwap_config.get('rolling_window', 20)
+                    df = self.analyzer.calculate_vwap(df, use_rolling=use_rolling, rolling_window=rolling_window)
+                    df['ma20'] = df['close'].rolling(window=20).mean()
+                    df['volume_ma5'] = df['volume'].rolling(window=5).mean()
+                    df['volume_ma20'] = df['volume'].rolling(window=20).mean()
                 df['trade_value'] = df['close'] * df['volume']  # 거래대금
 
                 # 보유 종목의 경우 실시간 가격 우선 사용
@@ -4050,11 +4258,15 @@ class IntegratedTradingSystem:
                 squeeze_config = self.config.get('squeeze_momentum', {})
                 if squeeze_config.get('enabled', False) and df is not None and len(df) >= 50:
                     try:
-                        from utils.squeeze_momentum_realtime import calculate_squeeze_momentum, get_current_squeeze_signal
+                        if indicators is not None:
+                            # 패널에서 계산된 최신 봉 색상 (calculate_squeeze_momentum 과 동일 정의)
+                            squeeze_color = indicators.squeeze_color
+                        else:
+                            from utils.squeeze_momentum_realtime import calculate_squeeze_momentum, get_current_squeeze_signal
 
-                        df_copy = df.copy()
-                        df_copy = calculate_squeeze_momentum(df_copy)
-                        signal = get_current_squeeze_signal(df_copy)
+                            df_copy = df.copy()
+                            df_copy = calculate_squeeze_momentum(df_copy)
+                            squeeze_color = get_current_squeeze_signal(df_copy)['color']
 
                         # 색상별 표시
                         color_map = {
@@ -4065,7 +4277,7 @@ class IntegratedTradingSystem:
                             'gray': ('⚪', '--', 'dim')
                         }
 
-                        emoji, abbr, color = color_map.get(signal['color'], ('⚪', '--', 'dim'))
+                        emoji, abbr, color = color_map.get(squeeze_color, ('⚪', '--', 'dim'))
                         squeeze_display = f"[{color}]{emoji}{abbr}[/{color}]"
                     except Exception:
                         squeeze_display = "[dim]-[/dim]"
@@ -4077,7 +4289,7 @@ class IntegratedTradingSystem:
                 if entry_mode == "squeeze_with_orderbook" and df is not None and len(df) >= 20:
                     try:
                         # 호가창 데이터 조회
-                        orderbook_data = self.api.get_stock_quote(stock_code)
+                        orderbook_data = await asyncio.to_thread(self.api.get_stock_quote, stock_code)
 
                         # 디버그: API 응답 확인
                         if orderbook_data is None:
@@ -4173,7 +4385,10 @@ class IntegratedTradingSystem:
 
                 # 매수/매도 신호 체크 (기존 로직)
                 _cycle_scanned += 1
-                if stock_code in self.positions:
+                if stock_code in self._exit_inflight:
+                    # 🔧 2026-10-16: 틱 승격으로 워커에서 청산 평가 중인 보유 종목 → 이번 사이클 건너뜀 (중복 매도 방지)
+                    pass
+                elif stock_code in self.positions:
                     self.check_exit_signal(stock_code, df)  # historical_df 전달
                     # 청산되지 않은 경우 → 등급 승격 + 피라미딩 체크
                     if stock_code in self.positions:
@@ -4189,7 +4404,7 @@ class IntegratedTradingSystem:
                     # 디버그: check_entry_signal 호출 전 로그
                     if orchestrator_status == "✅통과":
                         logger.debug(f"[ORCH_PASS] {stock_code} {stock_name}")
-                    await self.check_entry_signal(stock_code, df)  # 키움 데이터 전달 (async)
+                    await self.check_entry_signal(stock_code, df, indicators)  # 키움 데이터 + 지표 뷰 전달 (async)
                     # Cycle 신호/필터 카운트
                     _smc_state = self._smc_display_cache.get(stock_code, {}).get('smc_state', '')
                     if _smc_state == 'SIGNAL':
@@ -4214,6 +4429,9 @@ class IntegratedTradingSystem:
         # ── Signal Flush: detect → execute ────────────────────────────────
         self._flush_pending_signals(stock_data)
 
+        # 보유 종목 틱 청산 임계가 갱신 (신규 진입/부분청산/트레일링 반영)
+        self.exit_guard.sync(self.positions)
+
         # 보유 종목의 AI 점수와 승률을 캐싱 (시뮬레이션 테이블에서 재사용)
         position_scores = {}  # {stock_code: {'ai_score': 0, 'win_rate': 0}}
 
@@ -4268,7 +4486,8 @@ class IntegratedTradingSystem:
                         # 실시간 백테스트로 정확한 stats 계산
                         from analyzers.pre_trade_validator import PreTradeValidator
                         validator = PreTradeValidator(self.config)
-                        trades = validator._run_quick_simulation(historical_df)
+                        # 🔧 2026-10-16: 종목별 시뮬레이션 캐시 경유 (같은 봉이면 재계산 없음)
+                        trades = validator._run_quick_simulation(historical_df, cache_key=stock_code)
                         stats = validator._calculate_stats(trades)
                     else:
                         # 백테스트 불가능하면 기본값
@@ -4295,7 +4514,8 @@ class IntegratedTradingSystem:
                     # 실시간 데이터로 재계산
                     from analyzers.pre_trade_validator import PreTradeValidator
                     validator = PreTradeValidator(self.config)
-                    trades = validator._run_quick_simulation(historical_df)
+                    # 🔧 2026-10-16: 종목별 시뮬레이션 캐시 경유 (같은 봉이면 재계산 없음)
+                    trades = validator._run_quick_simulation(historical_df, cache_key=stock_code)
                     stats = validator._calculate_stats(trades)
                 else:
                     # 저장된 stats 사용 (StockGravity 종목은 stats가 없을 수 있음)
@@ -4447,7 +4667,8 @@ class IntegratedTradingSystem:
                             # VWAP 백테스트 실행
                             from analyzers.pre_trade_validator import PreTradeValidator
                             validator = PreTradeValidator(self.config)
-                            trades = validator._run_quick_simulation(historical_df)
+                            # 🔧 2026-10-16: 종목별 시뮬레이션 캐시 경유 (같은 봉이면 재계산 없음)
+                            trades = validator._run_quick_simulation(historical_df, cache_key=stock_code)
                             stats = validator._calculate_stats(trades)
 
                             win_rate = stats.get('win_rate', 0)
@@ -4758,7 +4979,7 @@ class IntegratedTradingSystem:
 
                 try:
                     # 키움 API로 실시간 데이터 조회
-                    result = self._get_stock_info_with_cache(stock_code)
+                    result = await asyncio.to_thread(self._get_stock_info_with_cache, stock_code)
                     if not result:
                         continue
 
@@ -4970,8 +5191,12 @@ class IntegratedTradingSystem:
 
         return True, "OK"
 
-    async def check_entry_signal(self, stock_code: str, kiwoom_df: pd.DataFrame = None):
-        """매수 신호 체크 (SignalOrchestrator 사용 - L0~L6 통합)"""
+    async def check_entry_signal(self, stock_code: str, kiwoom_df: pd.DataFrame = None, indicators=None):
+        """
+        매수 신호 체크 (SignalOrchestrator 사용 - L0~L6 통합)
+
+        indicators: kiwoom_df 와 같은 봉의 지표 뷰 (check_all_stocks 패널) — VWAP/ATR 재계산 생략
+        """
         try:
             # 🔥 2026-04-03: EMA9 블록 결과 확인 (15분 경과 시 현재가 비교)
             if stock_code in self._ema9_blocks:
@@ -5041,6 +5266,7 @@ class IntegratedTradingSystem:
             if kiwoom_df is not None and len(kiwoom_df) >= 20:
                 df = kiwoom_df.copy()
             else:
+                indicators = None
                 # Yahoo Finance fallback (to_thread로 이벤트 루프 블로킹 방지)
                 ticker_suffix = '.KS' if market == 'KOSPI' else '.KQ'
                 ticker = f"{stock_code}{ticker_suffix}"
@@ -5084,12 +5310,17 @@ class IntegratedTradingSystem:
                     )
                     return
 
-            # VWAP 계산
-            vwap_config = self.config.get_section('vwap')
-            df = self.analyzer.calculate_vwap(df,
-                                               use_rolling=vwap_config.get('use_rolling', True),
-                                               rolling_window=vwap_config.get('rolling_window', 20))
-            df = self.analyzer.calculate_atr(df)
+            # VWAP / ATR 계산
+            # 🔧 2026-10-16: 패널 뷰와 봉이 그대로면(가격 필터로 제거된 봉 없음) 같은 설정의 계산값 재사용
+            if indicators is not None and len(df) == len(indicators):
+                df['vwap'] = indicators['vwap']
+                df['atr'] = indicators['atr']
+            else:
+                vwap_config = self.config.get_section('vwap')
+                df = self.analyzer.calculate_vwap(df,
+                                                   use_rolling=vwap_config.get('use_rolling', True),
+                                                   rolling_window=vwap_config.get('rolling_window', 20))
+                df = self.analyzer.calculate_atr(df)
 
             # 🔧 FIX: ATR 변동성 필터 (문서 명세: ATR ≤ 5%)
             if 'atr' in df.columns:
@@ -5228,7 +5459,7 @@ class IntegratedTradingSystem:
 
                 # 1. 호가창 데이터 수집
                 try:
-                    orderbook_data = self.api.get_stock_quote(stock_code)
+                    orderbook_data = await asyncio.to_thread(self.api.get_stock_quote, stock_code)
 
                     # 🔥 FIX: None 체크 추가
                     if orderbook_data is None or orderbook_data.get('return_code') != 0:
@@ -5660,6 +5891,9 @@ class IntegratedTradingSystem:
                                                     return
 
                                             logger.info(f"[TREND_SIG] {stock_code} {stock_name}: {t_reason} | 레짐={regime_reason}")
+                                            event_journal.emit('TREND_SIG', stock_code=stock_code,
+                                                               entry_type=t_details.get("entry_type"),
+                                                               grade=t_details.get("grade"), detail=t_reason)
                                             console.print(f"[cyan]📈 [TREND] {stock_name}: {t_reason}[/cyan]")
 
                                             # 등급별 포지션 사이즈
@@ -9017,6 +9251,9 @@ class IntegratedTradingSystem:
             f"price={price:,} qty={quantity} amount={amount:,.0f} | "
             f"reason={entry_reason or ''} | trade_id={trade_id}"
         )
+        event_journal.emit('BUY', stock_code=stock_code, stock_name=stock_name, price=price,
+                           quantity=quantity, amount=amount, entry_reason=entry_reason,
+                           trade_id=trade_id)
         self._refresh_dashboard_cache()
 
         # ── TradeLogger 진입 기록 ─────────────────────────────────────────
@@ -10209,6 +10446,11 @@ class IntegratedTradingSystem:
         console.print()
 
     def execute_sell(self, stock_code: str, price: float, profit_pct: float, reason: str, use_market_order: bool = False):
+        """매도 실행 — 청산 경로의 잔고/체결 조회는 Rate Governor 청산 우선순위로"""
+        with rate_priority(PRIORITY_EXIT):
+            return self._execute_sell(stock_code, price, profit_pct, reason, use_market_order)
+
+    def _execute_sell(self, stock_code: str, price: float, profit_pct: float, reason: str, use_market_order: bool = False):
         """매도 실행 (전량 청산)"""
         position = self.positions.get(stock_code)
         if not position:
@@ -10398,6 +10640,7 @@ class IntegratedTradingSystem:
                     if not self.refresh_access_token():
                         logger.critical(f"[SELL_TOKEN_REFRESH_FAIL] {stock_code} 토큰 재발급 실패 — 수동 처리 필요")
                         console.print(f"[red]❌ 토큰 재발급 실패 — 수동 처리 필요[/red]")
+                        self._pending_exit_value = max(0.0, self._pending_exit_value - _pending_val)  # 🔧 2026-10-16: 실패 시 pending 해제
                         return
                     # _sell_attempt=1 로 재시도
                 else:
@@ -10406,17 +10649,20 @@ class IntegratedTradingSystem:
                     console.print(f"[yellow]⚠️  포지션은 유지됩니다. 수동으로 처리하세요.[/yellow]")
                     import traceback
                     console.print(f"[dim]{traceback.format_exc()}[/dim]")
+                    self._pending_exit_value = max(0.0, self._pending_exit_value - _pending_val)  # 🔧 2026-10-16: 실패 시 pending 해제
                     return
 
         # 🔧 FIX: order_result가 None인 경우 처리
         if order_result is None:
             console.print(f"[red]❌ 매도 주문 응답 없음 (API 오류)[/red]")
             console.print(f"[yellow]⚠️  포지션은 유지됩니다. 수동으로 처리하세요.[/yellow]")
+            self._pending_exit_value = max(0.0, self._pending_exit_value - _pending_val)  # 🔧 2026-10-16: 실패 시 pending 해제
             return
 
         if order_result.get('return_code') != 0:
             console.print(f"[red]❌ 매도 주문 실패: {order_result.get('return_msg')}[/red]")
             console.print(f"[yellow]⚠️  포지션은 유지됩니다. 수동으로 처리하세요.[/yellow]")
+            self._pending_exit_value = max(0.0, self._pending_exit_value - _pending_val)  # 🔧 2026-10-16: 실패 시 pending 해제
             return
 
         order_no = order_result.get('ord_no')
@@ -10788,6 +11034,10 @@ class IntegratedTradingSystem:
             pass
 
         console.print(f"✅ 매도 완료 (주문번호: {order_no})")
+        event_journal.emit('SELL', stock_code=stock_code, stock_name=position.get('name', ''),
+                           price=price, quantity=position['quantity'], pnl_pct=profit_pct,
+                           realized_pnl=realized_profit, exit_reason=reason,
+                           hold_seconds=holding_duration)
         self._refresh_dashboard_cache()
 
         # ── TradeLogger 청산 기록 ─────────────────────────────────────────
@@ -11460,6 +11710,7 @@ class IntegratedTradingSystem:
         finally:
             if self.websocket:
                 await self.websocket.close()
+            await self.async_api.close()
 
 
 def check_and_create_pid_lock():
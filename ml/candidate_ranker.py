@@ -17,7 +17,6 @@ Pipeline 위치:
 import os
 import json
 import logging
-import pickle
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
@@ -26,6 +25,8 @@ import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
 
+from utils.model_registry import atomic_pickle_dump, get_model_registry
+
 try:
     import lightgbm as lgb
 except ImportError:
@@ -71,6 +72,7 @@ class CandidateRanker:
         # 모델
         self.classifier = None  # buy_probability 예측
         self.regressor = None   # predicted_return 예측
+        self._registry_backed = False   # 저장된 모델 사용 중 → 랭킹마다 새 버전 확인
 
         # Feature 정의
         self.features = [
@@ -150,6 +152,9 @@ class CandidateRanker:
         Returns:
             점수가 추가된 DataFrame (정렬됨)
         """
+        if self._registry_backed:
+            self.load_models()          # 변경 없으면 메모리 참조 그대로 (파일 재확인은 check_interval 마다)
+
         if self.classifier is None:
             logger.warning("모델이 학습되지 않았습니다. 기본 점수 사용")
             candidates['buy_probability'] = 0.5
@@ -300,17 +305,18 @@ class CandidateRanker:
         return metrics
 
     def save_models(self):
-        """모델 저장"""
+        """모델 저장 (ModelRegistry 캐시 무효화 → 다음 load_models 가 방금 저장한 모델을 사용)"""
+        registry = get_model_registry()
         if self.classifier is not None:
             classifier_path = self.model_dir / "classifier.pkl"
-            with open(classifier_path, 'wb') as f:
-                pickle.dump(self.classifier, f)
+            atomic_pickle_dump(self.classifier, classifier_path)
+            registry.invalidate(str(classifier_path.resolve()))
             logger.info(f"Classifier 저장: {classifier_path}")
 
         if self.regressor is not None:
             regressor_path = self.model_dir / "regressor.pkl"
-            with open(regressor_path, 'wb') as f:
-                pickle.dump(self.regressor, f)
+            atomic_pickle_dump(self.regressor, regressor_path)
+            registry.invalidate(str(regressor_path.resolve()))
             logger.info(f"Regressor 저장: {regressor_path}")
 
         # 메타데이터 저장
@@ -319,7 +325,7 @@ class CandidateRanker:
             json.dump(self.metadata, f, indent=2, ensure_ascii=False)
 
     def load_models(self) -> bool:
-        """모델 로드"""
+        """모델 로드 (ModelRegistry 경유 — 프로세스 내 1회 언픽클, 파일이 바뀌면 새 모델로 교체)"""
         try:
             classifier_path = self.model_dir / "classifier.pkl"
             regressor_path = self.model_dir / "regressor.pkl"
@@ -329,16 +335,19 @@ class CandidateRanker:
                 logger.info("저장된 모델이 없습니다")
                 return False
 
-            with open(classifier_path, 'rb') as f:
-                self.classifier = pickle.load(f)
-
-            with open(regressor_path, 'rb') as f:
-                self.regressor = pickle.load(f)
-
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                self.metadata = json.load(f)
+            registry = get_model_registry()
+            classifier = registry.load(classifier_path)
+            regressor = registry.load(regressor_path)
+            if classifier is None or regressor is None:
+                return False
 
-            logger.info(f"모델 로드 완료 (학습일: {self.metadata.get('trained_at')})")
+            changed = classifier is not self.classifier or regressor is not self.regressor
+            self.classifier, self.regressor = classifier, regressor
+            self._registry_backed = True
+            if changed:
+                with open(metadata_path, 'r', encoding='utf-8') as f:
+                    self.metadata = json.load(f)
+                logger.info(f"모델 로드 완료 (학습일: {self.metadata.get('trained_at')})")
             return True
 
         except Exception as e:
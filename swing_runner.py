@@ -16,7 +16,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +26,7 @@ import yaml
 from analyzers.swing.signal_engine import SignalEngine
 from analyzers.swing.state_machine import SwingStateManager, SwingPosition, SwingState
 from analyzers.swing.holding_manager import HoldingManager
+from utils.ohlcv_store import get_store
 
 logging.basicConfig(
     level=logging.INFO,
@@ -60,24 +61,15 @@ def load_universe(universe_file: str) -> list[dict]:
 
 
 def fetch_daily(code: str, market: str, lookback: int = DEFAULT_LOOKBACK_DAYS) -> Optional[pd.DataFrame]:
-    """yfinance로 일봉 OHLCV 수집. 실패 시 None 반환."""
+    """일봉 OHLCV 수집 (로컬 캐시 data/ohlcv, 빈 구간만 yfinance 조회). 실패 시 None 반환."""
     try:
-        import yfinance as yf
-
-        suffix = ".KS" if market == "KS" else ".KQ"
-        ticker_sym = f"{code}{suffix}"
-        ticker = yf.Ticker(ticker_sym)
-        df = ticker.history(period=f"{lookback}d", interval="1d", auto_adjust=True)
+        start = date.today() - timedelta(days=lookback)
+        df = get_store().get(code, start, timeframe='1d', market=market)
 
         if df is None or len(df) < 20:
-            logger.debug(f"[SWING_RUN] 데이터 부족: {ticker_sym} ({len(df) if df is not None else 0}봉)")
+            logger.debug(f"[SWING_RUN] 데이터 부족: {code}.{market} ({len(df) if df is not None else 0}봉)")
             return None
 
-        df = df.rename(columns={
-            'Open': 'open', 'High': 'high', 'Low': 'low',
-            'Close': 'close', 'Volume': 'volume',
-        })
-        df = df[['open', 'high', 'low', 'close', 'volume']].dropna()
         return df
 
     except Exception as e:
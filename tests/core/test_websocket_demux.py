@@ -0,0 +1,115 @@
+"""
+WebSocketDemux 테스트
+
+케이스:
+  1. 순서가 뒤섞인 응답도 (trnm, seq) 대기자에게 각각 전달 (동시 대기)
+  2. 대기자 없는 프레임은 보관 → 이후 wait() 가 받음
+  3. PING 은 서버로 되돌려 보내고 대기자에게 전달하지 않음
+  4. subscribe() 큐는 해당 trnm 프레임 전부 수신, 연결 종료 시 None
+  5. 연결 종료 → 대기 중인 요청에 예외 전달
+"""
+import asyncio
+import json
+
+import pytest
+
+from core.websocket.demux import WebSocketDemux
+
+
+class _Closed(Exception):
+    pass
+
+
+class FakeWS:
+    def __init__(self):
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.sent = []
+
+    async def recv(self):
+        item = await self.inbox.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def send(self, raw):
+        self.sent.append(json.loads(raw))
+
+    def push(self, **frame):
+        self.inbox.put_nowait(json.dumps(frame))
+
+
+@pytest.fixture
+async def ws_demux():
+    ws = FakeWS()
+    demux = WebSocketDemux(ws).start()
+    yield ws, demux
+    await demux.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_routed_by_seq(ws_demux):
+    ws, demux = ws_demux
+
+    async def _search(seq):
+        return await demux.request('CNSRREQ', {'seq': seq}, seq=seq, timeout=1.0)
+
+    tasks = [asyncio.create_task(_search(s)) for s in ('1', '2', '3')]
+    await asyncio.sleep(0)
+    for s in ('3', '1', '2'):
+        ws.push(trnm='CNSRREQ', seq=s, data=[{'jmcode': f'A00000{s}'}])
+    results = await asyncio.gather(*tasks)
+
+    assert [r['seq'] for r in results] == ['1', '2', '3']
+    assert [m['seq'] for m in ws.sent] == ['1', '2', '3']
+    assert demux.stats['replies'] == 3 and demux.snapshot()['waiters'] == 0
+
+
+@pytest.mark.asyncio
+async def test_unclaimed_frame_kept_for_later_wait(ws_demux):
+    ws, demux = ws_demux
+    ws.push(trnm='CNSRREQ', seq='7', data=[])
+    ws.push(trnm='LOGIN', return_code=0)
+    await asyncio.sleep(0.01)
+
+    assert (await demux.wait('LOGIN', timeout=0.1))['return_code'] == 0
+    assert (await demux.wait('CNSRREQ', seq=7, timeout=0.1))['seq'] == '7'
+    assert await demux.wait('CNSRLST', timeout=0.05) is None
+    assert demux.stats['unclaimed'] == 2 and demux.stats['timeouts'] == 1
+
+
+@pytest.mark.asyncio
+async def test_ping_echoed_not_delivered(ws_demux):
+    ws, demux = ws_demux
+    ws.push(trnm='PING')
+    ws.push(trnm='CNSRLST', return_code=0)
+
+    assert (await demux.wait(timeout=1.0))['trnm'] == 'CNSRLST'
+    await asyncio.sleep(0)
+    assert ws.sent == [{'trnm': 'PING'}]
+    assert demux.stats['pings'] == 1
+
+
+@pytest.mark.asyncio
+async def test_subscription_stream_and_close(ws_demux):
+    ws, demux = ws_demux
+    queue = demux.subscribe('REAL')
+    for price in (100, 101):
+        ws.push(trnm='REAL', data=[{'values': {'10': price}}])
+    ws.inbox.put_nowait(_Closed('1000 OK'))
+
+    frames = [await asyncio.wait_for(queue.get(), 1.0) for _ in range(3)]
+    assert [f['data'][0]['values']['10'] for f in frames[:2]] == [100, 101]
+    assert frames[2] is None
+
+
+@pytest.mark.asyncio
+async def test_connection_close_fails_pending_request(ws_demux):
+    ws, demux = ws_demux
+    pending = asyncio.create_task(demux.request('CNSRREQ', {'seq': '1'}, seq='1', timeout=5.0))
+    await asyncio.sleep(0)
+    ws.inbox.put_nowait(_Closed('connection lost'))
+
+    with pytest.raises(_Closed):
+        await pending
+    with pytest.raises(_Closed):
+        await demux.wait('LOGIN', timeout=0.1)
@@ -0,0 +1,115 @@
+"""
+tests/unit/test_backtest_engine_arrays.py
+
+BacktestEngine 배열 fast path 동등성 테스트
+
+케이스:
+  1. TP/SL 모드: array_mode=True/False Trade 리스트 동일 (min_hold, TP 없음 포함)
+  2. 스윙 모드: ATR SL/trailing, max_hold 포함 동일
+  3. _atr_array()[i] == _calc_atr(df, i) (전 구간)
+  4. on_trade_complete 콜백 호출 순서/횟수 동일
+  5. signal_mask 입력 == 같은 신호의 signal_func (SMCAdapter.signal_mask 포함)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.engine import BacktestEngine
+
+
+def _frame(seed, n=300):
+    rng = np.random.default_rng(seed)
+    close = np.round(np.exp(np.cumsum(rng.normal(0, 0.02, size=n))) * 10000)
+    open_ = np.round(close * (1 + rng.normal(0, 0.005, size=n)))
+    high = np.maximum(close, open_) * (1 + np.abs(rng.normal(0, 0.01, size=n)))
+    low = np.minimum(close, open_) * (1 - np.abs(rng.normal(0, 0.01, size=n)))
+    idx = pd.date_range('2023-01-01', periods=n)
+    return pd.DataFrame({'open': open_, 'high': high, 'low': low, 'close': close, 'volume': 1000}, index=idx)
+
+
+def _signal_every(k):
+    def _sig(df, i):
+        return 'BUY' if i % k == 0 else None
+    return _sig
+
+
+def _both(df, **kwargs):
+    fast = BacktestEngine(array_mode=True, **kwargs).run(df, 'T').trades
+    slow = BacktestEngine(array_mode=False, **kwargs).run(df, 'T').trades
+    return fast, slow
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("tp,sl,min_hold", [(0.03, -0.02, 0), (0.05, -0.03, 5), (None, -0.02, 0)])
+def test_tp_sl_mode_identical(seed, tp, sl, min_hold):
+    fast, slow = _both(_frame(seed), tp_pct=tp, sl_pct=sl, min_hold_bars=min_hold,
+                       signal_func=_signal_every(7))
+    assert fast == slow
+    assert slow  # 시나리오가 실제 거래를 만들어야 의미 있음
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("atr_kwargs", [{}, {'sl_atr_mult': 1.5, 'trail_atr_mult': 2.0}])
+def test_swing_mode_identical(seed, atr_kwargs):
+    fast, slow = _both(
+        _frame(seed), tp_pct=0.12, sl_pct=-0.03, min_hold_bars=4,
+        trailing_pct=0.05, be_trigger_pct=0.03, max_hold_bars=30, swing_mode=True,
+        signal_func=_signal_every(5), **atr_kwargs,
+    )
+    assert fast == slow
+    assert slow
+
+
+@pytest.mark.parametrize("period", [1, 3, 14])
+def test_atr_array_matches_calc_atr(period):
+    df = _frame(9, n=80)
+    engine = BacktestEngine(atr_period=period)
+    atr = engine._atr_array(df['high'].to_numpy(), df['low'].to_numpy(), df['close'].to_numpy())
+    assert [float(a) for a in atr] == [engine._calc_atr(df, i) for i in range(len(df))]
+
+
+def test_callback_sequence_identical():
+    df = _frame(2)
+    calls = {True: [], False: []}
+    for mode in (True, False):
+        BacktestEngine(
+            signal_func=_signal_every(6), array_mode=mode,
+            on_trade_complete=lambda sym, trade, m=mode: calls[m].append(trade),
+        ).run(df, 'T')
+    assert calls[True] == calls[False]
+
+
+def _mask_every(k, n):
+    mask = np.zeros(n, dtype=bool)
+    mask[::k] = True
+    return mask
+
+
+@pytest.mark.parametrize("array_mode", [True, False])
+@pytest.mark.parametrize("swing", [False, True])
+def test_signal_mask_matches_signal_func(array_mode, swing):
+    df = _frame(4)
+    kwargs = dict(tp_pct=0.05, sl_pct=-0.03, min_hold_bars=3, swing_mode=swing, array_mode=array_mode)
+    by_func = BacktestEngine(signal_func=_signal_every(9), **kwargs).run(df, 'T').trades
+    by_mask = BacktestEngine(**kwargs).run(df, 'T', signal_mask=_mask_every(9, len(df))).trades
+    assert by_mask == by_func
+    assert by_func
+
+
+def test_signal_mask_length_checked():
+    df = _frame(0, n=50)
+    with pytest.raises(ValueError):
+        BacktestEngine().run(df, 'T', signal_mask=np.zeros(49, dtype=bool))
+
+
+def test_adapter_signal_mask_matches_get_signal():
+    from backtest.adapter import SMCAdapter
+    df = _frame(6, n=400)
+    adapter = SMCAdapter({'swing_lookback': 2}, require_sweep=False)
+    expected = [adapter.get_signal(df, i) == 'BUY' for i in range(len(df))]
+    assert adapter.signal_mask(df).tolist() == expected
@@ -0,0 +1,66 @@
+"""
+tests/unit/test_backtest_parallel.py
+
+그리드 서치 병렬 실행 테스트
+
+케이스:
+  1. SharedArrays → attach_arrays 값/dtype/shape 동일 (공유 메모리 view)
+  2. from_frames → attach_frames DataFrame 동일 (tz-aware 인덱스 포함)
+  3. run_grid_search(workers=2) 결과/on_progress 순서 == workers=1 (tp_sl, swing)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import runner
+from backtest.parallel import SharedArrays, attach_arrays, attach_frames
+
+
+def _frame(seed, n=260, tz=None):
+    rng = np.random.default_rng(seed)
+    close = np.round(np.exp(np.cumsum(rng.normal(0, 0.02, size=n))) * 10000)
+    open_ = np.round(close * (1 + rng.normal(0, 0.005, size=n)))
+    high = np.maximum(close, open_) * (1 + np.abs(rng.normal(0, 0.01, size=n)))
+    low = np.minimum(close, open_) * (1 - np.abs(rng.normal(0, 0.01, size=n)))
+    volume = rng.integers(1_000, 50_000, size=n).astype(float)
+    idx = pd.date_range('2023-01-01', periods=n, tz=tz)
+    return pd.DataFrame({'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume}, index=idx)
+
+
+def test_shared_arrays_roundtrip():
+    arrays = {'a': np.arange(10, dtype=np.int64), 'b': np.ones((3, 7), dtype=bool)}
+    with SharedArrays(arrays) as shared:
+        out = attach_arrays(shared.manifest)
+        for key, arr in arrays.items():
+            assert out[key].dtype == arr.dtype
+            np.testing.assert_array_equal(out[key], arr)
+
+
+def test_shared_frames_roundtrip():
+    frames = {'A': _frame(0), 'B': _frame(1, n=40, tz='Asia/Seoul')}
+    with SharedArrays.from_frames(frames) as shared:
+        out = attach_frames(shared.manifest)
+        for symbol, df in frames.items():
+            pd.testing.assert_frame_equal(out[symbol], df, check_freq=False)
+
+
+@pytest.mark.parametrize("mode", ['tp_sl', 'swing'])
+def test_parallel_grid_matches_sequential(monkeypatch, mode):
+    data = {f'S{i}': _frame(i) for i in range(3)}
+    monkeypatch.setattr(runner, 'load_multi', lambda *a, **k: data)
+    kwargs = dict(strategy='B', mode=mode, tp_range=[0.05, 0.08], sl_range=[0.02, 0.03])
+    if mode == 'swing':
+        kwargs.update(min_hold_range=[2], trailing_range=[0.05], be_trigger_range=[0.03, 0.06])
+
+    out = {}
+    for workers in (1, 2):
+        progress = []
+        rows = runner.run_grid_search(workers=workers, on_progress=lambda *x: progress.append(x), **kwargs)
+        out[workers] = (rows, progress)
+    assert out[2] == out[1]
+    assert out[1][0]
@@ -0,0 +1,94 @@
+"""
+tests/unit/test_bar_store.py
+
+MinuteBarStore 꼬리 병합 테스트
+
+케이스:
+  1. 최초 적재: 최신→과거 응답 → 오름차순 DataFrame, 부호 제거
+  2. 진행 중인 마지막 봉 갱신 + 신규 봉 추가 (과거 행 파싱 생략)
+  3. 용량 초과 시 가장 오래된 봉 덮어쓰기
+  4. 연속성 확인 불가 응답 → 전체 재적재
+  5. retain() 으로 이탈 종목 정리
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.bar_store import MinuteBarStore, BarRingBuffer
+
+
+def _row(ts, close, vol=100):
+    return {
+        'cntr_tm': str(ts),
+        'cur_prc': f"-{close}",
+        'open_pric': f"+{close}",
+        'high_pric': str(close + 10),
+        'low_pric': str(close - 10),
+        'trde_qty': str(vol),
+    }
+
+
+def _rows(start_ts, closes):
+    """오름차순 closes → 키움 응답 순서(최신→과거)."""
+    rows = [_row(start_ts + i * 500, c) for i, c in enumerate(closes)]
+    return rows[::-1]
+
+
+def test_initial_load_sorted_and_abs():
+    store = MinuteBarStore(capacity=10)
+    changed = store.merge_chart_rows("005930", "5", _rows(20260109090000, [100, 110, 120]))
+    df = store.get_frame("005930", "5")
+
+    assert changed == 3
+    assert list(df['close']) == [100.0, 110.0, 120.0]
+    assert list(df['open']) == [100.0, 110.0, 120.0]
+    assert list(df['cntr_tm']) == [20260109090000, 20260109090500, 20260109091000]
+    assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume', 'cntr_tm']
+
+
+def test_update_last_and_append_tail():
+    store = MinuteBarStore(capacity=10)
+    store.merge_chart_rows("005930", "5", _rows(20260109090000, [100, 110, 120]))
+    # 마지막 봉(09:10) 갱신 + 09:15 신규
+    changed = store.merge_chart_rows("005930", "5", _rows(20260109090000, [100, 110, 125, 130]))
+    df = store.get_frame("005930", "5")
+
+    assert changed == 2
+    assert list(df['close']) == [100.0, 110.0, 125.0, 130.0]
+    assert store.stats['skipped_rows'] == 2
+
+
+def test_ring_overwrites_oldest():
+    store = MinuteBarStore(capacity=3)
+    store.merge_chart_rows("A", "5", _rows(20260109090000, [1, 2, 3, 4, 5]))
+    df = store.get_frame("A", "5")
+
+    assert list(df['close']) == [3.0, 4.0, 5.0]
+
+
+def test_gap_triggers_rebuild():
+    store = MinuteBarStore(capacity=10)
+    store.merge_chart_rows("A", "5", _rows(20260109090000, [1, 2]))
+    store.merge_chart_rows("A", "5", _rows(20260110090000, [7, 8]))
+    df = store.get_frame("A", "5")
+
+    assert list(df['close']) == [7.0, 8.0]
+    assert store.stats['rebuilds'] == 1
+
+
+def test_retain_drops_stale_symbols():
+    store = MinuteBarStore(capacity=10)
+    store.merge_chart_rows("A", "5", _rows(20260109090000, [1]))
+    store.merge_chart_rows("B", "5", _rows(20260109090000, [1]))
+
+    assert store.retain({"A"}) == 1
+    assert store.get_frame("B", "5") is None
+    assert ("A", "5") in store
+
+
+def test_ring_buffer_rejects_older_bar():
+    buf = BarRingBuffer(capacity=4)
+    assert buf.upsert(2, [1, 1, 1, 1, 1])
+    assert not buf.upsert(1, [9, 9, 9, 9, 9])
+    assert buf.last_time == 2
@@ -0,0 +1,170 @@
+"""
+tests/unit/test_chart_downloader.py
+
+core.chart_downloader.ChartDownloader 테스트 (가짜 비동기 API — 페이지 스크립트)
+
+케이스:
+  1. 연속조회 끝까지 → 완료 파일 1개 (zstd, 시간 오름차순, since 이전 봉 제외), 작업 디렉토리 정리
+  2. 파이프라인: 페이지 N 기록 전에 N+1 요청이 이미 발행됨
+  3. 중간 실패 → 상태 유지, 재실행 시 저장된 next_key 부터 이어받아 완성
+  4. 증분: 완료 파일의 최신 봉까지만 받고 병합 (겹친 봉은 새 값)
+  5. 페이지 상한 → 받은 분량 병합 + 이어받기 위치 유지, 다음 실행(since 변경 포함)에서 과거 구간 완성
+  6. 여러 종목 동시 다운로드
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import asyncio
+from datetime import datetime
+
+import pyarrow.parquet as pq
+import pytest
+
+from core.chart_downloader import ChartDownloader, bars_path, load_bars, parse_rows
+
+SINCE = datetime(2026, 10, 16, 9, 0)
+
+
+def _row(minute, price):
+    return {'cntr_tm': f'20261016{9 + minute // 60:02d}{minute % 60:02d}00', 'cur_prc': f'-{price}',
+            'open_pric': str(price), 'high_pric': str(price + 1), 'low_pric': str(price - 1),
+            'trde_qty': '10'}
+
+
+class FakeChartAPI:
+    """최신 → 과거 순 페이지 (page_size 봉씩), next_key = 다음 페이지 번호"""
+
+    def __init__(self, minutes=10, page_size=3, first_minute=-2, fail_at=None, price=100, delay=0.0):
+        self.rows = [_row(m, price + m) for m in range(minutes - 1, first_minute - 1, -1)]
+        self.page_size = page_size
+        self.fail_at = fail_at
+        self.delay = delay
+        self.calls = []
+        self.events = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get_minute_chart(self, stock_code, tic_scope="1", upd_stkpc_tp="1", cont_yn="N", next_key=""):
+        page = int(next_key) if cont_yn == 'Y' else 0
+        self.calls.append((stock_code, cont_yn, page))
+        self.events.append(('fetch', page))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if page == self.fail_at:
+            return {'return_code': -1, 'data': []}
+        chunk = self.rows[page * self.page_size:(page + 1) * self.page_size]
+        more = (page + 1) * self.page_size < len(self.rows)
+        return {'return_code': 0, 'stk_min_pole_chart_qry': chunk,
+                'next_key': str(page + 1) if more else '', 'cont_yn': 'Y' if more else 'N'}
+
+
+def test_parse_rows_columns():
+    cols = parse_rows([_row(0, 100), {'cntr_tm': '', 'cur_prc': '1'}, _row(1, 101)])
+    assert cols['ts'].tolist() == [20261016090000, 20261016090100]
+    assert cols['close'].tolist() == [100.0, 101.0]
+
+
+@pytest.mark.asyncio
+async def test_full_download_compacts(tmp_path):
+    api = FakeChartAPI()
+    result = await ChartDownloader(api, root=tmp_path).download('005930', SINCE)
+
+    assert result['status'] == 'done'
+    path = bars_path('005930', '1', tmp_path)
+    meta = pq.ParquetFile(path).metadata
+    assert meta.row_group(0).column(0).compression == 'ZSTD'
+    df = load_bars('005930', '1', tmp_path)
+    assert len(df) == 10
+    assert df.index.is_monotonic_increasing
+    assert df.index[0] == SINCE
+    assert df['close'].iloc[-1] == 109.0
+    assert not (tmp_path / '1' / '005930').exists()
+
+
+@pytest.mark.asyncio
+async def test_next_page_requested_before_commit(tmp_path):
+    api = FakeChartAPI(delay=0.01)
+    downloader = ChartDownloader(api, root=tmp_path)
+    commit = downloader._commit_page
+
+    def tracking_commit(work, state, cols, next_key):
+        api.events.append(('commit', state['pages']))
+        commit(work, state, cols, next_key)
+
+    downloader._commit_page = tracking_commit
+    await downloader.download('005930', SINCE)
+    assert api.events.index(('fetch', 1)) < api.events.index(('commit', 0))
+    assert api.events.index(('fetch', 2)) < api.events.index(('commit', 1))
+
+
+@pytest.mark.asyncio
+async def test_resume_after_failure(tmp_path):
+    api = FakeChartAPI(fail_at=2)
+    downloader = ChartDownloader(api, root=tmp_path)
+    first = await downloader.download('005930', SINCE)
+    assert first['status'] == 'error'
+    assert first['pages'] == 2
+    assert not bars_path('005930', '1', tmp_path).exists()
+
+    api.fail_at = None
+    api.calls.clear()
+    second = await downloader.download('005930', SINCE)
+    assert second['status'] == 'done' and second['resumed']
+    assert api.calls[0] == ('005930', 'Y', 2)
+    assert len(load_bars('005930', '1', tmp_path)) == 10
+
+
+@pytest.mark.asyncio
+async def test_incremental_merge(tmp_path):
+    await ChartDownloader(FakeChartAPI(minutes=6), root=tmp_path).download('005930', SINCE)
+
+    api = FakeChartAPI(minutes=10, price=200)
+    result = await ChartDownloader(api, root=tmp_path).download('005930', SINCE)
+    assert result['status'] == 'done'
+    assert [c[2] for c in api.calls[:2]] == [0, 1]
+    assert len(api.calls) <= 3                  # 09:05 (기존 최신 봉) 페이지까지 + 선행 요청 1건
+
+    df = load_bars('005930', '1', tmp_path)
+    assert len(df) == 10
+    assert df['close'].iloc[0] == 100.0         # 기존 봉 유지
+    assert df['close'].iloc[5] == 205.0         # 겹친 봉은 새 값
+    assert df['close'].iloc[-1] == 209.0
+
+
+@pytest.mark.asyncio
+async def test_max_pages_keeps_cursor_for_backfill(tmp_path):
+    api = FakeChartAPI()
+    first = await ChartDownloader(api, root=tmp_path, max_pages=2).download('005930', SINCE)
+    assert first['status'] == 'max_pages'
+    df = load_bars('005930', '1', tmp_path)
+    assert len(df) == 6 and df.index[0] == datetime(2026, 10, 16, 9, 4)
+    assert (tmp_path / '1' / '005930' / 'state.json').exists()
+    assert not list((tmp_path / '1' / '005930').glob('part_*.parquet'))
+
+    api.calls.clear()
+    other = SINCE.replace(hour=8)               # CLI --days 재실행처럼 since 가 달라져도 이어받음
+    second = await ChartDownloader(api, root=tmp_path, max_pages=2).download('005930', other)
+    assert second['status'] == 'done' and second['resumed']
+    assert api.calls[0] == ('005930', 'Y', 2)
+    df = load_bars('005930', '1', tmp_path)
+    assert len(df) == 10 and df.index[0] == SINCE
+    assert not (tmp_path / '1' / '005930').exists()
+
+
+@pytest.mark.asyncio
+async def test_download_many_concurrent(tmp_path):
+    api = FakeChartAPI(delay=0.01)
+    downloader = ChartDownloader(api, root=tmp_path, concurrency=3)
+    symbols = ['005930', '000660', '035420', '051910']
+    results = await downloader.download_many(symbols + ['005930'], SINCE)
+
+    assert set(results) == set(symbols)
+    assert all(r['status'] == 'done' for r in results.values())
+    assert api.max_active > 1
+    assert all(len(load_bars(s, '1', tmp_path)) == 10 for s in symbols)
@@ -0,0 +1,135 @@
+"""
+tests/unit/test_dashboard_db.py
+
+database.dashboard_db 연결 풀 / prepared statement / trades 버전 캐시 테스트 (가짜 풀 사용)
+
+케이스:
+  1. statement 는 연결당 1회 PREPARE, 이후 EXECUTE 만
+  2. trades 버전이 같으면 캐시 반환, 바뀌면 재조회
+  3. 캐시 대상이 아닌 statement (account_snapshot) 는 매번 조회
+  4. invalidate() 후 즉시 재조회, 연결 끊김 시 연결 폐기
+  5. run() 은 이벤트 루프 밖 전용 스레드에서 실행
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import asyncio
+import threading
+
+import psycopg2
+import pytest
+
+from database.dashboard_db import DashboardDB
+
+
+class _Cursor:
+    def __init__(self, server):
+        self.server = server
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.server.log.append(sql.split()[0] + ' ' + sql.split()[1])
+        if self.server.fail:
+            raise psycopg2.OperationalError('server closed the connection')
+        if sql.startswith('EXECUTE trades_version'):
+            self._rows = [self.server.version]
+        elif sql.startswith('EXECUTE'):
+            self._rows = [(sql.split()[1], params)]
+
+    def fetchall(self):
+        return self._rows
+
+
+class _Conn:
+    def __init__(self, server):
+        self.server = server
+        self.prepared = set()
+        self.autocommit = True
+        self.closed = 0
+
+    def cursor(self):
+        return _Cursor(self.server)
+
+
+class FakePool:
+    def __init__(self):
+        self.version = (10, 100)
+        self.fail = False
+        self.log = []
+        self.idle = []
+        self.discarded = 0
+
+    def getconn(self):
+        return self.idle.pop() if self.idle else _Conn(self)
+
+    def putconn(self, conn, close=False):
+        if close:
+            self.discarded += 1
+        else:
+            self.idle.append(conn)
+
+
+@pytest.fixture
+def server():
+    return FakePool()
+
+
+@pytest.fixture
+def db(server):
+    return DashboardDB(max_conn=2, version_ttl=0.0, pool_factory=lambda: server)
+
+
+def test_prepare_once_per_connection(db, server):
+    for _ in range(3):
+        db.query('account_snapshot_latest')
+    assert server.log.count('PREPARE account_snapshot_latest') == 1
+    assert server.log.count('EXECUTE account_snapshot_latest') == 3
+    assert db.stats['prepares'] == 1
+
+
+def test_cache_follows_trades_version(db, server):
+    first = db.query('trades_range', '2026-04-01', '2026-04-24')
+    assert db.query('trades_range', '2026-04-01', '2026-04-24') is first
+    assert server.log.count('EXECUTE trades_range') == 1
+
+    db.query('trades_range', '2026-04-02', '2026-04-24')     # 인자가 다르면 별도 항목
+    assert server.log.count('EXECUTE trades_range') == 2
+
+    server.version = (11, 101)                               # 새 거래 적재
+    db.query('trades_range', '2026-04-01', '2026-04-24')
+    assert server.log.count('EXECUTE trades_range') == 3
+    assert db.stats['hits'] == 1 and db.stats['invalidations'] == 1
+
+
+def test_version_check_throttled(server):
+    db = DashboardDB(version_ttl=60.0, pool_factory=lambda: server)
+    db.query('trade_ledger')
+    server.version = (11, 101)
+    db.query('trade_ledger')
+    assert server.log.count('EXECUTE trades_version') == 1
+    assert server.log.count('EXECUTE trade_ledger') == 1
+
+
+def test_invalidate_and_broken_connection(db, server):
+    db.query('trade_ledger')
+    db.invalidate()
+    db.query('trade_ledger')
+    assert server.log.count('EXECUTE trade_ledger') == 2
+
+    server.fail = True
+    with pytest.raises(psycopg2.OperationalError):
+        db.query('account_snapshot_latest')
+    assert server.discarded == 1
+
+
+def test_run_uses_db_executor(db):
+    loop_thread = threading.current_thread().name
+
+    async def _main():
+        return await db.run(lambda: threading.current_thread().name)
+
+    name = asyncio.run(_main())
+    db.close()
+    assert name.startswith('dashboard-db') and name != loop_thread
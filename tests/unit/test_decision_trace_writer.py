@@ -0,0 +1,165 @@
+"""
+tests/unit/test_decision_trace_writer.py
+
+database.decision_trace 백그라운드 배치 writer 테스트 (DB 없이 가짜 연결 사용)
+
+케이스:
+  1. batch_size 단위 다중행 execute_values, key 별 묶음 + 적재 순서 유지
+  2. DB 장애 → spill 파일(JSONL) 기록, 복구 후 신규 행보다 먼저 재적재
+  3. 큐 포화 → 호출 스레드에서 바로 spill, queue_full 집계
+  4. 데이터 오류 행만 버리고 나머지는 기록 (savepoint 행 단위 재시도)
+  5. record_filter_stage / insert_blocked_trade / log_strategy_change 는 DB 연결 없이 큐 적재만
+     (created_at = 적재 시각 → spill 재적재 후에도 이벤트 시각 유지)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import json
+from contextlib import contextmanager
+from datetime import datetime
+
+import psycopg2
+import psycopg2.extras
+import pytest
+
+from database import decision_trace as dt
+
+
+class _Cursor:
+    def __init__(self, log):
+        self.log = log
+
+    def execute(self, sql, params=None):
+        self.log.append(('sql', sql.strip()))
+
+
+class _Conn:
+    def __init__(self, log):
+        self.log = log
+
+    def cursor(self):
+        return _Cursor(self.log)
+
+
+class FakeDB:
+    """_pooled 대체 — down=True 면 연결 단계에서 OperationalError, bad_ids 첫 컬럼 행은 DataError."""
+
+    def __init__(self):
+        self.down = False
+        self.bad_ids = set()
+        self.log = []
+        self.rows = []
+
+    @contextmanager
+    def connect(self):
+        if self.down:
+            raise psycopg2.OperationalError('connection refused')
+        yield _Conn(self.log)
+
+    def execute_values(self, cur, sql, rows, template=None, page_size=100):
+        if any(r[0] in self.bad_ids for r in rows):
+            raise psycopg2.DataError('bad row')
+        key = next(k for k, (s, _) in dt._STATEMENTS.items() if s == sql)
+        self.log.append(('values', key, len(rows)))
+        self.rows.extend((key, tuple(r)) for r in rows)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = FakeDB()
+    monkeypatch.setattr(psycopg2.extras, 'execute_values', fake.execute_values)
+    return fake
+
+
+@pytest.fixture
+def writer(db, tmp_path):
+    w = dt._TraceWriter(connect=db.connect, spill_path=tmp_path / 'spill.jsonl',
+                        batch_size=50, flush_interval=0.05)
+    yield w
+    w.close(timeout=2)
+
+
+def _row(i):
+    return ('filter_stage', (i, 1, f'{i:06d}', 'name', True, None, None, None, None, [], None))
+
+
+def test_batches_by_size_and_key(writer, db):
+    for i in range(120):
+        writer.put(*_row(i))
+        if i % 40 == 0:
+            writer.put('strategy_change', ('SMC', f'p{i}', '1', '2', 'threshold_change', None, None, None))
+    assert writer.flush(timeout=5)
+
+    stage_rows = [r for k, r in db.rows if k == 'filter_stage']
+    assert [r[0] for r in stage_rows] == list(range(120))
+    assert len([r for k, r in db.rows if k == 'strategy_change']) == 3
+    assert all(n <= 50 for _, _, n in (e for e in db.log if e[0] == 'values'))
+    stats = writer.snapshot()
+    assert stats['written'] == 123 and stats['enqueued'] == 123
+    assert stats['batches'] < 123 and stats['queue_depth'] == 0
+
+
+def test_spill_when_db_down_then_replay_first(writer, db, monkeypatch):
+    monkeypatch.setattr(dt, '_RETRY_SEC', 0.0)
+    db.down = True
+    for i in range(5):
+        writer.put(*_row(i))
+    assert writer.flush(timeout=5)
+
+    lines = writer.spill_path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['row'][0] for line in lines] == list(range(5))
+    assert writer.snapshot()['spilled'] == 5 and not db.rows
+
+    db.down = False
+    writer.put(*_row(99))
+    assert writer.flush(timeout=5)
+
+    assert [r[0] for _, r in db.rows] == [0, 1, 2, 3, 4, 99]
+    assert not writer.spill_path.exists() and not writer._replay_path.exists()
+    assert writer.snapshot()['replayed'] == 5
+
+
+def test_queue_full_spills_on_caller(db, tmp_path):
+    w = dt._TraceWriter(connect=db.connect, spill_path=tmp_path / 'spill.jsonl', maxsize=1)
+    w._thread = object()    # 소비자 미기동 → 큐가 그대로 참
+    w.put(*_row(0))
+    w.put(*_row(1))
+    assert w.stats['queue_full'] == 1 and w.stats['spilled'] == 1
+    assert json.loads(w.spill_path.read_text(encoding='utf-8'))['row'][0] == 1
+
+
+def test_bad_row_dropped_rest_written(writer, db):
+    db.bad_ids.add(3)
+    for i in range(6):
+        writer.put(*_row(i))
+    assert writer.flush(timeout=5)
+
+    assert [r[0] for _, r in db.rows] == [0, 1, 2, 4, 5]
+    assert writer.snapshot()['dropped'] == 1
+    assert ('sql', 'ROLLBACK TO SAVEPOINT dtrace_batch') in db.log
+
+
+def test_fire_and_forget_functions_only_enqueue(monkeypatch):
+    queued = []
+    monkeypatch.setattr(dt._writer, 'put', lambda key, row: queued.append((key, row)))
+    monkeypatch.setattr(dt, '_get_conn', lambda: pytest.fail('DB 연결 시도'))
+
+    dt.record_filter_stage(7, 2, '005930', '삼성전자', False, ['RVOL_LOW'], {'news': 1.0})
+    dt.record_filter_stage(None, 2, '005930', '삼성전자', False)
+    before = datetime.now()
+    dt.insert_blocked_trade('005930', '삼성전자', 'ML_BLOCK', None, 70000.0, entry_type='breakout')
+    dt.log_strategy_change('SMC', 'min_rr', 1.5, 2.0)
+
+    assert [k for k, _ in queued] == ['filter_stage', 'blocked_trade', 'strategy_change']
+    assert queued[0][1][:5] == (7, 2, '005930', '삼성전자', False)
+    assert queued[0][1][9] == ['RVOL_LOW']
+    assert queued[1][1][2] == 'ML_BLOCK' and queued[1][1][9] == 'breakout'
+    assert queued[2][1][:4] == ('SMC', 'min_rr', '1.5', '2.0')
+    # 적재 시각을 행에 담아 INSERT 컬럼과 개수 일치 (DB 기본값 = 재적재 시각이 되지 않도록)
+    for key, row in queued[1:]:
+        assert before <= row[-1] <= datetime.now()
+        columns = dt._STATEMENTS[key][0].split('(', 1)[1].split(')', 1)[0]
+        assert [c.strip() for c in columns.split(',')][-1] == 'created_at'
+        assert len(columns.split(',')) == len(row)
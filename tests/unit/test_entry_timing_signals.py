@@ -0,0 +1,154 @@
+"""
+tests/unit/test_entry_timing_signals.py
+
+EntryTimingAnalyzer.generate_signals 벡터화 동등성 테스트
+
+기준: 벡터화 이전 행 단위 루프 구현(_reference_generate_signals, 아래에 그대로 보존)
+데이터: data/raw/396500_KS_5m.csv (키움 5분봉 기록) 일자별 프레임 + 2일 연속 프레임
+
+케이스:
+  1. 기록 프레임 × 필터 조합 × 돌파 확인 캔들 수 → signal / 부가 컬럼(ma, volume_ma, amount, williams_r) 동일
+  2. 완화 모드(vwap_cross_only=False) + 허용 오차 + NaN 섞인 프레임 동일
+  3. 매수 후보가 없으면 amount 컬럼을 추가하지 않음 (기존 동작)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import itertools
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.entry_timing_analyzer import EntryTimingAnalyzer
+
+RECORDED = Path(__file__).resolve().parents[2] / 'data' / 'raw' / '396500_KS_5m.csv'
+
+
+def _reference_generate_signals(self, df, use_trend_filter=True, use_volume_filter=True,
+                                use_breakout_confirm=True, use_volume_value_filter=True,
+                                trend_period=20, volume_multiplier=1.2, vwap_tolerance_pct=0.0,
+                                ma_tolerance_pct=0.0, vwap_cross_only=True,
+                                use_williams_r_filter=False, williams_r_period=14,
+                                williams_r_long_ceiling=-20.0):
+    """벡터화 이전 generate_signals (시장/일봉 필터 제외 — 두 구현 공통 전처리)"""
+    df['signal'] = 0
+    if use_trend_filter:
+        df['ma'] = df['close'].rolling(window=trend_period).mean()
+        uptrend = df['close'] > df['ma']
+        downtrend = df['close'] < df['ma']
+    else:
+        uptrend = True
+        downtrend = True
+    if use_volume_filter:
+        df['volume_ma'] = df['volume'].rolling(window=20).mean()
+        vol_ma = df['volume_ma'].fillna(df['volume'])
+        volume_surge = df['volume'] > (vol_ma * float(volume_multiplier))
+    else:
+        volume_surge = True
+    if use_williams_r_filter:
+        wr_col = f'williams_r_{williams_r_period}'
+        if wr_col not in df.columns:
+            df = self.calculate_williams_r(df, period=williams_r_period)
+    else:
+        wr_col = None
+    vwap_tol = float(vwap_tolerance_pct) / 100.0
+    ma_tol = float(ma_tolerance_pct) / 100.0
+
+    for idx in range(1, len(df)):
+        current = df.iloc[idx]
+        previous = df.iloc[idx - 1]
+        if vwap_cross_only:
+            vwap_ok = (previous['close'] < previous['vwap']) and (current['close'] > current['vwap'])
+        else:
+            vwap_ok = (
+                current['close'] >= current['vwap'] * (1.0 - vwap_tol)
+                or ((previous['close'] < previous['vwap']) and (current['close'] > current['vwap']))
+            )
+        if use_trend_filter:
+            ma_val_curr = uptrend.iloc[idx] if isinstance(uptrend, pd.Series) else None
+            if ma_val_curr is not None and isinstance(ma_val_curr, (int, float)):
+                trend_ok = current['close'] >= ma_val_curr * (1.0 - ma_tol)
+            else:
+                trend_ok = bool(uptrend.iloc[idx] if isinstance(uptrend, pd.Series) else uptrend)
+        else:
+            trend_ok = True
+
+        if (vwap_ok and trend_ok and
+                (volume_surge.iloc[idx] if isinstance(volume_surge, pd.Series) else volume_surge)):
+            filters_passed = True
+            if use_williams_r_filter and wr_col:
+                if current[wr_col] >= williams_r_long_ceiling:
+                    filters_passed = False
+            if use_breakout_confirm:
+                if not self.confirm_breakout(df, idx):
+                    filters_passed = False
+            if use_volume_value_filter:
+                if 'amount' not in df.columns:
+                    df.loc[:, 'amount'] = df['close'] * df['volume']
+                if not self.check_volume_value(df, idx):
+                    filters_passed = False
+            if filters_passed:
+                df.loc[idx, 'signal'] = 1
+        elif (current['close'] < current['vwap'] and
+              previous['close'] > previous['vwap'] and
+              (downtrend.iloc[idx] if isinstance(downtrend, pd.Series) else downtrend) and
+              (volume_surge.iloc[idx] if isinstance(volume_surge, pd.Series) else volume_surge)):
+            df.loc[idx, 'signal'] = -1
+    return df
+
+
+def _recorded_frames():
+    raw = pd.read_csv(RECORDED)
+    days = [g.reset_index(drop=True) for _, g in raw.groupby(raw['Datetime'].str[:10])]
+    return days[:3] + [pd.concat(days[8:10], ignore_index=True)]     # 다일 프레임 (일자 경계 포함)
+
+
+def _assert_same(analyzer, frame, rolling=True, **kwargs):
+    base = analyzer.calculate_vwap(frame.copy(), use_rolling=rolling)
+    expected = _reference_generate_signals(analyzer, base.copy(), **kwargs)
+    actual = analyzer.generate_signals(base.copy(), **kwargs)
+    pd.testing.assert_frame_equal(actual, expected)
+    return actual
+
+
+FLAGS = ('use_trend_filter', 'use_volume_filter', 'use_breakout_confirm',
+         'use_volume_value_filter', 'use_williams_r_filter')
+
+
+@pytest.mark.parametrize('confirm, rolling', [(1, True), (2, True), (3, False)])
+def test_recorded_frames_equivalent(confirm, rolling):
+    analyzer = EntryTimingAnalyzer(breakout_confirm_candles=confirm, min_volume_value=5e8)
+    nonzero = 0
+    for frame in _recorded_frames():
+        for combo in itertools.product((True, False), repeat=len(FLAGS)):
+            result = _assert_same(analyzer, frame, rolling=rolling, **dict(zip(FLAGS, combo)))
+            nonzero += int((result['signal'] != 0).sum())
+    assert nonzero > 0      # 시그널이 실제로 나오는 조합이 포함됨
+
+
+@pytest.mark.parametrize('cross_only', [True, False])
+def test_relaxed_mode_with_gaps(cross_only):
+    rng = np.random.default_rng(3)
+    n = 300
+    close = 10000 + np.cumsum(rng.normal(0, 30, n))
+    frame = pd.DataFrame({'open': close, 'high': close + 20, 'low': close - 20, 'close': close,
+                          'volume': rng.integers(1000, 200000, n).astype(float)})
+    frame.loc[[5, 77, 150], 'close'] = np.nan
+    frame.loc[[40, 41], 'volume'] = np.nan
+    analyzer = EntryTimingAnalyzer(min_volume_value=1e8)
+    for tol, vol_mult in ((0.0, 1.2), (0.5, 1.0), (1.0, 0.8)):
+        _assert_same(analyzer, frame, vwap_cross_only=cross_only, vwap_tolerance_pct=tol,
+                     volume_multiplier=vol_mult, use_williams_r_filter=True)
+
+
+def test_amount_column_only_with_buy_candidates():
+    frame = pd.DataFrame({'open': 100.0, 'high': 101.0, 'low': 99.0,
+                          'close': np.linspace(100, 90, 60), 'volume': 1000.0})
+    analyzer = EntryTimingAnalyzer()
+    result = _assert_same(analyzer, frame)
+    assert 'amount' not in result.columns
+    assert (result['signal'] == 0).all()
@@ -0,0 +1,162 @@
+"""
+tests/unit/test_event_journal.py
+
+core/event_journal.py 이벤트 저널 테스트
+
+케이스:
+  1. emit → read_events 왕복 (타입/필드/ts 보존, 빠진 필드 기본값)
+  2. 타입 필터 / 종목 필터
+  3. 잘린 마지막 레코드 무시
+  4. 필드 추가 이전 레코드 → 없는 필드 None
+  5. 일자별 파일 분리 + read_range
+  6. analysis.log_analyzer.parse_journal_events 변환
+  7. 레벨이 섞인 저널 → 로그 파서와 같이 L0 REJECT 만 집계 (log_analyzer / reject_preentry_v3)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import struct
+from datetime import date, datetime
+
+from core.event_journal import (
+    EVENT_SCHEMAS,
+    EventJournal,
+    journal_path,
+    read_events,
+    read_range,
+)
+
+
+DAY = date(2026, 3, 20)
+
+
+def _ts(hhmmss, day=DAY):
+    return datetime.combine(day, datetime.strptime(hhmmss, '%H%M%S').time()).timestamp()
+
+
+def test_roundtrip(tmp_path):
+    journal = EventJournal(tmp_path)
+    assert journal.emit('ACCEPT', ts=_ts('100029'), stock_code='015260', price=954,
+                        conf=0.51, alpha=1.63, pos_mult=0.61)
+    assert journal.emit('GATE_BLOCK', ts=_ts('100100'), stock_code='005930',
+                        stock_name='삼성전자', tag='LSG_BLOCK', detail='conf=0.40<0.55')
+    journal.close()
+
+    events = read_events(DAY, directory=tmp_path)
+    assert [e['type'] for e in events] == ['ACCEPT', 'GATE_BLOCK']
+    accept = events[0]
+    assert (accept['stock_code'], accept['price'], accept['pos_mult']) == ('015260', 954, 0.61)
+    assert accept['ts'] == _ts('100029')
+    assert events[1]['stock_name'] == '삼성전자'
+    assert events[1]['entry_reason'] == ''
+    assert journal.stats['events'] == 2
+
+
+def test_type_and_symbol_filter(tmp_path):
+    journal = EventJournal(tmp_path)
+    journal.emit('REJECT', ts=_ts('091420'), stock_code='327260', level='L0', reason='진입 시간 외')
+    journal.emit('CHOCH', ts=_ts('103514'), stock_code='036930', direction='bullish',
+                 level=64100, wick=76600, close=75800, penetration=19.5)
+    journal.emit('REJECT', ts=_ts('103600'), stock_code='232680', level='L3', reason='MTF')
+    journal.close()
+
+    rejects = read_events(DAY, types=('REJECT',), directory=tmp_path)
+    assert [e['stock_code'] for e in rejects] == ['327260', '232680']
+    assert read_events(DAY, stock_code='036930', directory=tmp_path)[0]['level'] == 64100
+    assert read_events(date(2026, 3, 21), directory=tmp_path) == []
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    journal = EventJournal(tmp_path)
+    journal.emit('SELL', ts=_ts('140000'), stock_code='005930', price=71000, quantity=3,
+                 pnl_pct=-1.2, exit_reason='Hard Stop', hold_seconds=600)
+    journal.emit('SELL', ts=_ts('140500'), stock_code='000660', price=200000, quantity=1)
+    journal.close()
+
+    path = journal_path(DAY, tmp_path)
+    raw = path.read_bytes()
+    path.write_bytes(raw[:-5])
+    events = read_events(DAY, directory=tmp_path)
+    assert len(events) == 1
+    assert events[0]['hold_seconds'] == 600
+
+
+def test_record_without_new_fields(tmp_path):
+    # MKT_CTX 필드 2개(status, summary)만 있던 시절의 레코드
+    type_id = EVENT_SCHEMAS['MKT_CTX'][0]
+    payload = b''
+    for text in ('NO_TRADE_DAY', 'KOSPI❌'):
+        raw = text.encode('utf-8')
+        payload += struct.pack('<H', len(raw)) + raw
+    record = struct.pack('<IBd', len(payload), type_id, _ts('093026')) + payload
+    tmp_path.joinpath('events_20260320.bin').write_bytes(record)
+
+    (event,) = read_events(DAY, directory=tmp_path)
+    assert event['status'] == 'NO_TRADE_DAY'
+    assert event['atr_mode'] is None
+
+
+def test_daily_files_and_range(tmp_path):
+    journal = EventJournal(tmp_path)
+    journal.emit('BUY', ts=_ts('100000'), stock_code='005930', price=71000, quantity=3)
+    journal.emit('BUY', ts=_ts('100000', date(2026, 3, 23)), stock_code='000660', price=1, quantity=1)
+    journal.close()
+
+    assert journal_path(DAY, tmp_path).exists()
+    days = [(d, len(evs)) for d, evs in read_range(DAY, date(2026, 3, 23), directory=tmp_path)]
+    assert days == [(DAY, 1), (date(2026, 3, 23), 1)]
+
+
+def test_log_analyzer_consumes_journal():
+    from analysis.log_analyzer import parse_journal_events, summarize
+
+    journal = [
+        {'type': 'ACCEPT', 'stock_code': '015260', 'price': 954, 'conf': 0.514,
+         'alpha': 1.63, 'pos_mult': 0.61, 'ts': 0.0},
+        {'type': 'ACCEPT', 'stock_code': '015260', 'price': 954, 'conf': 0.514,
+         'alpha': 1.63, 'pos_mult': 0.61, 'ts': 1.0},
+        {'type': 'REJECT', 'stock_code': '327260', 'level': 'L0', 'reason': '진입 시간 외', 'ts': 2.0},
+        {'type': 'MKT_CTX', 'status': 'NO_TRADE_DAY', 'summary': 'KOSPI❌', 'atr_mode': 'NORMAL', 'ts': 3.0},
+        {'type': 'TREND_SIG', 'stock_code': '005930', 'entry_type': 'breakout',
+         'grade': 'STRONG', 'detail': 'TREND BREAKOUT[STRONG]', 'ts': 4.0},
+    ]
+    events, chochs, mkt_ctx, trends = parse_journal_events(journal)
+    summary = summarize(events=events, chochs=chochs, mkt_ctx=mkt_ctx, trend_signals=trends)
+    assert summary['accept_count'] == 1
+    assert summary['reject_count'] == 1
+    assert summary['no_trade_day'] is True
+    assert summary['mkt_ctx_reason'] == 'KOSPI❌'
+    assert summary['trend_grades'] == {'STRONG': 1}
+    assert events[0]['conf'] == 0.51
+
+
+def _mixed_level_rejects(directory):
+    journal = EventJournal(directory)
+    for hhmmss, code, level in [('091420', '327260', 'L0'), ('093000', '327260', 'L3'),
+                                ('100500', '232680', 'L6'), ('101000', '232680', 'CONFIDENCE'),
+                                ('102000', '005930', 'L1'), ('103000', '327260', 'L0')]:
+        journal.emit('REJECT', ts=_ts(hhmmss), stock_code=code, level=level, reason=f'{level} 거부 {hhmmss}')
+    journal.emit('SELL', ts=_ts('140000'), stock_code='232680', stock_name='', price=1000,
+                 quantity=1, pnl_pct=-1.5, reason='손절')
+    journal.close()
+
+
+def test_journal_rejects_match_log_levels(tmp_path, monkeypatch):
+    from analysis import reject_preentry_v3
+    from analysis.log_analyzer import parse_journal_events, summarize
+
+    _mixed_level_rejects(tmp_path)
+    journal = read_events(DAY, types=('REJECT',), directory=tmp_path)
+    assert len(journal) == 6
+
+    events, chochs, mkt_ctx, trends = parse_journal_events(journal)
+    assert [(e['stock_code'], e['level']) for e in events] == [('327260', 'L0'), ('327260', 'L0')]
+    assert summarize(events=events, chochs=chochs, mkt_ctx=mkt_ctx, trend_signals=trends)['reject_count'] == 2
+
+    monkeypatch.setenv('KIWOOM_EVENT_JOURNAL_DIR', str(tmp_path))
+    rejects, exits = reject_preentry_v3.parse_journal(DAY)
+    assert dict(rejects) == {'327260': [datetime.fromtimestamp(_ts('091420')),
+                                        datetime.fromtimestamp(_ts('103000'))]}
+    assert exits['232680'][1] == -1.5
@@ -0,0 +1,99 @@
+"""
+tests/unit/test_exit_guard.py
+
+ExitGuard 틱 단위 청산 임계가 테스트
+
+케이스:
+  1. 손절 하한가: 구조 손절 cap / Hard Stop / TP2 후 BE 스탑 중 최고가
+  2. 상한가: R-TP1, 트레일링 활성화가
+  3. 트레일링 활성 시 신고가마다 스탑 상승
+  4. 진입 검증(조기 이탈) 마감 전후
+  5. 승격 쿨다운 + sync() 로 청산 종목 해제
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from datetime import datetime, timedelta
+
+from trading.exit_guard import ExitGuard
+
+
+NOW = datetime(2026, 1, 9, 10, 0, 0)
+
+
+def _position(**kwargs):
+    position = {'entry_price': 10000, 'entry_time': NOW - timedelta(hours=1), 'partial_exit_stage': 0}
+    position.update(kwargs)
+    return position
+
+
+def test_stop_uses_highest_candidate():
+    guard = ExitGuard(max_stop_pct=5.0, emergency_stop_pct=6.0)
+    guard.arm("A", _position())
+    assert guard.snapshot("A")['stop'] == 9500
+
+    guard.arm("B", _position(structure_stop_price=9800))
+    assert guard.snapshot("B")['stop'] == 9800
+
+    # cap: 구조 손절이 -5% 보다 깊으면 -5% 에서 감시
+    guard.arm("C", _position(structure_stop_price=9000))
+    assert guard.snapshot("C")['stop'] == 9500
+
+    guard.arm("D", _position(partial_exit_stage=2, trailing_active=True,
+                             highest_price=11000, trailing_stop_price=9900))
+    assert guard.snapshot("D")['stop'] == 10020
+
+    assert guard.check("B", 9850, NOW) is None
+    assert guard.check("B", 9800, NOW) == 'stop'
+
+
+def test_upper_threshold():
+    guard = ExitGuard(trailing_activation_pct=2.0)
+    guard.arm("A", _position(r_tp1_price=10150, r_tp2_price=10300))
+    assert guard.snapshot("A")['upper'] == 10150
+    assert guard.check("A", 10149, NOW) is None
+    assert guard.check("A", 10150, NOW) == 'upper'
+
+    guard.arm("B", _position(partial_exit_stage=1, r_tp1_price=10150, r_tp2_price=10300))
+    assert guard.snapshot("B")['upper'] == 10200   # 트레일링 활성화가가 TP2 보다 낮음
+
+
+def test_trailing_stop_follows_new_highs():
+    guard = ExitGuard()
+    guard.arm("A", _position(trailing_active=True, highest_price=10500, trailing_stop_price=10200))
+    assert guard.check("A", 10800, NOW) is None
+    assert guard.snapshot("A")['stop'] == 10500
+    # 하락 시 스탑은 유지
+    assert guard.check("A", 10600, NOW) is None
+    assert guard.snapshot("A")['stop'] == 10500
+    assert guard.check("A", 10500, NOW) == 'stop'
+    assert guard.stats['trail_moves'] == 1
+
+
+def test_early_failure_window():
+    guard = ExitGuard(ef_max_bars=3, ef_min_pnl_pct=-0.3)
+    guard.arm("A", _position(entry_time=NOW))
+    assert guard.check("A", 9980, NOW + timedelta(minutes=5)) is None
+    assert guard.check("A", 9960, NOW + timedelta(minutes=10)) == 'early_failure'
+
+    guard.arm("B", _position(entry_time=NOW))
+    assert guard.check("B", 9960, NOW + timedelta(minutes=20)) is None
+
+
+def test_cooldown_and_sync():
+    guard = ExitGuard(cooldown_seconds=3)
+    positions = {"A": _position(), "B": _position()}
+    assert guard.sync(positions) == 2
+
+    assert guard.check("A", 9000, NOW) == 'stop'
+    guard.arm("A", positions["A"])               # 미청산 → 재무장해도 쿨다운 유지
+    assert guard.check("A", 9000, NOW + timedelta(seconds=1)) is None
+    assert guard.stats['suppressed'] == 1
+    assert guard.check("A", 9000, NOW + timedelta(seconds=4)) == 'stop'
+
+    del positions["A"]
+    assert guard.sync(positions) == 1
+    assert not guard.is_armed("A")
+    assert guard.check("A", 1, NOW) is None
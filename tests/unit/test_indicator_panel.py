@@ -0,0 +1,177 @@
+"""
+tests/unit/test_indicator_panel.py
+
+core.indicator_panel.IndicatorEngine 테스트
+
+기준: 종목별 DataFrame 계산 (EntryTimingAnalyzer.calculate_vwap/atr/rsi 와 같은 pandas 식,
+      utils.squeeze_momentum_realtime.calculate_squeeze_momentum, RSVI 정의)
+
+케이스:
+  1. 봉 수가 다른 여러 종목(NaN/거래량 0 포함) 패널 → 종목별 계산과 일치 (float32 허용 오차)
+  2. 누적 VWAP 모드 일치
+  3. 뷰/패널 배열 읽기 전용 + frame() 컬럼/원소 수정 불가/컬럼 추가 가능
+  4. 저장소 연동: 마지막 봉이 같은 종목은 뷰 재사용, 바뀐 종목만 재계산
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.bar_store import MinuteBarStore
+from core.indicator_panel import FRAME_COLUMNS, SQZ_COLORS, IndicatorEngine
+from utils.squeeze_momentum_realtime import calculate_squeeze_momentum
+
+
+def _bars(n, seed, base=20000.0):
+    rng = np.random.default_rng(seed)
+    close = base + np.cumsum(rng.normal(0, base * 0.002, n))
+    spread = np.abs(rng.normal(0, base * 0.003, n))
+    ohlcv = np.vstack([
+        close + rng.normal(0, base * 0.001, n),
+        close + spread,
+        close - spread,
+        close,
+        rng.integers(0, 50000, n).astype(float),
+    ])
+    times = 20261016090000 + np.arange(n, dtype=np.int64) * 500
+    return times, ohlcv
+
+
+def _expected(ohlcv, vwap_window=20, use_rolling=True):
+    df = pd.DataFrame(ohlcv.T, columns=['open', 'high', 'low', 'close', 'volume'])
+    pv = (df['high'] + df['low'] + df['close']) / 3 * df['volume']
+    if use_rolling:
+        df['vwap'] = pv.rolling(vwap_window).sum() / df['volume'].rolling(vwap_window).sum()
+    else:
+        df['vwap'] = pv.cumsum() / df['volume'].cumsum()
+    pc = df['close'].shift(1)
+    tr = pd.concat([df['high'] - df['low'], (df['high'] - pc).abs(), (df['low'] - pc).abs()], axis=1).max(axis=1)
+    df['atr'] = tr.ewm(span=14, adjust=False).mean()
+    delta = df['close'].diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    df['rsi'] = 100 - (100 / (1 + gain.ewm(span=14, adjust=False).mean() / loss.ewm(span=14, adjust=False).mean()))
+    df['ema9'] = df['close'].ewm(span=9, adjust=False).mean()
+    df['ema20'] = df['close'].ewm(span=20, adjust=False).mean()
+    df['ma20'] = df['close'].rolling(20).mean()
+    df['volume_ma5'] = df['volume'].rolling(5).mean()
+    df['volume_ma20'] = df['volume'].rolling(20).mean()
+
+    vol = df['volume'].fillna(0.0)
+    df['vol_ma20'] = vol.rolling(20, min_periods=1).mean()
+    df['vol_std20'] = vol.rolling(20, min_periods=1).std(ddof=0).fillna(0.0)
+    z = (vol - df['vol_ma20']) / (df['vol_std20'].abs() + 1e-9)
+    df['vol_z20'] = z.replace([np.inf, -np.inf], np.nan).fillna(0.0).clip(-5.0, 5.0)
+    prev = vol.shift(10).replace(0, np.nan)
+    vroc = vol / (prev.abs() + 1e-9) - 1.0
+    df['vroc10'] = vroc.replace([np.inf, -np.inf], np.nan).fillna(-1.0).clip(-5.0, 5.0)
+
+    sqz = calculate_squeeze_momentum(df[['open', 'high', 'low', 'close', 'volume']])
+    for col in ('sqz_on', 'sqz_off', 'sqz_momentum', 'sqz_color'):
+        df[col] = sqz[col]
+    return df
+
+
+def _assert_view(view, expected):
+    for col in ('vwap', 'atr', 'rsi', 'ema9', 'ema20', 'ma20', 'volume_ma5', 'volume_ma20',
+                'vol_ma20', 'vol_std20', 'vol_z20', 'vroc10'):
+        np.testing.assert_allclose(view[col], expected[col].to_numpy(dtype=float),
+                                   rtol=2e-6, atol=1e-4, equal_nan=True, err_msg=col)
+    np.testing.assert_array_equal(view['sqz_on'] == 1, expected['sqz_on'].to_numpy(dtype=bool))
+    np.testing.assert_array_equal(view['sqz_off'] == 1, expected['sqz_off'].to_numpy(dtype=bool))
+    mom = expected['sqz_momentum'].to_numpy(dtype=float)
+    np.testing.assert_allclose(view['sqz_momentum'], mom, rtol=1e-5, atol=1e-3, equal_nan=True)
+    # 색상은 모멘텀/차분 부호로 결정 → 부호가 0 근처인 봉만 제외하고 비교
+    colors = np.asarray(SQZ_COLORS)[np.nan_to_num(view['sqz_color']).astype(int)]
+    stable = np.abs(np.diff(mom, prepend=np.nan)) > 1e-2
+    stable &= np.abs(np.nan_to_num(mom)) > 1e-2
+    np.testing.assert_array_equal(colors[stable], expected['sqz_color'].to_numpy()[stable])
+
+
+def test_panel_matches_per_symbol():
+    engine = IndicatorEngine()
+    sizes = [900, 25, 300, 5, 640]
+    data = [_bars(n, seed) for seed, n in enumerate(sizes)]
+    data[2][1][3, 40] = np.nan              # 종가 결측
+    data[2][1][4, 50:53] = np.nan           # 거래량 결측
+    data[4][1][4, 100:140] = 0.0            # 거래 없음 구간
+    expected = [_expected(ohlcv.copy()) for _, ohlcv in data]
+
+    panel = engine.compute([f"S{i}" for i in range(len(sizes))], [t for t, _ in data], [o for _, o in data])
+    assert panel.values['close'].shape == (len(sizes), 900)
+    assert panel.values['vwap'].dtype == np.float32
+    assert np.isnan(panel.values['close'][1, :-25]).all()
+
+    for i, exp in enumerate(expected):
+        view = panel.view(f"S{i}")
+        assert len(view) == sizes[i]
+        _assert_view(view, exp)
+        assert view.last('close') == exp['close'].iloc[-1]
+
+
+def test_cumulative_vwap():
+    times, ohlcv = _bars(200, 11)
+    view = IndicatorEngine(use_rolling_vwap=False).compute(['A'], [times], [ohlcv]).view('A')
+    np.testing.assert_allclose(view['vwap'], _expected(ohlcv.copy(), use_rolling=False)['vwap'], rtol=2e-6)
+
+
+def test_views_are_read_only():
+    times, ohlcv = _bars(120, 3)
+    panel = IndicatorEngine().compute(['A'], [times], [ohlcv])
+    view = panel.view('A')
+    with pytest.raises(ValueError):
+        view['vwap'][-1] = 0.0
+    with pytest.raises(ValueError):
+        panel.values['close'][0, -1] = 0.0
+
+    df = view.frame()
+    assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume', 'cntr_tm', *FRAME_COLUMNS]
+    assert df['close'].iloc[-1] == view.last('close') and df['cntr_tm'].iloc[-1] == view.last_time
+    with pytest.raises(ValueError):
+        df.loc[len(df) - 1, 'close'] = 0.0
+    df['trade_value'] = df['close'] * df['volume']          # 컬럼 추가/교체는 가능
+    df['vwap'] = df['vwap'] * 2
+    assert view.last('vwap') * 2 == pytest.approx(df['vwap'].iloc[-1])
+
+    full = view.frame(columns=None)
+    assert full['sqz_color'].iloc[-1] == view.squeeze_color
+    assert full['sqz_on'].dtype == bool
+    copy = full.copy()
+    copy.loc[0, 'close'] = 1.0                               # 복사본은 수정 가능
+
+
+def _rows(times, ohlcv):
+    """키움 ka10080 응답 형식 (최신 → 과거)"""
+    return [{'cntr_tm': str(t), 'open_pric': f"{o:.0f}", 'high_pric': f"{h:.0f}",
+             'low_pric': f"{lo:.0f}", 'cur_prc': f"-{c:.0f}", 'trde_qty': f"{v:.0f}"}
+            for t, (o, h, lo, c, v) in zip(times[::-1], ohlcv.T[::-1])]
+
+
+def test_views_reuse_unchanged_symbols():
+    store = MinuteBarStore(capacity=900)
+    engine = IndicatorEngine()
+    data = {code: _bars(150, seed) for seed, code in enumerate(['005930', '000660', '035720'])}
+    for code, (times, ohlcv) in data.items():
+        store.merge_chart_rows(code, "5", _rows(times, ohlcv))
+
+    first = engine.views(store, [*data, '999999'], "5")
+    assert set(first) == set(data)
+    assert engine.stats == {'hits': 0, 'computed': 3, 'batches': 1}
+    np.testing.assert_array_equal(first['000660']['close'], store.get_frame('000660', "5")['close'])
+
+    times, ohlcv = data['000660']
+    bar = ohlcv[:, -1].copy()
+    bar[3] = round(bar[3]) + 100.0
+    store.upsert_bar('000660', "5", int(times[-1]), bar.tolist())
+    second = engine.views(store, list(data), "5")
+    assert second['005930'] is first['005930'] and second['035720'] is first['035720']
+    assert second['000660'] is not first['000660']
+    assert second['000660'].last('close') == bar[3]
+    assert engine.stats == {'hits': 2, 'computed': 4, 'batches': 2}
+
+    expected = _expected(store.get_frame('000660', "5")[['open', 'high', 'low', 'close', 'volume']].to_numpy().T)
+    _assert_view(second['000660'], expected)
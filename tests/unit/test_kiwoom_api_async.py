@@ -0,0 +1,135 @@
+"""
+tests/unit/test_kiwoom_api_async.py
+
+kiwoom_api_async.AsyncKiwoomAPI 테스트 (HTTP 는 _send 대체)
+
+케이스:
+  1. 동시 N개 요청이 401 → 토큰 발급 1회, 전부 새 토큰으로 재시도 성공
+  2. 동기 KiwoomAPI 와 토큰 공유 (발급 결과 반영 / 더 새 토큰 이어받기)
+  3. 요청 마감시간 초과 → 조회 기본값 반환 + deadline_exceeded
+  4. TR 헤더 / 본문 / 연속조회 키 병합, 주문은 'order' 그룹
+  5. 재발급 후에도 8005 → AuthenticationError (handle_api_errors 가 전파)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from exceptions import AuthenticationError
+from kiwoom_api_async import AsyncKiwoomAPI
+from utils.rate_governor import RateGovernor
+
+
+class FakeAsyncAPI(AsyncKiwoomAPI):
+    """_send 를 응답 스크립트로 대체"""
+
+    def __init__(self, tmp_path, handler, **kwargs):
+        super().__init__(api_key='app-key', api_secret='secret', account_number='1234',
+                         http=SimpleNamespace(), **kwargs)
+        self.governor = RateGovernor('app-key', rates={'tr': 1000.0, 'order': 1000.0},
+                                     burst=100, directory=tmp_path)
+        self.handler = handler
+        self.sent = []
+        self.issued = 0
+
+    async def _send(self, method, url, headers, body=None):
+        self.sent.append((method, url, headers, body))
+        if url.endswith('/oauth2/token'):
+            self.issued += 1
+            await asyncio.sleep(0.01)
+            return 200, {}, {'return_code': 0, 'token': f'T{self.issued}', 'expires_dt': '29991231235959'}
+        return await self.handler(headers, body)
+
+
+async def _chart_ok(headers, body):
+    return 200, {'next-key': 'NK', 'cont-yn': 'Y'}, {'return_code': 0, 'stk_min_pole_chart_qry': [{'cur_prc': '100'}]}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_401_single_refresh(tmp_path):
+    async def handler(headers, body):
+        if headers['authorization'] != 'Bearer T2':
+            return 401, {}, {'return_code': 3, 'return_msg': '[8005:Token이 유효하지 않습니다]'}
+        return await _chart_ok(headers, body)
+
+    api = FakeAsyncAPI(tmp_path, handler)
+    api.access_token = 'T1'
+    api.issued = 1
+    results = await asyncio.gather(*(api.get_minute_chart(f'00{i:04d}', tic_scope='5') for i in range(8)))
+
+    assert all(r['return_code'] == 0 for r in results)
+    assert api.issued == 2                          # 재발급은 1회
+    assert api.stats['token_refreshes'] == 1
+    assert api.stats['auth_retries'] == 8
+    assert api.stats['refresh_coalesced'] == 7
+
+
+@pytest.mark.asyncio
+async def test_token_shared_with_sync_client(tmp_path):
+    sync = SimpleNamespace(api_key='app-key', api_secret='secret', account_number='1234',
+                           user_id=None, access_token=None, token_expires_at=None)
+    api = FakeAsyncAPI(tmp_path, _chart_ok, token_source=sync)
+
+    await api.get_minute_chart('005930')
+    assert sync.access_token == 'T1'
+    assert api.sent[-1][2]['authorization'] == 'Bearer T1'
+
+    # 동기 클라이언트가 재발급 → 비동기 쪽이 이어받음 (발급 없음)
+    sync.access_token, sync.token_expires_at = 'S9', time.time() + 3600
+    await api.get_minute_chart('005930')
+    assert api.sent[-1][2]['authorization'] == 'Bearer S9'
+    assert api.issued == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_exceeded_returns_default(tmp_path):
+    async def slow(headers, body):
+        await asyncio.sleep(1.0)
+        return await _chart_ok(headers, body)
+
+    api = FakeAsyncAPI(tmp_path, slow)
+    api.access_token = 'T0'
+    result = await api.get_minute_chart('005930', deadline=0.05)
+    assert result == {'return_code': -1, 'data': []}
+    assert api.stats['deadline_exceeded'] == 1
+
+
+@pytest.mark.asyncio
+async def test_headers_body_and_groups(tmp_path):
+    async def handler(headers, body):
+        if headers['api-id'] == 'kt10000':
+            return 200, {}, {'return_code': 0, 'ord_no': '0001'}
+        return await _chart_ok(headers, body)
+
+    api = FakeAsyncAPI(tmp_path, handler)
+    api.access_token = 'T0'
+    chart = await api.get_minute_chart('005930', tic_scope='5', cont_yn='Y', next_key='PREV')
+    _, url, headers, body = api.sent[-1]
+    assert url.endswith('/api/dostk/chart')
+    assert (headers['api-id'], headers['cont-yn'], headers['next-key']) == ('ka10080', 'Y', 'PREV')
+    assert body == {'stk_cd': '005930', 'tic_scope': '5', 'upd_stkpc_tp': '1'}
+    assert (chart['next_key'], chart['cont_yn']) == ('NK', 'Y')
+
+    order = await api.order_buy('005930', 3, price=71000)
+    assert order['ord_no'] == '0001'
+    assert api.sent[-1][3]['ord_uv'] == '71000'
+    assert api.governor.snapshot('order')['tokens'] < 100
+    assert 'next_key' not in order
+
+
+@pytest.mark.asyncio
+async def test_token_still_rejected_raises(tmp_path):
+    async def handler(headers, body):
+        return 200, {}, {'return_code': 3, 'return_msg': '[8005:Token이 유효하지 않습니다]'}
+
+    api = FakeAsyncAPI(tmp_path, handler)
+    api.access_token = 'T0'
+    with pytest.raises(AuthenticationError):
+        await api.order_buy('005930', 1)
+    assert api.issued == 1
@@ -0,0 +1,82 @@
+"""
+tests/unit/test_log_tail.py
+
+LogTail / LogIndex 증분 로그 인덱서 테스트
+
+케이스:
+  1. 추가된 줄만 읽기, 쓰는 중인 마지막 줄(개행 전)은 다음 poll 로
+  2. truncate / 파일 교체 → 처음부터 다시 읽고 ring 초기화
+  3. 종류별 ring 크기 제한 + uid 중복 무시
+  4. since_line 으로 최근 N줄 범위 조회
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.log_tail import LogIndex, LogTail
+
+
+def _append(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _parse(line, line_no):
+    if line.startswith('EV '):
+        kind, uid = line[3:].split(' ', 1)
+        return kind, uid, {'kind': kind, 'uid': uid, 'line': line_no}
+    return None
+
+
+def test_tail_reads_only_appended_complete_lines(tmp_path):
+    path = tmp_path / 'a.log'
+    _append(path, '첫줄\n둘째')
+    tail = LogTail(path)
+    assert tail.poll() == (False, ['첫줄'])
+    assert tail.poll() == (False, [])
+
+    _append(path, '줄\n셋째\n')
+    assert tail.poll() == (False, ['둘째줄', '셋째'])
+
+
+def test_tail_missing_file(tmp_path):
+    assert LogTail(tmp_path / 'none.log').poll() == (False, [])
+
+
+def test_truncate_resets_index(tmp_path):
+    path = tmp_path / 'a.log'
+    _append(path, 'EV buy 1\nEV buy 2\n')
+    index = LogIndex(path, _parse, maxlen=10)
+    assert index.refresh() == 2
+    assert [e['uid'] for e in index.events('buy')] == ['1', '2']
+
+    path.write_text('EV sell 9\n', encoding='utf-8')
+    index.refresh()
+    assert index.events('buy') == []
+    assert [e['uid'] for e in index.events('sell')] == ['9']
+    assert index.lines == 1
+    assert index.stats['resets'] == 1
+
+
+def test_ring_bound_and_dedup(tmp_path):
+    path = tmp_path / 'a.log'
+    _append(path, ''.join(f'EV buy {i}\n' for i in range(5)) + 'EV buy 4\nnoise\n')
+    index = LogIndex(path, _parse, maxlen={'buy': 3})
+    index.refresh()
+    assert [e['uid'] for e in index.events('buy')] == ['2', '3', '4']
+    assert [e['uid'] for e in index.events('buy', last=2)] == ['3', '4']
+
+    # 밀려난 uid 는 다시 들어올 수 있음
+    _append(path, 'EV buy 0\n')
+    index.refresh()
+    assert [e['uid'] for e in index.events('buy')] == ['3', '4', '0']
+
+
+def test_since_line_window(tmp_path):
+    path = tmp_path / 'a.log'
+    _append(path, 'EV choch a\nx\nx\nEV choch b\nx\n')
+    index = LogIndex(path, _parse, maxlen=10)
+    index.refresh()
+    assert [e['uid'] for e in index.events('choch', since_line=index.lines - 2)] == ['b']
+    assert [e['uid'] for e in index.events('choch', since_line=0)] == ['a', 'b']
@@ -0,0 +1,93 @@
+"""
+tests/unit/test_mtf_bars.py
+
+core.mtf_bars.MTFBarProvider 테스트
+
+케이스:
+  1. 슬라이딩 윈도우로 한 봉씩 공급 → 전체 이력 일괄 계산(resample + ewm(adjust=False) + 일별 누적 VWAP)과 일치
+  2. 같은 마지막 봉 → 캐시 반환, 진행 중 봉 갱신 → 마지막 행만 변경
+  3. 기준 간격의 배수가 아닌 타임프레임 → None / 시간 역행 → 전체 재계산
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.mtf_bars import MTFBarProvider, base_minutes, resample_ohlcv
+
+
+def _session_bars(days=2, minutes=5, seed=7):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for d in range(days):
+        idx = pd.date_range(f'2026-10-{13 + d} 09:00', f'2026-10-{13 + d} 15:25', freq=f'{minutes}min')
+        close = 70000 + np.cumsum(rng.normal(0, 50, len(idx)))
+        frames.append(pd.DataFrame({
+            'open': close + rng.normal(0, 10, len(idx)),
+            'high': close + 60, 'low': close - 60, 'close': close,
+            'volume': rng.integers(100, 5000, len(idx)).astype(float),
+        }, index=idx))
+    return pd.concat(frames)
+
+
+def _expected(full, minutes, period=20):
+    bars = resample_ohlcv(full, minutes)
+    bars['ema'] = bars['close'].ewm(span=period, adjust=False).mean()
+    pv = (bars['high'] + bars['low'] + bars['close']) / 3 * bars['volume']
+    day = bars.index.date
+    bars['vwap'] = pv.groupby(day).cumsum() / bars['volume'].groupby(day).cumsum()
+    return bars
+
+
+@pytest.mark.parametrize('minutes', [15, 30, 60])
+def test_incremental_matches_full_history(minutes):
+    full = _session_bars()
+    provider = MTFBarProvider()
+    window = 120
+    for end in range(window, len(full) + 1):
+        frame = provider.get('005930', full.iloc[max(0, end - window):end], minutes)
+
+    expected = _expected(full, minutes)
+    assert len(frame) == len(expected)
+    np.testing.assert_allclose(frame['close'], expected['close'])
+    np.testing.assert_allclose(frame['ema'], expected['ema'], rtol=1e-10)
+    np.testing.assert_allclose(frame['vwap'], expected['vwap'], rtol=1e-10)
+    assert provider.stats['rebuilds'] == 1
+
+
+def test_cache_hit_and_open_bar_update():
+    full = _session_bars(days=1)
+    provider = MTFBarProvider()
+    first = provider.get('005930', full, 15)
+    assert provider.get('005930', full.copy(), 15) is first
+    assert provider.stats['hits'] == 1
+
+    live = full.copy()
+    live.iloc[-1, live.columns.get_loc('close')] += 500
+    live.iloc[-1, live.columns.get_loc('high')] += 500
+    updated = provider.get('005930', live, 15)
+    pd.testing.assert_frame_equal(updated.iloc[:-1], first.iloc[:-1])
+    assert updated['close'].iloc[-1] == first['close'].iloc[-1] + 500
+    np.testing.assert_allclose(updated['ema'], _expected(live, 15)['ema'])
+
+    snap = provider.latest('005930', live, 15)
+    assert snap['bars'] == len(updated) and snap['ema'] == updated['ema'].iloc[-1]
+
+
+def test_unsupported_and_rebuild():
+    full = _session_bars(days=1)
+    provider = MTFBarProvider()
+    assert base_minutes(full.index) == 5
+    assert provider.get('005930', full, 3) is None
+    assert provider.get('005930', full, 5) is not None
+    assert provider.get('005930', full.reset_index(drop=True), 15) is None
+
+    provider.get('000660', full, 15)
+    provider.get('000660', full.iloc[:30], 15)      # 시간 역행 → 재계산
+    assert provider.stats['rebuilds'] == 3
+    np.testing.assert_allclose(provider.get('000660', full.iloc[:30], 15)['ema'],
+                               _expected(full.iloc[:30], 15)['ema'])
@@ -0,0 +1,297 @@
+"""
+tests/unit/test_quick_simulation.py
+
+L6 빠른 시뮬레이션 (QuickTradeSimulator + ValidationCache) 동등성 테스트
+
+기준: 배열 시뮬레이터 이전 행 단위 루프 구현(_reference_quick_simulation, 아래에 그대로 보존)
+데이터: data/raw/396500_KS_5m.csv (키움 5분봉 기록)
+
+케이스:
+  1. 설정 변형(부분청산 on/off, ATR 트레일링 + 목표가 강화, 누적 VWAP) × 기록 구간 → 거래 목록 동일
+  2. 봉이 하나씩 늘고 진행 중 봉이 갱신될 때 → 캐시 결과 == 전체 재계산, 체크포인트에서 이어서 계산
+  3. 윈도우 이동(앞부분 변경) → 전체 재시뮬레이션, 같은 입력 → 캐시 적중 / 설정 변경 → 별도 항목
+  4. validate_trade 통계가 기존 루프 결과와 동일
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import copy
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from analyzers.entry_timing_analyzer import EntryTimingAnalyzer
+from analyzers.pre_trade_validator import PreTradeValidator
+from analyzers.quick_simulation import QuickTradeSimulator, ValidationCache
+from utils.config_loader import ConfigLoader
+
+ROOT = Path(__file__).resolve().parents[2]
+RECORDED = ROOT / 'data' / 'raw' / '396500_KS_5m.csv'
+
+
+def _reference_quick_simulation(self, df):
+    """배열 시뮬레이터 이전 _run_quick_simulation (df.iloc 행 단위 루프)"""
+
+    # Analyzer 초기화
+    analyzer_config = self.config.get_analyzer_config()
+    analyzer = EntryTimingAnalyzer(**analyzer_config)
+
+    # Signal generation config
+    signal_config = self.config.get_signal_generation_config()
+    trailing_config = self.config.get_trailing_config()
+    trailing_kwargs = {
+        'use_atr_based': trailing_config.get('use_atr_based', False),
+        'atr_multiplier': trailing_config.get('atr_multiplier', 1.5),
+        'use_profit_tier': trailing_config.get('use_profit_tier', False),
+        'profit_tier_threshold': trailing_config.get('profit_tier_threshold', 3.0)
+    }
+    partial_config = self.config.get_partial_exit_config()
+
+    # 데이터 복사
+    df = df.copy()
+
+    # 데이터 검증: close 가격이 0이거나 너무 작은 경우 필터링
+    if 'close' in df.columns:
+        df = df[df['close'] > 0].copy()  # 0 제거
+        df = df[df['close'] > df['close'].median() * 0.01].copy()  # 중앙값의 1% 이하 제거 (이상치)
+
+    if len(df) < 100:
+        # 데이터가 너무 적으면 빈 리스트 반환
+        return []
+
+    # VWAP 설정 가져오기
+    vwap_config = self.config.get_section('vwap')
+    use_rolling = vwap_config.get('use_rolling', True)
+    rolling_window = vwap_config.get('rolling_window', 20)
+
+    # VWAP, ATR 계산
+    df = analyzer.calculate_vwap(df, use_rolling=use_rolling, rolling_window=rolling_window)
+    df = analyzer.calculate_atr(df)
+
+    # 시그널 생성
+    df = analyzer.generate_signals(df, **signal_config)
+
+    # 시뮬레이션
+    trades = []
+    position = None
+    executed_tiers = []
+
+    for idx in range(len(df)):
+        row = df.iloc[idx]
+        current_price = row['close']
+        signal = row['signal']
+
+        # 가격 검증: 0이거나 너무 작은 값 스킵
+        if current_price <= 0 or pd.isna(current_price):
+            continue
+
+        # 진입
+        if position is None and signal == 1:
+            position = {
+                'entry_price': current_price,
+                'quantity': 100,
+                'highest_price': current_price,
+                'trailing_active': False,
+                'entry_idx': idx
+            }
+            executed_tiers = []
+
+        # 청산
+        elif position is not None:
+            # 최고가 갱신
+            if current_price > position['highest_price']:
+                position['highest_price'] = current_price
+
+            # 수익률 계산
+            profit_pct = ((current_price - position['entry_price']) / position['entry_price']) * 100
+
+            # 청산 여부 판단
+            should_exit = False
+
+            # 1. Hard Stop (실거래와 동일)
+            stop_loss_pct = trailing_config.get('stop_loss_pct', getattr(analyzer, 'stop_loss_pct', 3.0))
+            if profit_pct <= -stop_loss_pct:
+                should_exit = True
+
+            # 2. 부분 청산
+            elif partial_config['enabled'] and partial_config['tiers']:
+                partial_should_exit, exit_qty, reason, new_executed = analyzer.check_partial_exit(
+                    current_price=current_price,
+                    avg_price=position['entry_price'],
+                    current_quantity=position['quantity'],
+                    exit_tiers=partial_config['tiers'],
+                    executed_tiers=executed_tiers
+                )
+
+                if partial_should_exit:
+                    # 안전장치: entry_price가 0이면 거래 기록 안 함
+                    if position['entry_price'] <= 0:
+                        continue
+
+                    profit = exit_qty * (current_price - position['entry_price'])
+                    profit_pct_calc = ((current_price - position['entry_price']) / position['entry_price']) * 100
+
+                    # 비정상적인 수익률 필터링 (-300% ~ +1000% 범위 밖)
+                    if -300 < profit_pct_calc < 1000:
+                        trades.append({
+                            'entry_price': position['entry_price'],
+                            'exit_price': current_price,
+                            'profit': profit,
+                            'profit_pct': profit_pct_calc,
+                            'holding_bars': idx - position['entry_idx']
+                        })
+
+                    position['quantity'] -= exit_qty
+                    executed_tiers = new_executed
+
+                    if position['quantity'] <= 0:
+                        position = None
+                        executed_tiers = []
+                    continue
+
+            # 3. VWAP 하향 돌파 (실거래와 동일)
+            elif signal == -1:
+                should_exit = True
+
+            # 4. 트레일링 스탑 (실거래와 동일)
+            if not should_exit:
+                atr = row.get('atr', None)
+                trailing_should_exit, trailing_active, stop_price, trailing_reason = analyzer.check_trailing_stop(
+                    current_price=current_price,
+                    avg_price=position['entry_price'],
+                    highest_price=position['highest_price'],
+                    trailing_active=position['trailing_active'],
+                    atr=atr,
+                    **trailing_kwargs
+                )
+
+                position['trailing_active'] = trailing_active
+
+                if trailing_should_exit:
+                    should_exit = True
+
+            # 전량 청산 실행
+            if should_exit:
+                # 안전장치: entry_price가 0이면 거래 기록 안 함
+                if position['entry_price'] <= 0:
+                    position = None
+                    executed_tiers = []
+                    continue
+
+                profit = position['quantity'] * (current_price - position['entry_price'])
+                profit_pct = ((current_price - position['entry_price']) / position['entry_price']) * 100
+
+                # 비정상적인 수익률 필터링 (-300% ~ +1000% 범위 밖)
+                if -300 < profit_pct < 1000:
+                    trades.append({
+                        'entry_price': position['entry_price'],
+                        'exit_price': current_price,
+                        'profit': profit,
+                        'profit_pct': profit_pct,
+                        'holding_bars': idx - position['entry_idx']
+                    })
+
+                position = None
+                executed_tiers = []
+
+    return trades
+
+
+class _Holder:
+    """_reference_quick_simulation 의 self 역할 (config 만 사용)"""
+
+    def __init__(self, config):
+        self.config = config
+
+
+def _config(**sections):
+    config = ConfigLoader(str(ROOT / 'config' / 'strategy_config.yaml'))
+    config.config = copy.deepcopy(config.config)
+    for name, values in sections.items():
+        config.config.setdefault(name, {}).update(values)
+    return config
+
+
+VARIANTS = {
+    'repo': {},
+    'no_partial': {'partial_exit': {'enabled': False}},
+    'atr_tier': {'partial_exit': {'enabled': False},
+                 'trailing': {'use_atr_based': True, 'use_profit_tier': True, 'profit_tier_threshold': 2.0}},
+    'cumulative_vwap': {'vwap': {'use_rolling': False},
+                        'filters': {'vwap_cross_only': True, 'use_williams_r_filter': False}},
+}
+
+
+def _recorded():
+    raw = pd.read_csv(RECORDED)
+    raw.columns = [c.lower() for c in raw.columns]
+    return raw
+
+
+@pytest.mark.parametrize('variant', list(VARIANTS))
+def test_matches_reference_loop(variant):
+    config = _config(**VARIANTS[variant])
+    raw = _recorded()
+    simulator = QuickTradeSimulator(config)
+    total = 0
+    for start, length in ((0, 900), (1500, 900), (3000, 600), (0, len(raw))):
+        frame = raw.iloc[start:start + length].reset_index(drop=True)
+        expected = _reference_quick_simulation(_Holder(config), frame)
+        assert simulator.simulate(frame) == expected
+        total += len(expected)
+    assert total > 0
+    assert simulator.simulate(raw.iloc[:99]) == []
+
+
+def test_cache_extends_growing_frame():
+    config = _config()
+    raw = _recorded()
+    simulator = QuickTradeSimulator(config)
+    cache = ValidationCache()
+    for end in range(600, 630):
+        frame = raw.iloc[:end].copy()
+        assert cache.simulate('396500', frame, simulator) == simulator.simulate(frame)
+        # 진행 중 봉 갱신 (마지막 행만 변경)
+        frame.iloc[-1, frame.columns.get_loc('close')] *= 1.004
+        frame.iloc[-1, frame.columns.get_loc('volume')] += 5000
+        assert cache.simulate('396500', frame, simulator) == simulator.simulate(frame)
+    assert cache.stats['rebuilds'] == 1
+    assert cache.stats['extends'] == 2 * 30 - 1
+
+
+def test_cache_hit_rebuild_and_config_key():
+    config = _config()
+    raw = _recorded()
+    simulator = QuickTradeSimulator(config)
+    cache = ValidationCache()
+
+    frame = raw.iloc[1000:1900]
+    first = cache.simulate('396500', frame, simulator)
+    assert cache.simulate('396500', frame.copy(), simulator) == first
+    assert cache.stats['hits'] == 1
+
+    # 윈도우 이동 → 앞부분이 달라져 전체 재시뮬레이션
+    moved = raw.iloc[1012:1912]
+    assert cache.simulate('396500', moved, simulator) == simulator.simulate(moved)
+    assert cache.stats['rebuilds'] == 2
+
+    other = QuickTradeSimulator(_config(**VARIANTS['no_partial']))
+    assert other.config_hash != simulator.config_hash
+    assert cache.simulate('396500', moved, other) == other.simulate(moved)
+    assert cache.summary()['entries'] == 2
+    cache.invalidate('396500')
+    assert cache.summary()['entries'] == 0
+
+
+def test_validate_trade_stats_unchanged():
+    config = _config()
+    frame = _recorded().iloc[2000:2900].reset_index(drop=True)
+    validator = PreTradeValidator(config)
+    expected = validator._calculate_stats(_reference_quick_simulation(_Holder(config), frame))
+    for _ in range(2):
+        allowed, reason, stats = validator.validate_trade('396500', 'test', frame, 0.0, None)
+        for key, value in expected.items():
+            assert stats[key] == value
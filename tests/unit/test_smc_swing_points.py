@@ -0,0 +1,153 @@
+"""
+tests/unit/test_smc_swing_points.py
+
+스윙 포인트 벡터화/증분 탐지 동등성 테스트
+
+케이스:
+  1. find_swing_points == 기존 이중 루프 구현 (동일가/NaN/최소 크기 필터 포함)
+  2. IncrementalSwingDetector == find_swing_points (봉 누적 / 슬라이딩 윈도우 매 시점)
+  3. 캐시 구간 데이터 변경 / 다른 종목 키 → 전체 재계산, 결과 동일
+  4. SMCStructureAnalyzer: symbol 전달 시 증분 탐지기 사용, 결과 동일
+  5. backtest.adapter: 전역 피벗 마스크 슬라이스 == window 별 _find_pivots
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.smc.smc_utils import find_swing_points, IncrementalSwingDetector
+from analyzers.smc.smc_structure import SMCStructureAnalyzer
+from backtest.adapter import SMCAdapter, _find_pivots
+
+
+def _loop_reference(df, lookback, min_swing_size_pct=0.0):
+    """기존 find_swing_points 이중 루프 (기준값)"""
+    high_values = df['high'].values
+    low_values = df['low'].values
+    end_idx = len(df) - 1
+    out = []
+    if len(df) < lookback * 2 + 1:
+        return out
+    for i in range(lookback, end_idx):
+        is_high = all(
+            not (high_values[i] <= high_values[i - j])
+            and not (i + j < end_idx and high_values[i] <= high_values[i + j])
+            for j in range(1, lookback + 1)
+        )
+        is_low = all(
+            not (low_values[i] >= low_values[i - j])
+            and not (i + j < end_idx and low_values[i] >= low_values[i + j])
+            for j in range(1, lookback + 1)
+        )
+        if min_swing_size_pct > 0:
+            avg = (high_values[i] + low_values[i]) / 2
+            if abs(high_values[i] - low_values[i]) / avg * 100 < min_swing_size_pct:
+                is_high = is_low = False
+        if is_high:
+            out.append((i, 'high'))
+        if is_low:
+            out.append((i, 'low'))
+    return out
+
+
+def _frame(seed, n=150, with_nan=False):
+    rng = np.random.default_rng(seed)
+    close = np.round(np.cumsum(rng.normal(size=n)) * 3 + 100)
+    high = (close + rng.integers(0, 3, size=n)).astype(float)
+    low = (close - rng.integers(0, 3, size=n)).astype(float)
+    if with_nan:
+        high[n // 2] = np.nan
+    return pd.DataFrame({'high': high, 'low': low, 'close': close})
+
+
+def _keys(swings):
+    return [(s.index, s.type) for s in swings]
+
+
+def _full(swings):
+    return [(s.index, s.type, None if np.isnan(s.price) else s.price, s.timestamp) for s in swings]
+
+
+def _timed(seed, n=150, with_nan=False):
+    df = _frame(seed, n=n, with_nan=with_nan)
+    df.index = pd.date_range('2026-10-16 09:00', periods=n, freq='5min')
+    return df
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("lookback,min_pct", [(1, 0.0), (3, 0.0), (5, 0.0), (5, 2.0)])
+def test_vectorized_matches_loop(seed, lookback, min_pct):
+    df = _frame(seed, with_nan=(seed % 2 == 0))
+    assert _keys(find_swing_points(df, lookback, min_pct)) == _loop_reference(df, lookback, min_pct)
+
+
+def test_uppercase_columns_without_copy():
+    df = _frame(1).rename(columns={'high': 'High', 'low': 'Low'})
+    assert _keys(find_swing_points(df, 3)) == _loop_reference(_frame(1), 3)
+    assert list(df.columns) == ['High', 'Low', 'close']
+
+
+@pytest.mark.parametrize("lookback,min_pct", [(2, 0.0), (5, 0.0), (5, 2.0)])
+def test_incremental_matches_batch_growing(lookback, min_pct):
+    df = _timed(3, n=120, with_nan=True)
+    det = IncrementalSwingDetector(lookback=lookback, min_swing_size_pct=min_pct)
+    for n in range(1, len(df) + 1):
+        view = df.iloc[:n]
+        assert _full(det.swings('005930', view)) == _full(find_swing_points(view, lookback, min_pct))
+    assert det.stats['incremental'] > det.stats['full']
+
+
+@pytest.mark.parametrize("lookback", [1, 3, 5])
+def test_incremental_matches_batch_sliding_window(lookback):
+    df = _timed(7, n=300)
+    det = IncrementalSwingDetector(lookback=lookback)
+    window = 80
+    for n in range(window, len(df) + 1):
+        # 봉 저장소가 가득 찬 뒤: 앞 봉이 잘리며 행 위치가 매 봉 한 칸씩 밀림
+        view = df.iloc[n - window:n]
+        assert _full(det.swings('005930', view)) == _full(find_swing_points(view, lookback))
+    assert det.stats['full'] == 1
+
+
+def test_revised_bars_and_other_keys_recompute():
+    lookback = 3
+    det = IncrementalSwingDetector(lookback=lookback)
+    a = _timed(1, n=100)
+    b = _timed(2, n=100)
+    det.swings('A', a.iloc[:90])
+    det.swings('B', b.iloc[:90])
+
+    revised = a.copy()
+    revised.iloc[80:, :] += 50.0
+    assert _full(det.swings('A', revised)) == _full(find_swing_points(revised, lookback))
+    assert _full(det.swings('B', b)) == _full(find_swing_points(b, lookback))
+    # 창이 과거 쪽으로 늘어나도 동일
+    assert _full(det.swings('B', b.iloc[:60])) == _full(find_swing_points(b.iloc[:60], lookback))
+
+    plain = _frame(4)
+    assert _full(det.swings('C', plain)) == _full(find_swing_points(plain, lookback))
+
+
+def test_structure_analyzer_uses_symbol_detector():
+    df = _timed(5, n=200)
+    with_symbol = SMCStructureAnalyzer(swing_lookback=3, min_swing_size_pct=0.0)
+    batch = SMCStructureAnalyzer(swing_lookback=3, min_swing_size_pct=0.0)
+    for n in range(100, 201, 10):
+        view = df.iloc[n - 100:n]
+        got = with_symbol.analyze_structure(view, symbol='005930')
+        expected = batch.analyze_structure(view)
+        assert _full(got.swing_points) == _full(expected.swing_points)
+        assert got.trend == expected.trend
+    assert with_symbol._swing_detector.stats['incremental'] > 0
+
+
+def test_adapter_window_pivots_match_sliced_find_pivots():
+    df = _frame(5, n=200)
+    adapter = SMCAdapter({'swing_lookback': 3, 'window_size': 60})
+    for i in range(1, len(df) + 1):
+        start = max(0, i - 60)
+        assert adapter._window_pivots(df, start, i) == _find_pivots(df.iloc[start:i], 3)
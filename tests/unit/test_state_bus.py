@@ -0,0 +1,72 @@
+"""
+tests/unit/test_state_bus.py
+
+StateBusWriter / StateBusReader 공유 메모리 스냅샷 테스트
+
+케이스:
+  1. 미발행 섹션 → default
+  2. 발행 → 디코딩, 같은 시퀀스 재조회는 캐시 (재디코딩 없음)
+  3. 쓰는 중(홀수 시퀀스) → 직전 스냅샷 유지
+  4. 용량 초과 → False, 기존 스냅샷 유지
+  5. writer 재시작 후에도 시퀀스 증가
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.state_bus import StateBusReader, StateBusWriter, _SEQ, _SEQ_OFFSET
+
+
+def test_unpublished_section_returns_default(tmp_path):
+    reader = StateBusReader(tmp_path)
+    assert reader.read('positions') is None
+    assert reader.read('positions', {}) == {}
+    assert reader.version('positions') is None
+
+
+def test_publish_and_cached_read(tmp_path):
+    writer = StateBusWriter(tmp_path, capacity=4096)
+    reader = StateBusReader(tmp_path)
+
+    assert writer.publish('positions', {'005930': {'entry_price': 71000}})
+    assert reader.read('positions') == {'005930': {'entry_price': 71000}}
+    assert reader.read('positions') == {'005930': {'entry_price': 71000}}
+    assert reader.stats['decodes'] == 1
+    assert reader.stats['hits'] == 1
+
+    writer.publish('positions', {})
+    assert reader.read('positions') == {}
+    assert reader.version('positions') == 4
+
+
+def test_torn_write_keeps_previous_snapshot(tmp_path):
+    writer = StateBusWriter(tmp_path, capacity=4096)
+    reader = StateBusReader(tmp_path)
+    writer.publish('heartbeat', {'stage': 'monitoring'})
+    assert reader.read('heartbeat') == {'stage': 'monitoring'}
+
+    mm, seq = writer._slots['heartbeat']
+    _SEQ.pack_into(mm, _SEQ_OFFSET, seq + 1)     # 쓰기 도중 상태
+    assert reader.read('heartbeat') == {'stage': 'monitoring'}
+    assert reader.stats['torn'] >= 1
+
+
+def test_oversize_payload_rejected(tmp_path):
+    writer = StateBusWriter(tmp_path, capacity=64)
+    reader = StateBusReader(tmp_path)
+    assert writer.publish('watchlist', [1, 2, 3])
+    assert not writer.publish('watchlist', ['x' * 100])
+    assert writer.stats['oversize'] == 1
+    assert reader.read('watchlist') == [1, 2, 3]
+
+
+def test_sequence_survives_writer_restart(tmp_path):
+    StateBusWriter(tmp_path, capacity=256).publish('events', {'n': 1})
+    reader = StateBusReader(tmp_path)
+    assert reader.read('events') == {'n': 1}
+    before = reader.version('events')
+
+    StateBusWriter(tmp_path, capacity=256).publish('events', {'n': 2})
+    assert reader.version('events') > before
+    assert reader.read('events') == {'n': 2}
@@ -0,0 +1,134 @@
+"""
+tests/unit/test_tick_bars.py
+
+TickBarBuilder 체결 틱 집계 테스트
+
+케이스:
+  1. 같은 구간 틱 → OHLCV 누적, 저장소 진행 중 봉 갱신
+  2. 다음 구간 첫 틱 → 이전 봉 마감 콜백 (5분봉은 1분봉보다 늦게 마감)
+  3. REAL 프레임 파싱 (부호 제거, 0B 외 타입 무시)
+  4. flush() 로 틱 없는 종목 봉 마감
+  5. backfill 후 진행 중 봉 이어받기 + 'end' 표기 자동 전환
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from datetime import datetime
+
+from core.bar_store import MinuteBarStore
+from core.tick_bars import TickBarBuilder
+
+
+DAY = datetime(2026, 1, 9)
+
+
+def _at(hhmmss):
+    return datetime.strptime(f"20260109{hhmmss}", '%Y%m%d%H%M%S')
+
+
+def _builder(**kwargs):
+    store = MinuteBarStore(capacity=50)
+    builder = TickBarBuilder(store, **kwargs)
+    closed = []
+    builder.on_bar_close(lambda s, tf, ts, bar: closed.append((s, tf, ts, list(bar))))
+    return store, builder, closed
+
+
+def test_ticks_accumulate_in_bucket():
+    store, builder, closed = _builder()
+    builder.on_tick("005930", 100, 10, _at("090001"))
+    builder.on_tick("005930", 105, 5, _at("090130"))
+    builder.on_tick("005930", 98, 7, _at("090459"))
+
+    df = store.get_frame("005930", "5")
+    assert len(df) == 1
+    row = df.iloc[-1]
+    assert (row['open'], row['high'], row['low'], row['close'], row['volume']) == (100, 105, 98, 98, 22)
+    assert row['cntr_tm'] == 20260109090000
+    assert builder.last_price("005930") == 98
+    # 1분봉 2개, 3분봉 1개는 이미 마감 (5분봉은 진행 중)
+    assert [c[1] for c in closed] == ['1', '1', '3']
+
+
+def test_next_bucket_closes_previous_bar():
+    _, builder, closed = _builder(timeframes=('5',))
+    builder.on_tick("005930", 100, 1, _at("090100"))
+    builder.on_tick("005930", 110, 2, _at("090400"))
+    assert closed == []
+
+    assert builder.on_tick("005930", 120, 3, _at("090500")) == 1
+    assert closed == [("005930", "5", 20260109090000, [100, 110, 100, 110, 3])]
+
+    # 이전 구간 지연 틱은 무시
+    builder.on_tick("005930", 1, 1, _at("090459"))
+    assert builder.stats['late_ticks'] == 1
+
+
+def test_on_real_parses_frame():
+    store, builder, _ = _builder(timeframes=('1',))
+    frame = {
+        'trnm': 'REAL',
+        'data': [
+            {'type': '0B', 'item': '005930', 'values': {'20': '090010', '10': '-71500', '15': '-30'}},
+            {'type': '0D', 'item': '005930', 'values': {}},
+            {'type': '0B', 'item': '005930', 'values': {'20': '', '10': '71600', '15': '5'}},
+        ],
+    }
+    assert builder.on_real(frame, now=DAY) == 1
+    assert builder.stats['bad_ticks'] == 1
+    last_ts, bar = store.last_bar("005930", "1")
+    assert last_ts == 20260109090000
+    assert bar == [71500, 71500, 71500, 71500, 30]
+
+
+def test_flush_closes_idle_bars():
+    _, builder, closed = _builder(timeframes=('5',))
+    builder.on_tick("000660", 200, 1, _at("090200"))
+    assert builder.flush(_at("090459")) == 0
+    assert builder.flush(_at("090500")) == 1
+    # 같은 봉은 한 번만 마감
+    assert builder.flush(_at("091000")) == 0
+    assert len(closed) == 1
+
+
+def test_backfill_then_ticks_continue():
+    store, builder, closed = _builder(timeframes=('5',))
+    rows = [
+        {'cntr_tm': '20260109090500', 'open_pric': '+110', 'high_pric': '115',
+         'low_pric': '108', 'cur_prc': '-112', 'trde_qty': '40'},
+        {'cntr_tm': '20260109090000', 'open_pric': '100', 'high_pric': '111',
+         'low_pric': '99', 'cur_prc': '110', 'trde_qty': '50'},
+    ]
+    assert builder.backfill("005930", "5", rows, now=_at("090700")) == 2
+    assert builder.is_live("005930")
+
+    builder.on_tick("005930", 120, 5, _at("090800"))
+    last_ts, bar = store.last_bar("005930", "5")
+    assert last_ts == 20260109090500
+    assert bar == [110, 120, 108, 120, 45]
+
+    builder.on_tick("005930", 121, 1, _at("091000"))
+    assert closed[-1][2] == 20260109090500
+    assert len(store.get_frame("005930", "5")) == 3
+
+    builder.reset()
+    assert not builder.is_live("005930")
+
+
+def test_backfill_detects_end_label():
+    _, builder, _ = _builder(timeframes=('5',))
+    rows = [{'cntr_tm': '20260109091000', 'open_pric': '100', 'high_pric': '101',
+             'low_pric': '99', 'cur_prc': '100', 'trde_qty': '1'}]
+    builder.backfill("005930", "5", rows, now=_at("090700"))
+    assert builder.label == 'end'
+    assert builder.stats['label_switches'] == 1
+
+
+def test_on_trade_callback_after_bar_update():
+    store, builder, _ = _builder(timeframes=('5',))
+    seen = []
+    builder.on_trade(lambda s, price, when: seen.append((s, price, store.last_bar(s, '5')[1][3])))
+    builder.on_tick("005930", 100, 1, _at("090100"))
+    assert seen == [("005930", 100, 100)]
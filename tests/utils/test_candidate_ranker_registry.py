@@ -0,0 +1,59 @@
+"""
+tests/utils/test_candidate_ranker_registry.py
+
+CandidateRanker ↔ ModelRegistry 연동 테스트
+
+케이스:
+  1. 저장된 모델 로드 후 재학습 → 저장 → 랭킹: check_interval 안이어도 새로 학습한 모델로 예측
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("lightgbm")
+
+from ml import candidate_ranker as cr
+from utils.model_registry import ModelRegistry
+
+
+def _data(seed, n=200):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'code': [f"{i:06d}" for i in range(n)],
+        'vwap_backtest_winrate': rng.uniform(0.3, 0.8, n),
+        'vwap_avg_profit': rng.uniform(-2, 5, n),
+        'current_vwap_distance': rng.uniform(-5, 5, n),
+        'volume_z_score': rng.uniform(-2, 4, n),
+        'recent_return_5d': rng.uniform(-10, 10, n),
+        'market_volatility': rng.uniform(10, 30, n),
+        'sector_strength': rng.uniform(-5, 5, n),
+        'price_momentum': rng.uniform(-3, 3, n),
+    })
+    # seed 마다 다른 관계 → 두 모델의 예측이 달라지도록
+    sign = 1.0 if seed % 2 == 0 else -1.0
+    df['actual_profit_pct'] = sign * df['current_vwap_distance'] + rng.normal(0, 0.5, n)
+    return df
+
+
+def test_retrained_model_used_after_save(tmp_path, monkeypatch):
+    registry = ModelRegistry(manifest_path=tmp_path / 'manifest.json', check_interval=60)
+    monkeypatch.setattr(cr, 'get_model_registry', lambda: registry)
+
+    cr.CandidateRanker(model_dir=tmp_path, min_train_samples=50).train(_data(0))
+
+    ranker = cr.CandidateRanker(model_dir=tmp_path, min_train_samples=50)
+    assert ranker.load_models()                          # 레지스트리 캐시에 이전 모델
+    old_classifier = ranker.classifier
+
+    ranker.train(_data(1))                               # 학습 + save_models
+    candidates = _data(2, n=30)
+    expected = ranker.classifier.predict_proba(ranker.prepare_features(candidates.copy()))[:, 1]
+
+    ranked = ranker.rank_candidates(candidates, threshold=0.0)
+    assert ranker.classifier is not old_classifier
+    np.testing.assert_allclose(ranked.sort_index()['buy_probability'], expected)
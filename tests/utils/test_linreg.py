@@ -0,0 +1,85 @@
+"""
+tests/utils/test_linreg.py
+
+누적합 기반 rolling linreg 커널 테스트 (np.polyfit 기준값과 비교)
+
+케이스:
+  1. linreg(src, len, 0) == polyfit 회귀선의 마지막 값
+  2. 기울기 == polyfit(range(len), window, 1)[0]
+  3. 윈도우 내 NaN → NaN, 처음 len-1 봉 → NaN
+  4. 2-D (symbols × bars) 입력 == 행별 1-D 결과
+  5. 블록 경계(4096봉)를 넘는 긴 시계열에서도 오차 일정
+  6. offset 인자 (Pine linreg offset)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.linreg import rolling_linreg, rolling_linreg_slope
+
+
+def _reference(values, length, offset=0):
+    slope = np.full(len(values), np.nan)
+    value = np.full(len(values), np.nan)
+    x = np.arange(length)
+    for i in range(length - 1, len(values)):
+        window = values[i - length + 1:i + 1]
+        if np.isnan(window).any():
+            continue
+        m, b = np.polyfit(x, window, 1)
+        slope[i] = m
+        value[i] = b + m * (length - 1 - offset)
+    return slope, value
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(42)
+    return np.cumsum(rng.normal(size=600)) + 50_000.0
+
+
+def test_value_matches_polyfit(prices):
+    _, ref = _reference(prices, 20)
+    np.testing.assert_allclose(rolling_linreg(prices, 20), ref, rtol=0, atol=1e-8, equal_nan=True)
+
+
+def test_slope_matches_polyfit(prices):
+    ref, _ = _reference(prices, 20)
+    np.testing.assert_allclose(rolling_linreg_slope(prices, 20), ref, rtol=0, atol=1e-9, equal_nan=True)
+
+
+def test_nan_window_and_warmup(prices):
+    prices = prices.copy()
+    prices[100] = np.nan
+    out = rolling_linreg(pd.Series(prices), 20)
+
+    assert isinstance(out, pd.Series)
+    assert out.iloc[:19].isna().all()
+    assert out.iloc[100:120].isna().all()
+    assert not np.isnan(out.iloc[120])
+
+
+def test_2d_matches_rows(prices):
+    panel = np.vstack([prices, prices[::-1], prices * 0.5])
+    out = rolling_linreg(panel, 14)
+
+    assert out.shape == panel.shape
+    for row in range(panel.shape[0]):
+        np.testing.assert_allclose(out[row], rolling_linreg(panel[row], 14), equal_nan=True)
+
+
+def test_long_series_across_blocks():
+    rng = np.random.default_rng(7)
+    values = np.cumsum(rng.normal(size=10_000)) + 80_000.0
+    _, ref = _reference(values, 20)
+    np.testing.assert_allclose(rolling_linreg(values, 20), ref, rtol=0, atol=1e-7, equal_nan=True)
+
+
+def test_offset(prices):
+    _, ref = _reference(prices, 20, offset=3)
+    np.testing.assert_allclose(rolling_linreg(prices, 20, offset=3), ref, rtol=0, atol=1e-8, equal_nan=True)
@@ -0,0 +1,124 @@
+"""
+tests/utils/test_model_registry.py
+
+ModelRegistry (1회 로드 + 새 버전 교체 + 배치 예측) 테스트
+
+케이스:
+  1. 같은 파일 반복 조회 → 언픽클 1회, check_interval 안에서는 파일 재확인 안 함
+  2. 파일 교체(mtime/size 변경) → 새 모델로 교체, 깨진 파일이면 기존 모델 유지
+  3. manifest 항목이 있으면 그 경로/버전 사용, 버전 변경 시 교체
+  4. predict_many: payload 의 feature_cols/cat_cols 로 한 번에 예측
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from utils.model_registry import ModelRegistry, atomic_pickle_dump, write_manifest_entry
+
+
+class ConstModel:
+    """행마다 rvol * scale 을 양성 확률로 반환 (배치 호출 횟수 기록)"""
+
+    def __init__(self, scale=0.1):
+        self.scale = scale
+        self.batches = []
+
+    def predict_proba(self, X):
+        self.batches.append(len(X))
+        assert isinstance(X['entry_type'].dtype, pd.CategoricalDtype)
+        p = X['rvol'].fillna(0).to_numpy() * self.scale
+        return np.column_stack([1 - p, p])
+
+
+def _counting_registry(tmp_path, **kwargs):
+    loads = []
+
+    def loader(f):
+        loads.append(f.name)
+        return pickle.load(f)
+
+    registry = ModelRegistry(manifest_path=tmp_path / 'manifest.json', loader=loader, **kwargs)
+    return registry, loads
+
+
+def _bump_mtime(path, seconds=10):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_loads_once(tmp_path):
+    path = tmp_path / 'm.pkl'
+    atomic_pickle_dump({'model': ConstModel(), 'metrics': {'auc': 0.6}}, path)
+    registry, loads = _counting_registry(tmp_path, check_interval=60)
+    registry.register('entry', path)
+
+    first = registry.get('entry')
+    for _ in range(20):
+        assert registry.get('entry') is first
+    assert len(loads) == 1
+    assert first.meta['auc'] == 0.6
+
+    # check_interval 안에서는 파일이 바뀌어도 재확인 안 함, force_check 면 교체
+    atomic_pickle_dump({'model': ConstModel(0.2), 'metrics': {'auc': 0.7}}, path)
+    _bump_mtime(path)
+    assert registry.get('entry') is first
+    assert registry.get('entry', force_check=True).meta['auc'] == 0.7
+    assert registry.load(path) is registry.load(str(path))
+
+
+def test_swap_and_keep_on_corrupt(tmp_path):
+    path = tmp_path / 'm.pkl'
+    atomic_pickle_dump({'model': ConstModel(), 'metrics': {'auc': 0.6}}, path)
+    registry, loads = _counting_registry(tmp_path, check_interval=0)
+    registry.register('entry', path)
+    old = registry.get('entry')
+
+    path.write_bytes(b'not a pickle')
+    _bump_mtime(path)
+    assert registry.get('entry') is old
+    assert registry.stats['failures'] == 1
+
+    atomic_pickle_dump({'model': ConstModel(), 'metrics': {'auc': 0.8}}, path)
+    _bump_mtime(path, 20)
+    new = registry.get('entry')
+    assert new is not old and new.meta['auc'] == 0.8
+    assert registry.stats['reloads'] == 1
+
+
+def test_manifest_version(tmp_path):
+    v1, v2 = tmp_path / 'v1.pkl', tmp_path / 'v2.pkl'
+    atomic_pickle_dump({'model': ConstModel(), 'metrics': {'auc': 0.1}}, v1)
+    atomic_pickle_dump({'model': ConstModel(), 'metrics': {'auc': 0.2}}, v2)
+    registry, _ = _counting_registry(tmp_path, check_interval=0)
+    registry.register('entry', tmp_path / 'missing.pkl')
+    assert registry.get('entry') is None
+
+    write_manifest_entry('entry', v1, version='20261016_0900', manifest_path=tmp_path / 'manifest.json')
+    entry = registry.get('entry')
+    assert (entry.version, entry.meta['auc']) == ('20261016_0900', 0.1)
+
+    write_manifest_entry('entry', v2, version='20261016_1630', manifest_path=tmp_path / 'manifest.json')
+    entry = registry.get('entry')
+    assert (entry.version, entry.meta['auc']) == ('20261016_1630', 0.2)
+    assert registry.summary()['models']['entry']['version'] == '20261016_1630'
+
+
+def test_predict_many_batched(tmp_path):
+    path = tmp_path / 'm.pkl'
+    atomic_pickle_dump({'model': ConstModel(), 'feature_cols': ['rvol', 'entry_type'],
+                        'cat_cols': ['entry_type']}, path)
+    registry, _ = _counting_registry(tmp_path)
+    registry.register('entry', path)
+
+    rows = [{'rvol': 1.0, 'entry_type': 'TREND', 'extra': 1}, {'rvol': 3.0, 'entry_type': 'SMC'},
+            {'entry_type': 'OTHER'}]
+    probs = registry.predict_many('entry', rows)
+    assert np.allclose(probs, [0.1, 0.3, 0.0])
+    assert registry.get('entry').model.batches == [3]
+    assert registry.predict_many('missing', rows) is None
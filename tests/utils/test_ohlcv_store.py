@@ -0,0 +1,142 @@
+"""
+tests/utils/test_ohlcv_store.py
+
+로컬 OHLCV 캐시 테스트 (가짜 fetcher, tmp 디렉토리)
+
+케이스:
+  1. 같은 구간 재요청 → 네트워크 조회 없음 (파일 캐시)
+  2. 구간 확장 → 빈 구간만 조회
+  3. 겹친 봉 종가 변경(수정주가) → 전체 재조회
+  4. 조회 실패 / offline → 캐시된 봉만 반환, 커버리지 미기록
+  5. 평일 구간 빈 응답(yfinance 오류 삼킴) → 커버리지 미기록, 재요청 시 재조회
+  6. 오늘 이후 구간은 커버리지로 기록하지 않음
+  7. missing_ranges 구간 차집합
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.ohlcv_store import OHLCVStore, missing_ranges
+
+pytest.importorskip('pyarrow')
+
+
+class FakeFetcher:
+    """영업일 봉 생성 — scale 로 수정주가 변경 흉내."""
+
+    def __init__(self):
+        self.calls = []
+        self.scale = 1.0
+        self.fail = False
+        self.empty = False
+
+    def __call__(self, symbol, timeframe, start, end, market=None):
+        self.calls.append((start, end))
+        if self.fail:
+            raise ConnectionError('offline')
+        if self.empty:
+            return pd.DataFrame()
+        idx = pd.bdate_range(start, end - pd.Timedelta(days=1))
+        close = (idx - pd.Timestamp('2020-01-01')).days.to_numpy() * self.scale + 1000.0
+        return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1,
+                             'close': close, 'volume': 100.0}, index=idx)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return OHLCVStore(root=tmp_path, fetcher=FakeFetcher(), offline=False)
+
+
+def test_repeat_request_served_from_file(store):
+    first = store.get('005930', '2024-01-01', '2024-03-01')
+    again = OHLCVStore(root=store.root, fetcher=store.fetcher).get('005930', '2024-01-01', '2024-03-01')
+
+    assert len(store.fetcher.calls) == 1
+    pd.testing.assert_frame_equal(first, again, check_freq=False)
+    assert store.path('005930').exists()
+
+
+def test_extension_fetches_only_gap(store):
+    store.get('005930', '2024-01-01', '2024-03-01')
+    df = store.get('005930', '2024-01-01', '2024-04-01')
+
+    start, end = store.fetcher.calls[-1]
+    assert end == pd.Timestamp('2024-04-01')
+    assert pd.Timestamp('2024-02-20') <= start < pd.Timestamp('2024-03-01')   # 겹침 구간만큼 앞당김
+    assert df.index[0] >= pd.Timestamp('2024-01-01') and df.index[-1] < pd.Timestamp('2024-04-01')
+    assert df.index.is_monotonic_increasing and not df.index.has_duplicates
+
+
+def test_adjusted_prices_trigger_refresh(store):
+    store.get('005930', '2024-01-01', '2024-03-01')
+    store.fetcher.scale = 0.5
+    df = store.get('005930', '2024-01-01', '2024-04-01')
+
+    assert store.stats['refreshes'] == 1
+    assert store.fetcher.calls[-1] == (pd.Timestamp('2024-01-01'), pd.Timestamp('2024-04-01'))
+    expected = store.fetcher('005930', '1d', pd.Timestamp('2024-01-01'), pd.Timestamp('2024-04-01'))
+    np.testing.assert_allclose(df['close'].to_numpy(), expected['close'].to_numpy())
+
+
+def test_fetch_failure_returns_cached(store):
+    cached = store.get('005930', '2024-01-01', '2024-03-01')
+    store.fetcher.fail = True
+    df = store.get('005930', '2024-01-01', '2024-04-01')
+
+    pd.testing.assert_frame_equal(df, cached, check_freq=False)
+    store.fetcher.fail = False
+    store.get('005930', '2024-01-01', '2024-04-01')
+    assert store.fetcher.calls[-1][1] == pd.Timestamp('2024-04-01')   # 실패 구간은 다시 조회
+
+    offline = OHLCVStore(root=store.root, fetcher=store.fetcher, offline=True)
+    n_calls = len(store.fetcher.calls)
+    pd.testing.assert_frame_equal(offline.get('005930', '2023-06-01', '2024-04-01'),
+                                  store.read('005930'), check_freq=False)
+    assert len(store.fetcher.calls) == n_calls
+
+
+def test_empty_result_is_not_covered(store):
+    cached = store.get('005930', '2024-01-01', '2024-03-01')
+    store.fetcher.empty = True
+    df = store.get('005930', '2024-01-01', '2024-04-01')
+    pd.testing.assert_frame_equal(df, cached, check_freq=False)
+    assert store.stats['empty'] == 1
+
+    store.fetcher.empty = False
+    df = store.get('005930', '2024-01-01', '2024-04-01')
+    assert store.fetcher.calls[-1][1] == pd.Timestamp('2024-04-01')   # 빈 구간은 다시 조회
+    assert df.index[-1] >= pd.Timestamp('2024-03-29')
+
+    # 주말만인 구간은 빈 응답이 정상 → 커버리지 기록
+    store.fetcher.empty = True
+    store.get('005930', '2024-04-06', '2024-04-08')
+    n_calls = len(store.fetcher.calls)
+    store.get('005930', '2024-04-06', '2024-04-08')
+    assert len(store.fetcher.calls) == n_calls
+
+
+def test_today_is_never_covered(store):
+    today = pd.Timestamp.now(tz='Asia/Seoul').normalize().tz_localize(None)
+    store.get('005930', today - pd.Timedelta(days=10))
+    store.get('005930', today - pd.Timedelta(days=10))
+
+    assert len(store.fetcher.calls) == 2
+    assert store.fetcher.calls[-1][0] >= today - pd.Timedelta(days=7)
+
+
+def test_missing_ranges():
+    ts = pd.Timestamp
+    coverage = [(ts('2024-01-10'), ts('2024-01-20')), (ts('2024-01-15'), ts('2024-01-25')),
+                (ts('2024-02-01'), ts('2024-02-05'))]
+    assert missing_ranges(coverage, ts('2024-01-01'), ts('2024-02-10')) == [
+        (ts('2024-01-01'), ts('2024-01-10')),
+        (ts('2024-01-25'), ts('2024-02-01')),
+        (ts('2024-02-05'), ts('2024-02-10')),
+    ]
+    assert missing_ranges(coverage, ts('2024-01-12'), ts('2024-01-24')) == []
+    assert missing_ranges([], ts('2024-01-01'), ts('2024-01-02')) == [(ts('2024-01-01'), ts('2024-01-02'))]
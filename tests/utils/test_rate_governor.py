@@ -0,0 +1,182 @@
+"""
+tests/utils/test_rate_governor.py
+
+RateGovernor (프로세스 간 공용 토큰 버킷) 테스트
+
+케이스:
+  1. 버스트까지 즉시 획득, 이후 rate 에 맞춘 대기 시간
+  2. 대시보드는 마지막 토큰을 남김
+  3. 상위 우선순위 대기 중이면 하위 우선순위 양보
+  4. rate 에러 보고 → 백오프 + 보충 속도 감소, 정상 응답으로 복구
+  5. 같은 디렉토리/앱 키의 두 인스턴스가 버킷 공유
+  6. rate_priority 컨텍스트 / is_rate_limited 판정
+  7. 이벤트 루프 스레드의 acquire: 진입은 대기 없음, 주문/청산은 제한 시간까지만 대기 (스레드는 대기 후 획득)
+  8. KiwoomAPI 세션: 토큰이 없어도 주문은 전송, 조회는 APIException
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import asyncio
+import time
+
+import pytest
+
+from utils import rate_governor
+from utils.rate_governor import (
+    PRIORITY_DASHBOARD,
+    PRIORITY_ENTRY,
+    PRIORITY_EXIT,
+    PRIORITY_ORDER,
+    RateGovernor,
+    current_priority,
+    fcntl,
+    group_for,
+    is_rate_limited,
+    rate_priority,
+)
+
+
+T0 = time.time() + 60.0   # 슬롯 생성 시각 이후 (버킷 가득 찬 상태에서 시작)
+
+
+def _governor(tmp_path, **kwargs):
+    kwargs.setdefault('rates', {'tr': 10.0})
+    kwargs.setdefault('burst', 3)
+    return RateGovernor('app-key', directory=tmp_path, **kwargs)
+
+
+def _drain(governor, now, n):
+    for _ in range(n):
+        assert governor.try_acquire('tr', PRIORITY_ENTRY, now) == 0
+
+
+def test_burst_then_paced(tmp_path):
+    governor = _governor(tmp_path)
+    _drain(governor, T0, 3)
+    assert governor.try_acquire('tr', PRIORITY_ENTRY, T0) == pytest.approx(0.1)
+    assert governor.try_acquire('tr', PRIORITY_ENTRY, T0 + 0.11) == 0
+
+
+def test_dashboard_keeps_reserve(tmp_path):
+    governor = _governor(tmp_path)
+    _drain(governor, T0, 2)
+    assert governor.try_acquire('tr', PRIORITY_DASHBOARD, T0) > 0
+    assert governor.try_acquire('tr', PRIORITY_ENTRY, T0) == 0
+
+
+def test_lower_priority_yields_to_waiting_higher(tmp_path):
+    governor = _governor(tmp_path)
+    _drain(governor, T0, 3)
+    assert governor.try_acquire('tr', PRIORITY_EXIT, T0) > 0           # 청산 조회 대기 표시
+    # 토큰이 보충돼도 대기 표시 유효 시간 동안 진입 스캔은 양보
+    assert governor.try_acquire('tr', PRIORITY_ENTRY, T0 + 0.15) > 0
+    assert governor.stats['yielded'] == 1
+    assert governor.try_acquire('tr', PRIORITY_EXIT, T0 + 0.15) == 0
+    assert governor.try_acquire('tr', PRIORITY_ENTRY, T0 + 0.5) == 0
+
+
+def test_backoff_on_rate_limit(tmp_path):
+    governor = _governor(tmp_path)
+    governor.report('tr', rate_limited=True, now=T0)
+    snap = governor.snapshot('tr')
+    assert snap['backoff_until'] == T0 + 1.0
+    assert snap['penalty'] == 0.5
+    assert governor.try_acquire('tr', PRIORITY_ORDER, T0 + 0.5) == pytest.approx(0.5)
+
+    governor.report('tr', rate_limited=True, now=T0 + 1.0)
+    assert governor.snapshot('tr')['backoff_until'] == T0 + 3.0      # 지수 백오프
+
+    # 백오프 동안은 보충 없음, 이후 줄어든 속도(10 × 0.25)로 보충
+    assert governor.try_acquire('tr', PRIORITY_ENTRY, T0 + 3.0) == pytest.approx(1 / 2.5)
+    governor.report('tr', rate_limited=False, now=T0 + 4.0)
+    snap = governor.snapshot('tr')
+    assert snap['strikes'] == 0
+    assert snap['penalty'] == pytest.approx(0.3)
+
+
+@pytest.mark.skipif(fcntl is None, reason="flock 미지원 환경")
+def test_instances_share_bucket(tmp_path):
+    a = _governor(tmp_path)
+    b = _governor(tmp_path)
+    assert a.snapshot('tr')['shared']
+    _drain(a, T0, 3)
+    assert b.try_acquire('tr', PRIORITY_ENTRY, T0) > 0
+    # 다른 그룹(주문)은 별도 버킷
+    assert b.try_acquire('order', PRIORITY_ORDER, T0) == 0
+
+
+def test_priority_context_and_classification():
+    assert current_priority() == PRIORITY_ENTRY
+    with rate_priority(PRIORITY_EXIT):
+        assert current_priority() == PRIORITY_EXIT
+    assert current_priority(PRIORITY_DASHBOARD) == PRIORITY_DASHBOARD
+
+    assert group_for('kt10001') == 'order'
+    assert group_for('ka10080') == 'tr'
+    assert group_for(None) == 'tr'
+
+    assert is_rate_limited(429)
+    assert is_rate_limited(400, {'error_code': 1700})
+    assert is_rate_limited(200, {'return_code': 5, 'return_msg': '허용된 요청 개수를 초과하였습니다[1700]'})
+    assert not is_rate_limited(200, {'return_code': 0})
+
+
+def test_event_loop_acquire_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(rate_governor, '_LOOP_WAIT_MAX', 0.3)
+    governor = _governor(tmp_path, rates={'tr': 100.0})
+    governor.report('tr', rate_limited=True)                          # 1초 백오프
+
+    async def on_loop(priority):
+        started = time.monotonic()
+        granted = governor.acquire('tr', priority)
+        return granted, time.monotonic() - started
+
+    # 진입 스캔: 대기 없이 실패
+    granted, elapsed = asyncio.run(on_loop(PRIORITY_ENTRY))
+    assert granted is False and elapsed < 0.1
+    # 주문/청산: 제한 시간 안에 토큰이 안 나오면 실패 (세션은 주문을 그대로 전송), 안에 나오면 대기 후 획득
+    granted, elapsed = asyncio.run(on_loop(PRIORITY_ORDER))
+    assert granted is False and elapsed < 0.1
+
+    monkeypatch.setattr(rate_governor, '_LOOP_WAIT_MAX', 3.0)
+    granted, elapsed = asyncio.run(on_loop(PRIORITY_EXIT))
+    assert granted is True and elapsed < 1.5
+
+    # 루프 밖(스레드)에서는 백오프가 끝날 때까지 대기 후 획득
+    governor.report('tr', rate_limited=False)
+    governor.report('tr', rate_limited=True)
+
+    async def in_thread():
+        return await asyncio.to_thread(governor.acquire, 'tr', PRIORITY_ENTRY, 3.0)
+
+    assert asyncio.run(in_thread()) is True
+
+
+def test_session_never_drops_orders(monkeypatch):
+    import requests
+    from kiwoom_api import APIException, _GovernedSession
+
+    class _NoToken:
+        reported = []
+
+        def acquire(self, group, priority):
+            return False
+
+        def report(self, group, rate_limited):
+            self.reported.append(group)
+
+    class _Response:
+        status_code = 200
+
+    sent = []
+    monkeypatch.setattr(requests.Session, 'request',
+                        lambda self, method, url, *a, **kw: sent.append(kw['headers']['api-id']) or _Response())
+    session = _GovernedSession(_NoToken(), PRIORITY_ENTRY)
+
+    session.request('POST', 'https://api.kiwoom.com/api/dostk/ordr', headers={'api-id': 'kt10001'})
+    with pytest.raises(APIException):
+        session.request('POST', 'https://api.kiwoom.com/api/dostk/acnt', headers={'api-id': 'ka01690'})
+    assert sent == ['kt10001']
+    assert _NoToken.reported == ['order']
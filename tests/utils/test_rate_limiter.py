@@ -0,0 +1,71 @@
+"""
+tests/utils/test_rate_limiter.py
+
+TokenBucket 테스트
+
+케이스:
+  1. 버스트 용량까지는 대기 없이 즉시 획득
+  2. 용량 초과분은 rate 에 맞춰 지연
+  3. 대기열에서는 priority 가 낮은(우선) 호출이 먼저 토큰을 받음
+  4. 취소된 대기자는 토큰을 소비하지 않음
+"""
+
+import sys
+import os
+import asyncio
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from utils.rate_limiter import TokenBucket, PRIORITY_HELD, PRIORITY_SCAN
+
+
+@pytest.mark.asyncio
+async def test_burst_is_immediate():
+    bucket = TokenBucket(rate=10, capacity=3)
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_excess_is_paced_by_rate():
+    bucket = TokenBucket(rate=20, capacity=1)
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+    # 1개 즉시 + 4개 × 50ms
+    assert time.monotonic() - start >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_priority_order():
+    bucket = TokenBucket(rate=50, capacity=1)
+    await bucket.acquire()  # 버킷 비우기
+    order = []
+
+    async def worker(name, prio):
+        await bucket.acquire(prio)
+        order.append(name)
+
+    await asyncio.gather(
+        worker("scan1", PRIORITY_SCAN),
+        worker("scan2", PRIORITY_SCAN),
+        worker("held", PRIORITY_HELD),
+    )
+    assert order == ["held", "scan1", "scan2"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_slot():
+    bucket = TokenBucket(rate=20, capacity=1)
+    await bucket.acquire()
+    task = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0)
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start < 0.1
+    assert bucket.pending == 0
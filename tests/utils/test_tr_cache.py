@@ -0,0 +1,149 @@
+"""
+tests/utils/test_tr_cache.py
+
+TRCache / CachedKiwoomAPI (TR 조회 캐시 + 요청 병합) 테스트
+
+케이스:
+  1. 같은 인자 재호출 → 캐시, 다른 인자 / 연속조회 → 새 조회, 반환은 복사본
+  2. 분봉 만료 시각은 다음 봉 경계를 넘지 않음
+  3. 실패 응답은 저장하지 않음, TTL 0 이면 캐시 안 함
+  4. 동기 동시 호출 병합 (스레드)
+  5. 비동기 동시 호출 병합 + 먼저 요청한 쪽 취소돼도 나머지는 결과 수신
+  6. 프록시: 캐시 외 메서드 / 속성 대입은 원본으로
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.tr_cache import CachedKiwoomAPI, TRCache, next_bar_boundary
+
+
+class FakeAPI:
+    def __init__(self, delay=0.0, return_code=0):
+        self.calls = []
+        self.delay = delay
+        self.return_code = return_code
+        self.access_token = 'T0'
+
+    def get_minute_chart(self, stock_code, tic_scope="1", upd_stkpc_tp="1", cont_yn="N", next_key=""):
+        self.calls.append((stock_code, tic_scope, cont_yn))
+        time.sleep(self.delay)
+        return {'return_code': self.return_code, 'stk_min_pole_chart_qry': [{'cur_prc': '100'}]}
+
+    def get_investor_trend(self, stock_code, dt=None, cont_yn="N", next_key=""):
+        self.calls.append((stock_code, 'trend', cont_yn))
+        return {'return_code': 0, 'output': []}
+
+    def order_buy(self, stock_code, quantity):
+        self.calls.append((stock_code, 'buy', quantity))
+        return {'return_code': 0}
+
+
+class FakeAsyncAPI:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_minute_chart(self, stock_code, tic_scope="1", upd_stkpc_tp="1", cont_yn="N",
+                               next_key="", deadline=None):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {'return_code': 0, 'stock_code': stock_code}
+
+
+def test_read_through_and_copy():
+    raw = FakeAPI()
+    api = CachedKiwoomAPI(raw, TRCache())
+
+    first = api.get_minute_chart('005930', tic_scope='5')
+    first['data'] = 'mutated'
+    second = api.get_minute_chart(stock_code='005930', tic_scope='5', upd_stkpc_tp='1')
+    assert 'data' not in second
+    assert len(raw.calls) == 1
+
+    api.get_minute_chart('005930', tic_scope='1')
+    api.get_minute_chart('005930', tic_scope='5', cont_yn='Y', next_key='K')
+    assert len(raw.calls) == 3
+
+    summary = api.cache.summary()
+    assert (summary['hits'], summary['misses']) == (1, 2)
+    assert summary['by_tr']['ka10080']['hit_rate'] == pytest.approx(1 / 3, abs=1e-3)
+
+
+def test_expiry_aligned_to_bar_boundary():
+    cache = TRCache(ttls={'ka10080': 600})
+    api = CachedKiwoomAPI(FakeAPI(), cache)
+    now = time.time()
+    api.get_minute_chart('005930', tic_scope='5')
+    (expires, _), = cache._store.values()
+    assert expires <= next_bar_boundary(now + 1, 5)
+    assert expires - now <= 300 + 1
+
+    lt = time.localtime(expires)
+    assert lt.tm_min % 5 == 0 and lt.tm_sec == 0
+
+
+def test_failures_not_cached_and_ttl_zero_disables():
+    raw = FakeAPI(return_code=-1)
+    api = CachedKiwoomAPI(raw, TRCache())
+    api.get_minute_chart('005930')
+    api.get_minute_chart('005930')
+    assert len(raw.calls) == 2
+
+    raw = FakeAPI()
+    api = CachedKiwoomAPI(raw, TRCache(ttls={'ka10059': 0}))
+    api.get_investor_trend('005930')
+    api.get_investor_trend('005930')
+    assert len(raw.calls) == 2
+
+
+def test_sync_singleflight():
+    raw = FakeAPI(delay=0.1)
+    cache = TRCache()
+    api = CachedKiwoomAPI(raw, cache)
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(lambda _: api.get_minute_chart('005930', tic_scope='5'), range(6)))
+    assert len(raw.calls) == 1
+    assert all(r['return_code'] == 0 for r in results)
+    stats = cache.summary()
+    assert stats['misses'] == 1
+    assert stats['coalesced'] + stats['hits'] == 5
+
+
+@pytest.mark.asyncio
+async def test_async_singleflight_survives_leader_cancel():
+    raw = FakeAsyncAPI()
+    cache = TRCache()
+    api = CachedKiwoomAPI(raw, cache)
+
+    leader = asyncio.ensure_future(api.get_minute_chart('005930', tic_scope='5'))
+    await asyncio.sleep(0)
+    followers = [asyncio.ensure_future(api.get_minute_chart('005930', tic_scope='5', deadline=3))
+                 for _ in range(4)]
+    await asyncio.sleep(0)
+    leader.cancel()
+    results = await asyncio.gather(*followers)
+
+    assert raw.calls == 1
+    assert all(r['stock_code'] == '005930' for r in results)
+    assert cache.summary()['coalesced'] == 4
+    assert (await api.get_minute_chart('005930', tic_scope='5'))['return_code'] == 0
+    assert raw.calls == 1
+
+
+def test_proxy_passthrough():
+    raw = FakeAPI()
+    api = CachedKiwoomAPI(raw, TRCache())
+    api.order_buy('005930', 1)
+    api.order_buy('005930', 1)
+    assert len(raw.calls) == 2
+
+    api.access_token = None
+    assert raw.access_token is None
+    assert api.raw is raw
@@ -0,0 +1,220 @@
+"""
+보유 종목 틱 단위 청산 감시 (ExitGuard)
+
+check_exit_signal 은 DataFrame 기반(VWAP/ATR/신호 재계산)이라 60초 주기 스윕에서만 돈다.
+손절은 분 단위 지연만큼 슬리피지가 생기므로, 포지션별 임계가를 미리 계산해 두고
+REAL 체결 틱마다 O(1) 비교 → 임계가를 넘을 때만 전체 청산 로직으로 승격한다.
+
+포지션별 임계값 (arm 시 계산):
+  - stop:     하한가 — 긴급/구조/Hard 손절, TP2 후 BE 스탑, 트레일링 스탑, DEFENSIVE 손절 중 최고가
+  - upper:    상한가 — R-TP1/TP2, A+ TP, DEFENSIVE 익절, 트레일링 활성화가 중 최저가
+  - trail:    트레일링 활성 시 (고가 기준점, 스탑까지 거리) → 틱 신고가마다 스탑 끌어올림
+  - ef:       진입 검증(3봉 조기 이탈) 가격 + 마감 시각
+
+임계가는 OptimizedExitLogic 보다 보수적으로 (먼저 걸리게) 잡는다 — 승격은 판정이 아니라
+전체 로직 재평가 요청이므로, 오탐은 평가 1회 비용뿐이고 누락은 슬리피지가 된다.
+
+사용:
+  guard = ExitGuard.from_config(config)
+  guard.sync(positions)                          # 주기 스윕/체결 후
+  reason = guard.check(code, price, now)         # 틱마다, None 이면 통과
+  if reason: check_exit_signal(code, df); guard.arm(code, positions[code], now)
+
+v1.0 2026-10-16: 최초 작성
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_INF = float('inf')
+
+
+class _Thresholds:
+    __slots__ = ('stop', 'upper', 'anchor', 'trail_distance', 'trail_floor',
+                 'ef_price', 'ef_deadline', 'cooldown_until')
+
+    def __init__(self):
+        self.stop = 0.0
+        self.upper = _INF
+        self.anchor = 0.0
+        self.trail_distance = 0.0
+        self.trail_floor = 0.0
+        self.ef_price = 0.0
+        self.ef_deadline: Optional[datetime] = None
+        self.cooldown_until: Optional[datetime] = None
+
+
+class ExitGuard:
+    """
+    보유 포지션별 임계가 보관 + 틱 비교
+
+    Args:
+        max_stop_pct: 구조 손절 cap / 구조 손절 없을 때 Hard Stop (%)
+        emergency_stop_pct: 긴급 손절 (%)
+        be_stop_buffer_pct: TP2 이후 BE 스탑 버퍼 (%)
+        trailing_activation_pct: 트레일링 활성화 수익률 (%)
+        ef_enabled: 진입 검증 조기 이탈 사용 여부
+        ef_max_bars: 진입 후 검증 봉 수 (5분봉)
+        ef_min_pnl_pct: 검증 기간 내 이탈 손실률 (%)
+        cooldown_seconds: 승격 후 같은 종목 재승격 최소 간격 (최소 락/1봉 유예로 미청산 시 폭주 방지)
+    """
+
+    def __init__(
+        self,
+        max_stop_pct: float = 5.0,
+        emergency_stop_pct: float = 6.0,
+        be_stop_buffer_pct: float = 0.2,
+        trailing_activation_pct: float = 2.0,
+        ef_enabled: bool = True,
+        ef_max_bars: int = 3,
+        ef_min_pnl_pct: float = -0.3,
+        cooldown_seconds: float = 3.0,
+    ):
+        self.max_stop_pct = max_stop_pct
+        self.emergency_stop_pct = emergency_stop_pct
+        self.be_stop_buffer_pct = be_stop_buffer_pct
+        self.trailing_activation_pct = trailing_activation_pct
+        self.ef_enabled = ef_enabled
+        self.ef_max_bars = ef_max_bars
+        self.ef_min_pnl_pct = ef_min_pnl_pct
+        self.cooldown = timedelta(seconds=cooldown_seconds)
+        self._armed: Dict[str, _Thresholds] = {}
+        self.stats = {'ticks': 0, 'escalations': 0, 'suppressed': 0, 'trail_moves': 0}
+
+    @classmethod
+    def from_config(cls, config) -> 'ExitGuard':
+        """OptimizedExitLogic / check_exit_signal 과 같은 설정 키 사용."""
+        ev_cfg = config.get('entry_verification', {}) or {}
+        return cls(
+            max_stop_pct=config.get('risk_control', {}).get('structure_based_stop', {}).get('max_stop_pct', 5.0),
+            emergency_stop_pct=config.get('risk_control.emergency_stop_pct', 6.0),
+            be_stop_buffer_pct=config.get('risk_control.be_stop_buffer_pct', 0.2),
+            trailing_activation_pct=config.get('risk_control.trailing_activation_pct', 2.0),
+            ef_enabled=ev_cfg.get('enabled', True),
+            ef_max_bars=int(ev_cfg.get('max_bars', 3)),
+            ef_min_pnl_pct=float(ev_cfg.get('min_pnl_pct', -0.3)),
+        )
+
+    # ── 임계값 계산 ───────────────────────────────────────────────────────
+
+    def arm(self, symbol: str, position: Dict, now: Optional[datetime] = None) -> bool:
+        """포지션 필드로 임계가 재계산. 진입가 없으면 감시 해제 후 False."""
+        entry = float(position.get('entry_price') or position.get('avg_price') or 0)
+        if entry <= 0:
+            self.disarm(symbol)
+            return False
+
+        th = _Thresholds()
+        stage = position.get('partial_exit_stage', 0) or 0
+        trailing = bool(position.get('trailing_active'))
+
+        stops = [entry * (1 - self.emergency_stop_pct / 100)]
+        structure = position.get('structure_stop_price')
+        if structure:
+            stops.append(max(float(structure), entry * (1 - self.max_stop_pct / 100)))
+        else:
+            stops.append(entry * (1 - self.max_stop_pct / 100))
+        if stage >= 2:
+            stops.append(entry * (1 + self.be_stop_buffer_pct / 100))
+        if position.get('defensive_mode') and position.get('defensive_stop_price'):
+            stops.append(float(position['defensive_stop_price']))
+
+        trail_stop = position.get('trailing_stop_price')
+        if trailing and trail_stop:
+            trail_stop = float(trail_stop)
+            th.anchor = float(position.get('highest_price') or entry)
+            th.trail_distance = max(th.anchor - trail_stop, 0.0)
+            th.trail_floor = trail_stop
+            stops.append(trail_stop)
+        th.stop = max(stops)
+
+        uppers = []
+        if stage < 1 and position.get('r_tp1_price'):
+            uppers.append(float(position['r_tp1_price']))
+        elif stage == 1 and position.get('r_tp2_price'):
+            uppers.append(float(position['r_tp2_price']))
+        if position.get('a_plus_tp_price') and not position.get('a_plus_tp_hit'):
+            uppers.append(float(position['a_plus_tp_price']))
+        if position.get('defensive_mode') and position.get('defensive_tp_price'):
+            uppers.append(float(position['defensive_tp_price']))
+        if not trailing:
+            uppers.append(entry * (1 + self.trailing_activation_pct / 100))
+        th.upper = min(uppers) if uppers else _INF
+
+        entry_time = position.get('entry_time')
+        if isinstance(entry_time, str):
+            try:
+                entry_time = datetime.fromisoformat(entry_time)
+            except ValueError:
+                entry_time = None
+        if self.ef_enabled and isinstance(entry_time, datetime):
+            th.ef_price = entry * (1 + self.ef_min_pnl_pct / 100)
+            th.ef_deadline = entry_time + timedelta(minutes=5 * (self.ef_max_bars + 1))
+
+        previous = self._armed.get(symbol)
+        if previous is not None:
+            th.cooldown_until = previous.cooldown_until
+        self._armed[symbol] = th
+        return True
+
+    def disarm(self, symbol: str) -> None:
+        self._armed.pop(symbol, None)
+
+    def sync(self, positions: Dict[str, Dict], now: Optional[datetime] = None) -> int:
+        """보유 종목 전체 재무장, 청산된 종목 해제. 감시 종목 수 반환."""
+        for symbol in [s for s in self._armed if s not in positions]:
+            del self._armed[symbol]
+        for symbol, position in list(positions.items()):   # 워커 스레드 청산과 동시 변경 대비 스냅샷
+            self.arm(symbol, position, now)
+        return len(self._armed)
+
+    def is_armed(self, symbol: str) -> bool:
+        return symbol in self._armed
+
+    # ── 틱 비교 ───────────────────────────────────────────────────────────
+
+    def check(self, symbol: str, price: float, now: datetime) -> Optional[str]:
+        """
+        틱 1건 비교 (O(1)).
+
+        Returns:
+            넘은 임계값 이름 ('stop' | 'upper' | 'early_failure') 또는 None
+        """
+        th = self._armed.get(symbol)
+        if th is None:
+            return None
+        self.stats['ticks'] += 1
+
+        if th.trail_distance > 0 and price > th.anchor:
+            th.anchor = price
+            moved = price - th.trail_distance
+            if moved > th.trail_floor:
+                th.trail_floor = moved
+                if moved > th.stop:
+                    th.stop = moved
+                    self.stats['trail_moves'] += 1
+
+        if price <= th.stop:
+            reason = 'stop'
+        elif price >= th.upper:
+            reason = 'upper'
+        elif th.ef_deadline is not None and now < th.ef_deadline and price < th.ef_price:
+            reason = 'early_failure'
+        else:
+            return None
+
+        if th.cooldown_until is not None and now < th.cooldown_until:
+            self.stats['suppressed'] += 1
+            return None
+        th.cooldown_until = now + self.cooldown
+        self.stats['escalations'] += 1
+        return reason
+
+    def snapshot(self, symbol: str) -> Optional[Dict[str, float]]:
+        th = self._armed.get(symbol)
+        if th is None:
+            return None
+        return {'stop': th.stop, 'upper': th.upper, 'anchor': th.anchor,
+                'ef_price': th.ef_price, 'ef_deadline': th.ef_deadline}
@@ -442,6 +442,20 @@ class KISHTTPConfig(HTTPClientConfig):
     USER_AGENT = "KISCollector/1.0 (Python aiohttp)"
 
 
+# 키움 REST API 전용 설정 (kiwoom_api_async.AsyncKiwoomAPI)
+class KiwoomHTTPConfig(HTTPClientConfig):
+    """키움 REST API 전용 HTTP 설정 (재시도/마감시간은 AsyncKiwoomAPI 가 관리)"""
+
+    CONNECT_TIMEOUT = 5
+    READ_TIMEOUT = 15
+    TOTAL_TIMEOUT = 30
+
+    CONNECTION_POOL_SIZE = 20
+    CONNECTION_LIMIT_PER_HOST = 10   # 초당 TR 예산(5~10건)을 넘는 동시 연결은 불필요
+
+    USER_AGENT = "KiwoomTrading/1.0 (Python aiohttp)"
+
+
 # 뉴스 API 전용 설정
 class NewsHTTPConfig(HTTPClientConfig):
     """뉴스 API 전용 HTTP 설정"""
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rolling Linear Regression 커널 (O(n), 누적합 기반)
+
+Pine Script linreg(src, length, offset) 과 동일한 값을 계산한다.
+  linreg = intercept + slope * (length - 1 - offset)
+
+- 입력: 1-D (bars) 또는 2-D (symbols × bars) 배열 / pd.Series
+- 윈도우 내 NaN 이 하나라도 있으면 NaN (pandas rolling(min_periods=length) 과 동일)
+- 처음 length-1 개 봉은 NaN
+
+누적합은 구간 길이에 비례해 오차가 커지므로 블록 단위(기본 4096봉)로 나눠
+블록마다 인덱스/값을 재중심화한다 → 수년치 백테스트 시계열에서도 오차가 일정.
+
+사용처:
+- analyzers/squeeze_momentum_lazybear.SqueezeMomentumLazyBear._linreg
+- analyzers/indicators.calculate_momentum_linreg
+- utils/squeeze_momentum.py, utils/squeeze_momentum_realtime.py (기울기)
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[np.ndarray, pd.Series]
+
+_BLOCK = 4096
+
+
+def _coeffs_block(y: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    2-D 블록(rows × m)의 윈도우별 (slope, mean) 계산. 윈도우 미완성/NaN 포함 → NaN.
+    """
+    rows, m = y.shape
+    slope = np.full((rows, m), np.nan)
+    mean = np.full((rows, m), np.nan)
+    if m < length:
+        return slope, mean
+
+    nan_mask = np.isnan(y)
+    # 값 재중심화 (행별 유효값 평균) → 누적합 크기 축소
+    filled = np.where(nan_mask, 0.0, y)
+    valid = np.maximum((~nan_mask).sum(axis=1, keepdims=True), 1)
+    center = filled.sum(axis=1, keepdims=True) / valid
+    y0 = np.where(nan_mask, 0.0, y - center)
+
+    k = np.arange(m, dtype=np.float64)
+    zeros = np.zeros((rows, 1))
+    cs_y = np.concatenate([zeros, np.cumsum(y0, axis=1)], axis=1)
+    cs_ky = np.concatenate([zeros, np.cumsum(y0 * k, axis=1)], axis=1)
+    cs_nan = np.concatenate([zeros, np.cumsum(nan_mask, axis=1)], axis=1)
+
+    end = np.arange(length, m + 1)          # 윈도우 끝(exclusive)
+    start = end - length                     # 윈도우 시작 (= 로컬 x=0 의 전역 인덱스)
+    s_y = cs_y[:, end] - cs_y[:, start]
+    s_ky = cs_ky[:, end] - cs_ky[:, start]
+    n_nan = cs_nan[:, end] - cs_nan[:, start]
+
+    # 로컬 x = 0..length-1 기준 Σx·y
+    s_xy = s_ky - start * s_y
+    x_mean = (length - 1) / 2.0
+    s_xx = length * (length * length - 1) / 12.0
+
+    w_slope = (s_xy - x_mean * s_y) / s_xx
+    w_mean = s_y / length + center
+    invalid = n_nan > 0
+    w_slope[invalid] = np.nan
+    w_mean[invalid] = np.nan
+
+    slope[:, length - 1:] = w_slope
+    mean[:, length - 1:] = w_mean
+    return slope, mean
+
+
+def rolling_linreg_coeffs(src: ArrayLike, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    윈도우별 회귀 기울기와 마지막 봉(offset=0) 회귀값.
+
+    Args:
+        src: 1-D 또는 2-D (symbols × bars) 값
+        length: 회귀 윈도우 길이
+
+    Returns:
+        (slope, value) — src 와 같은 shape 의 float64 배열
+    """
+    if length < 1:
+        raise ValueError(f"length must be >= 1: {length}")
+
+    arr = np.asarray(src, dtype=np.float64)
+    squeeze = arr.ndim == 1
+    y = arr.reshape(1, -1) if squeeze else arr
+    if y.ndim != 2:
+        raise ValueError(f"src must be 1-D or 2-D: ndim={arr.ndim}")
+
+    n = y.shape[1]
+    slope = np.full(y.shape, np.nan)
+    value = np.full(y.shape, np.nan)
+
+    if length == 1:
+        # 점 1개 회귀: 기울기 0, 값 = 자기 자신 (분모 0 → y_mean 반환과 동일)
+        slope = np.where(np.isnan(y), np.nan, 0.0)
+        value = y.copy()
+    else:
+        x_end = (length - 1) / 2.0  # offset=0 일 때 (length-1) - x_mean
+        # 블록 경계에서 윈도우가 끊기지 않도록 length-1 봉씩 겹쳐서 처리
+        for block_start in range(0, n, _BLOCK):
+            lo = max(0, block_start - (length - 1))
+            hi = min(n, block_start + _BLOCK)
+            b_slope, b_mean = _coeffs_block(y[:, lo:hi], length)
+            skip = block_start - lo
+            slope[:, block_start:hi] = b_slope[:, skip:]
+            value[:, block_start:hi] = b_mean[:, skip:] + b_slope[:, skip:] * x_end
+
+    if squeeze:
+        return slope[0], value[0]
+    return slope, value
+
+
+def rolling_linreg(src: ArrayLike, length: int, offset: int = 0) -> ArrayLike:
+    """
+    Pine Script linreg(src, length, offset).
+
+    pd.Series 입력 시 같은 index 의 Series 반환, 그 외에는 ndarray.
+    """
+    slope, value = rolling_linreg_coeffs(src, length)
+    if offset:
+        value = value - slope * offset
+    if isinstance(src, pd.Series):
+        return pd.Series(value, index=src.index, name=src.name)
+    return value
+
+
+def rolling_linreg_slope(src: ArrayLike, length: int) -> ArrayLike:
+    """
+    윈도우별 회귀 기울기 (np.polyfit(range(length), window, 1)[0] 과 동일).
+
+    pd.Series 입력 시 같은 index 의 Series 반환, 그 외에는 ndarray.
+    """
+    slope, _ = rolling_linreg_coeffs(src, length)
+    if isinstance(src, pd.Series):
+        return pd.Series(slope, index=src.index, name=src.name)
+    return slope
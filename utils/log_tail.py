@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+utils/log_tail.py
+
+증분 로그 인덱서 — 파일별 바이트 오프셋을 기억하고 새로 붙은 줄만 파싱
+
+- LogTail: 마지막으로 읽은 오프셋 이후의 '완성된 줄'만 반환 (쓰는 중인 마지막 줄은 다음 poll 로)
+  파일이 줄었거나(truncate) inode 가 바뀌면(rotate) 처음부터 다시 읽고 reset 신호
+- LogIndex: LogTail + 줄 파서 → 종류(kind)별 bounded ring (collections.deque)
+  파서: parse(line, line_no) → (kind, uid, event) | None
+  같은 ring 안에서 uid 중복은 무시 (ring 에서 밀려나면 uid 도 해제 → 메모리 상한 고정)
+
+대시보드 폴링 비용이 '장 시작 후 누적 로그 크기'가 아니라 '직전 폴링 이후 추가된 줄 수'에 비례.
+
+사용처: api_server /api/decision-log (auto_trading / smc_decision / signal_orchestrator 로그)
+"""
+
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+
+class LogTail:
+    """파일 1개 증분 reader (바이트 오프셋 유지)"""
+
+    def __init__(self, path: Path, encoding: str = 'utf-8'):
+        self.path = Path(path)
+        self.encoding = encoding
+        self.offset = 0
+        self._inode: Optional[int] = None
+
+    def poll(self) -> Tuple[bool, List[str]]:
+        """
+        Returns:
+            (reset, lines) — reset=True 면 처음부터 다시 읽은 것 (기존 인덱스 폐기 필요)
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False, []
+
+        reset = False
+        if self._inode is not None and (st.st_ino != self._inode or st.st_size < self.offset):
+            self.offset = 0
+            reset = True
+        self._inode = st.st_ino
+        if st.st_size == self.offset:
+            return reset, []
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            chunk = f.read(st.st_size - self.offset)
+        end = chunk.rfind(b'\n')
+        if end < 0:
+            return reset, []
+        self.offset += end + 1
+        text = chunk[:end].decode(self.encoding, errors='replace')
+        return reset, text.split('\n')
+
+
+class LogIndex:
+    """
+    LogTail + 파서 → 종류별 최근 이벤트 ring (스레드 안전)
+
+    Args:
+        path: 로그 파일 경로
+        parse: parse(line, line_no) → (kind, uid, event) 또는 None
+        maxlen: 종류별 ring 크기 (int 또는 {kind: int}, 없는 kind 는 default_maxlen)
+    """
+
+    def __init__(self, path: Path, parse: Callable[[str, int], Optional[Tuple[str, str, dict]]],
+                 maxlen=50, default_maxlen: int = 50):
+        self.tail = LogTail(path)
+        self.parse = parse
+        self._maxlen = maxlen if isinstance(maxlen, dict) else {}
+        self._default_maxlen = maxlen if isinstance(maxlen, int) else default_maxlen
+        self._rings: Dict[str, Deque[Tuple[str, int, dict]]] = {}
+        self._uids: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.lines = 0
+        self.stats = {'polls': 0, 'lines': 0, 'events': 0, 'resets': 0}
+
+    @property
+    def path(self) -> Path:
+        return self.tail.path
+
+    def clear(self) -> None:
+        """ring 비우기 (파서가 구간 전환 시 호출 가능 — refresh 안에서 호출해도 안전)."""
+        self._rings.clear()
+        self._uids.clear()
+
+    def _add(self, kind: str, uid: str, line_no: int, event: dict) -> None:
+        ring = self._rings.get(kind)
+        if ring is None:
+            ring = deque()
+            self._rings[kind] = ring
+            self._uids[kind] = set()
+        uids = self._uids[kind]
+        if uid in uids:
+            return
+        if len(ring) >= self._maxlen.get(kind, self._default_maxlen):
+            old_uid, _, _ = ring.popleft()
+            uids.discard(old_uid)
+        ring.append((uid, line_no, event))
+        uids.add(uid)
+        self.stats['events'] += 1
+
+    def refresh(self) -> int:
+        """새로 추가된 줄 파싱. 읽은 줄 수 반환."""
+        with self._lock:
+            self.stats['polls'] += 1
+            reset, lines = self.tail.poll()
+            if reset:
+                self.clear()
+                self.lines = 0
+                self.stats['resets'] += 1
+            for line in lines:
+                self.lines += 1
+                parsed = self.parse(line, self.lines)
+                if parsed is not None:
+                    kind, uid, event = parsed
+                    self._add(kind, uid, self.lines, event)
+            self.stats['lines'] += len(lines)
+            return len(lines)
+
+    def events(self, kind: str, last: Optional[int] = None, since_line: int = 0) -> List[dict]:
+        """kind 의 최근 이벤트 (오래된 것 → 최신). last: 최근 N개, since_line: 해당 줄 번호 초과만."""
+        with self._lock:
+            ring = self._rings.get(kind)
+            if not ring:
+                return []
+            items = [ev for _, line_no, ev in ring if line_no > since_line]
+        return items[-last:] if last else items
+
+    def kinds(self) -> List[str]:
+        with self._lock:
+            return list(self._rings)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+utils/model_registry.py
+
+프로세스 공용 ML 모델 레지스트리 (1회 로드 + 새 버전 자동 교체 + 배치 예측)
+
+기존 방식:
+  analysis.ml_pipeline.predict_entry_quality → 호출마다 load_latest_model() 로 lgbm_entry_latest.pkl 재언픽클
+  ai.ml_model_trainer.MLModelTrainer.load_model / ml.candidate_ranker.CandidateRanker.load_models 도 동일
+  → 진입 후보 1건마다 LightGBM 언픽클 수십 ms 가 주문 경로에 얹힘
+
+ModelRegistry:
+  - 모델 파일별 1회 로드, 이후 get() 은 메모리 참조 반환
+  - 새 버전 감지: check_interval 초마다 (manifest 버전, 파일 mtime_ns, size) 비교
+    manifest(models/manifest.json) 에 이름이 있으면 그 path/version 을 따름
+    (analysis.ml_pipeline.train 저장 시 기록 — auto_retrain 재훈련 포함)
+  - 교체: 새 파일은 잠금 밖에서 완전히 로드한 뒤 참조만 바꿈 → 읽는 쪽은 항상 온전한 이전/새 모델
+    로드 실패(쓰는 중, 깨진 파일) 시 기존 모델 유지, 다음 확인 때 재시도
+  - predict_many(name, feature_rows): 후보 여러 건을 DataFrame 1개로 한 번에 predict_proba
+
+저장 쪽은 atomic_pickle_dump() 사용 (임시 파일 → os.replace) — 반쯤 쓰인 파일을 읽지 않도록.
+
+사용:
+  registry = get_model_registry()
+  registry.register('lgbm_entry', 'models/lgbm_entry_latest.pkl')
+  entry = registry.get('lgbm_entry')            # ModelEntry(obj, version, path, loaded_at)
+  probs = registry.predict_many('lgbm_entry', [{'rvol': 2.1, ...}, ...])
+  clf = registry.load('models/ranker/classifier.pkl')   # 경로를 이름으로 쓰는 단축형
+
+v1.0 2026-10-16: 최초 작성
+"""
+
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.logger import get_logger
+
+logger = get_logger("ModelRegistry")
+
+MODELS_DIR = Path(__file__).resolve().parent.parent / 'models'
+MANIFEST_NAME = 'manifest.json'
+
+PathLike = Union[str, Path]
+
+
+@dataclass(frozen=True)
+class ModelEntry:
+    """로드된 모델 1개 (교체 시 객체째 바뀜 — 필드 단위로 섞이지 않음)"""
+    name: str
+    obj: Any
+    path: str
+    version: str
+    signature: tuple
+    loaded_at: float
+
+    @property
+    def model(self) -> Any:
+        """예측기 — ml_pipeline 형식 payload({'model': ..., 'metrics': ...})면 안쪽 모델"""
+        if isinstance(self.obj, dict) and 'model' in self.obj:
+            return self.obj['model']
+        return self.obj
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        if isinstance(self.obj, dict):
+            return self.obj.get('metrics') or {}
+        return {}
+
+
+def atomic_pickle_dump(obj: Any, path: PathLike) -> None:
+    """같은 디렉토리 임시 파일에 쓰고 os.replace — 읽는 쪽은 이전/새 파일 중 하나만 봄."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f'.{path.name}.', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(obj, f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_manifest_entry(name: str, path: PathLike, version: str,
+                         manifest_path: Optional[PathLike] = None, **meta: Any) -> None:
+    """manifest 에 모델 항목 기록 (path 는 manifest 기준 상대경로로 저장)."""
+    manifest_path = Path(manifest_path or MODELS_DIR / MANIFEST_NAME)
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        manifest = {}
+    path = Path(path)
+    try:
+        rel = os.path.relpath(path, manifest_path.parent)
+    except ValueError:
+        rel = str(path)
+    manifest[name] = {'path': rel, 'version': str(version), 'saved_at': time.time(), **meta}
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = manifest_path.with_name(manifest_path.name + '.tmp')
+    tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False, default=str), encoding='utf-8')
+    os.replace(tmp, manifest_path)
+
+
+class ModelRegistry:
+    """
+    모델 캐시 + 변경 감지 (스레드 안전)
+
+    Args:
+        manifest_path: 버전 manifest (None → models/manifest.json)
+        check_interval: 같은 모델의 파일/manifest 재확인 최소 간격 (초)
+        loader: 파일 → 객체 (기본 pickle.load)
+    """
+
+    def __init__(self, manifest_path: Optional[PathLike] = None, check_interval: float = 5.0,
+                 loader: Callable[[Any], Any] = pickle.load):
+        self.manifest_path = Path(manifest_path or MODELS_DIR / MANIFEST_NAME)
+        self.check_interval = check_interval
+        self.loader = loader
+        self._paths: Dict[str, Path] = {}
+        self._entries: Dict[str, ModelEntry] = {}
+        self._checked: Dict[str, float] = {}
+        self._manifest: Tuple[Optional[tuple], Dict[str, Any]] = (None, {})
+        self._lock = threading.Lock()           # 등록/manifest
+        self._load_lock = threading.Lock()      # 같은 파일 중복 로드 방지
+        self.stats = {'loads': 0, 'reloads': 0, 'failures': 0, 'hits': 0}
+
+    # ── 등록 / 버전 확인 ──────────────────────────────────────────────────
+
+    def register(self, name: str, path: PathLike) -> None:
+        """이름 → 기본 파일 경로 (manifest 에 같은 이름이 있으면 manifest 가 우선)."""
+        with self._lock:
+            self._paths[name] = Path(path)
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            st = self.manifest_path.stat()
+        except OSError:
+            return {}
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if self._manifest[0] == stamp:
+                return self._manifest[1]
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"[MODEL] manifest 읽기 실패: {e}")
+            return self._manifest[1]
+        with self._lock:
+            self._manifest = (stamp, manifest)
+        return manifest
+
+    def _resolve(self, name: str) -> Tuple[Optional[Path], str, Optional[tuple]]:
+        """(경로, 버전, 시그니처) — 파일이 없으면 시그니처 None."""
+        spec = self._read_manifest().get(name)
+        if spec and spec.get('path'):
+            path = Path(spec['path'])
+            if not path.is_absolute():
+                path = self.manifest_path.parent / path
+            version = str(spec.get('version', ''))
+        else:
+            path = self._paths.get(name)
+            version = ''
+        if path is None:
+            return None, version, None
+        try:
+            st = path.stat()
+        except OSError:
+            return path, version, None
+        if not version:
+            version = time.strftime('%Y%m%d_%H%M%S', time.localtime(st.st_mtime))
+        return path, version, (version, str(path), st.st_mtime_ns, st.st_size)
+
+    # ── 조회 ──────────────────────────────────────────────────────────────
+
+    def get(self, name: str, force_check: bool = False) -> Optional[ModelEntry]:
+        """
+        현재 모델 (파일이 바뀌었으면 새로 로드해 교체). 모델이 없으면 None.
+
+        check_interval 안의 재호출은 파일 시스템을 보지 않음.
+        """
+        entry = self._entries.get(name)
+        now = time.monotonic()
+        if entry is not None and not force_check and now - self._checked.get(name, 0.0) < self.check_interval:
+            self.stats['hits'] += 1
+            return entry
+
+        path, version, signature = self._resolve(name)
+        self._checked[name] = now
+        if signature is None:
+            return entry                    # 파일 사라짐 — 기존 모델 유지
+        if entry is not None and entry.signature == signature:
+            self.stats['hits'] += 1
+            return entry
+
+        with self._load_lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry.signature == signature:
+                return entry
+            try:
+                with open(path, 'rb') as f:
+                    obj = self.loader(f)
+            except Exception as e:
+                self.stats['failures'] += 1
+                logger.warning(f"[MODEL] {name} 로드 실패 ({path}): {e} — 기존 모델 유지")
+                return entry
+            new_entry = ModelEntry(name=name, obj=obj, path=str(path), version=version,
+                                   signature=signature, loaded_at=time.time())
+            self._entries[name] = new_entry
+        if entry is None:
+            self.stats['loads'] += 1
+            logger.info(f"[MODEL] {name} 로드: {path} (version={version})")
+        else:
+            self.stats['reloads'] += 1
+            logger.info(f"[MODEL] {name} 교체: {entry.version} → {version}")
+        return new_entry
+
+    def load(self, path: PathLike) -> Optional[Any]:
+        """경로를 이름으로 등록하고 객체 반환 (같은 파일이면 메모리 참조)."""
+        name = str(Path(path).resolve())
+        if name not in self._paths:
+            self.register(name, name)
+        entry = self.get(name)
+        return entry.obj if entry is not None else None
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """다음 get() 이 파일을 다시 확인하도록 (교체는 시그니처가 다를 때만)."""
+        if name is None:
+            self._checked.clear()
+        else:
+            self._checked.pop(name, None)
+
+    # ── 예측 ──────────────────────────────────────────────────────────────
+
+    def predict_many(self, name: str, feature_rows: Union[pd.DataFrame, Iterable[Dict[str, Any]]],
+                     columns: Optional[List[str]] = None,
+                     categorical: Optional[List[str]] = None) -> Optional[np.ndarray]:
+        """
+        후보 여러 건 한 번에 예측 → 양성 확률 배열 (분류기) / 예측값 배열 (회귀). 모델 없으면 None.
+
+        columns / categorical 기본값은 payload 의 feature_cols / cat_cols.
+        """
+        entry = self.get(name)
+        if entry is None:
+            return None
+        payload = entry.obj if isinstance(entry.obj, dict) else {}
+        columns = columns or payload.get('feature_cols')
+        categorical = categorical if categorical is not None else payload.get('cat_cols', [])
+
+        X = feature_rows if isinstance(feature_rows, pd.DataFrame) else pd.DataFrame(list(feature_rows))
+        if columns:
+            X = X.reindex(columns=columns)
+        if X.empty:
+            return np.empty(0, dtype=float)
+        for col in categorical or []:
+            if col in X.columns:
+                X[col] = X[col].astype('category')
+
+        model = entry.model
+        if hasattr(model, 'predict_proba'):
+            return np.asarray(model.predict_proba(X))[:, 1]
+        return np.asarray(model.predict(X), dtype=float)
+
+    def summary(self) -> Dict[str, Any]:
+        """로드된 모델 버전 + 통계 (하트비트용)."""
+        return {
+            'models': {name: {'version': e.version, 'path': e.path, 'loaded_at': e.loaded_at}
+                       for name, e in list(self._entries.items())},
+            **self.stats,
+        }
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry(**kwargs) -> ModelRegistry:
+    """프로세스 공용 ModelRegistry (첫 호출의 kwargs 로 생성)."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry(**kwargs)
+    return _registry
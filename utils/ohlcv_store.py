@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+utils/ohlcv_store.py
+
+로컬 컬럼형 OHLCV 캐시 (Arrow IPC, 종목 × 타임프레임 파일 1개)
+
+    data/ohlcv/{timeframe}/{symbol}.arrow
+
+- 읽기: pyarrow.memory_map → 비압축 IPC 파일을 그대로 매핑 (역직렬화 비용 없음)
+- 커버리지: 이미 조회한 구간 [start, end) 목록을 파일 메타데이터에 보관
+  → 요청 구간에서 커버리지를 뺀 '빈 구간'만 네트워크 조회 (휴장일을 결측으로 오판하지 않음)
+- 오늘(KST) 이후 구간은 커버리지로 기록하지 않음 → 장중 미완성 봉은 다음 실행 때 다시 조회
+- 수정주가 감지: 빈 구간을 조회할 때 직전 며칠을 겹쳐 받아 종가가 달라졌으면
+  (배당/분할로 과거 수정주가 변경) 요청 구간 전체를 다시 받아 교체
+- 오프라인 안전: 조회 실패 / offline=True / OHLCV_OFFLINE=1 → 캐시된 봉만 반환
+- pyarrow 미설치 시 캐시 없이 매번 fetcher 호출 (기존 동작)
+
+인덱스: tz-naive KST DatetimeIndex (name='datetime'), 컬럼: open, high, low, close, volume
+
+사용처: backtest.loader.load_daily, swing_runner.fetch_daily,
+        analysis/cooldown_optimizer, ef_sensitivity_analyzer, exit_performance_analyzer,
+        defensive_short_backtest (backtest/daily_scan 은 loader 경유)
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent / 'data' / 'ohlcv'
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+_KST = 'Asia/Seoul'
+_COVERAGE_KEY = b'ohlcv_coverage'
+_OVERLAP = timedelta(days=7)     # 수정주가 감지용 겹침 구간
+_ADJ_TOLERANCE = 1e-4            # 겹친 봉 종가 상대 오차 허용치
+
+TimeLike = Union[str, datetime, pd.Timestamp]
+Fetcher = Callable[[str, str, pd.Timestamp, pd.Timestamp, Optional[str]], Optional[pd.DataFrame]]
+
+
+def _today() -> pd.Timestamp:
+    """KST 오늘 0시 (tz-naive)."""
+    return pd.Timestamp.now(tz=_KST).normalize().tz_localize(None)
+
+
+def _ts(value: TimeLike) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    if ts.tz is not None:
+        ts = ts.tz_convert(_KST).tz_localize(None)
+    return ts
+
+
+def _has_weekday(start: pd.Timestamp, end: pd.Timestamp) -> bool:
+    """[start, end) 에 평일이 하루라도 있으면 True — 주말만인 구간은 빈 응답이 정상."""
+    return len(pd.bdate_range(start.normalize(), (end - pd.Timedelta(1, 'ns')).normalize())) > 0
+
+
+def normalize_ohlcv(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """
+    yfinance 등 원본 → 표준 형태 (소문자 OHLCV, tz-naive KST 인덱스, 정렬/중복 제거).
+    """
+    if df is None or df.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], name='datetime'))
+
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    df.columns = [str(c).lower() for c in df.columns]
+    df = df.rename(columns={'adj close': 'close'}) if 'close' not in df.columns else df
+    df = df[OHLCV_COLUMNS].dropna()
+
+    idx = pd.DatetimeIndex(pd.to_datetime(df.index))
+    if idx.tz is not None:
+        idx = idx.tz_convert(_KST).tz_localize(None)
+    df.index = idx.rename('datetime')
+    df = df[~df.index.duplicated(keep='last')].sort_index()
+    return df.astype('float64')
+
+
+def yfinance_fetch(
+    symbol: str,
+    timeframe: str,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    market: Optional[str] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    기본 fetcher — yfinance [start, end) 조회.
+
+    symbol 이 종목코드면 market('KS'|'KQ') 우선, 실패 시 반대 시장 시도.
+    '^KQ11', '229200.KS' 처럼 이미 티커 형태면 그대로 사용.
+    Ticker.history 는 네트워크/티커 오류를 삼키고 빈 df 를 반환하므로,
+    빈 결과는 호출측(OHLCVStore._fill)에서 평일 구간이면 커버리지 미기록으로 처리.
+    """
+    import yfinance as yf
+
+    if '.' in symbol or symbol.startswith('^'):
+        tickers = [symbol]
+    else:
+        order = ['.KQ', '.KS'] if market == 'KQ' else ['.KS', '.KQ']
+        tickers = [f'{symbol}{suffix}' for suffix in order]
+
+    df = None
+    for ticker in tickers:
+        # yf.download 는 전역 상태를 공유 → 스레드 병렬 조회 시 Ticker.history 사용
+        df = yf.Ticker(ticker).history(start=start.to_pydatetime(), end=end.to_pydatetime(),
+                                       interval=timeframe, auto_adjust=True)
+        if df is not None and not df.empty:
+            break
+    return normalize_ohlcv(df)
+
+
+def _merge_ranges(ranges: list) -> list:
+    ranges = sorted((a, b) for a, b in ranges if a < b)
+    merged = []
+    for a, b in ranges:
+        if merged and a <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], b))
+        else:
+            merged.append((a, b))
+    return merged
+
+
+def missing_ranges(coverage: list, start: pd.Timestamp, end: pd.Timestamp) -> list:
+    """[start, end) 에서 coverage 로 덮이지 않은 구간 목록."""
+    gaps, cursor = [], start
+    for a, b in _merge_ranges(coverage):
+        if b <= cursor:
+            continue
+        if a >= end:
+            break
+        if a > cursor:
+            gaps.append((cursor, min(a, end)))
+        cursor = max(cursor, b)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class OHLCVStore:
+    """
+    종목 × 타임프레임 OHLCV 로컬 캐시.
+
+    Args:
+        root: 저장 루트 (기본 data/ohlcv)
+        fetcher: (symbol, timeframe, start, end, market) → DataFrame | None
+        offline: True 면 네트워크 조회 없이 캐시만 사용 (환경변수 OHLCV_OFFLINE=1 과 동일)
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_ROOT,
+        fetcher: Optional[Fetcher] = None,
+        offline: Optional[bool] = None,
+    ):
+        self.root = Path(root)
+        self.fetcher = fetcher or yfinance_fetch
+        if offline is None:
+            offline = os.getenv('OHLCV_OFFLINE', '').lower() in ('1', 'true', 'yes')
+        self.offline = offline
+        self._locks: dict = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {'hits': 0, 'fetches': 0, 'fetch_errors': 0, 'empty': 0, 'refreshes': 0}
+
+    # ── 경로/잠금 ─────────────────────────────────────────────────────────
+
+    def path(self, symbol: str, timeframe: str = '1d') -> Path:
+        safe = re.sub(r'[^0-9A-Za-z_-]', '_', symbol)
+        return self.root / timeframe / f'{safe}.arrow'
+
+    def _lock(self, symbol: str, timeframe: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault((symbol, timeframe), threading.Lock())
+
+    # ── 파일 I/O ──────────────────────────────────────────────────────────
+
+    def _read(self, path: Path) -> tuple[pd.DataFrame, list]:
+        if not PYARROW_AVAILABLE or not path.exists():
+            return normalize_ohlcv(None), []
+        try:
+            with pa.memory_map(str(path), 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+            meta = table.schema.metadata or {}
+            coverage = [
+                (pd.Timestamp(a), pd.Timestamp(b))
+                for a, b in json.loads(meta.get(_COVERAGE_KEY, b'[]'))
+            ]
+            df = table.to_pandas()
+            df.index.name = 'datetime'
+            return df, coverage
+        except Exception as e:
+            logger.warning(f'[OHLCV_STORE] 캐시 파일 손상 → 무시: {path} ({e})')
+            return normalize_ohlcv(None), []
+
+    def _write(self, path: Path, df: pd.DataFrame, coverage: list) -> None:
+        if not PYARROW_AVAILABLE:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        meta = dict(table.schema.metadata or {})
+        meta[_COVERAGE_KEY] = json.dumps(
+            [(a.isoformat(), b.isoformat()) for a, b in _merge_ranges(coverage)]
+        ).encode()
+        table = table.replace_schema_metadata(meta)
+        # 임시 파일 → rename (매핑 중인 리더는 기존 inode 를 계속 봄)
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with pa.OSFile(str(tmp), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+
+    # ── 조회 ──────────────────────────────────────────────────────────────
+
+    def read(self, symbol: str, timeframe: str = '1d') -> pd.DataFrame:
+        """캐시된 봉 전체 (네트워크 조회 없음)."""
+        df, _ = self._read(self.path(symbol, timeframe))
+        return df
+
+    def get(
+        self,
+        symbol: str,
+        start: TimeLike,
+        end: Optional[TimeLike] = None,
+        timeframe: str = '1d',
+        market: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        [start, end) 구간 OHLCV. 빈 구간만 fetcher 로 채운 뒤 캐시에 병합.
+
+        end=None → 내일 0시 (오늘 봉 포함).
+        """
+        start = _ts(start)
+        end = _ts(end) if end is not None else _today() + timedelta(days=1)
+        if start >= end:
+            return normalize_ohlcv(None)
+
+        if not PYARROW_AVAILABLE:
+            return self._fetch_or_empty(symbol, timeframe, start, end, market)
+
+        path = self.path(symbol, timeframe)
+        with self._lock(symbol, timeframe):
+            df, coverage = self._read(path)
+            gaps = missing_ranges(coverage, start, end)
+            if gaps and not self.offline:
+                df, coverage = self._fill(symbol, timeframe, market, df, coverage, gaps, start, end)
+                self._write(path, df, coverage)
+            elif not gaps:
+                self.stats['hits'] += 1
+
+        return df.loc[(df.index >= start) & (df.index < end)]
+
+    def _fetch_or_empty(self, symbol, timeframe, start, end, market) -> pd.DataFrame:
+        if self.offline:
+            return normalize_ohlcv(None)
+        try:
+            self.stats['fetches'] += 1
+            return normalize_ohlcv(self.fetcher(symbol, timeframe, start, end, market))
+        except Exception as e:
+            self.stats['fetch_errors'] += 1
+            logger.warning(f'[OHLCV_STORE] {symbol} {timeframe} 조회 실패: {e}')
+            return normalize_ohlcv(None)
+
+    def _fill(self, symbol, timeframe, market, df, coverage, gaps, start, end):
+        """빈 구간 조회 + 병합. 수정주가 변경 감지 시 요청 구간 전체 재조회."""
+        cap = _today()
+        frames = [df]
+        for gap_start, gap_end in gaps:
+            # 기존 봉 바로 뒤를 채우는 구간이면 겹쳐 받아 수정주가 변경 확인
+            overlap = not df.empty and df.index[0] < gap_start and gap_start <= df.index[-1] + _OVERLAP
+            fetch_start = gap_start - _OVERLAP if overlap else gap_start
+            try:
+                self.stats['fetches'] += 1
+                fresh = normalize_ohlcv(self.fetcher(symbol, timeframe, fetch_start, gap_end, market))
+            except Exception as e:
+                self.stats['fetch_errors'] += 1
+                logger.warning(f'[OHLCV_STORE] {symbol} {timeframe} 조회 실패 → 캐시 사용: {e}')
+                continue
+
+            if overlap and self._adjusted(df, fresh, gap_start):
+                logger.info(f'[OHLCV_STORE] {symbol} {timeframe} 수정주가 변경 감지 → 재조회')
+                self.stats['refreshes'] += 1
+                return self._refresh(symbol, timeframe, market, min(start, df.index[0]), end)
+
+            frames.append(fresh)
+            covered_to = min(gap_end, cap)
+            if gap_start >= covered_to:
+                continue
+            # yfinance 는 네트워크/티커 오류를 삼키고 빈 df 를 돌려주므로, 평일이 낀 구간이
+            # 비어 있으면 커버리지로 기록하지 않고 다음 요청에서 다시 조회
+            in_gap = (fresh.index >= gap_start) & (fresh.index < gap_end)
+            if in_gap.any() or not _has_weekday(gap_start, covered_to):
+                coverage = coverage + [(gap_start, covered_to)]
+            else:
+                self.stats['empty'] += 1
+                logger.warning(f'[OHLCV_STORE] {symbol} {timeframe} {gap_start.date()}~{gap_end.date()} '
+                               f'빈 응답 → 커버리지 미기록')
+
+        merged = pd.concat([f for f in frames if not f.empty]) if any(not f.empty for f in frames) else df
+        merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+        return merged, coverage
+
+    def _refresh(self, symbol, timeframe, market, start, end):
+        try:
+            self.stats['fetches'] += 1
+            fresh = normalize_ohlcv(self.fetcher(symbol, timeframe, start, end, market))
+        except Exception as e:
+            self.stats['fetch_errors'] += 1
+            logger.warning(f'[OHLCV_STORE] {symbol} {timeframe} 재조회 실패: {e}')
+            return self._read(self.path(symbol, timeframe))
+        if fresh.empty:
+            self.stats['empty'] += 1
+            logger.warning(f'[OHLCV_STORE] {symbol} {timeframe} 재조회 빈 응답 → 캐시 유지')
+            return self._read(self.path(symbol, timeframe))
+        cap = _today()
+        coverage = [(start, min(end, cap))] if start < min(end, cap) else []
+        return fresh, coverage
+
+    @staticmethod
+    def _adjusted(cached: pd.DataFrame, fresh: pd.DataFrame, gap_start: pd.Timestamp) -> bool:
+        """겹친 구간(gap_start 이전) 종가가 달라졌으면 True."""
+        common = cached.index.intersection(fresh.index[fresh.index < gap_start])
+        if common.empty:
+            return False
+        old = cached.loc[common, 'close'].to_numpy()
+        new = fresh.loc[common, 'close'].to_numpy()
+        return bool((abs(new - old) > abs(old) * _ADJ_TOLERANCE).any())
+
+
+_default_store: Optional[OHLCVStore] = None
+_default_lock = threading.Lock()
+
+
+def get_store() -> OHLCVStore:
+    """프로세스 공용 기본 저장소 (data/ohlcv)."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = OHLCVStore()
+        return _default_store
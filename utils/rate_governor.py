@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+utils/rate_governor.py
+
+키움 REST 호출 프로세스 간 공용 Rate Governor (토큰 버킷 + 우선순위 + 적응형 백오프)
+
+- 앱 키 × TR 그룹('order' 주문 / 'tr' 조회)마다 버킷 1개, 상태는 공유 파일(/dev/shm)에 두고
+  fcntl.flock 으로 갱신 → 트레이딩 프로세스와 api_server 가 같은 예산을 나눠 씀
+  (fcntl 없는 환경은 프로세스 내 버킷으로 동작)
+- 우선순위: 주문 > 청산 > 진입 > 대시보드 (PRIORITY_ORDER=0 … PRIORITY_DASHBOARD=3)
+  토큰을 못 받은 호출은 자기 우선순위의 '대기 중' 시각을 남기고, 더 낮은 우선순위는
+  최근 DEMAND_WINDOW 초 안에 상위 대기가 있으면 양보 → 대시보드 폭주가 주문을 굶기지 않음
+  대시보드는 버킷 마지막 토큰 1개를 쓰지 않음 (상위 우선순위 순간 버스트용 여유)
+- 429 / return_code 1687·1700 응답 → 버킷 비우고 지수 백오프, 보충 속도 절반.
+  정상 응답마다 보충 속도 서서히 복구
+
+동기/비동기 공용:
+  governor = get_governor(app_key)
+  governor.acquire('tr', PRIORITY_ENTRY)               # requests (스레드, 이벤트 루프 스레드 예외는 acquire 참고)
+  await governor.acquire_async('tr', PRIORITY_EXIT)    # aiohttp
+  governor.report('tr', rate_limited=is_rate_limited(status, body))
+
+호출 우선순위는 contextvar 로 전달 (asyncio.to_thread 는 컨텍스트를 복사함):
+  with rate_priority(PRIORITY_EXIT):
+      await asyncio.to_thread(api.get_minute_chart, ...)
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from utils.logger import get_logger
+
+logger = get_logger("RateGovernor")
+
+PRIORITY_ORDER = 0       # 주문 (매수/매도/정정/취소)
+PRIORITY_EXIT = 1        # 보유 종목 청산 판단 조회
+PRIORITY_ENTRY = 2       # 워치리스트 진입 스캔
+PRIORITY_DASHBOARD = 3   # 대시보드 API
+_PRIORITIES = 4
+
+GROUP_ORDER = 'order'
+GROUP_TR = 'tr'
+ORDER_API_IDS = frozenset({'kt10000', 'kt10001', 'kt10002', 'kt10003'})
+RATE_LIMIT_CODES = frozenset({429, 1687, 1700})
+
+DEMAND_WINDOW = 0.25      # 상위 우선순위 대기 표시 유효 시간 (초)
+_RESERVE = (0.0, 0.0, 0.0, 1.0)   # 우선순위별 남겨둘 토큰 수
+_MAX_SLEEP = 0.5
+_MIN_PENALTY = 0.2
+_PENALTY_RECOVERY = 0.05
+_BACKOFF_BASE = 1.0
+_BACKOFF_MAX = 30.0
+_LOOP_WAIT_MAX = 3.0      # 이벤트 루프 스레드의 주문/청산 호출 최대 대기 (초) — 진입/대시보드는 대기 없음
+
+# tokens, updated, backoff_until, penalty, strikes, demand[4]
+_SLOT = struct.Struct('<4sxxxx5d4d')
+_MAGIC = b'KRG1'
+
+_priority: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar('kiwoom_rate_priority', default=None)
+
+
+@contextlib.contextmanager
+def rate_priority(priority: int):
+    """블록 안(및 asyncio.to_thread 로 넘긴 호출)의 키움 요청 우선순위 지정."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority(default: int = PRIORITY_ENTRY) -> int:
+    value = _priority.get()
+    return default if value is None else value
+
+
+def group_for(api_id: Optional[str]) -> str:
+    return GROUP_ORDER if api_id in ORDER_API_IDS else GROUP_TR
+
+
+def is_rate_limited(status: int, body=None) -> bool:
+    """HTTP 429 또는 키움 rate 에러 코드(1687/1700) 응답 여부."""
+    if status == 429:
+        return True
+    if not isinstance(body, dict):
+        return False
+    for key in ('error_code', 'return_code'):
+        try:
+            if int(body.get(key) or 0) in RATE_LIMIT_CODES:
+                return True
+        except (TypeError, ValueError):
+            pass
+    msg = str(body.get('return_msg') or body.get('error_message') or '')
+    return '1700' in msg or '허용된 요청 개수' in msg
+
+
+def on_event_loop_thread() -> bool:
+    """현재 스레드에서 asyncio 이벤트 루프가 실행 중인지 (sleep 하면 루프 전체가 멈춤)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def default_governor_dir() -> Path:
+    """KIWOOM_RATE_DIR > /dev/shm/kiwoom_rate > 임시 디렉토리."""
+    env = os.environ.get('KIWOOM_RATE_DIR')
+    if env:
+        return Path(env)
+    shm = Path('/dev/shm')
+    if shm.is_dir():
+        return shm / 'kiwoom_rate'
+    return Path(tempfile.gettempdir()) / 'kiwoom_rate'
+
+
+class _Slot:
+    """그룹 1개 버킷 상태 — 공유 파일(mmap + flock) 또는 프로세스 메모리."""
+
+    def __init__(self, path: Optional[Path], capacity: float):
+        self._thread_lock = threading.Lock()
+        self._fd: Optional[int] = None
+        if path is not None and fcntl is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+                if os.fstat(self._fd).st_size < _SLOT.size:
+                    os.ftruncate(self._fd, _SLOT.size)
+                self._buf = mmap.mmap(self._fd, _SLOT.size)
+            except OSError as e:
+                logger.debug(f"공유 rate 슬롯 사용 불가, 프로세스 내 버킷 사용: {e}")
+                if self._fd is not None:
+                    os.close(self._fd)
+                self._fd = None
+        if self._fd is None:
+            self._buf = bytearray(_SLOT.size)
+        with self.locked():
+            if bytes(self._buf[:4]) != _MAGIC:
+                self.store([capacity, time.time(), 0.0, 1.0, 0.0] + [0.0] * _PRIORITIES)
+
+    @contextlib.contextmanager
+    def locked(self):
+        with self._thread_lock:
+            if self._fd is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if self._fd is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def load(self) -> list:
+        return list(_SLOT.unpack_from(self._buf, 0)[1:])
+
+    def store(self, values: list) -> None:
+        _SLOT.pack_into(self._buf, 0, _MAGIC, *values)
+
+    @property
+    def shared(self) -> bool:
+        return self._fd is not None
+
+
+class RateGovernor:
+    """
+    앱 키 1개의 그룹별 토큰 버킷
+
+    Args:
+        app_key: 키움 앱 키 (공유 파일 이름은 해시 사용)
+        rates: 그룹별 초당 요청 수 {'order': 5, 'tr': 5} — 같은 앱 키를 쓰는 프로세스는 같은 값 사용
+        burst: 버킷 크기 (순간 허용량)
+        directory: 공유 상태 디렉토리 (None → default_governor_dir(), False → 프로세스 내 전용)
+    """
+
+    def __init__(self, app_key: str, rates: Optional[Dict[str, float]] = None,
+                 burst: float = 5.0, directory=None):
+        self.rates = {GROUP_ORDER: 5.0, GROUP_TR: 5.0}
+        self.rates.update(rates or {})
+        self.burst = float(burst)
+        self._key = hashlib.sha1((app_key or 'default').encode()).hexdigest()[:12]
+        self._dir = None if directory is False else Path(directory or default_governor_dir())
+        self._slots: Dict[str, _Slot] = {}
+        self._slots_lock = threading.Lock()
+        self.stats = {'granted': 0, 'waited': 0, 'yielded': 0, 'rate_limited': 0}
+
+    def configure(self, rates: Optional[Dict[str, float]] = None, burst: Optional[float] = None) -> None:
+        """설정 파일 값으로 그룹 속도/버킷 크기 갱신 (생성 후 config 로드 시점)."""
+        if rates:
+            self.rates.update({g: float(r) for g, r in rates.items() if r})
+        if burst:
+            self.burst = float(burst)
+
+    def _slot(self, group: str) -> _Slot:
+        slot = self._slots.get(group)
+        if slot is None:
+            with self._slots_lock:
+                slot = self._slots.get(group)
+                if slot is None:
+                    path = self._dir / f"{self._key}_{group}.rate" if self._dir else None
+                    slot = _Slot(path, self.burst)
+                    self._slots[group] = slot
+        return slot
+
+    def try_acquire(self, group: str, priority: int, now: Optional[float] = None) -> float:
+        """토큰 1개 시도. 획득하면 0, 아니면 다시 시도할 때까지 대기 초."""
+        now = time.time() if now is None else now
+        priority = min(max(int(priority), 0), _PRIORITIES - 1)
+        rate = self.rates.get(group, self.rates[GROUP_TR])
+        slot = self._slot(group)
+        with slot.locked():
+            tokens, updated, backoff_until, penalty, strikes, *demand = slot.load()
+            effective = rate * penalty
+            start = max(updated, backoff_until)          # 백오프 중에는 보충 없음
+            if now > start:
+                tokens = min(self.burst, tokens + (now - start) * effective)
+                updated = now
+            need = 1.0 + _RESERVE[priority]
+
+            if now < backoff_until:
+                wait = backoff_until - now
+            elif any(now - demand[q] < DEMAND_WINDOW for q in range(priority)):
+                self.stats['yielded'] += 1
+                wait = max(need - tokens, 1.0) / effective
+            elif tokens >= need:
+                tokens -= 1.0
+                wait = 0.0
+            else:
+                wait = (need - tokens) / effective
+
+            if wait > 0:
+                demand[priority] = now
+            slot.store([tokens, updated, backoff_until, penalty, strikes] + demand)
+
+        if wait > 0:
+            self.stats['waited'] += 1
+        else:
+            self.stats['granted'] += 1
+        return wait
+
+    def acquire(self, group: str = GROUP_TR, priority: Optional[int] = None,
+                timeout: Optional[float] = None) -> bool:
+        """
+        토큰 획득까지 대기 (스레드용). timeout 초과 시 False.
+
+        이벤트 루프 스레드에서 호출되면 (루프 위 동기 KiwoomAPI 호출) 백오프 중 time.sleep 으로
+        REAL 틱 / 청산 가드 / demux 수신이 멈추지 않도록 대기를 제한:
+          - 주문/청산(PRIORITY_EXIT 이하): 최대 _LOOP_WAIT_MAX 초 — 청산이 rate 때문에 바로 실패하지 않도록
+          - 진입/대시보드: 대기 없이 1회만 시도
+        """
+        priority = current_priority() if priority is None else priority
+        if on_event_loop_thread():
+            limit = _LOOP_WAIT_MAX if priority <= PRIORITY_EXIT else 0.0
+            timeout = limit if timeout is None else min(timeout, limit)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(group, priority)
+            if wait <= 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(min(wait, _MAX_SLEEP))
+
+    async def acquire_async(self, group: str = GROUP_TR, priority: Optional[int] = None,
+                            timeout: Optional[float] = None) -> bool:
+        """acquire 의 비동기판 (이벤트 루프 비차단)."""
+        priority = current_priority() if priority is None else priority
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(group, priority)
+            if wait <= 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(min(wait, _MAX_SLEEP))
+
+    def report(self, group: str, rate_limited: bool, now: Optional[float] = None) -> None:
+        """응답 결과 반영 — rate 에러면 버킷 비우고 지수 백오프, 정상이면 보충 속도 복구."""
+        now = time.time() if now is None else now
+        slot = self._slot(group)
+        with slot.locked():
+            tokens, updated, backoff_until, penalty, strikes, *demand = slot.load()
+            if rate_limited:
+                strikes += 1
+                backoff = min(_BACKOFF_BASE * 2 ** (strikes - 1), _BACKOFF_MAX)
+                backoff_until = max(backoff_until, now + backoff)
+                penalty = max(_MIN_PENALTY, penalty * 0.5)
+                tokens = 0.0
+                updated = now
+            elif strikes or penalty < 1.0:
+                strikes = 0.0
+                penalty = min(1.0, penalty + _PENALTY_RECOVERY)
+            else:
+                return
+            slot.store([tokens, updated, backoff_until, penalty, strikes] + demand)
+        if rate_limited:
+            self.stats['rate_limited'] += 1
+            logger.warning(f"⏳ [{group}] rate limit 응답 → {backoff:.0f}초 백오프, 속도 ×{penalty:.2f}")
+
+    def snapshot(self, group: str = GROUP_TR) -> Dict[str, float]:
+        slot = self._slot(group)
+        with slot.locked():
+            tokens, updated, backoff_until, penalty, strikes, *_ = slot.load()
+        return {'tokens': tokens, 'backoff_until': backoff_until, 'penalty': penalty,
+                'strikes': strikes, 'shared': slot.shared}
+
+
+_governors: Dict[str, RateGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_governor(app_key: Optional[str] = None, **kwargs) -> RateGovernor:
+    """앱 키별 프로세스 공용 RateGovernor (첫 호출의 kwargs 로 생성)."""
+    key = app_key or os.getenv("KIWOOM_APP_KEY") or 'default'
+    governor = _governors.get(key)
+    if governor is None:
+        with _governors_lock:
+            governor = _governors.get(key)
+            if governor is None:
+                governor = RateGovernor(key, **kwargs)
+                _governors[key] = governor
+    return governor
@@ -5,9 +5,11 @@ API Rate Limiter - KIS API 초당 20건 제한 처리
 """
 
 import asyncio
+import heapq
+import itertools
 import time
 from collections import deque
-from typing import Optional
+from typing import List, Optional, Tuple
 from utils.logger import get_logger
 
 logger = get_logger("RateLimiter")
@@ -54,6 +56,81 @@ class RateLimiter:
         for _ in range(count):
             await self.acquire()
 
+
+# TokenBucket 우선순위 (작을수록 먼저 토큰 획득)
+PRIORITY_HELD = 0    # 보유 종목 (청산 판단)
+PRIORITY_SCAN = 10   # 워치리스트 진입 스캔
+
+
+class TokenBucket:
+    """
+    토큰 버킷 Rate Limiter (우선순위 대기열)
+
+    - rate: 초당 토큰 보충량 (= 지속 처리량)
+    - capacity: 버킷 크기 (= 순간 버스트 허용량)
+    - 대기자는 (priority, 도착순) 으로 토큰을 받는다 → 보유 종목 조회가 스캔보다 먼저 나감
+
+    동시에 발행된 코루틴 N개가 함께 대기해도 타이머는 하나만 유지한다.
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive: {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _dispatch(self):
+        """보충된 토큰을 우선순위 순으로 분배하고, 남은 대기자가 있으면 타이머 예약"""
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, fut = heapq.heappop(self._waiters)
+            if fut.done():  # 취소된 대기자
+                continue
+            self._tokens -= 1
+            fut.set_result(None)
+
+        # 취소된 대기자만 남았으면 정리
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+
+        if self._waiters and self._timer is None:
+            delay = (1 - self._tokens) / self.rate
+            self._timer = asyncio.get_running_loop().call_later(max(delay, 0.0), self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._dispatch()
+
+    async def acquire(self, priority: int = PRIORITY_SCAN):
+        """토큰 1개 획득 (필요시 대기)"""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        if len(self._waiters) == 1:
+            logger.debug(f"⏳ TokenBucket 대기 시작 (tokens={self._tokens:.2f})")
+        self._dispatch()
+        await fut
+
+    @property
+    def pending(self) -> int:
+        """토큰 대기 중인 호출 수"""
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+
 # 전역 Rate Limiter 인스턴스
 _global_limiter: Optional[RateLimiter] = None
 
@@ -13,6 +13,8 @@ import pandas as pd
 import numpy as np
 from typing import Tuple, Optional
 
+from utils.linreg import rolling_linreg_slope
+
 
 def calculate_squeeze_momentum(
     df: pd.DataFrame,
@@ -79,11 +81,8 @@ def calculate_squeeze_momentum(
     # Linear Regression을 통한 모멘텀
     momentum = df['close'] - avg_close_hl
 
-    # Linear Regression 계산 (간소화)
-    sqz_momentum = momentum.rolling(window=mom_length).apply(
-        lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) == mom_length else 0,
-        raw=False
-    )
+    # Linear Regression 기울기 (누적합 기반 O(n) 커널)
+    sqz_momentum = rolling_linreg_slope(momentum, mom_length)
 
     # 5. 시그널 생성
     sqz_signal = pd.Series('HOLD', index=df.index)
@@ -21,6 +21,8 @@ import numpy as np
 from typing import Tuple, Dict
 from rich.console import Console
 
+from utils.linreg import rolling_linreg_slope
+
 console = Console()
 
 
@@ -89,11 +91,8 @@ def calculate_squeeze_momentum(
     # Linear Regression을 통한 모멘텀
     momentum = df['close'] - avg_close_hl
 
-    # Linear Regression 계산 (간소화)
-    sqz_momentum = momentum.rolling(window=mom_length).apply(
-        lambda x: np.polyfit(range(len(x)), x, 1)[0] if len(x) == mom_length else 0,
-        raw=False
-    )
+    # Linear Regression 기울기 (누적합 기반 O(n) 커널)
+    sqz_momentum = rolling_linreg_slope(momentum, mom_length)
 
     # 5. 시그널 생성
     sqz_signal = pd.Series('HOLD', index=df.index)
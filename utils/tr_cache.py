@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+utils/tr_cache.py
+
+키움 TR 조회 read-through 캐시 + 동일 요청 병합(singleflight)
+
+기존 방식:
+  한 주기 안에서 같은 종목/지수 데이터를 모듈마다 따로 조회
+  (check_all_stocks 5분봉, market_context 지수 분봉, L4 LiquidityShiftDetector 수급, ...)
+  → 같은 TR 이 초당 예산을 중복 소모
+
+TRCache:
+  - 키: (메서드, 기본값까지 채운 인자) — 연속조회(cont_yn='Y') 페이지는 캐시하지 않음
+  - TTL: TR 별 (TR_POLICIES, 설정으로 덮어쓰기 / 0 이면 캐시 안 함)
+    분봉/일봉은 만료 시각을 다음 봉 경계로 자름 → 봉이 바뀌면 반드시 새로 조회
+  - 병합: 같은 키 요청이 진행 중이면 새로 보내지 않고 그 결과를 함께 받음
+    동기(스레드) / 비동기(이벤트 루프) 호출 모두 지원
+  - 정상 응답(return_code == 0)만 저장, 반환은 얕은 복사본 (호출 측 키 추가가 캐시를 오염시키지 않음)
+  - 통계: TR 별 hits / misses / coalesced, hit_rate = (hits + coalesced) / 전체
+
+CachedKiwoomAPI(api, cache):
+  KiwoomAPI / AsyncKiwoomAPI 프록시 — 캐시 대상 조회 메서드만 가로채고
+  나머지 속성/메서드(주문, 토큰, 계좌 조회 등)는 그대로 전달 (속성 대입 포함).
+
+사용:
+  cache = TRCache(ttls={'ka10059': 120})
+  api = CachedKiwoomAPI(KiwoomAPI(), cache)
+  api.get_minute_chart(stock_code='005930', tic_scope='5')    # 같은 5분 구간 안 재호출은 캐시
+  cache.summary()['hit_rate']
+
+v1.0 2026-10-16: 최초 작성
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# 메서드 → (TR, 기본 TTL 초)
+TR_POLICIES: Dict[str, Tuple[str, float]] = {
+    'get_minute_chart': ('ka10080', 20.0),
+    'get_daily_chart': ('ka10081', 300.0),
+    'get_stock_price': ('price', 2.0),
+    'get_stock_quote': ('ka10004', 1.0),
+    'get_execution_info': ('ka10003', 2.0),
+    'get_stock_info': ('ka10001', 600.0),
+    'get_investor_trend': ('ka10059', 60.0),
+    'get_foreign_investor_trend': ('ka10008', 60.0),
+    'get_program_trading': ('ka90004', 60.0),
+}
+
+_UNKEYED_ARGS = ('deadline',)      # 결과와 무관한 인자
+
+
+def next_bar_boundary(now: float, minutes: int) -> float:
+    """now 이후 첫 minutes 분봉 경계 (로컬 자정 기준 — 09:00 은 1~60분 봉 모두의 경계)."""
+    lt = time.localtime(now)
+    midnight = int(now) - (lt.tm_hour * 3600 + lt.tm_min * 60 + lt.tm_sec)
+    span = minutes * 60
+    return midnight + (int((now - midnight) // span) + 1) * span
+
+
+def _bar_minutes(method: str, arguments: Dict[str, Any]) -> Optional[int]:
+    if method == 'get_minute_chart':
+        try:
+            return max(1, int(arguments.get('tic_scope') or 1))
+        except (TypeError, ValueError):
+            return None
+    if method == 'get_daily_chart':
+        return 1440
+    return None
+
+
+def _cacheable(result: Any) -> bool:
+    return isinstance(result, dict) and result.get('return_code') == 0
+
+
+def _copy(result: Any) -> Any:
+    return dict(result) if isinstance(result, dict) else result
+
+
+class _Flight:
+    """동기 호출 진행 중 표시 (후속 호출은 event 대기)"""
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class TRCache:
+    """
+    TR 응답 캐시 + 요청 병합 (스레드 안전)
+
+    Args:
+        ttls: TR 별 TTL 덮어쓰기 {'ka10080': 30, 'ka10059': 0, ...}
+        max_entries: 저장 항목 상한 (초과 시 만료 항목 → 오래된 항목 순으로 정리)
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 4096):
+        self.ttls: Dict[str, float] = {tr: ttl for tr, ttl in TR_POLICIES.values()}
+        if ttls:
+            self.ttls.update({tr: float(ttl) for tr, ttl in ttls.items()})
+        self.max_entries = max_entries
+        self._store: Dict[tuple, Tuple[float, Any]] = {}
+        self._sync_flights: Dict[tuple, _Flight] = {}
+        self._async_flights: Dict[tuple, asyncio.Future] = {}
+        self._signatures: Dict[Any, inspect.Signature] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    # ── 키 / 저장 ─────────────────────────────────────────────────────────
+
+    def _key(self, method: str, fn: Callable, args: tuple, kwargs: dict):
+        """(key, tr, bar_minutes) — 캐시 불가 호출이면 key=None."""
+        tr, _ = TR_POLICIES[method]
+        if self.ttls.get(tr, 0) <= 0:
+            return None, tr, None
+        func = getattr(fn, '__func__', fn)      # 동기/비동기 클라이언트는 시그니처가 다름
+        sig = self._signatures.get(func)
+        if sig is None:
+            sig = inspect.signature(fn)
+            self._signatures[func] = sig
+        try:
+            bound = sig.bind(*args, **kwargs)
+        except TypeError:
+            return None, tr, None           # 잘못된 호출 — 원래 메서드가 그대로 에러 내도록
+        bound.apply_defaults()
+        arguments = {k: v for k, v in bound.arguments.items() if k not in _UNKEYED_ARGS}
+        if arguments.get('cont_yn', 'N') != 'N':
+            return None, tr, None           # 연속조회 페이지
+        key = (method,) + tuple(sorted(arguments.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None, tr, None
+        return key, tr, _bar_minutes(method, arguments)
+
+    def _count(self, tr: str, field: str) -> None:
+        stats = self.stats.get(tr)
+        if stats is None:
+            stats = self.stats[tr] = {'hits': 0, 'misses': 0, 'coalesced': 0}
+        stats[field] += 1
+
+    def _get(self, key: tuple, now: float):
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        if now >= entry[0]:
+            del self._store[key]
+            return None
+        return entry[1]
+
+    def _put(self, key: tuple, tr: str, minutes: Optional[int], result: Any, now: float) -> None:
+        if not _cacheable(result):
+            return
+        expires = now + self.ttls[tr]
+        if minutes:
+            expires = min(expires, next_bar_boundary(now, minutes))
+        self._store[key] = (expires, result)
+        if len(self._store) > self.max_entries:
+            for stale in [k for k, (exp, _) in self._store.items() if exp <= now]:
+                del self._store[stale]
+            while len(self._store) > self.max_entries:
+                del self._store[next(iter(self._store))]
+
+    def invalidate(self, method: Optional[str] = None) -> None:
+        """저장 항목 삭제 (method 지정 시 해당 메서드만)."""
+        with self._lock:
+            if method is None:
+                self._store.clear()
+            else:
+                for key in [k for k in self._store if k[0] == method]:
+                    del self._store[key]
+
+    # ── 조회 ──────────────────────────────────────────────────────────────
+
+    def call(self, method: str, fn: Callable, args: tuple = (), kwargs: Optional[dict] = None) -> Any:
+        """동기 메서드 read-through (같은 키 진행 중이면 그 결과 대기)."""
+        kwargs = kwargs or {}
+        key, tr, minutes = self._key(method, fn, args, kwargs)
+        if key is None:
+            return fn(*args, **kwargs)
+
+        with self._lock:
+            hit = self._get(key, time.time())
+            if hit is not None:
+                self._count(tr, 'hits')
+                return _copy(hit)
+            flight = self._sync_flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._sync_flights[key] = _Flight()
+                self._count(tr, 'misses')
+            else:
+                self._count(tr, 'coalesced')
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _copy(flight.result)
+
+        try:
+            flight.result = fn(*args, **kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._sync_flights.pop(key, None)
+                if flight.error is None:
+                    self._put(key, tr, minutes, flight.result, time.time())
+            flight.event.set()
+        return _copy(flight.result)
+
+    async def call_async(self, method: str, fn: Callable, args: tuple = (),
+                         kwargs: Optional[dict] = None) -> Any:
+        """
+        코루틴 메서드 read-through.
+
+        조회는 공유 태스크로 실행 — 먼저 요청한 쪽이 취소돼도 함께 기다리던 호출은 결과를 받음.
+        """
+        kwargs = kwargs or {}
+        key, tr, minutes = self._key(method, fn, args, kwargs)
+        if key is None:
+            return await fn(*args, **kwargs)
+
+        with self._lock:
+            hit = self._get(key, time.time())
+            if hit is not None:
+                self._count(tr, 'hits')
+                return _copy(hit)
+            self._count(tr, 'coalesced' if key in self._async_flights else 'misses')
+
+        task = self._async_flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill_async(key, tr, minutes, fn, args, kwargs))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._async_flights[key] = task
+        return _copy(await asyncio.shield(task))
+
+    async def _fill_async(self, key: tuple, tr: str, minutes: Optional[int],
+                          fn: Callable, args: tuple, kwargs: dict) -> Any:
+        try:
+            result = await fn(*args, **kwargs)
+            with self._lock:
+                self._put(key, tr, minutes, result, time.time())
+            return result
+        finally:
+            self._async_flights.pop(key, None)
+
+    # ── 통계 ──────────────────────────────────────────────────────────────
+
+    def summary(self) -> Dict[str, Any]:
+        """전체 / TR 별 hits, misses, coalesced, hit_rate (대시보드·하트비트용)."""
+        def _rate(s: Dict[str, int]) -> float:
+            total = s['hits'] + s['misses'] + s['coalesced']
+            return round((s['hits'] + s['coalesced']) / total, 3) if total else 0.0
+
+        with self._lock:
+            by_tr = {tr: dict(s, hit_rate=_rate(s)) for tr, s in self.stats.items()}
+            entries = len(self._store)
+        total = {field: sum(s[field] for s in by_tr.values())
+                 for field in ('hits', 'misses', 'coalesced')}
+        return {**total, 'hit_rate': _rate(total), 'entries': entries, 'by_tr': by_tr}
+
+
+class CachedKiwoomAPI:
+    """
+    KiwoomAPI / AsyncKiwoomAPI 캐시 프록시
+
+    TR_POLICIES 메서드는 cache 경유 (코루틴 메서드는 call_async), 나머지는 원본 그대로.
+    속성 대입(api.access_token = None 등)도 원본에 반영.
+    """
+
+    def __init__(self, api: Any, cache: TRCache):
+        object.__setattr__(self, '_api', api)
+        object.__setattr__(self, '_cache', cache)
+        object.__setattr__(self, '_wrappers', {})
+
+    @property
+    def raw(self) -> Any:
+        """캐시를 거치지 않는 원본 클라이언트"""
+        return self._api
+
+    @property
+    def cache(self) -> TRCache:
+        return self._cache
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name not in TR_POLICIES or not callable(attr):
+            return attr
+        wrapper = self._wrappers.get(name)
+        if wrapper is None:
+            api, cache = self._api, self._cache
+            if asyncio.iscoroutinefunction(attr):
+                async def wrapper(*args, **kwargs):
+                    return await cache.call_async(name, getattr(api, name), args, kwargs)
+            else:
+                def wrapper(*args, **kwargs):
+                    return cache.call(name, getattr(api, name), args, kwargs)
+            functools.update_wrapper(wrapper, attr)
+            self._wrappers[name] = wrapper
+        return wrapper
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._api, name, value)